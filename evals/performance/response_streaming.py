@@ -0,0 +1,109 @@
+"""Run `pip install openai agno memory_profiler` to install dependencies.
+
+Measures the per-token overhead of streaming a long response through an Agent.
+OpenAIChat streams NUM_TOKENS prebuilt chunks instead of calling the API, so only agno's own work is measured:
+the provider's response_stream() and the agent's streaming loop.
+"""
+
+from dataclasses import dataclass
+from timeit import timeit
+from typing import Any, Iterator, List, Optional
+
+from openai.types.chat.chat_completion_chunk import ChatCompletionChunk, Choice, ChoiceDelta
+
+from agno.agent import Agent
+from agno.eval.perf import PerfEval
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.models.response import ModelResponse, ModelResponseEvent
+from agno.run.response import RunResponse
+from agno.utils.stream import StreamBuffer
+
+NUM_TOKENS = 5000
+TOKEN = "token "
+
+CHUNKS = [
+    ChatCompletionChunk(
+        id="chunk",
+        object="chat.completion.chunk",
+        created=0,
+        model="gpt-4o",
+        choices=[Choice(index=0, delta=ChoiceDelta(role="assistant", content=TOKEN))],
+    )
+    for _ in range(NUM_TOKENS)
+]
+
+
+class LocalOpenAIChat(OpenAIChat):
+    """OpenAIChat that streams the prebuilt CHUNKS instead of calling the API"""
+
+    def invoke_stream(self, messages: List[Message]) -> Iterator[Any]:
+        yield from CHUNKS
+
+
+agent = Agent(model=LocalOpenAIChat(api_key="test"), system_message="Be concise.", telemetry=False, monitoring=False)
+
+
+def stream_response():
+    for _ in agent.run("Write a long story.", stream=True):
+        pass
+    assert len(agent.run_response.content) == NUM_TOKENS * len(TOKEN)
+
+
+def stream_chunks() -> Iterator[ModelResponse]:
+    return agent.model.response_stream(messages=[Message(role="user", content="Write a long story.")])  # type: ignore
+
+
+def old_agent_loop():
+    """The agent's streaming loop before StreamBuffer: a str += and a new RunResponse per chunk"""
+    model_response = ModelResponse(content="")
+    for chunk in stream_chunks():
+        if chunk.event == ModelResponseEvent.assistant_response.value and chunk.content is not None:
+            model_response.content += chunk.content
+            agent.create_run_response(content=chunk.content, created_at=chunk.created_at)
+    assert len(model_response.content) == NUM_TOKENS * len(TOKEN)
+
+
+def new_agent_loop():
+    """The agent's streaming loop: a StreamBuffer and a copy of a RunResponse template per chunk"""
+    content_buffer = StreamBuffer()
+    chunk_template: Optional[RunResponse] = None
+    for chunk in stream_chunks():
+        if chunk.event == ModelResponseEvent.assistant_response.value and chunk.content is not None:
+            content_buffer.append(chunk.content)
+            if chunk_template is None:
+                chunk_template = agent.create_run_response()
+            chunk_template.copy_with_content(content=chunk.content, created_at=chunk.created_at)
+    assert len(content_buffer.getvalue()) == NUM_TOKENS * len(TOKEN)
+
+
+@dataclass
+class StrStreamData:
+    response_content: str = ""
+
+
+def accumulate_in_str():
+    # CPython can extend a local str in place, an attribute is copied on every += like in the old StreamData
+    stream_data = StrStreamData()
+    for _ in range(NUM_TOKENS):
+        stream_data.response_content += TOKEN
+    return stream_data.response_content
+
+
+def accumulate_in_buffer():
+    buffer = StreamBuffer()
+    for _ in range(NUM_TOKENS):
+        buffer.append(TOKEN)
+    return buffer.getvalue()
+
+
+response_streaming_perf = PerfEval(func=stream_response, num_iterations=20)
+
+if __name__ == "__main__":
+    result = response_streaming_perf.run(print_results=True)
+    print(f"Per-token overhead of Agent.run(stream=True): {result.avg_run_time / NUM_TOKENS * 1e6:.2f}us")
+
+    # Both loops consume the same OpenAIChat stream, the difference is the agent's own work per chunk
+    for benchmark in (old_agent_loop, new_agent_loop, accumulate_in_str, accumulate_in_buffer):
+        seconds = timeit(benchmark, number=20) / 20
+        print(f"{benchmark.__name__}: {seconds / NUM_TOKENS * 1e6:.3f}us per token")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections import ChainMap, defaultdict, deque
 from dataclasses import dataclass
 from os import getenv
@@ -14,6 +15,7 @@ from typing import (
     Literal,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
     cast,
@@ -26,7 +28,8 @@ from pydantic import BaseModel
 from agno.exceptions import AgentRunException, StopAgentRun
 from agno.knowledge.agent import AgentKnowledge
 from agno.media import Audio, AudioArtifact, Image, ImageArtifact, Video, VideoArtifact
-from agno.memory.agent import AgentMemory, AgentRun
+from agno.memory.agent import AgentMemory, AgentRun, MemoryRetrieval
+from agno.memory.executor import MemoryExecutor, get_default_memory_executor
 from agno.models.base import Model
 from agno.models.message import Message, MessageReferences
 from agno.models.response import ModelResponse, ModelResponseEvent
@@ -40,6 +43,7 @@ from agno.tools.toolkit import Toolkit
 from agno.utils.log import logger, set_log_level_to_debug, set_log_level_to_info
 from agno.utils.message import get_text_from_message
 from agno.utils.safe_formatter import SafeFormatter
+from agno.utils.stream import StreamBuffer
 from agno.utils.timer import Timer
 
 
@@ -81,6 +85,12 @@ class Agent:
     add_history_to_messages: bool = False
     # Number of historical responses to add to the messages.
     num_history_responses: int = 3
+    # If True, update the user memories and the session summary after the response is returned.
+    # Updates for a session run in order and the next run on the session waits for them before reading it.
+    # Use flush_memory_updates() to wait for them.
+    defer_memory_updates: bool = False
+    # Executor for deferred memory updates, defaults to an executor shared by all agents
+    memory_executor: Optional[MemoryExecutor] = None
 
     # --- Agent Knowledge ---
     knowledge: Optional[AgentKnowledge] = None
@@ -242,6 +252,8 @@ class Agent:
     agent_session: Optional[AgentSession] = None
 
     _formatter: Optional[SafeFormatter] = None
+    # The session memory last loaded into or written from self.memory, used to skip rebuilding an unchanged memory
+    _loaded_memory: Optional[Tuple[Dict[str, Any], AgentMemory]] = None
 
     def __init__(
         self,
@@ -260,6 +272,8 @@ class Agent:
         memory: Optional[AgentMemory] = None,
         add_history_to_messages: bool = False,
         num_history_responses: int = 3,
+        defer_memory_updates: bool = False,
+        memory_executor: Optional[MemoryExecutor] = None,
         knowledge: Optional[AgentKnowledge] = None,
         add_references: bool = False,
         retriever: Optional[Callable[..., Optional[List[Dict]]]] = None,
@@ -332,6 +346,8 @@ class Agent:
         self.memory = memory
         self.add_history_to_messages = add_history_to_messages
         self.num_history_responses = num_history_responses
+        self.defer_memory_updates = defer_memory_updates
+        self.memory_executor = memory_executor
 
         self.knowledge = knowledge
         self.add_references = add_references
@@ -408,6 +424,7 @@ class Agent:
 
         self.agent_session = None
         self._formatter = None
+        self._loaded_memory = None
 
     def set_agent_id(self) -> str:
         if self.agent_id is None:
@@ -504,6 +521,8 @@ class Agent:
 
         # 3. Read existing session from storage
         self.read_from_storage()
+        # 3.1 Retrieve the user memories relevant to this message
+        self.retrieve_user_memories(message)
 
         # 4. Prepare run messages
         run_messages: RunMessages = self.get_run_messages(
@@ -534,19 +553,25 @@ class Agent:
         self.model = cast(Model, self.model)
         if self.stream:
             model_response = ModelResponse(content="")
+            content_buffer = StreamBuffer()
+            chunk_template: Optional[RunResponse] = None
             for model_response_chunk in self.model.response_stream(messages=run_messages.messages):
                 # If the model response is an assistant_response, yield a RunResponse with the content
                 if model_response_chunk.event == ModelResponseEvent.assistant_response.value:
-                    if model_response_chunk.content is not None and model_response.content is not None:
-                        model_response.content += model_response_chunk.content
+                    if model_response_chunk.content is not None:
+                        content_buffer.append(model_response_chunk.content)
                         # Update the run_response with the content
                         self.run_response.content = model_response_chunk.content
                         self.run_response.created_at = model_response_chunk.created_at
-                        yield self.create_run_response(
+                        # Copy the fields shared by all content chunks from a template, rebuilt after tool calls
+                        if chunk_template is None:
+                            chunk_template = self.create_run_response()
+                        yield chunk_template.copy_with_content(
                             content=model_response_chunk.content, created_at=model_response_chunk.created_at
                         )
                 # If the model response is a tool_call_started, add the tool call to the run_response
                 elif model_response_chunk.event == ModelResponseEvent.tool_call_started.value:
+                    chunk_template = None
                     # Add tool calls to the run_response
                     tool_calls_list = model_response_chunk.tool_calls
                     if tool_calls_list is not None:
@@ -565,6 +590,7 @@ class Agent:
 
                 # If the model response is a tool_call_completed, update the existing tool call in the run_response
                 elif model_response_chunk.event == ModelResponseEvent.tool_call_completed.value:
+                    chunk_template = None
                     tool_calls_list = model_response_chunk.tool_calls
                     if tool_calls_list is not None:
                         # Update the existing tool call in the run_response
@@ -587,6 +613,7 @@ class Agent:
                                 content=model_response_chunk.content,
                                 event=RunEvent.tool_call_completed,
                             )
+            model_response.content = content_buffer.getvalue()
         else:
             # Get the model response
             model_response = self.model.response(messages=run_messages.messages)
@@ -658,13 +685,14 @@ class Agent:
         # Create an AgentRun object to add to memory
         agent_run = AgentRun(response=self.run_response)
         agent_run.message = run_messages.user_message
-        # Update the memories with the user message if needed
+        # Collect the inputs to update the user memories with
+        memory_inputs: List[str] = []
         if (
             self.memory.create_user_memories
             and self.memory.update_user_memories_after_run
             and run_messages.user_message is not None
         ):
-            self.memory.update_memory(input=run_messages.user_message.get_content_string())
+            memory_inputs.append(run_messages.user_message.get_content_string())
         if messages is not None and len(messages) > 0:
             for _im in messages:
                 # Parse the message and convert to a Message object if possible
@@ -686,17 +714,29 @@ class Agent:
                         agent_run.messages = []
                     agent_run.messages.append(mp)
                     if self.memory.create_user_memories and self.memory.update_user_memories_after_run:
-                        self.memory.update_memory(input=mp.get_content_string())
+                        memory_inputs.append(mp.get_content_string())
                 else:
                     logger.warning("Unable to add message to memory")
         # Add AgentRun to memory
         self.memory.add_run(agent_run)
-        # Update the session summary if needed
-        if self.memory.create_session_summary and self.memory.update_session_summary_after_run:
-            self.memory.update_summary()
+        # Update the user memories and the session summary if needed
+        update_summary = (
+            self.memory.create_session_summary
+            and self.memory.update_session_summary_after_run
+            and self.memory.should_update_summary()
+        )
+        defer_memory_update = self.defer_memory_updates and (len(memory_inputs) > 0 or update_summary)
+        if not defer_memory_update:
+            self.update_memory_after_run(memory_inputs, update_summary)
 
         # 10. Save session to storage
         self.write_to_storage()
+        if defer_memory_update:
+            # Update a snapshot of the memory after the response is returned and save it to this session
+            session, memory = self.get_memory_update_snapshot()
+            self.get_memory_executor().submit(
+                session.session_id, self.update_memory_after_run, memory_inputs, update_summary, memory, session
+            )
 
         # 11. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=message)
@@ -932,11 +972,23 @@ class Agent:
             self.resolve_run_context()
 
         # 3. Read existing session from storage
-        self.read_from_storage()
+        await self.aread_from_storage()
+        # 3.1 Retrieve the user memories relevant to this message
+        await self.aretrieve_user_memories(message)
 
         # 4. Prepare run messages
+        # Retrieve references from the knowledge base without blocking the event loop
+        references: Optional[MessageReferences] = None
+        if self.add_references and isinstance(message, str) and message:
+            references = await self.aget_references_from_knowledge(query=message, **kwargs)
         run_messages: RunMessages = self.get_run_messages(
-            message=message, audio=audio, images=images, videos=videos, messages=messages, **kwargs
+            message=message,
+            audio=audio,
+            images=images,
+            videos=videos,
+            messages=messages,
+            references=references,
+            **kwargs,
         )
         self.run_messages = run_messages
 
@@ -964,20 +1016,26 @@ class Agent:
         self.model = cast(Model, self.model)
         if stream and self.is_streamable:
             model_response = ModelResponse(content="")
+            content_buffer = StreamBuffer()
+            chunk_template: Optional[RunResponse] = None
             model_response_stream = self.model.aresponse_stream(messages=run_messages.messages)  # type: ignore
             async for model_response_chunk in model_response_stream:  # type: ignore
                 # If the model response is an assistant_response, yield a RunResponse with the content
                 if model_response_chunk.event == ModelResponseEvent.assistant_response.value:
-                    if model_response_chunk.content is not None and model_response.content is not None:
-                        model_response.content += model_response_chunk.content
+                    if model_response_chunk.content is not None:
+                        content_buffer.append(model_response_chunk.content)
                         # Update the run_response with the content
                         self.run_response.content = model_response_chunk.content
                         self.run_response.created_at = model_response_chunk.created_at
-                        yield self.create_run_response(
+                        # Copy the fields shared by all content chunks from a template, rebuilt after tool calls
+                        if chunk_template is None:
+                            chunk_template = self.create_run_response()
+                        yield chunk_template.copy_with_content(
                             content=model_response_chunk.content, created_at=model_response_chunk.created_at
                         )
                 # If the model response is a tool_call_started, add the tool call to the run_response
                 elif model_response_chunk.event == ModelResponseEvent.tool_call_started.value:
+                    chunk_template = None
                     # Add tool calls to the run_response
                     tool_calls_list = model_response_chunk.tool_calls
                     if tool_calls_list is not None:
@@ -995,6 +1053,7 @@ class Agent:
                         )
                 # If the model response is a tool_call_completed, update the existing tool call in the run_response
                 elif model_response_chunk.event == ModelResponseEvent.tool_call_completed.value:
+                    chunk_template = None
                     tool_calls_list = model_response_chunk.tool_calls
                     if tool_calls_list is not None:
                         # Update the existing tool call in the run_response
@@ -1017,6 +1076,7 @@ class Agent:
                             content=model_response_chunk.content,
                             event=RunEvent.tool_call_completed,
                         )
+            model_response.content = content_buffer.getvalue()
         else:
             # Get the model response
             model_response = await self.model.aresponse(messages=run_messages.messages)
@@ -1086,13 +1146,14 @@ class Agent:
         # Create an AgentRun object to add to memory
         agent_run = AgentRun(response=self.run_response)
         agent_run.message = run_messages.user_message
-        # Update the memories with the user message if needed
+        # Collect the inputs to update the user memories with
+        memory_inputs: List[str] = []
         if (
             self.memory.create_user_memories
             and self.memory.update_user_memories_after_run
             and run_messages.user_message is not None
         ):
-            await self.memory.aupdate_memory(input=run_messages.user_message.get_content_string())
+            memory_inputs.append(run_messages.user_message.get_content_string())
         if messages is not None and len(messages) > 0:
             for _im in messages:
                 # Parse the message and convert to a Message object if possible
@@ -1114,17 +1175,29 @@ class Agent:
                         agent_run.messages = []
                     agent_run.messages.append(mp)
                     if self.memory.create_user_memories and self.memory.update_user_memories_after_run:
-                        await self.memory.aupdate_memory(input=mp.get_content_string())
+                        memory_inputs.append(mp.get_content_string())
                 else:
                     logger.warning("Unable to add message to memory")
         # Add AgentRun to memory
         self.memory.add_run(agent_run)
-        # Update the session summary if needed
-        if self.memory.create_session_summary and self.memory.update_session_summary_after_run:
-            await self.memory.aupdate_summary()
+        # Update the user memories and the session summary if needed
+        update_summary = (
+            self.memory.create_session_summary
+            and self.memory.update_session_summary_after_run
+            and self.memory.should_update_summary()
+        )
+        defer_memory_update = self.defer_memory_updates and (len(memory_inputs) > 0 or update_summary)
+        if not defer_memory_update:
+            await self.aupdate_memory_after_run(memory_inputs, update_summary)
 
         # 10. Save session to storage
-        self.write_to_storage()
+        await self.awrite_to_storage()
+        if defer_memory_update:
+            # Update a snapshot of the memory after the response is returned and save it to this session
+            session, memory = self.get_memory_update_snapshot()
+            self.get_memory_executor().asubmit(
+                session.session_id, self.aupdate_memory_after_run, memory_inputs, update_summary, memory, session
+            )
 
         # 11. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=message)
@@ -1323,14 +1396,14 @@ class Agent:
         if self.read_tool_call_history:
             tools.append(self.get_tool_call_history)
         if self.memory and self.memory.create_user_memories:
-            tools.append(self.update_memory)
+            tools.append(self.get_sequential_function(self.update_memory))
 
         # Add tools for accessing knowledge
         if self.knowledge is not None or self.retriever is not None:
             if self.search_knowledge:
-                tools.append(self.search_knowledge_base)
+                tools.append(self.get_sequential_function(self.search_knowledge_base))
             if self.update_knowledge:
-                tools.append(self.add_to_knowledge)
+                tools.append(self.get_sequential_function(self.add_to_knowledge))
 
         # Add transfer tools
         if self.team is not None and len(self.team) > 0:
@@ -1339,6 +1412,10 @@ class Agent:
 
         return tools
 
+    def get_sequential_function(self, tool: Callable) -> Function:
+        """Returns a Function for a tool that changes the state of the agent, so it never runs in parallel"""
+        return Function(name=tool.__name__, entrypoint=tool, run_in_parallel=False)
+
     def update_model(self) -> None:
         # Use the default Model (OpenAIChat) if no model is provided
         if self.model is None:
@@ -1415,6 +1492,9 @@ class Agent:
     def load_user_memories(self) -> None:
         self.memory = cast(AgentMemory, self.memory)
         if self.memory and self.memory.create_user_memories:
+            if self.memory.retrieval == MemoryRetrieval.semantic:
+                # The memories relevant to each message are retrieved when the run starts
+                return
             if self.user_id is not None:
                 self.memory.user_id = self.user_id
 
@@ -1424,6 +1504,36 @@ class Agent:
             else:
                 logger.debug("Memories loaded")
 
+    def get_memory_retrieval_query(self, message: Optional[Union[str, List, Dict, Message]]) -> Optional[str]:
+        """Returns the query for semantic retrieval of user memories, or None if it is not used."""
+        self.memory = cast(AgentMemory, self.memory)
+        if not self.memory.create_user_memories or self.memory.retrieval != MemoryRetrieval.semantic:
+            return None
+        if isinstance(message, Message):
+            message = message.content
+        if isinstance(message, str) and message:
+            return message
+        return None
+
+    def retrieve_user_memories(self, message: Optional[Union[str, List, Dict, Message]]) -> None:
+        """Load the user memories most relevant to the message into the system prompt, for semantic retrieval.
+        Without a text message, the latest memories are loaded.
+        """
+        self.memory = cast(AgentMemory, self.memory)
+        if not self.memory.create_user_memories or self.memory.retrieval != MemoryRetrieval.semantic:
+            return
+        if self.user_id is not None:
+            self.memory.user_id = self.user_id
+        self.memory.load_user_memories(query=self.get_memory_retrieval_query(message))
+
+    async def aretrieve_user_memories(self, message: Optional[Union[str, List, Dict, Message]]) -> None:
+        self.memory = cast(AgentMemory, self.memory)
+        if not self.memory.create_user_memories or self.memory.retrieval != MemoryRetrieval.semantic:
+            return
+        if self.user_id is not None:
+            self.memory.user_id = self.user_id
+        await self.memory.aload_user_memories(query=self.get_memory_retrieval_query(message))
+
     def get_agent_data(self) -> Dict[str, Any]:
         agent_data: Dict[str, Any] = {}
         if self.name is not None:
@@ -1557,16 +1667,25 @@ class Agent:
             else:
                 raise TypeError(f"Expected memory to be a dict or AgentMemory, but got {type(self.memory)}")
 
-        if session.memory is not None:
+        if (
+            session.memory is not None
+            and self._loaded_memory is not None
+            and self._loaded_memory[0] is session.memory
+            and self._loaded_memory[1] is self.memory
+        ):
+            # The memory was not written by anyone else since this agent loaded or wrote it (e.g. it was served by
+            # CachedAgentStorage), so self.memory is already up to date
+            logger.debug(f"-*- AgentSession memory unchanged: {session.session_id}")
+        elif session.memory is not None:
             try:
                 if "runs" in session.memory:
                     try:
-                        self.memory.runs = [AgentRun(**m) for m in session.memory["runs"]]
+                        self.memory.set_runs(session.memory["runs"])
                     except Exception as e:
                         logger.warning(f"Failed to load runs from memory: {e}")
                 if "messages" in session.memory:
                     try:
-                        self.memory.messages = [Message(**m) for m in session.memory["messages"]]
+                        self.memory.set_messages(session.memory["messages"])
                     except Exception as e:
                         logger.warning(f"Failed to load messages from memory: {e}")
                 if "summary" in session.memory:
@@ -1574,6 +1693,8 @@ class Agent:
                         self.memory.summary = SessionSummary(**session.memory["summary"])
                     except Exception as e:
                         logger.warning(f"Failed to load session summary from memory: {e}")
+                if "summarized_runs" in session.memory:
+                    self.memory.summarized_runs = session.memory["summarized_runs"]
                 if "memories" in session.memory:
                     try:
                         self.memory.memories = [Memory(**m) for m in session.memory["memories"]]
@@ -1581,6 +1702,7 @@ class Agent:
                         logger.warning(f"Failed to load user memories: {e}")
             except Exception as e:
                 logger.warning(f"Failed to load AgentMemory: {e}")
+            self._loaded_memory = (session.memory, self.memory)
         logger.debug(f"-*- AgentSession loaded: {session.session_id}")
 
     def read_from_storage(self) -> Optional[AgentSession]:
@@ -1590,12 +1712,29 @@ class Agent:
             Optional[AgentSession]: The loaded AgentSession or None if not found.
         """
         if self.storage is not None and self.session_id is not None:
+            # Deferred memory updates of the session are saved before it is read
+            self.flush_memory_updates()
             self.agent_session = self.storage.read(session_id=self.session_id)
             if self.agent_session is not None:
                 self.load_agent_session(session=self.agent_session)
             self.load_user_memories()
         return self.agent_session
 
+    async def aread_from_storage(self) -> Optional[AgentSession]:
+        """Load the AgentSession from storage without blocking the event loop
+
+        Returns:
+            Optional[AgentSession]: The loaded AgentSession or None if not found.
+        """
+        if self.storage is not None and self.session_id is not None:
+            # Deferred memory updates of the session are saved before it is read
+            await self.aflush_memory_updates()
+            self.agent_session = await self.storage.aread(session_id=self.session_id)
+            if self.agent_session is not None:
+                self.load_agent_session(session=self.agent_session)
+            self.load_user_memories()
+        return self.agent_session
+
     def write_to_storage(self) -> Optional[AgentSession]:
         """Save the AgentSession to storage
 
@@ -1604,15 +1743,165 @@ class Agent:
         """
         if self.storage is not None:
             self.agent_session = self.storage.upsert(session=self.get_agent_session())
+            self._set_loaded_memory()
         return self.agent_session
 
+    async def awrite_to_storage(self) -> Optional[AgentSession]:
+        """Save the AgentSession to storage without blocking the event loop
+
+        Returns:
+            Optional[AgentSession]: The saved AgentSession or None if not saved.
+        """
+        if self.storage is not None:
+            self.agent_session = await self.storage.aupsert(session=self.get_agent_session())
+            self._set_loaded_memory()
+        return self.agent_session
+
+    def _set_loaded_memory(self) -> None:
+        """Remember the memory of the written AgentSession, it holds the same runs and messages as self.memory"""
+        if self.agent_session is not None and self.agent_session.memory is not None:
+            self._loaded_memory = (self.agent_session.memory, cast(AgentMemory, self.memory))
+        else:
+            self._loaded_memory = None
+
+    def get_memory_executor(self) -> MemoryExecutor:
+        if self.memory_executor is None:
+            self.memory_executor = get_default_memory_executor()
+        return self.memory_executor
+
+    def get_memory_update_snapshot(self) -> Tuple[AgentSession, AgentMemory]:
+        """Returns a snapshot of the current session and its memory, for a memory update after the response.
+
+        The update changes the copy of the memory and saves it to the session of the snapshot, so the agent can
+        start the next run or load another session while the update runs.
+        """
+        from copy import deepcopy
+
+        self.memory = cast(AgentMemory, self.memory)
+        memory = self.memory.model_copy(
+            update={
+                "runs": list(self.memory.runs),
+                "messages": list(self.memory.messages),
+                "evicted_runs": list(self.memory.evicted_runs),
+                "evicted_messages": list(self.memory.evicted_messages),
+                "memories": list(self.memory.memories) if self.memory.memories is not None else None,
+                # The classifier and manager are set up for the user of each update
+                "classifier": self.memory.classifier.model_copy() if self.memory.classifier is not None else None,
+                "manager": self.memory.manager.model_copy() if self.memory.manager is not None else None,
+            }
+        )
+        session = AgentSession(
+            session_id=cast(str, self.session_id),
+            agent_id=self.agent_id,
+            user_id=self.user_id,
+            agent_data=self.get_agent_data(),
+            session_data=deepcopy(self.get_session_data()),
+            extra_data=deepcopy(self.extra_data),
+        )
+        return session, memory
+
+    def update_memory_after_run(
+        self,
+        memory_inputs: List[str],
+        update_summary: bool,
+        memory: Optional[AgentMemory] = None,
+        session: Optional[AgentSession] = None,
+    ) -> None:
+        """Update the user memories with the inputs of a run and the session summary if needed
+
+        Args:
+            memory_inputs: The messages of the run to update the user memories with.
+            update_summary: Update the session summary.
+            memory: The memory to update, defaults to the memory of the agent.
+            session: Save the updated memory to this session, used when the update runs after the response.
+        """
+        if memory is None:
+            memory = cast(AgentMemory, self.memory)
+        for memory_input in memory_inputs:
+            memory.update_memory(input=memory_input)
+        if update_summary:
+            memory.update_summary()
+        if session is not None:
+            if self.storage is not None:
+                # Runs added to the session while the update ran are kept
+                stored_session = self.storage.read(session_id=session.session_id)
+                self.storage.upsert(session=self.merge_memory_update(memory, session, stored_session))
+            self.apply_memory_update(memory, session)
+
+    async def aupdate_memory_after_run(
+        self,
+        memory_inputs: List[str],
+        update_summary: bool,
+        memory: Optional[AgentMemory] = None,
+        session: Optional[AgentSession] = None,
+    ) -> None:
+        """Update the user memories with the inputs of a run and the session summary if needed"""
+        if memory is None:
+            memory = cast(AgentMemory, self.memory)
+        for memory_input in memory_inputs:
+            await memory.aupdate_memory(input=memory_input)
+        if update_summary:
+            await memory.aupdate_summary()
+        if session is not None:
+            if self.storage is not None:
+                stored_session = await self.storage.aread(session_id=session.session_id)
+                await self.storage.aupsert(session=self.merge_memory_update(memory, session, stored_session))
+            self.apply_memory_update(memory, session)
+
+    def merge_memory_update(
+        self, memory: AgentMemory, session: AgentSession, stored_session: Optional[AgentSession]
+    ) -> AgentSession:
+        """Returns the stored session with the summary and user memories of an updated snapshot
+
+        Args:
+            memory: The updated snapshot of the memory.
+            session: The session of the snapshot, saved with the whole snapshot if the session is not stored.
+            stored_session: The latest session in storage, it may hold runs added after the snapshot.
+        """
+        if stored_session is None or stored_session.memory is None:
+            session.memory = memory.to_dict()
+            return session
+        merged_memory = dict(stored_session.memory)
+        # Keep a summary of more runs written by a later update
+        if memory.summary is not None and memory.summarized_runs >= merged_memory.get("summarized_runs", 0):
+            merged_memory["summary"] = memory.summary.to_dict()
+            merged_memory["summarized_runs"] = memory.summarized_runs
+        if memory.memories is not None:
+            merged_memory["memories"] = [m.to_dict() for m in memory.memories]
+        stored_session.memory = merged_memory
+        return stored_session
+
+    def apply_memory_update(self, memory: AgentMemory, session: AgentSession) -> None:
+        """Copy the summary and user memories of an updated snapshot to the agent, if it is still on that session"""
+        if self.session_id != session.session_id or not isinstance(self.memory, AgentMemory):
+            return
+        self.memory.set_summary(memory.summary, memory.summarized_runs)
+        if memory.memories is not None:
+            self.memory.memories = memory.memories
+
+    def flush_memory_updates(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the deferred memory updates of this session to finish
+
+        Returns:
+            bool: True if all updates finished, False if the timeout expired first.
+        """
+        # Copies of the agent and other agents may have submitted updates of this session to the default executor
+        if self.memory_executor is None and not self.defer_memory_updates:
+            return True
+        return self.get_memory_executor().flush(key=self.session_id or "", timeout=timeout)
+
+    async def aflush_memory_updates(self) -> None:
+        """Wait for the deferred memory updates of this session to finish"""
+        if self.memory_executor is not None or self.defer_memory_updates:
+            await self.get_memory_executor().aflush(key=self.session_id or "")
+
     def add_introduction(self, introduction: str) -> None:
         """Add an introduction to the chat history"""
 
         self.memory = cast(AgentMemory, self.memory)
         if introduction is not None:
             # Add an introduction as the first response from the Agent
-            if len(self.memory.runs) == 0:
+            if self.memory.get_num_runs() == 0:
                 self.memory.add_run(
                     AgentRun(
                         response=RunResponse(
@@ -1666,6 +1955,7 @@ class Agent:
         - Load the new session
         """
         self.agent_session = None
+        self._loaded_memory = None
         if self.model is not None:
             self.model.clear()
         if self.memory is not None:
@@ -1946,6 +2236,7 @@ class Agent:
         audio: Optional[Sequence[Audio]] = None,
         images: Optional[Sequence[Image]] = None,
         videos: Optional[Sequence[Video]] = None,
+        references: Optional[MessageReferences] = None,
         **kwargs: Any,
     ) -> Optional[Message]:
         """Return the user message for the Agent.
@@ -1953,11 +2244,12 @@ class Agent:
         1. If the user_message is provided, use that.
         2. If create_default_user_message is False or if the message is a list, return the message as is.
         3. Build the default user message for the Agent
+
+        If references are provided (e.g. retrieved asynchronously), the knowledge base is not searched again.
         """
         # Get references from the knowledge base to use in the user message
-        references = None
         self.run_response = cast(RunResponse, self.run_response)
-        if self.add_references and message:
+        if references is None and self.add_references and message:
             message_str: str
             if isinstance(message, str):
                 message_str = message
@@ -1973,12 +2265,7 @@ class Agent:
                 references = MessageReferences(
                     query=message_str, references=docs_from_knowledge, time=round(retrieval_timer.elapsed, 4)
                 )
-                # Add the references to the run_response
-                if self.run_response.extra_data is None:
-                    self.run_response.extra_data = RunResponseExtraData()
-                if self.run_response.extra_data.references is None:
-                    self.run_response.extra_data.references = []
-                self.run_response.extra_data.references.append(references)
+                self.add_references_to_run_response(references)
             retrieval_timer.stop()
             logger.debug(f"Time to get references: {retrieval_timer.elapsed:.4f}s")
 
@@ -2056,6 +2343,7 @@ class Agent:
         images: Optional[Sequence[Image]] = None,
         videos: Optional[Sequence[Video]] = None,
         messages: Optional[Sequence[Union[Dict, Message]]] = None,
+        references: Optional[MessageReferences] = None,
         **kwargs: Any,
     ) -> RunMessages:
         """This function returns a RunMessages object with the following attributes:
@@ -2142,7 +2430,9 @@ class Agent:
         user_message: Optional[Message] = None
         # 4.1 Build user message if message is None, str or list
         if message is None or isinstance(message, str) or isinstance(message, list):
-            user_message = self.get_user_message(message=message, audio=audio, images=images, videos=videos, **kwargs)
+            user_message = self.get_user_message(
+                message=message, audio=audio, images=images, videos=videos, references=references, **kwargs
+            )
         # 4.2 If message is provided as a Message, use it directly
         elif isinstance(message, Message):
             user_message = message
@@ -2188,7 +2478,7 @@ class Agent:
         from dataclasses import fields
 
         # Do not copy agent_session and session_name to the new agent
-        excluded_fields = ["agent_session", "session_name", "memory"]
+        excluded_fields = ["agent_session", "session_name", "memory", "_loaded_memory"]
         # Extract the fields to set for the new Agent
         fields_for_new_agent: Dict[str, Any] = {}
 
@@ -2331,6 +2621,8 @@ class Agent:
 
         transfer_function = Function.from_callable(_transfer_task_to_agent)
         transfer_function.name = f"transfer_task_to_{agent_name}"
+        # Transfers run the member agent, which is shared by all calls and not thread-safe
+        transfer_function.run_in_parallel = False
         transfer_function.description = dedent(f"""\
         Use this function to transfer a task to {agent_name}
         You must provide a clear and concise description of the task the agent should achieve AND the expected output.
@@ -2399,6 +2691,61 @@ class Agent:
             return None
         return [doc.to_dict() for doc in relevant_docs]
 
+    async def aget_relevant_docs_from_knowledge(
+        self, query: str, num_documents: Optional[int] = None, **kwargs
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return a list of references from the knowledge base without blocking the event loop"""
+        from agno.document import Document
+
+        if self.retriever is not None and callable(self.retriever):
+            from inspect import iscoroutinefunction, signature
+
+            try:
+                sig = signature(self.retriever)
+                retriever_kwargs: Dict[str, Any] = {}
+                if "agent" in sig.parameters:
+                    retriever_kwargs = {"agent": self}
+                retriever_kwargs.update({"query": query, "num_documents": num_documents, **kwargs})
+                if iscoroutinefunction(self.retriever):
+                    return await self.retriever(**retriever_kwargs)
+                return await asyncio.to_thread(self.retriever, **retriever_kwargs)
+            except Exception as e:
+                logger.warning(f"Retriever failed: {e}")
+                return None
+
+        if self.knowledge is None:
+            return None
+
+        relevant_docs: List[Document] = await self.knowledge.async_search(
+            query=query, num_documents=num_documents, **kwargs
+        )
+        if len(relevant_docs) == 0:
+            return None
+        return [doc.to_dict() for doc in relevant_docs]
+
+    async def aget_references_from_knowledge(self, query: str, **kwargs) -> MessageReferences:
+        """Retrieve references for a query without blocking the event loop and add them to the run_response"""
+        retrieval_timer = Timer()
+        retrieval_timer.start()
+        docs_from_knowledge = await self.aget_relevant_docs_from_knowledge(query=query, **kwargs)
+        references = MessageReferences(
+            query=query, references=docs_from_knowledge, time=round(retrieval_timer.elapsed, 4)
+        )
+        if docs_from_knowledge is not None:
+            self.add_references_to_run_response(references)
+        retrieval_timer.stop()
+        logger.debug(f"Time to get references: {retrieval_timer.elapsed:.4f}s")
+        return references
+
+    def add_references_to_run_response(self, references: MessageReferences) -> None:
+        """Add references from the knowledge base to the run_response"""
+        self.run_response = cast(RunResponse, self.run_response)
+        if self.run_response.extra_data is None:
+            self.run_response.extra_data = RunResponseExtraData()
+        if self.run_response.extra_data.references is None:
+            self.run_response.extra_data.references = []
+        self.run_response.extra_data.references.append(references)
+
     def convert_documents_to_string(self, docs: List[Dict[str, Any]]) -> str:
         if docs is None or len(docs) == 0:
             return ""
@@ -3023,12 +3370,7 @@ class Agent:
             references = MessageReferences(
                 query=query, references=docs_from_knowledge, time=round(retrieval_timer.elapsed, 4)
             )
-            # Add the references to the run_response
-            if self.run_response.extra_data is None:
-                self.run_response.extra_data = RunResponseExtraData()
-            if self.run_response.extra_data.references is None:
-                self.run_response.extra_data.references = []
-            self.run_response.extra_data.references.append(references)
+            self.add_references_to_run_response(references)
         retrieval_timer.stop()
         logger.debug(f"Time to get references: {retrieval_timer.elapsed:.4f}s")
 
@@ -3088,16 +3430,11 @@ class Agent:
         if not (self.telemetry or self.monitoring):
             return
 
-        from agno.api.agent import AgentSessionCreate, create_agent_session
+        from agno.api.agent import create_agent_session
 
         try:
-            agent_session: AgentSession = self.agent_session or self.get_agent_session()
             create_agent_session(
-                session=AgentSessionCreate(
-                    session_id=agent_session.session_id,
-                    agent_data=agent_session.monitoring_data() if self.monitoring else agent_session.telemetry_data(),
-                ),
-                monitor=self.monitoring,
+                session=self._get_agent_session_create(), monitor=self.monitoring, session_id=self.session_id
             )
         except Exception as e:
             logger.debug(f"Could not create agent monitor: {e}")
@@ -3106,22 +3443,57 @@ class Agent:
         if not (self.telemetry or self.monitoring):
             return
 
-        from agno.api.agent import AgentSessionCreate, acreate_agent_session
+        from agno.api.agent import acreate_agent_session
 
         try:
-            agent_session: AgentSession = self.agent_session or self.get_agent_session()
             await acreate_agent_session(
-                session=AgentSessionCreate(
-                    session_id=agent_session.session_id,
-                    agent_data=agent_session.monitoring_data() if self.monitoring else agent_session.telemetry_data(),
-                ),
-                monitor=self.monitoring,
+                session=self._get_agent_session_create(), monitor=self.monitoring, session_id=self.session_id
             )
         except Exception as e:
             logger.debug(f"Could not create agent monitor: {e}")
 
-    def _create_run_data(self) -> Dict[str, Any]:
-        """Create and return the run data dictionary."""
+    def _get_monitored_agent_session(self) -> AgentSession:
+        """Returns the AgentSession to report. Without a stored session, memory is only serialized for monitoring."""
+        if self.agent_session is not None:
+            return self.agent_session
+        if self.monitoring:
+            return self.get_agent_session()
+        return AgentSession(
+            session_id=cast(str, self.session_id),
+            agent_id=self.agent_id,
+            user_id=self.user_id,
+            agent_data=self.get_agent_data(),
+        )
+
+    def _get_agent_data_factory(self) -> Callable[[], Dict[str, Any]]:
+        """Returns a function that builds the agent data of the session from what the session is now.
+
+        The stored session is replaced, not changed, on every write, so it is captured by reference.
+        """
+        agent_session = self._get_monitored_agent_session()
+        monitoring = self.monitoring
+
+        def get_agent_data() -> Dict[str, Any]:
+            return agent_session.monitoring_data() if monitoring else agent_session.telemetry_data()
+
+        return get_agent_data
+
+    def _get_agent_session_create(self) -> Callable[[], Any]:
+        """Returns a function that builds the AgentSessionCreate on the telemetry exporter's thread"""
+        from agno.api.agent import AgentSessionCreate
+
+        session_id = cast(str, self.session_id)
+        get_agent_data = self._get_agent_data_factory()
+        return lambda: AgentSessionCreate(session_id=session_id, agent_data=get_agent_data())
+
+    def _get_run_data_factory(self) -> Callable[[], Dict[str, Any]]:
+        """Returns a function that creates the run data dictionary from a snapshot of the run.
+
+        Only references and small copies are taken here. Serializing the run response and functions is done by
+        the returned function, on the telemetry exporter's thread.
+        """
+        from copy import deepcopy
+
         run_response_format = "text"
         self.run_response = cast(RunResponse, self.run_response)
         if self.response_model is not None:
@@ -3129,27 +3501,43 @@ class Agent:
         elif self.markdown:
             run_response_format = "markdown"
 
-        functions = {}
+        functions: List[Function] = []
         if self.model is not None and self.model._functions is not None:
-            functions = {
-                f_name: func.to_dict() for f_name, func in self.model._functions.items() if isinstance(func, Function)
+            functions = [func for func in self.model._functions.values() if isinstance(func, Function)]
+        # The run response is replaced at the start of the next run, but its metrics are updated in place
+        run_response = self.run_response.copy_with_content(self.run_response.content)
+        run_response.metrics = deepcopy(self.run_response.metrics)
+        run_input = self.run_input
+        monitoring = self.monitoring
+
+        def create_run_data() -> Dict[str, Any]:
+            run_data: Dict[str, Any] = {
+                "functions": {func.name: func.to_dict() for func in functions},
+                "metrics": run_response.metrics,
             }
+            if monitoring:
+                run_data.update(
+                    {
+                        "run_input": run_input,
+                        "run_response": run_response.to_dict(),
+                        "run_response_format": run_response_format,
+                    }
+                )
+            return run_data
 
-        run_data: Dict[str, Any] = {
-            "functions": functions,
-            "metrics": self.run_response.metrics,
-        }
+        return create_run_data
 
-        if self.monitoring:
-            run_data.update(
-                {
-                    "run_input": self.run_input,
-                    "run_response": self.run_response.to_dict(),
-                    "run_response_format": run_response_format,
-                }
-            )
+    def _get_agent_run_create(self) -> Callable[[], Any]:
+        """Returns a function that builds the AgentRunCreate on the telemetry exporter's thread"""
+        from agno.api.agent import AgentRunCreate
 
-        return run_data
+        run_id = self.run_id
+        session_id = cast(str, self.session_id)
+        create_run_data = self._get_run_data_factory()
+        get_agent_data = self._get_agent_data_factory()
+        return lambda: AgentRunCreate(
+            run_id=run_id, run_data=create_run_data(), session_id=session_id, agent_data=get_agent_data()
+        )
 
     def log_agent_run(self) -> None:
         self.set_monitoring()
@@ -3157,21 +3545,10 @@ class Agent:
         if not (self.telemetry or self.monitoring):
             return
 
-        from agno.api.agent import AgentRunCreate, create_agent_run
+        from agno.api.agent import create_agent_run
 
         try:
-            run_data = self._create_run_data()
-            agent_session: AgentSession = self.agent_session or self.get_agent_session()
-
-            create_agent_run(
-                run=AgentRunCreate(
-                    run_id=self.run_id,
-                    run_data=run_data,
-                    session_id=agent_session.session_id,
-                    agent_data=agent_session.monitoring_data() if self.monitoring else agent_session.telemetry_data(),
-                ),
-                monitor=self.monitoring,
-            )
+            create_agent_run(run=self._get_agent_run_create(), monitor=self.monitoring, run_id=self.run_id)
         except Exception as e:
             logger.debug(f"Could not create agent event: {e}")
 
@@ -3181,21 +3558,10 @@ class Agent:
         if not (self.telemetry or self.monitoring):
             return
 
-        from agno.api.agent import AgentRunCreate, acreate_agent_run
+        from agno.api.agent import acreate_agent_run
 
         try:
-            run_data = self._create_run_data()
-            agent_session: AgentSession = self.agent_session or self.get_agent_session()
-
-            await acreate_agent_run(
-                run=AgentRunCreate(
-                    run_id=self.run_id,
-                    run_data=run_data,
-                    session_id=agent_session.session_id,
-                    agent_data=agent_session.monitoring_data() if self.monitoring else agent_session.telemetry_data(),
-                ),
-                monitor=self.monitoring,
-            )
+            await acreate_agent_run(run=self._get_agent_run_create(), monitor=self.monitoring, run_id=self.run_id)
         except Exception as e:
             logger.debug(f"Could not create agent event: {e}")
 
@@ -1,67 +1,65 @@
-from agno.api.api import api
+from typing import Callable, Optional, Union
+
+from agno.api.exporter import telemetry_exporter
 from agno.api.routes import ApiRoutes
 from agno.api.schemas.agent import AgentRunCreate, AgentSessionCreate
 from agno.cli.settings import agno_cli_settings
 from agno.utils.log import logger
 
 
-def create_agent_session(session: AgentSessionCreate, monitor: bool = False) -> None:
+def create_agent_session(
+    session: Union[AgentSessionCreate, Callable[[], AgentSessionCreate]],
+    monitor: bool = False,
+    session_id: Optional[str] = None,
+) -> None:
+    """Queue the Agent session to be posted by the background telemetry exporter.
+
+    session can be a function that builds the AgentSessionCreate, which is then called on the exporter's thread.
+    """
     if not agno_cli_settings.api_enabled:
         return
 
     logger.debug("--**-- Logging Agent Session")
-    with api.AuthenticatedClient() as api_client:
-        try:
-            api_client.post(
-                ApiRoutes.AGENT_SESSION_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_SESSION_CREATE,
-                json={"session": session.model_dump(exclude_none=True)},
-            )
-        except Exception as e:
-            logger.debug(f"Could not create Agent session: {e}")
-    return
+    telemetry_exporter.export(
+        ApiRoutes.AGENT_SESSION_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_SESSION_CREATE,
+        "session",
+        session,
+        coalesce_key=session.session_id if isinstance(session, AgentSessionCreate) else session_id,
+    )
+
 
+def create_agent_run(
+    run: Union[AgentRunCreate, Callable[[], AgentRunCreate]],
+    monitor: bool = False,
+    run_id: Optional[str] = None,
+) -> None:
+    """Queue the Agent run to be posted by the background telemetry exporter.
 
-def create_agent_run(run: AgentRunCreate, monitor: bool = False) -> None:
+    run can be a function that builds the AgentRunCreate, which is then called on the exporter's thread.
+    """
     if not agno_cli_settings.api_enabled:
         return
 
     logger.debug("--**-- Logging Agent Run")
-    with api.AuthenticatedClient() as api_client:
-        try:
-            api_client.post(
-                ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
-        except Exception as e:
-            logger.debug(f"Could not create Agent run: {e}")
-    return
+    telemetry_exporter.export(
+        ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE,
+        "run",
+        run,
+        coalesce_key=run.run_id if isinstance(run, AgentRunCreate) else run_id,
+    )
 
 
-async def acreate_agent_session(session: AgentSessionCreate, monitor: bool = False) -> None:
-    if not agno_cli_settings.api_enabled:
-        return
+async def acreate_agent_session(
+    session: Union[AgentSessionCreate, Callable[[], AgentSessionCreate]],
+    monitor: bool = False,
+    session_id: Optional[str] = None,
+) -> None:
+    create_agent_session(session=session, monitor=monitor, session_id=session_id)
 
-    logger.debug("--**-- Logging Agent Session (Async)")
-    async with api.AuthenticatedAsyncClient() as api_client:
-        try:
-            await api_client.post(
-                ApiRoutes.AGENT_SESSION_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_SESSION_CREATE,
-                json={"session": session.model_dump(exclude_none=True)},
-            )
-        except Exception as e:
-            logger.debug(f"Could not create Agent session: {e}")
-
-
-async def acreate_agent_run(run: AgentRunCreate, monitor: bool = False) -> None:
-    if not agno_cli_settings.api_enabled:
-        return
 
-    logger.debug("--**-- Logging Agent Run (Async)")
-    async with api.AuthenticatedAsyncClient() as api_client:
-        try:
-            await api_client.post(
-                ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
-        except Exception as e:
-            logger.debug(f"Could not create Agent run: {e}")
+async def acreate_agent_run(
+    run: Union[AgentRunCreate, Callable[[], AgentRunCreate]],
+    monitor: bool = False,
+    run_id: Optional[str] = None,
+) -> None:
+    create_agent_run(run=run, monitor=monitor, run_id=run_id)
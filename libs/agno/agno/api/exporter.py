@@ -0,0 +1,232 @@
+import atexit
+import json
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+from httpx import Client as HttpxClient
+from httpx import Limits
+from pydantic import BaseModel
+
+from agno.api.api import api
+from agno.cli.settings import agno_cli_settings
+from agno.utils.log import logger
+
+# A payload, or a function that builds the payload on the worker thread
+TelemetryPayload = Union[BaseModel, Dict[str, Any], Callable[[], Union[BaseModel, Dict[str, Any]]]]
+# (route, payload key, payload, coalesce key)
+TelemetryEvent = Tuple[str, str, TelemetryPayload, Optional[Hashable]]
+
+
+class _Flush:
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class TelemetryExporter:
+    """Posts telemetry and monitoring events to the agno API from a background worker thread.
+
+    Events are queued without blocking the caller. The worker drains the queue in batches, keeps only the
+    latest event per coalesce key within a batch and posts using one persistent pooled client. When the queue
+    is full, events are appended to spill_path (if set) and replayed once the worker is idle, or dropped.
+
+    Payloads can be functions, which are called by the worker, so building and serializing the payload is not
+    done on the caller's thread. They must only read data that is not changed after the event is exported.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 1000,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        spill_path: Optional[Path] = None,
+        client: Optional[HttpxClient] = None,
+    ):
+        self.max_queue_size: int = max_queue_size
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self.spill_path: Optional[Path] = spill_path
+        self.dropped: int = 0
+        self.spilled: int = 0
+
+        self._client: Optional[HttpxClient] = client
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+
+    def get_client(self) -> HttpxClient:
+        if self._client is None:
+            self._client = HttpxClient(
+                base_url=agno_cli_settings.api_url,
+                headers=api.authenticated_headers,
+                timeout=60,
+                limits=Limits(max_connections=10, max_keepalive_connections=10),
+            )
+        return self._client
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="agno-telemetry-exporter", daemon=True)
+            self._thread.start()
+
+    def export(
+        self,
+        route: str,
+        key: str,
+        payload: TelemetryPayload,
+        coalesce_key: Optional[Hashable] = None,
+    ) -> None:
+        """Queue an event to be posted as {key: payload} to route. Never blocks the caller."""
+        self.start()
+        event: TelemetryEvent = (route, key, payload, coalesce_key)
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            if not self._spill(event):
+                self.dropped += 1
+                logger.debug("Telemetry queue is full, dropping event")
+
+    def flush(self, timeout: Optional[float] = 10) -> bool:
+        """Wait until all events queued so far have been posted. Returns False on timeout."""
+        if self._thread is None or not self._thread.is_alive():
+            return self._queue.empty()
+        marker = _Flush()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.done.wait(timeout)
+
+    def shutdown(self, timeout: Optional[float] = 10) -> None:
+        """Flush pending events, stop the worker thread and close the client"""
+        if self._thread is not None and self._thread.is_alive():
+            self.flush(timeout=timeout)
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+                self._thread.join(timeout)
+            except queue.Full:
+                pass
+        self._thread = None
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._replay_spill()
+                continue
+
+            batch: List[TelemetryEvent] = []
+            markers: List[_Flush] = []
+            stop = False
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, _Flush):
+                    markers.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            self._post_batch(self._coalesce(batch))
+            for marker in markers:
+                marker.done.set()
+            if stop:
+                return
+
+    @staticmethod
+    def _coalesce(batch: List[TelemetryEvent]) -> List[TelemetryEvent]:
+        """Keep only the latest event per (route, coalesce key), in the order of their last occurrence"""
+        coalesced: Dict[Hashable, TelemetryEvent] = {}
+        for i, event in enumerate(batch):
+            route, _, _, coalesce_key = event
+            dedup_key = (route, coalesce_key) if coalesce_key is not None else i
+            coalesced.pop(dedup_key, None)
+            coalesced[dedup_key] = event
+        return list(coalesced.values())
+
+    @staticmethod
+    def _dump(payload: TelemetryPayload) -> Dict[str, Any]:
+        if callable(payload):
+            payload = payload()
+        if isinstance(payload, BaseModel):
+            return payload.model_dump(exclude_none=True)
+        return payload
+
+    def _post_batch(self, batch: List[TelemetryEvent]) -> None:
+        for route, key, payload, _ in batch:
+            try:
+                self.get_client().post(route, json={key: self._dump(payload)})
+            except Exception as e:
+                logger.debug(f"Could not export telemetry event to {route}: {e}")
+
+    def _spill(self, event: TelemetryEvent) -> bool:
+        if self.spill_path is None:
+            return False
+        route, key, payload, coalesce_key = event
+        try:
+            line = json.dumps(
+                {"route": route, "key": key, "payload": self._dump(payload), "coalesce_key": coalesce_key},
+                default=str,
+            )
+            with self._spill_lock:
+                self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                with self.spill_path.open("a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            self.spilled += 1
+            return True
+        except Exception as e:
+            logger.debug(f"Could not spill telemetry event to {self.spill_path}: {e}")
+            return False
+
+    def _replay_spill(self) -> None:
+        if self.spill_path is None:
+            return
+        with self._spill_lock:
+            if not self.spill_path.exists():
+                return
+            try:
+                lines = self.spill_path.read_text(encoding="utf-8").splitlines()
+                self.spill_path.unlink()
+            except Exception as e:
+                logger.debug(f"Could not read spilled telemetry events from {self.spill_path}: {e}")
+                return
+
+        batch: List[TelemetryEvent] = []
+        for line in lines:
+            try:
+                event = json.loads(line)
+                coalesce_key = event.get("coalesce_key")
+                batch.append(
+                    (
+                        event["route"],
+                        event["key"],
+                        event["payload"],
+                        tuple(coalesce_key) if isinstance(coalesce_key, list) else coalesce_key,
+                    )
+                )
+            except Exception:
+                # A partially written line
+                continue
+        for i in range(0, len(batch), self.batch_size):
+            self._post_batch(self._coalesce(batch[i : i + self.batch_size]))
+
+
+telemetry_exporter = TelemetryExporter(spill_path=agno_cli_settings.telemetry_spill_path)
+atexit.register(telemetry_exporter.shutdown, 5)
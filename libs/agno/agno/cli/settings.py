@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from importlib import metadata
 from pathlib import Path
+from typing import Optional
 
 from pydantic import Field, field_validator
 from pydantic_core.core_schema import ValidationInfo
@@ -25,6 +26,8 @@ class AgnoCliSettings(BaseSettings):
 
     api_runtime: str = "prd"
     api_enabled: bool = True
+    # Telemetry events that do not fit in the exporter queue are appended here instead of being dropped
+    telemetry_spill_path: Optional[Path] = None
     alpha_features: bool = False
     api_url: str = Field("https://api.agno.com", validate_default=True)
     signin_url: str = Field("https://app.agno.com/login", validate_default=True)
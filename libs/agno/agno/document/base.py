@@ -2,6 +2,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from agno.embedder import Embedder
+from agno.embedder.base import split_usage
 
 
 @dataclass
@@ -26,6 +27,37 @@ class Document:
 
         self.embedding, self.usage = _embedder.get_embedding_and_usage(self.content)
 
+    @staticmethod
+    def embed_batch(documents: List["Document"], embedder: Embedder) -> None:
+        """Embed a list of documents using batched requests to the embedder"""
+        if not documents:
+            return
+
+        texts = [document.content for document in documents]
+        embeddings, usage = embedder.get_embeddings_batch(texts)
+        if len(embeddings) != len(documents):
+            raise ValueError(f"Expected {len(documents)} embeddings, got {len(embeddings)}")
+
+        # Usage is reported for the whole batch, each document gets its share by estimated tokens
+        for document, embedding, document_usage in zip(documents, embeddings, split_usage(usage, texts)):
+            document.embedding = embedding
+            document.usage = document_usage
+
+    @staticmethod
+    async def async_embed_batch(documents: List["Document"], embedder: Embedder) -> None:
+        """Async version of embed_batch()"""
+        if not documents:
+            return
+
+        texts = [document.content for document in documents]
+        embeddings, usage = await embedder.async_get_embeddings_batch(texts)
+        if len(embeddings) != len(documents):
+            raise ValueError(f"Expected {len(documents)} embeddings, got {len(embeddings)}")
+
+        for document, embedding, document_usage in zip(documents, embeddings, split_usage(usage, texts)):
+            document.embedding = embedding
+            document.usage = document_usage
+
     def to_dict(self) -> Dict[str, Any]:
         """Returns a dictionary representation of the document"""
         fields = {"name", "meta_data", "content"}
@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 from os import getenv
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, merge_usage
 from agno.utils.log import logger
 
 try:
@@ -32,6 +32,9 @@ class AzureOpenAIEmbedder(Embedder):
     request_params: Optional[Dict[str, Any]] = None
     client_params: Optional[Dict[str, Any]] = None
     openai_client: Optional[AzureOpenAIClient] = None
+    # The embeddings endpoint accepts up to 2048 inputs and 300k tokens per request
+    batch_size: int = 2048
+    max_batch_tokens: Optional[int] = 300_000
 
     @property
     def client(self) -> AzureOpenAIClient:
@@ -55,9 +58,10 @@ class AzureOpenAIEmbedder(Embedder):
             _client_params["azure_ad_token"] = self.azure_ad_token
         if self.azure_ad_token_provider:
             _client_params["azure_ad_token_provider"] = self.azure_ad_token_provider
-        return AzureOpenAIClient(**_client_params)
+        self.openai_client = AzureOpenAIClient(**_client_params)
+        return self.openai_client
 
-    def _response(self, text: str) -> CreateEmbeddingResponse:
+    def _response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.id,
@@ -86,3 +90,14 @@ class AzureOpenAIEmbedder(Embedder):
         embedding = response.data[0].embedding
         usage = response.usage
         return embedding, usage.model_dump()
+
+    def get_embeddings_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict] = None
+        for batch in self.iter_batches(texts):
+            response: CreateEmbeddingResponse = self._response(text=batch)
+            # Results are not guaranteed to be returned in input order
+            embeddings.extend(item.embedding for item in sorted(response.data, key=lambda item: item.index))
+            if response.usage:
+                usage = merge_usage(usage, response.usage.model_dump())
+        return embeddings, usage
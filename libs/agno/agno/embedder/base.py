@@ -1,5 +1,29 @@
+import asyncio
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from agno.utils.rate_limit import (
+    RateLimit,
+    RateLimiter,
+    get_rate_limiter,
+    get_rate_limiter_key,
+    wrap_rate_limited_methods,
+)
+from agno.utils.tokens import estimate_tokens
+
+# Methods that send a single request to the embedding provider. Batch methods split the texts into several
+# requests, so they are not limited themselves, each request they send takes its own slot in the limiter.
+EMBEDDING_METHODS = frozenset(
+    {
+        "get_embedding",
+        "get_embedding_and_usage",
+        "async_get_embedding",
+        "async_get_embedding_and_usage",
+        "response",
+        "aresponse",
+        "_response",
+    }
+)
 
 
 @dataclass
@@ -7,9 +31,140 @@ class Embedder:
     """Base class for managing embedders"""
 
     dimensions: Optional[int] = 1536
+    # Maximum number of texts sent to the provider in a single batch request
+    batch_size: int = 100
+    # Maximum number of (estimated) tokens sent to the provider in a single batch request
+    max_batch_tokens: Optional[int] = None
+    # Client-side rate limit for requests, shared by all embedders with the same provider, API key and id.
+    rate_limit: Optional[RateLimit] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        wrap_rate_limited_methods(
+            cls, EMBEDDING_METHODS, get_limiter=lambda embedder: embedder.get_rate_limiter(), count_tokens=count_tokens
+        )
+
+    def get_rate_limiter(self) -> Optional[RateLimiter]:
+        if self.rate_limit is None:
+            return None
+        api_key = getattr(self, "api_key", None)
+        model_id = getattr(self, "id", None)
+        key = get_rate_limiter_key(
+            self.__class__.__name__,
+            api_key if isinstance(api_key, str) else None,
+            model_id if isinstance(model_id, str) else None,
+        )
+        return get_rate_limiter(key, self.rate_limit)
 
     def get_embedding(self, text: str) -> List[float]:
         raise NotImplementedError
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    def get_embeddings_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        """Returns the embeddings for a list of texts, in order, along with the combined usage.
+
+        Embedders that support bulk requests should override this method.
+        The default implementation embeds each text individually.
+        """
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict] = None
+        for text in texts:
+            embedding, _usage = self.get_embedding_and_usage(text)
+            embeddings.append(embedding)
+            usage = merge_usage(usage, _usage)
+        return embeddings, usage
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        """Async version of get_embedding(). Runs the sync implementation in a thread unless overridden."""
+        return await asyncio.to_thread(self.get_embedding, text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        """Async version of get_embedding_and_usage(). Runs the sync implementation in a thread unless overridden."""
+        return await asyncio.to_thread(self.get_embedding_and_usage, text)
+
+    async def async_get_embeddings_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        """Async version of get_embeddings_batch(). Runs the sync implementation in a thread unless overridden."""
+        return await asyncio.to_thread(self.get_embeddings_batch, texts)
+
+    def __deepcopy__(self, memo):
+        """Deep copy the embedder. API clients hold connection pools and locks, so they are shared with the copy."""
+        from copy import deepcopy
+
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+        for k, v in self.__dict__.items():
+            if k.endswith("client") or k == "_async_client_loop":
+                setattr(copied, k, v)
+            else:
+                setattr(copied, k, deepcopy(v, memo))
+        return copied
+
+    def iter_batches(self, texts: List[str]) -> Iterator[List[str]]:
+        """Split texts into batches that respect the batch_size and max_batch_tokens limits"""
+        batch: List[str] = []
+        batch_tokens = 0
+        for text in texts:
+            text_tokens = estimate_tokens(text)
+            if batch and (
+                len(batch) >= self.batch_size
+                or (self.max_batch_tokens is not None and batch_tokens + text_tokens > self.max_batch_tokens)
+            ):
+                yield batch
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += text_tokens
+        if batch:
+            yield batch
+
+
+def merge_usage(usage: Optional[Dict[str, Any]], other: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Sum the numeric fields of two usage dictionaries"""
+    if not other:
+        return usage
+    if not usage:
+        return dict(other)
+    merged = dict(usage)
+    for key, value in other.items():
+        if isinstance(value, (int, float)) and isinstance(merged.get(key), (int, float)):
+            merged[key] += value
+        elif key not in merged:
+            merged[key] = value
+    return merged
+
+
+def split_usage(usage: Optional[Dict[str, Any]], texts: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """Split the usage of a batch request across its texts, in proportion to their estimated tokens.
+
+    Integer fields are split so that the parts add up to the batch total, other fields are copied to each part.
+    """
+    if not usage:
+        return [None for _ in texts]
+    weights = [estimate_tokens(text) for text in texts]
+    total_weight = sum(weights)
+    parts: List[Dict[str, Any]] = [{} for _ in texts]
+    for key, value in usage.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            for part in parts:
+                part[key] = value
+            continue
+        shares = [value * weight / total_weight for weight in weights]
+        if isinstance(value, int):
+            # Largest remainder rounding, so the integer parts add up to the total
+            rounded = [int(share) for share in shares]
+            by_remainder = sorted(range(len(texts)), key=lambda i: shares[i] - rounded[i], reverse=True)
+            for i in by_remainder[: value - sum(rounded)]:
+                rounded[i] += 1
+            shares = rounded  # type: ignore
+        for part, share in zip(parts, shares):
+            part[key] = share
+    return list(parts)
+
+
+def count_tokens(*args, **kwargs) -> int:
+    """Estimates the tokens of an embedding request for the rate limiter"""
+    texts: Union[str, List[str]] = args[0] if args else kwargs.get("text", kwargs.get("texts", ""))
+    if isinstance(texts, str):
+        return estimate_tokens(texts)
+    return sum(estimate_tokens(text) for text in texts)
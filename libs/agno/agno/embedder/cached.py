@@ -0,0 +1,407 @@
+import asyncio
+import json
+import mmap
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows
+    fcntl = None  # type: ignore
+
+from agno.embedder.base import Embedder
+from agno.utils.log import logger
+
+
+class EmbeddingCache:
+    """Base class for embedding cache backends"""
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Returns the cached embeddings for the given keys. Missing keys are left out."""
+        raise NotImplementedError
+
+    def set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def get(self, key: str) -> Optional[List[float]]:
+        return self.get_many([key]).get(key)
+
+    def set(self, key: str, embedding: List[float]) -> None:
+        self.set_many({key: embedding})
+
+    def __deepcopy__(self, memo):
+        # Caches hold locks and connections, copies of an agent share the same cache
+        return self
+
+
+class InMemoryEmbeddingCache(EmbeddingCache):
+    """In-process LRU cache, bounded by max_size entries"""
+
+    def __init__(self, max_size: int = 10_000):
+        self.max_size: int = max_size
+        self._embeddings: OrderedDict[str, List[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            for key in keys:
+                embedding = self._embeddings.get(key)
+                if embedding is not None:
+                    self._embeddings.move_to_end(key)
+                    found[key] = embedding
+        return found
+
+    def set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        with self._lock:
+            for key, embedding in embeddings.items():
+                self._embeddings[key] = embedding
+                self._embeddings.move_to_end(key)
+            while len(self._embeddings) > self.max_size:
+                self._embeddings.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._embeddings.clear()
+
+    def __len__(self) -> int:
+        return len(self._embeddings)
+
+
+class SqliteEmbeddingCache(EmbeddingCache):
+    """Persistent cache stored in a SQLite file, with embeddings packed as float32 blobs"""
+
+    def __init__(self, db_file: Union[str, Path] = "tmp/embedding_cache.db", table_name: str = "embedding_cache"):
+        self.db_file: Path = Path(db_file)
+        self.table_name: str = table_name
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} (key TEXT PRIMARY KEY, embedding BLOB NOT NULL)"
+            )
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            # Stay well under SQLite's limit on bound parameters
+            for i in range(0, len(keys), 500):
+                chunk = keys[i : i + 500]
+                rows = self._connection.execute(
+                    f"SELECT key, embedding FROM {self.table_name} WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+        return found
+
+    def set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, embedding) VALUES (?, ?)",
+                [(key, array("f", embedding).tobytes()) for key, embedding in embeddings.items()],
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table_name}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()[0]
+
+
+class MmapEmbeddingCache(EmbeddingCache):
+    """Persistent cache of fixed-size float32 vectors appended to a memory-mapped file.
+
+    The directory holds vectors.f32 (the vectors, one row per key), keys.tsv (key and row number)
+    and meta.json (the vector dimensions, fixed by the first write).
+    Processes sharing the directory append under an exclusive file lock and pick up each other's keys on a miss.
+    """
+
+    def __init__(self, path: Union[str, Path] = "tmp/embedding_cache"):
+        self.path: Path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.vectors_file: Path = self.path / "vectors.f32"
+        self.keys_file: Path = self.path / "keys.tsv"
+        self.meta_file: Path = self.path / "meta.json"
+
+        self.dimensions: Optional[int] = None
+        self._rows: Dict[str, int] = {}
+        self._num_rows: int = 0
+        # Bytes of keys.tsv already read into _rows
+        self._keys_offset: int = 0
+        self._mmap: Optional[mmap.mmap] = None
+        self._lock = threading.Lock()
+        with self._lock, self._file_lock():
+            self._load_dimensions()
+            # Drop a partial trailing row left by a writer that did not finish
+            if self.dimensions and self.vectors_file.exists():
+                size = self.vectors_file.stat().st_size
+                if size % self._row_size != 0:
+                    with self.vectors_file.open("r+b") as f:
+                        f.truncate(size - size % self._row_size)
+            self._read_new_keys()
+
+    @property
+    def _row_size(self) -> int:
+        return (self.dimensions or 0) * 4
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the cache directory, shared by all processes writing to the cache"""
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(self.path, os.O_RDONLY)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            # Closing the file descriptor releases the lock
+            os.close(fd)
+
+    def _load_dimensions(self) -> None:
+        if self.dimensions is None and self.meta_file.exists():
+            self.dimensions = json.loads(self.meta_file.read_text()).get("dimensions")
+
+    def _read_new_keys(self) -> None:
+        """Read the keys appended to keys.tsv since the last read, by this or another process"""
+        if not self.keys_file.exists():
+            return
+        self._load_dimensions()
+        if not self.dimensions:
+            return
+        with self.keys_file.open("rb") as f:
+            f.seek(self._keys_offset)
+            data = f.read()
+        # Only read complete lines, a line without its newline is still being written
+        data = data[: data.rfind(b"\n") + 1]
+        self._keys_offset += len(data)
+        # Vectors are written before their keys, so every key read has its row
+        self._num_rows = self.vectors_file.stat().st_size // self._row_size if self.vectors_file.exists() else 0
+        for line in data.decode("utf-8").splitlines():
+            key, _, row = line.partition("\t")
+            if row.isdigit() and int(row) < self._num_rows:
+                self._rows[key] = int(row)
+
+    def _get_mmap(self) -> Optional[mmap.mmap]:
+        """Returns a read-only map covering every stored row, remapping the file if it has grown"""
+        size = self._num_rows * self._row_size
+        if size == 0:
+            return None
+        if self._mmap is None or len(self._mmap) < size:
+            if self._mmap is not None:
+                self._mmap.close()
+            with self.vectors_file.open("rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            if any(key not in self._rows for key in keys):
+                # Other processes may have cached the missing keys
+                self._read_new_keys()
+            mapped = self._get_mmap()
+            if mapped is None:
+                return found
+            for key in keys:
+                row = self._rows.get(key)
+                if row is not None:
+                    offset = row * self._row_size
+                    found[key] = array("f", mapped[offset : offset + self._row_size]).tolist()
+        return found
+
+    def set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        with self._lock:
+            if all(key in self._rows for key in embeddings):
+                return
+            with self._file_lock():
+                self._read_new_keys()
+                new_embeddings = {key: embedding for key, embedding in embeddings.items() if key not in self._rows}
+                if not new_embeddings:
+                    return
+                if self.dimensions is None:
+                    self.dimensions = len(next(iter(new_embeddings.values())))
+                    self.meta_file.write_text(json.dumps({"dimensions": self.dimensions}))
+
+                # Rows are numbered by the size of the file, which includes the rows of other processes
+                num_rows = self.vectors_file.stat().st_size // self._row_size if self.vectors_file.exists() else 0
+                rows: Dict[str, int] = {}
+                with self.vectors_file.open("ab") as vectors:
+                    for key, embedding in new_embeddings.items():
+                        if len(embedding) != self.dimensions:
+                            logger.warning(
+                                f"Not caching embedding with {len(embedding)} dimensions, expected {self.dimensions}"
+                            )
+                            continue
+                        vectors.write(array("f", embedding).tobytes())
+                        rows[key] = num_rows
+                        num_rows += 1
+                # Keys are written after their vectors, so readers never see a key without its row
+                with self.keys_file.open("a") as keys_file:
+                    keys_file.write("".join(f"{key}\t{row}\n" for key, row in rows.items()))
+                self._read_new_keys()
+
+    def clear(self) -> None:
+        with self._lock, self._file_lock():
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            for file in (self.vectors_file, self.keys_file, self.meta_file):
+                file.unlink(missing_ok=True)
+            self._rows.clear()
+            self._num_rows = 0
+            self._keys_offset = 0
+            self.dimensions = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+@dataclass
+class CachedEmbedder(Embedder):
+    """Wraps an Embedder and caches embeddings by embedder id, dimensions and content hash.
+
+    Query embeddings are cached too, so vector dbs using a CachedEmbedder do not re-embed repeated queries.
+    """
+
+    embedder: Optional[Embedder] = None
+    cache: EmbeddingCache = field(default_factory=InMemoryEmbeddingCache)
+    # Number of texts served from the cache and sent to the wrapped embedder
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        if self.embedder is None:
+            from agno.embedder.openai import OpenAIEmbedder
+
+            self.embedder = OpenAIEmbedder()
+        self.dimensions = self.embedder.dimensions
+        self.batch_size = self.embedder.batch_size
+        self.max_batch_tokens = self.embedder.max_batch_tokens
+        self._counter_lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        # Share the cache and counters with copies of an agent
+        return self
+
+    @property
+    def _embedder(self) -> Embedder:
+        assert self.embedder is not None
+        return self.embedder
+
+    def cache_key(self, text: str) -> str:
+        embedder_id = getattr(self._embedder, "id", None)
+        content_hash = sha256(text.encode()).hexdigest()
+        return f"{self._embedder.__class__.__name__}:{embedder_id}:{self.dimensions}:{content_hash}"
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def cache_info(self) -> Dict[str, Union[int, float]]:
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate}
+
+    def _record(self, hits: int, misses: int) -> None:
+        with self._counter_lock:
+            self.hits += hits
+            self.misses += misses
+
+    def _store(self, key: str, embedding: List[float]) -> None:
+        # Failed requests return an empty embedding, which should be retried rather than cached
+        if embedding:
+            self.cache.set(key, embedding)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        key = self.cache_key(text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._record(hits=1, misses=0)
+            return cached, None
+
+        self._record(hits=0, misses=1)
+        embedding, usage = self._embedder.get_embedding_and_usage(text)
+        self._store(key, embedding)
+        return embedding, usage
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return (await self.async_get_embedding_and_usage(text))[0]
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        key = self.cache_key(text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._record(hits=1, misses=0)
+            return cached, None
+
+        self._record(hits=0, misses=1)
+        embedding, usage = await self._embedder.async_get_embedding_and_usage(text)
+        self._store(key, embedding)
+        return embedding, usage
+
+    def _lookup(self, texts: List[str]) -> Tuple[List[str], Dict[str, List[float]], List[str]]:
+        """Returns the cache keys, the cached embeddings and the distinct texts that need embedding"""
+        keys = [self.cache_key(text) for text in texts]
+        cached = self.cache.get_many(keys)
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+        self._record(hits=len(texts) - len(missing), misses=len(missing))
+        return keys, cached, list(missing.values())
+
+    def _merge(
+        self, keys: List[str], cached: Dict[str, List[float]], missing: List[str], embeddings: List[List[float]]
+    ) -> List[List[float]]:
+        new_embeddings = {
+            self.cache_key(text): embedding for text, embedding in zip(missing, embeddings) if len(embedding) > 0
+        }
+        if new_embeddings:
+            self.cache.set_many(new_embeddings)
+        cached.update(new_embeddings)
+        return [cached.get(key, []) for key in keys]
+
+    def get_embeddings_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        keys, cached, missing = self._lookup(texts)
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict] = None
+        if missing:
+            embeddings, usage = self._embedder.get_embeddings_batch(missing)
+        return self._merge(keys, cached, missing, embeddings), usage
+
+    async def async_get_embeddings_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        keys, cached, missing = await asyncio.to_thread(self._lookup, texts)
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict] = None
+        if missing:
+            embeddings, usage = await self._embedder.async_get_embeddings_batch(missing)
+        return self._merge(keys, cached, missing, embeddings), usage
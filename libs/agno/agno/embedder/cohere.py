@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, merge_usage
 from agno.utils.log import logger
 
 try:
@@ -20,6 +20,8 @@ class CohereEmbedder(Embedder):
     request_params: Optional[Dict[str, Any]] = None
     client_params: Optional[Dict[str, Any]] = None
     cohere_client: Optional[CohereClient] = None
+    # The embed endpoint accepts up to 96 texts per request
+    batch_size: int = 96
 
     @property
     def client(self) -> CohereClient:
@@ -30,7 +32,9 @@ class CohereEmbedder(Embedder):
             client_params["api_key"] = self.api_key
         return CohereClient(**client_params)
 
-    def response(self, text: str) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
+    def response(
+        self, text: Union[str, List[str]]
+    ) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
         request_params: Dict[str, Any] = {}
 
         if self.id:
@@ -41,7 +45,8 @@ class CohereEmbedder(Embedder):
             request_params["embedding_types"] = self.embedding_types
         if self.request_params:
             request_params.update(self.request_params)
-        return self.client.embed(texts=[text], **request_params)
+        texts = text if isinstance(text, list) else [text]
+        return self.client.embed(texts=texts, **request_params)
 
     def get_embedding(self, text: str) -> List[float]:
         response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=text)
@@ -70,3 +75,19 @@ class CohereEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def get_embeddings_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict[str, Any]]]:
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict[str, Any]] = None
+        for batch in self.iter_batches(texts):
+            response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=batch)
+            if isinstance(response, EmbeddingsFloatsEmbedResponse):
+                embeddings.extend(response.embeddings)
+            elif isinstance(response, EmbeddingsByTypeEmbedResponse) and response.embeddings.float_:
+                embeddings.extend(response.embeddings.float_)
+            else:
+                logger.warning("No embeddings found")
+                embeddings.extend([] for _ in batch)
+            if response.meta and response.meta.billed_units:
+                usage = merge_usage(usage, response.meta.billed_units.model_dump())
+        return embeddings, usage
@@ -35,3 +35,8 @@ class FastEmbedEmbedder(Embedder):
         usage = None
 
         return embedding, usage
+
+    def get_embeddings_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        model = TextEmbedding(model_name=self.id)
+        embeddings = [embedding.tolist() for embedding in model.embed(texts, batch_size=self.batch_size)]
+        return embeddings, None
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
 from os import getenv
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, merge_usage
 from agno.utils.log import logger
 
 try:
@@ -26,6 +26,8 @@ class MistralEmbedder(Embedder):
     client_params: Optional[Dict[str, Any]] = None
     # -*- Provide the Mistral Client manually
     mistral_client: Optional[Mistral] = None
+    # The embeddings endpoint accepts up to 16384 tokens per request
+    max_batch_tokens: Optional[int] = 16_000
 
     @property
     def client(self) -> Mistral:
@@ -45,7 +47,7 @@ class MistralEmbedder(Embedder):
             _client_params.update(self.client_params)
         return Mistral(**_client_params)
 
-    def _response(self, text: str) -> EmbeddingResponse:
+    def _response(self, text: Union[str, List[str]]) -> EmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "inputs": text,
             "model": self.id,
@@ -78,3 +80,16 @@ class MistralEmbedder(Embedder):
         except Exception as e:
             logger.warning(f"Error getting embedding and usage: {e}")
             return [], {}
+
+    def get_embeddings_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict[str, Any]]]:
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict[str, Any]] = None
+        for batch in self.iter_batches(texts):
+            response: EmbeddingResponse = self._response(text=batch)
+            data = sorted(response.data or [], key=lambda item: item.index or 0)
+            if len(data) != len(batch):
+                raise ValueError(f"Expected {len(batch)} embeddings, got {len(data)}")
+            embeddings.extend(item.embedding or [] for item in data)
+            if response.usage:
+                usage = merge_usage(usage, response.usage.model_dump())
+        return embeddings, usage
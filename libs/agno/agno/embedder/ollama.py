@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from agno.embedder.base import Embedder
 from agno.utils.log import logger
@@ -34,11 +34,13 @@ class OllamaEmbedder(Embedder):
             _ollama_params.update(self.client_kwargs)
         return OllamaClient(**_ollama_params)
 
-    def _response(self, text: str) -> Dict[str, Any]:
+    def _response(self, text: Union[str, List[str]]) -> Dict[str, Any]:
         kwargs: Dict[str, Any] = {}
         if self.options is not None:
             kwargs["options"] = self.options
 
+        if isinstance(text, list):
+            return self.client.embed(model=self.id, input=text, **kwargs)  # type: ignore
         return self.client.embeddings(prompt=text, model=self.id, **kwargs)  # type: ignore
 
     def get_embedding(self, text: str) -> List[float]:
@@ -55,3 +57,14 @@ class OllamaEmbedder(Embedder):
         embedding = self.get_embedding(text=text)
         usage = None
         return embedding, usage
+
+    def get_embeddings_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        # Older Ollama clients only expose the single-prompt embeddings endpoint
+        if not hasattr(self.client, "embed"):
+            return super().get_embeddings_batch(texts)
+
+        embeddings: List[List[float]] = []
+        for batch in self.iter_batches(texts):
+            response = self._response(text=batch)
+            embeddings.extend(list(embedding) for embedding in response.get("embeddings", []))
+        return embeddings, None
@@ -1,12 +1,14 @@
+import asyncio
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, merge_usage
 from agno.utils.log import logger
 
 try:
+    from openai import AsyncOpenAI as AsyncOpenAIClient
     from openai import OpenAI as OpenAIClient
     from openai.types.create_embedding_response import CreateEmbeddingResponse
 except ImportError:
@@ -25,12 +27,14 @@ class OpenAIEmbedder(Embedder):
     request_params: Optional[Dict[str, Any]] = None
     client_params: Optional[Dict[str, Any]] = None
     openai_client: Optional[OpenAIClient] = None
+    async_openai_client: Optional[AsyncOpenAIClient] = None
+    # Event loop the async client was created on, when it was created by this embedder
+    _async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+    # The embeddings endpoint accepts up to 2048 inputs and 300k tokens per request
+    batch_size: int = 2048
+    max_batch_tokens: Optional[int] = 300_000
 
-    @property
-    def client(self) -> OpenAIClient:
-        if self.openai_client:
-            return self.openai_client
-
+    def _get_client_params(self) -> Dict[str, Any]:
         _client_params: Dict[str, Any] = {}
         if self.api_key:
             _client_params["api_key"] = self.api_key
@@ -40,9 +44,30 @@ class OpenAIEmbedder(Embedder):
             _client_params["base_url"] = self.base_url
         if self.client_params:
             _client_params.update(self.client_params)
-        return OpenAIClient(**_client_params)
+        return _client_params
 
-    def response(self, text: str) -> CreateEmbeddingResponse:
+    @property
+    def client(self) -> OpenAIClient:
+        if self.openai_client is None:
+            self.openai_client = OpenAIClient(**self._get_client_params())
+        return self.openai_client
+
+    @property
+    def async_client(self) -> AsyncOpenAIClient:
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        # Pooled connections are bound to an event loop, so a client created on another loop is replaced
+        if self._async_client_loop is not None and self._async_client_loop is not loop:
+            self.async_openai_client = None
+            self._async_client_loop = None
+        if self.async_openai_client is None:
+            self.async_openai_client = AsyncOpenAIClient(**self._get_client_params())
+            self._async_client_loop = loop
+        return self.async_openai_client
+
+    def _get_request_params(self, text: Union[str, List[str]]) -> Dict[str, Any]:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.id,
@@ -54,7 +79,13 @@ class OpenAIEmbedder(Embedder):
             _request_params["dimensions"] = self.dimensions
         if self.request_params:
             _request_params.update(self.request_params)
-        return self.client.embeddings.create(**_request_params)
+        return _request_params
+
+    def response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
+        return self.client.embeddings.create(**self._get_request_params(text))
+
+    async def aresponse(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
+        return await self.async_client.embeddings.create(**self._get_request_params(text))
 
     def get_embedding(self, text: str) -> List[float]:
         response: CreateEmbeddingResponse = self.response(text=text)
@@ -72,3 +103,41 @@ class OpenAIEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def get_embeddings_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict] = None
+        for batch in self.iter_batches(texts):
+            response: CreateEmbeddingResponse = self.response(text=batch)
+            # Results are not guaranteed to be returned in input order
+            embeddings.extend(item.embedding for item in sorted(response.data, key=lambda item: item.index))
+            if response.usage:
+                usage = merge_usage(usage, response.usage.model_dump())
+        return embeddings, usage
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        response: CreateEmbeddingResponse = await self.aresponse(text=text)
+        try:
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning(e)
+            return []
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        response: CreateEmbeddingResponse = await self.aresponse(text=text)
+
+        embedding = response.data[0].embedding
+        usage = response.usage
+        if usage:
+            return embedding, usage.model_dump()
+        return embedding, None
+
+    async def async_get_embeddings_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict] = None
+        for batch in self.iter_batches(texts):
+            response: CreateEmbeddingResponse = await self.aresponse(text=batch)
+            embeddings.extend(item.embedding for item in sorted(response.data, key=lambda item: item.index))
+            if response.usage:
+                usage = merge_usage(usage, response.usage.model_dump())
+        return embeddings, usage
@@ -36,3 +36,8 @@ class SentenceTransformerEmbedder(Embedder):
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
+
+    def get_embeddings_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        model = self.sentence_transformer_client or SentenceTransformer(model_name_or_path=self.id)
+        embeddings = model.encode(texts, batch_size=self.batch_size)
+        return embeddings.tolist(), None
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, merge_usage
 from agno.utils.log import logger
 
 try:
@@ -22,6 +22,9 @@ class VoyageAIEmbedder(Embedder):
     timeout: Optional[float] = None
     client_params: Optional[Dict[str, Any]] = None
     voyage_client: Optional[Client] = None
+    # The embed endpoint accepts up to 128 texts and 120k tokens (voyage-2) per request
+    batch_size: int = 128
+    max_batch_tokens: Optional[int] = 120_000
 
     @property
     def client(self) -> Client:
@@ -39,9 +42,9 @@ class VoyageAIEmbedder(Embedder):
             _client_params.update(self.client_params)
         return Client(**_client_params)
 
-    def _response(self, text: str) -> EmbeddingsObject:
+    def _response(self, text: Union[str, List[str]]) -> EmbeddingsObject:
         _request_params: Dict[str, Any] = {
-            "texts": [text],
+            "texts": text if isinstance(text, list) else [text],
             "model": self.id,
         }
         if self.request_params:
@@ -62,3 +65,12 @@ class VoyageAIEmbedder(Embedder):
         embedding = response.embeddings[0]
         usage = {"total_tokens": response.total_tokens}
         return embedding, usage
+
+    def get_embeddings_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict] = None
+        for batch in self.iter_batches(texts):
+            response: EmbeddingsObject = self._response(text=batch)
+            embeddings.extend(response.embeddings)
+            usage = merge_usage(usage, {"total_tokens": response.total_tokens})
+        return embeddings, usage
@@ -1,4 +1,9 @@
-from typing import Any, Dict, Iterator, List, Optional
+import asyncio
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from hashlib import md5
+from typing import Any, Dict, Iterator, List, Optional, Set
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -6,6 +11,7 @@ from agno.document import Document
 from agno.document.chunking.fixed import FixedSizeChunking
 from agno.document.chunking.strategy import ChunkingStrategy
 from agno.document.reader.base import Reader
+from agno.utils.cache import TTLCache
 from agno.utils.log import logger
 from agno.vectordb import VectorDb
 
@@ -21,6 +27,13 @@ class AgentKnowledge(BaseModel):
     num_documents: int = 5
     # Number of documents to optimize the vector db on
     optimize_on: Optional[int] = 1000
+    # Cache search results in memory, so repeated queries skip the embedder and the vector db
+    cache_search_results: bool = False
+    # Number of seconds a cached search result is valid for
+    search_cache_ttl: Optional[float] = 300
+    # Maximum number of cached search results
+    search_cache_size: int = 1000
+    search_cache: Optional[TTLCache] = None
 
     chunking_strategy: ChunkingStrategy = Field(default_factory=FixedSizeChunking)
 
@@ -39,6 +52,30 @@ class AgentKnowledge(BaseModel):
         """
         raise NotImplementedError
 
+    def _get_search_cache(self) -> Optional[TTLCache]:
+        if not self.cache_search_results:
+            return None
+        if self.search_cache is None:
+            self.search_cache = TTLCache(max_size=self.search_cache_size, ttl=self.search_cache_ttl)
+        return self.search_cache
+
+    @staticmethod
+    def _get_search_cache_key(query: str, num_documents: int, filters: Optional[Dict[str, Any]]) -> str:
+        # The query is not normalized: queries that differ in case or whitespace are embedded differently
+        _filters = json.dumps(filters, sort_keys=True, default=str) if filters else None
+        return json.dumps([query, num_documents, _filters])
+
+    def clear_search_cache(self) -> None:
+        """Clear cached search results, called whenever the knowledge base changes"""
+        if self.search_cache is not None:
+            self.search_cache.clear()
+
+    def search_cache_info(self) -> Optional[Dict[str, Any]]:
+        """Returns the search cache hits, misses, hit rate and size, or None if search results are not cached"""
+        if self.search_cache is None:
+            return None
+        return self.search_cache.cache_info()
+
     def search(
         self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
@@ -49,8 +86,48 @@ class AgentKnowledge(BaseModel):
                 return []
 
             _num_documents = num_documents or self.num_documents
+            search_cache = self._get_search_cache()
+            cache_key = self._get_search_cache_key(query, _num_documents, filters)
+            if search_cache is not None:
+                cached_documents = search_cache.get(cache_key)
+                if cached_documents is not None:
+                    logger.debug(f"Using cached search results for query: {query}")
+                    return list(cached_documents)
+
             logger.debug(f"Getting {_num_documents} relevant documents for query: {query}")
-            return self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            documents = self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            # Empty results are not cached, since vector dbs also return no documents when a search fails
+            if search_cache is not None and len(documents) > 0:
+                search_cache.set(cache_key, list(documents))
+            return documents
+        except Exception as e:
+            logger.error(f"Error searching for documents: {e}")
+            return []
+
+    async def async_search(
+        self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Returns relevant documents matching a query without blocking the event loop"""
+        try:
+            if self.vector_db is None:
+                logger.warning("No vector db provided")
+                return []
+
+            _num_documents = num_documents or self.num_documents
+            search_cache = self._get_search_cache()
+            cache_key = self._get_search_cache_key(query, _num_documents, filters)
+            if search_cache is not None:
+                cached_documents = search_cache.get(cache_key)
+                if cached_documents is not None:
+                    logger.debug(f"Using cached search results for query: {query}")
+                    return list(cached_documents)
+
+            logger.debug(f"Getting {_num_documents} relevant documents for query: {query}")
+            documents = await self.vector_db.async_search(query=query, limit=_num_documents, filters=filters)
+            # Empty results are not cached, since vector dbs also return no documents when a search fails
+            if search_cache is not None and len(documents) > 0:
+                search_cache.set(cache_key, list(documents))
+            return documents
         except Exception as e:
             logger.error(f"Error searching for documents: {e}")
             return []
@@ -61,6 +138,7 @@ class AgentKnowledge(BaseModel):
         upsert: bool = False,
         skip_existing: bool = True,
         filters: Optional[Dict[str, Any]] = None,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         """Load the knowledge base to the vector db
 
@@ -69,6 +147,8 @@ class AgentKnowledge(BaseModel):
             upsert (bool): If True, upserts documents to the vector db. Defaults to False.
             skip_existing (bool): If True, skips documents which already exist in the vector db when inserting. Defaults to True.
             filters (Optional[Dict[str, Any]]): Filters to add to each row that can be used to limit results during querying. Defaults to None.
+            max_concurrency (Optional[int]): If set, document lists are embedded and written by this many worker threads
+                while the next document lists are being read. Defaults to None (load serially).
         """
 
         if self.vector_db is None:
@@ -84,25 +164,193 @@ class AgentKnowledge(BaseModel):
 
         logger.info("Loading knowledge base")
         num_documents = 0
-        for document_list in self.document_lists:
-            documents_to_load = document_list
-            # Upsert documents if upsert is True and vector db supports upsert
-            if upsert and self.vector_db.upsert_available():
-                self.vector_db.upsert(documents=documents_to_load, filters=filters)
-            # Insert documents
-            else:
-                # Filter out documents which already exist in the vector db
-                if skip_existing:
-                    # Use set for O(1) lookups
-                    seen_content = set()
-                    documents_to_load = []
-                    for doc in document_list:
-                        if doc.content not in seen_content and not self.vector_db.doc_exists(doc):
-                            seen_content.add(doc.content)
-                            documents_to_load.append(doc)
-                self.vector_db.insert(documents=documents_to_load, filters=filters)
-            num_documents += len(documents_to_load)
-            logger.info(f"Added {len(documents_to_load)} documents to knowledge base")
+        # Digests of the content seen across all document lists, so duplicates are only loaded once
+        seen_content: Set[str] = set()
+        seen_content_lock = threading.Lock()
+        if max_concurrency is None or max_concurrency <= 1:
+            for document_list in self.document_lists:
+                num_documents += self._load_document_list(
+                    document_list, upsert, skip_existing, filters, seen_content, seen_content_lock
+                )
+        else:
+            # Read document lists in this thread while worker threads embed and write the previous ones.
+            # The semaphore bounds the number of document lists held in memory.
+            in_flight = threading.BoundedSemaphore(max_concurrency * 2)
+            futures: List[Future] = []
+            errors: List[BaseException] = []
+
+            def on_done(future: Future) -> None:
+                if not future.cancelled() and future.exception() is not None:
+                    errors.append(future.exception())  # type: ignore
+                in_flight.release()
+
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                for document_list in self.document_lists:
+                    in_flight.acquire()
+                    if errors:
+                        # Stop reading at the first failed document list
+                        in_flight.release()
+                        break
+                    future = executor.submit(
+                        self._load_document_list,
+                        document_list,
+                        upsert,
+                        skip_existing,
+                        filters,
+                        seen_content,
+                        seen_content_lock,
+                    )
+                    future.add_done_callback(on_done)
+                    futures.append(future)
+                if errors:
+                    # Document lists that did not start are not loaded, running ones finish before the error is raised
+                    for future in futures:
+                        future.cancel()
+            if errors:
+                raise errors[0]
+            for future in futures:
+                num_documents += future.result()
+        self.clear_search_cache()
+        logger.info(f"Loaded {num_documents} documents to knowledge base")
+
+    def _load_document_list(
+        self,
+        document_list: List[Document],
+        upsert: bool,
+        skip_existing: bool,
+        filters: Optional[Dict[str, Any]],
+        seen_content: Set[str],
+        seen_content_lock: threading.Lock,
+    ) -> int:
+        """Load a single list of documents to the vector db and return the number of documents loaded"""
+        if self.vector_db is None:
+            return 0
+
+        documents_to_load = document_list
+        # Upsert documents if upsert is True and vector db supports upsert
+        if upsert and self.vector_db.upsert_available():
+            self.vector_db.upsert(documents=documents_to_load, filters=filters)
+        # Insert documents
+        else:
+            # Filter out documents which already exist in the vector db
+            if skip_existing:
+                with seen_content_lock:
+                    candidates = self._claim_unseen_documents(document_list, seen_content)
+                # Check the whole list in one round trip instead of once per document
+                exists = self.vector_db.doc_exists_batch(candidates) if candidates else []
+                documents_to_load = [doc for doc, doc_exists in zip(candidates, exists) if not doc_exists]
+            self.vector_db.insert(documents=documents_to_load, filters=filters)
+        logger.info(f"Added {len(documents_to_load)} documents to knowledge base")
+        return len(documents_to_load)
+
+    @staticmethod
+    def _claim_unseen_documents(document_list: List[Document], seen_content: Set[str]) -> List[Document]:
+        """Returns the documents whose content is not in seen_content and adds their content to it.
+
+        seen_content holds md5 digests rather than the content, so its size does not grow with the size of the chunks.
+        """
+        unseen_documents = []
+        for doc in document_list:
+            content_hash = md5(doc.content.encode()).hexdigest()
+            if content_hash not in seen_content:
+                seen_content.add(content_hash)
+                unseen_documents.append(doc)
+        return unseen_documents
+
+    async def aload(
+        self,
+        recreate: bool = False,
+        upsert: bool = False,
+        skip_existing: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
+        max_concurrency: int = 4,
+    ) -> None:
+        """Load the knowledge base to the vector db without blocking the event loop.
+
+        Reading, embedding and writing are pipelined: document lists are read in a background thread
+        and handed through a bounded queue to max_concurrency workers that embed and write them.
+
+        Args:
+            recreate (bool): If True, recreates the collection in the vector db. Defaults to False.
+            upsert (bool): If True, upserts documents to the vector db. Defaults to False.
+            skip_existing (bool): If True, skips documents which already exist in the vector db when inserting. Defaults to True.
+            filters (Optional[Dict[str, Any]]): Filters to add to each row that can be used to limit results during querying. Defaults to None.
+            max_concurrency (int): Number of document lists embedded and written concurrently. Defaults to 4.
+        """
+        if self.vector_db is None:
+            logger.warning("No vector db provided")
+            return
+
+        if recreate:
+            logger.info("Dropping collection")
+            await asyncio.to_thread(self.vector_db.drop)
+
+        logger.info("Creating collection")
+        await self.vector_db.async_create()
+
+        logger.info("Loading knowledge base")
+        num_workers = max(1, max_concurrency)
+        queue: asyncio.Queue[Optional[List[Document]]] = asyncio.Queue(maxsize=num_workers)
+        seen_content: Set[str] = set()
+
+        async def read() -> None:
+            document_lists = iter(self.document_lists)
+            while True:
+                # Reading and chunking is blocking, so it runs in a thread
+                document_list = await asyncio.to_thread(next, document_lists, None)
+                if document_list is None:
+                    break
+                await queue.put(document_list)
+            for _ in range(num_workers):
+                await queue.put(None)
+
+        async def write() -> int:
+            num_loaded = 0
+            while True:
+                document_list = await queue.get()
+                if document_list is None:
+                    return num_loaded
+                num_loaded += await self._aload_document_list(
+                    document_list, upsert, skip_existing, filters, seen_content
+                )
+
+        tasks = [asyncio.ensure_future(read()), *(asyncio.ensure_future(write()) for _ in range(num_workers))]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # A failed reader or writer would leave the others blocked on the queue, so stop them all
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        self.clear_search_cache()
+        logger.info(f"Loaded {sum(results[1:])} documents to knowledge base")
+
+    async def _aload_document_list(
+        self,
+        document_list: List[Document],
+        upsert: bool,
+        skip_existing: bool,
+        filters: Optional[Dict[str, Any]],
+        seen_content: Set[str],
+    ) -> int:
+        """Load a single list of documents to the vector db asynchronously and return the number of documents loaded"""
+        if self.vector_db is None:
+            return 0
+
+        documents_to_load = document_list
+        if upsert and self.vector_db.upsert_available():
+            await self.vector_db.async_upsert(documents=documents_to_load, filters=filters)
+        else:
+            if skip_existing:
+                # Claim content before awaiting so concurrent workers never load the same content twice
+                candidates = self._claim_unseen_documents(document_list, seen_content)
+                exists = await self.vector_db.async_doc_exists_batch(candidates) if candidates else []
+                documents_to_load = [doc for doc, doc_exists in zip(candidates, exists) if not doc_exists]
+            if len(documents_to_load) > 0:
+                await self.vector_db.async_insert(documents=documents_to_load, filters=filters)
+        logger.info(f"Added {len(documents_to_load)} documents to knowledge base")
+        return len(documents_to_load)
 
     def load_documents(
         self,
@@ -131,19 +379,20 @@ class AgentKnowledge(BaseModel):
         # Upsert documents if upsert is True
         if upsert and self.vector_db.upsert_available():
             self.vector_db.upsert(documents=documents, filters=filters)
+            self.clear_search_cache()
             logger.info(f"Loaded {len(documents)} documents to knowledge base")
             return
 
         # Filter out documents which already exist in the vector db
-        documents_to_load = (
-            [document for document in documents if not self.vector_db.doc_exists(document)]
-            if skip_existing
-            else documents
-        )
+        documents_to_load = documents
+        if skip_existing and len(documents) > 0:
+            exists = self.vector_db.doc_exists_batch(documents)
+            documents_to_load = [document for document, doc_exists in zip(documents, exists) if not doc_exists]
 
         # Insert documents
         if len(documents_to_load) > 0:
             self.vector_db.insert(documents=documents_to_load, filters=filters)
+            self.clear_search_cache()
             logger.info(f"Loaded {len(documents_to_load)} documents to knowledge base")
         else:
             logger.info("No new documents to load")
@@ -227,4 +476,5 @@ class AgentKnowledge(BaseModel):
             logger.warning("No vector db available")
             return True
 
+        self.clear_search_cache()
         return self.vector_db.delete()
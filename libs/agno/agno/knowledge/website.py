@@ -74,8 +74,9 @@ class WebsiteKnowledgeBase(AgentKnowledge):
         for url in urls_to_read:
             document_list = self.reader.read(url=url)
             # Filter out documents which already exist in the vector db
-            if not recreate:
-                document_list = [document for document in document_list if not self.vector_db.doc_exists(document)]
+            if not recreate and len(document_list) > 0:
+                exists = self.vector_db.doc_exists_batch(document_list)
+                document_list = [document for document, doc_exists in zip(document_list, exists) if not doc_exists]
             if upsert and self.vector_db.upsert_available():
                 self.vector_db.upsert(documents=document_list, filters=filters)
             else:
@@ -83,6 +84,8 @@ class WebsiteKnowledgeBase(AgentKnowledge):
             num_documents += len(document_list)
             logger.info(f"Loaded {num_documents} documents to knowledge base")
 
+        self.clear_search_cache()
+
         if self.optimize_on is not None and num_documents > self.optimize_on:
             logger.debug("Optimizing Vector DB")
             self.vector_db.optimize()
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict
 
@@ -9,11 +10,13 @@ from agno.memory.classifier import MemoryClassifier
 from agno.memory.db import MemoryDb
 from agno.memory.manager import MemoryManager
 from agno.memory.memory import Memory
+from agno.memory.row import MemoryRow
 from agno.memory.summarizer import MemorySummarizer
 from agno.memory.summary import SessionSummary
 from agno.models.message import Message
 from agno.run.response import RunResponse
 from agno.utils.log import logger
+from agno.utils.tokens import estimate_message_tokens
 
 
 class AgentRun(BaseModel):
@@ -37,6 +40,20 @@ class AgentMemory(BaseModel):
     messages: List[Message] = []
     update_system_message_on_change: bool = False
 
+    # Maximum number of runs kept in memory. Older runs are evicted to storage-only form:
+    # they are still written to storage, but are no longer used to build the history sent to the model.
+    max_runs: Optional[int] = None
+    # Maximum number of messages kept in memory, older messages are evicted to storage-only form.
+    # System messages are never evicted.
+    max_messages: Optional[int] = None
+    # Maximum number of tokens of history sent to the model
+    max_history_tokens: Optional[int] = None
+    # Function to count the tokens of a message, defaults to a character based estimate
+    token_counter: Optional[Callable[[Message], int]] = None
+    # Runs and messages evicted from memory, as dictionaries
+    evicted_runs: List[Dict[str, Any]] = []
+    evicted_messages: List[Dict[str, Any]] = []
+
     # Summary of the session
     summary: Optional[SessionSummary] = None
     # Create and store session summaries
@@ -45,6 +62,14 @@ class AgentMemory(BaseModel):
     update_session_summary_after_run: bool = True
     # Summarizer to generate session summaries
     summarizer: Optional[MemorySummarizer] = None
+    # Update the session summary from the previous summary and the runs since, instead of the whole session
+    incremental_session_summary: bool = False
+    # Update the session summary once this many runs were added since the last summary
+    session_summary_every_n_runs: Optional[int] = None
+    # Update the session summary once the runs since the last summary exceed this many tokens
+    session_summary_token_threshold: Optional[int] = None
+    # Number of runs in the session covered by the summary
+    summarized_runs: int = 0
 
     # Create and store personalized memories for this user
     create_user_memories: bool = False
@@ -57,6 +82,7 @@ class AgentMemory(BaseModel):
     user_id: Optional[str] = None
     retrieval: MemoryRetrieval = MemoryRetrieval.last_n
     memories: Optional[List[Memory]] = None
+    # Number of memories to load. With semantic retrieval, the number of most relevant memories, defaults to 5.
     num_memories: Optional[int] = None
     classifier: Optional[MemoryClassifier] = None
     manager: Optional[MemoryManager] = None
@@ -79,8 +105,26 @@ class AgentMemory(BaseModel):
                 "update_user_memories_after_run",
                 "user_id",
                 "num_memories",
+                "max_runs",
+                "max_messages",
+                "max_history_tokens",
+                "incremental_session_summary",
+                "session_summary_every_n_runs",
+                "session_summary_token_threshold",
+                "summarized_runs",
             },
         )
+        # Evicted runs and messages are older than the ones in memory
+        if self.evicted_runs:
+            _memory_dict["runs"] = self.evicted_runs + _memory_dict.get("runs", [])
+        if self.evicted_messages:
+            messages = _memory_dict.get("messages", [])
+            num_system_messages = next(
+                (i for i, m in enumerate(self.messages) if not self._is_system_message(m)), len(self.messages)
+            )
+            _memory_dict["messages"] = (
+                messages[:num_system_messages] + self.evicted_messages + messages[num_system_messages:]
+            )
         # Add summary if it exists
         if self.summary is not None:
             _memory_dict["summary"] = self.summary.to_dict()
@@ -93,6 +137,57 @@ class AgentMemory(BaseModel):
         """Adds an AgentRun to the runs list."""
         self.runs.append(agent_run)
         logger.debug("Added AgentRun to AgentMemory")
+        self.evict()
+
+    def set_runs(self, runs: List[Dict[str, Any]]) -> None:
+        """Set the runs from storage, keeping the runs beyond max_runs in storage-only form."""
+        num_evicted = max(len(runs) - self.max_runs, 0) if self.max_runs is not None else 0
+        self.evicted_runs = list(runs[:num_evicted])
+        self.runs = [AgentRun(**run) for run in runs[num_evicted:]]
+
+    def set_messages(self, messages: List[Dict[str, Any]]) -> None:
+        """Set the messages from storage, keeping the messages beyond max_messages in storage-only form."""
+        self.evicted_messages = []
+        self.messages = [Message(**m) for m in messages]
+        self.evict()
+
+    def get_num_runs(self) -> int:
+        """Returns the number of runs in the session, including evicted runs."""
+        return len(self.evicted_runs) + len(self.runs)
+
+    def get_runs(self, from_run: int = 0) -> List[AgentRun]:
+        """Returns the runs of the session from the run index from_run on, including evicted runs."""
+        num_evicted = len(self.evicted_runs)
+        runs = [AgentRun(**run) for run in self.evicted_runs[from_run:]]
+        return runs + self.runs[max(from_run - num_evicted, 0) :]
+
+    def evict(self) -> None:
+        """Evict the runs and messages beyond max_runs and max_messages to storage-only form."""
+        if self.max_runs is not None and len(self.runs) > self.max_runs:
+            num_evicted = len(self.runs) - self.max_runs
+            self.evicted_runs = self.evicted_runs + [
+                run.model_dump(exclude_none=True) for run in self.runs[:num_evicted]
+            ]
+            self.runs = self.runs[num_evicted:]
+            logger.debug(f"Evicted {num_evicted} runs from AgentMemory")
+
+        if self.max_messages is not None:
+            num_evicted = sum(1 for m in self.messages if not self._is_system_message(m)) - self.max_messages
+            if num_evicted > 0:
+                messages: List[Message] = []
+                evicted_messages: List[Dict[str, Any]] = []
+                for message in self.messages:
+                    if len(evicted_messages) < num_evicted and not self._is_system_message(message):
+                        evicted_messages.append(message.model_dump(exclude_none=True))
+                    else:
+                        messages.append(message)
+                self.evicted_messages = self.evicted_messages + evicted_messages
+                self.messages = messages
+                logger.debug(f"Evicted {num_evicted} messages from AgentMemory")
+
+    @staticmethod
+    def _is_system_message(message: Message) -> bool:
+        return message.role in ("system", "developer")
 
     def add_system_message(self, message: Message, system_message_role: str = "system") -> None:
         """Add the system messages to the messages list"""
@@ -121,28 +216,37 @@ class AgentMemory(BaseModel):
         """Add a Message to the messages list."""
         self.messages.append(message)
         logger.debug("Added Message to AgentMemory")
+        self.evict()
 
     def add_messages(self, messages: List[Message]) -> None:
         """Add a list of messages to the messages list."""
         self.messages.extend(messages)
         logger.debug(f"Added {len(messages)} Messages to AgentMemory")
+        self.evict()
 
     def get_messages(self) -> List[Dict[str, Any]]:
         """Returns the messages list as a list of dictionaries."""
         return [message.model_dump() for message in self.messages]
 
     def get_messages_from_last_n_runs(
-        self, last_n: Optional[int] = None, skip_role: Optional[str] = None
+        self, last_n: Optional[int] = None, skip_role: Optional[str] = None, max_tokens: Optional[int] = None
     ) -> List[Message]:
         """Returns the messages from the last_n runs
 
         Args:
             last_n: The number of runs to return from the end of the conversation.
             skip_role: Skip messages with this role.
+            max_tokens: The maximum number of tokens of the returned messages, defaults to max_history_tokens.
+                The most recent runs that fit are returned, runs are never split.
 
         Returns:
             A list of Messages in the last_n runs.
         """
+        if max_tokens is None:
+            max_tokens = self.max_history_tokens
+        if max_tokens is not None:
+            return self.get_messages_within_token_budget(max_tokens=max_tokens, last_n=last_n, skip_role=skip_role)
+
         if last_n is None:
             logger.debug("Getting messages from all previous runs")
             messages_from_all_history = []
@@ -168,16 +272,49 @@ class AgentMemory(BaseModel):
         logger.debug(f"Messages from last {last_n} runs: {len(messages_from_last_n_history)}")
         return messages_from_last_n_history
 
+    def get_messages_within_token_budget(
+        self, max_tokens: int, last_n: Optional[int] = None, skip_role: Optional[str] = None
+    ) -> List[Message]:
+        """Returns the messages from the most recent runs (at most last_n) that fit within max_tokens"""
+        token_counter = self.token_counter or estimate_message_tokens
+        runs = self.runs[-last_n:] if last_n is not None else self.runs
+
+        history_runs: List[List[Message]] = []
+        num_tokens = 0
+        for prev_run in reversed(runs):
+            if not (prev_run.response and prev_run.response.messages):
+                continue
+            if skip_role:
+                prev_run_messages = [m for m in prev_run.response.messages if m.role != skip_role]
+            else:
+                prev_run_messages = prev_run.response.messages
+            run_tokens = sum(token_counter(m) for m in prev_run_messages)
+            if num_tokens + run_tokens > max_tokens:
+                break
+            num_tokens += run_tokens
+            history_runs.append(prev_run_messages)
+
+        history = [m for run_messages in reversed(history_runs) for m in run_messages]
+        logger.debug(f"Messages from {len(history_runs)} runs within {max_tokens} tokens: {len(history)}")
+        return history
+
     def get_message_pairs(
-        self, user_role: str = "user", assistant_role: Optional[List[str]] = None
+        self, user_role: str = "user", assistant_role: Optional[List[str]] = None, from_run: Optional[int] = None
     ) -> List[Tuple[Message, Message]]:
-        """Returns a list of tuples of (user message, assistant response)."""
+        """Returns a list of tuples of (user message, assistant response).
+
+        Args:
+            user_role: The role of user messages.
+            assistant_role: The roles of assistant messages.
+            from_run: Only return pairs from this run index on, including evicted runs.
+                By default, pairs are returned from the runs in memory.
+        """
 
         if assistant_role is None:
             assistant_role = ["assistant", "model", "CHATBOT"]
 
         runs_as_message_pairs: List[Tuple[Message, Message]] = []
-        for run in self.runs:
+        for run in self.runs if from_run is None else self.get_runs(from_run=from_run):
             if run.response and run.response.messages:
                 user_messages_from_run = None
                 assistant_messages_from_run = None
@@ -210,25 +347,68 @@ class AgentMemory(BaseModel):
                         return tool_calls
         return tool_calls
 
-    def load_user_memories(self) -> None:
-        """Load memories from memory db for this user."""
+    def _use_semantic_retrieval(self, query: Optional[str]) -> bool:
+        """Semantic retrieval needs a query and a db with an embedder, otherwise the latest memories are loaded."""
+        if self.retrieval != MemoryRetrieval.semantic or not query or self.db is None:
+            return False
+        if self.db.embedder is None:
+            logger.warning("Semantic retrieval requires a MemoryDb with an embedder, loading the latest memories.")
+            return False
+        return True
+
+    def load_user_memories(self, query: Optional[str] = None) -> None:
+        """Load memories from memory db for this user.
+
+        With semantic retrieval, loads the memories most relevant to the query.
+        """
 
         if self.db is None:
             return
 
         try:
-            if self.retrieval in (MemoryRetrieval.last_n, MemoryRetrieval.first_n):
+            if self._use_semantic_retrieval(query):
+                query_embedding = self.db.embedder.get_embedding(query)  # type: ignore
+                memory_rows = self.db.search_memories(
+                    query_embedding=query_embedding, user_id=self.user_id, limit=self.num_memories or 5
+                )
+            else:
                 memory_rows = self.db.read_memories(
                     user_id=self.user_id,
                     limit=self.num_memories,
                     sort="asc" if self.retrieval == MemoryRetrieval.first_n else "desc",
                 )
-            else:
-                raise NotImplementedError("Semantic retrieval not yet supported.")
         except Exception as e:
             logger.debug(f"Error reading memory: {e}")
             return
 
+        self.set_user_memories(memory_rows)
+
+    async def aload_user_memories(self, query: Optional[str] = None) -> None:
+        """Async version of load_user_memories(), reads the memory db on a thread so the event loop is not blocked."""
+
+        if self.db is None:
+            return
+
+        if not self._use_semantic_retrieval(query):
+            await asyncio.to_thread(self.load_user_memories, query=query)
+            return
+
+        try:
+            query_embedding = await self.db.embedder.async_get_embedding(query)  # type: ignore
+            # Searching may also embed and store the memories of the user that have no embedding yet
+            memory_rows = await asyncio.to_thread(
+                self.db.search_memories,
+                query_embedding=query_embedding,
+                user_id=self.user_id,
+                limit=self.num_memories or 5,
+            )
+        except Exception as e:
+            logger.debug(f"Error reading memory: {e}")
+            return
+
+        self.set_user_memories(memory_rows)
+
+    def set_user_memories(self, memory_rows: Optional[List[MemoryRow]]) -> None:
         # Clear the existing memories
         self.memories = []
 
@@ -298,7 +478,7 @@ class AgentMemory(BaseModel):
             self.manager.user_id = self.user_id
 
         response = self.manager.run(input)
-        self.load_user_memories()
+        self.load_user_memories(query=input)
         self.updating_memory = False
         return response
 
@@ -331,10 +511,46 @@ class AgentMemory(BaseModel):
             self.manager.user_id = self.user_id
 
         response = await self.manager.arun(input)
-        self.load_user_memories()
+        await self.aload_user_memories(query=input)
         self.updating_memory = False
         return response
 
+    def should_update_summary(self) -> bool:
+        """Determines if the session summary is due, based on the runs added since the last summary."""
+        num_unsummarized_runs = self.get_num_runs() - self.summarized_runs
+        if num_unsummarized_runs <= 0:
+            return False
+        if self.session_summary_every_n_runs is None and self.session_summary_token_threshold is None:
+            return True
+        if self.session_summary_every_n_runs is not None and num_unsummarized_runs >= self.session_summary_every_n_runs:
+            return True
+        if self.session_summary_token_threshold is not None:
+            token_counter = self.token_counter or estimate_message_tokens
+            num_tokens = sum(
+                token_counter(user_message) + token_counter(assistant_message)
+                for user_message, assistant_message in self.get_message_pairs(from_run=self.summarized_runs)
+            )
+            return num_tokens >= self.session_summary_token_threshold
+        return False
+
+    def get_summary_input(self) -> Tuple[int, List[Tuple[Message, Message]], Optional[SessionSummary]]:
+        """Returns the number of runs, the message pairs to summarize and the summary to update.
+
+        The input is taken before the summarizer runs, so the summary can be created while new runs are added.
+        """
+        num_runs = self.get_num_runs()
+        if self.incremental_session_summary and self.summary is not None:
+            return num_runs, self.get_message_pairs(from_run=self.summarized_runs), self.summary
+        if self.incremental_session_summary:
+            return num_runs, self.get_message_pairs(from_run=0), None
+        return num_runs, self.get_message_pairs(), None
+
+    def set_summary(self, summary: Optional[SessionSummary], num_runs: int) -> None:
+        """Set the summary created from the first num_runs runs of the session"""
+        if summary is not None:
+            self.summary = summary
+            self.summarized_runs = num_runs
+
     def update_summary(self) -> Optional[SessionSummary]:
         """Creates a summary of the session"""
         from agno.memory.summarizer import MemorySummarizer
@@ -344,7 +560,9 @@ class AgentMemory(BaseModel):
         if self.summarizer is None:
             self.summarizer = MemorySummarizer()
 
-        self.summary = self.summarizer.run(self.get_message_pairs())
+        num_runs, message_pairs, previous_summary = self.get_summary_input()
+        summary = self.summarizer.run(message_pairs, previous_summary=previous_summary)
+        self.set_summary(summary, num_runs)
         self.updating_memory = False
         return self.summary
 
@@ -357,7 +575,9 @@ class AgentMemory(BaseModel):
         if self.summarizer is None:
             self.summarizer = MemorySummarizer()
 
-        self.summary = await self.summarizer.arun(self.get_message_pairs())
+        num_runs, message_pairs, previous_summary = self.get_summary_input()
+        summary = await self.summarizer.arun(message_pairs, previous_summary=previous_summary)
+        self.set_summary(summary, num_runs)
         self.updating_memory = False
         return self.summary
 
@@ -366,7 +586,10 @@ class AgentMemory(BaseModel):
 
         self.runs = []
         self.messages = []
+        self.evicted_runs = []
+        self.evicted_messages = []
         self.summary = None
+        self.summarized_runs = 0
         self.memories = None
 
     def deep_copy(self) -> "AgentMemory":
@@ -377,7 +600,7 @@ class AgentMemory(BaseModel):
 
         # Manually deepcopy fields that are known to be safe
         for field_name, field_value in self.__dict__.items():
-            if field_name not in ["db", "classifier", "manager", "summarizer"]:
+            if field_name not in ["db", "classifier", "manager", "summarizer", "token_counter"]:
                 try:
                     setattr(copied_obj, field_name, deepcopy(field_value))
                 except Exception as e:
@@ -388,5 +611,6 @@ class AgentMemory(BaseModel):
         copied_obj.classifier = self.classifier
         copied_obj.manager = self.manager
         copied_obj.summarizer = self.summarizer
+        copied_obj.token_counter = self.token_counter
 
         return copied_obj
@@ -1,12 +1,24 @@
+import base64
+import heapq
+import json
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Set, Tuple
 
+from agno.embedder.base import Embedder
 from agno.memory.row import MemoryRow
+from agno.utils.log import logger
+from agno.utils.similarity import cosine_similarity
 
 
 class MemoryDb(ABC):
     """Base class for the Memory Database."""
 
+    # Embedder used to embed memories on upsert, required for semantic retrieval
+    embedder: Optional[Embedder] = None
+    # Users whose memories without an embedding were embedded by backfill_embeddings()
+    _backfilled_user_ids: Optional[Set[Optional[str]]] = None
+
     @abstractmethod
     def create(self) -> None:
         raise NotImplementedError
@@ -40,3 +52,145 @@ class MemoryDb(ABC):
     @abstractmethod
     def clear(self) -> bool:
         raise NotImplementedError
+
+    def read_memories_page(
+        self,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: Optional[str] = None,
+    ) -> Tuple[List[MemoryRow], Optional[str]]:
+        """
+        Read a page of memories ordered by (created_at, id), newest first unless sort is "asc".
+        Backends override this default, which reads and pages all memories in memory.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            limit (Optional[int]): Maximum number of memories to return. Returns all memories if None.
+            cursor (Optional[str]): Cursor returned with the previous page.
+            sort (Optional[str]): Sort order, "asc" or "desc".
+
+        Returns:
+            Tuple[List[MemoryRow], Optional[str]]: The memories and the cursor of the next page, None on the last page.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        descending = sort != "asc"
+        memories = sorted(self.read_memories(user_id=user_id), key=memory_sort_key, reverse=descending)
+        if cursor is not None:
+            after = decode_memory_cursor(cursor)
+            after_key = (after[0] or datetime.min, after[1])
+            if descending:
+                memories = [m for m in memories if memory_sort_key(m) < after_key]
+            else:
+                memories = [m for m in memories if memory_sort_key(m) > after_key]
+        return get_memory_page(memories, limit)
+
+    def upsert_memories(self, memories: List[MemoryRow]) -> None:
+        """Create or update memories. Backends override this default, which upserts the memories one by one."""
+        for memory in memories:
+            self.upsert_memory(memory)
+
+    def delete_memories(self, ids: List[str]) -> None:
+        """Delete memories by id. Backends override this default, which deletes the memories one by one."""
+        for id in ids:
+            self.delete_memory(id=id)
+
+    def embed_memories(self, memories: List[MemoryRow]) -> List[MemoryRow]:
+        """Set the embeddings of the memories without one in a single batch, if an embedder is configured."""
+        if self.embedder is None:
+            return memories
+        to_embed = [m for m in memories if m.embedding is None and isinstance(m.memory.get("memory"), str)]
+        to_embed = [m for m in to_embed if m.memory["memory"]]
+        if len(to_embed) > 0:
+            embeddings, _ = self.embedder.get_embeddings_batch([m.memory["memory"] for m in to_embed])
+            for memory, embedding in zip(to_embed, embeddings):
+                memory.embedding = embedding
+        return memories
+
+    def embed_memory(self, memory: MemoryRow) -> MemoryRow:
+        """Set the embedding of the memory text, if an embedder is configured and the memory has no embedding."""
+        if self.embedder is None or memory.embedding is not None:
+            return memory
+        memory_text = memory.memory.get("memory")
+        if isinstance(memory_text, str) and memory_text:
+            memory.embedding = self.embedder.get_embedding(memory_text)
+        return memory
+
+    def read_memories_without_embedding(self, user_id: Optional[str] = None) -> List[MemoryRow]:
+        """Returns the memories of the user that have no embedding.
+        Backends override this default, which reads all memories of the user.
+        """
+        return [m for m in self.read_memories(user_id=user_id) if m.embedding is None]
+
+    def backfill_embeddings(self, user_id: Optional[str] = None) -> int:
+        """Embed and store the memories of the user that have no embedding, e.g. memories created before the
+        embedder was configured. Each user is backfilled once per MemoryDb, later memories are embedded on upsert.
+
+        Returns:
+            int: The number of memories that were embedded.
+        """
+        if self.embedder is None:
+            return 0
+        if self._backfilled_user_ids is None:
+            self._backfilled_user_ids = set()
+        if user_id in self._backfilled_user_ids:
+            return 0
+        memories = self.embed_memories(self.read_memories_without_embedding(user_id=user_id))
+        memories = [m for m in memories if m.embedding is not None]
+        if len(memories) > 0:
+            logger.debug(f"Embedded {len(memories)} memories without an embedding")
+            self.upsert_memories(memories)
+        self._backfilled_user_ids.add(user_id)
+        return len(memories)
+
+    def search_memories(
+        self, query_embedding: List[float], user_id: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[MemoryRow]:
+        """Returns the memories most similar to the query embedding, most similar first.
+
+        Backends with a vector index should override this method and call backfill_embeddings() first.
+        The default implementation ranks all memories of the user by cosine similarity.
+        """
+        self.backfill_embeddings(user_id=user_id)
+        memories = [m for m in self.read_memories(user_id=user_id) if m.embedding is not None]
+        return rank_by_similarity(query_embedding, memories, limit)
+
+
+def rank_by_similarity(
+    query_embedding: List[float], memories: List[MemoryRow], limit: Optional[int] = None
+) -> List[MemoryRow]:
+    """Returns the memories ordered by cosine similarity to the query embedding, keeping the top `limit`."""
+    scored = [(cosine_similarity(query_embedding, m.embedding), i, m) for i, m in enumerate(memories) if m.embedding]
+    if limit is not None:
+        top = heapq.nlargest(limit, scored, key=lambda s: (s[0], -s[1]))
+    else:
+        top = sorted(scored, key=lambda s: (s[0], -s[1]), reverse=True)
+    return [m for _, _, m in top]
+
+
+def memory_sort_key(memory: MemoryRow) -> Tuple[datetime, str]:
+    return (memory.created_at or datetime.min, memory.id or "")
+
+
+def encode_memory_cursor(created_at: Optional[datetime], id: str) -> str:
+    value = json.dumps([created_at.isoformat() if created_at else None, id])
+    return base64.urlsafe_b64encode(value.encode("utf-8")).decode("ascii")
+
+
+def decode_memory_cursor(cursor: str) -> Tuple[Optional[datetime], str]:
+    """Returns the (created_at, id) a cursor points after. Raises ValueError for an invalid cursor."""
+    try:
+        created_at, id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return (datetime.fromisoformat(created_at) if created_at else None), str(id)
+    except Exception:
+        raise ValueError(f"Invalid memory cursor: {cursor}")
+
+
+def get_memory_page(memories: List[MemoryRow], limit: Optional[int]) -> Tuple[List[MemoryRow], Optional[str]]:
+    """Trim memories read with limit + 1 to a page and return it with the cursor of the next page."""
+    if limit is None or len(memories) <= limit:
+        return memories, None
+    page = memories[:limit]
+    return page, encode_memory_cursor(page[-1].created_at, page[-1].id or "") if page else None
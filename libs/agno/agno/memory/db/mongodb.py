@@ -1,15 +1,17 @@
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
-    from pymongo import MongoClient
+    from pymongo import MongoClient, UpdateOne
     from pymongo.collection import Collection
     from pymongo.database import Database
     from pymongo.errors import PyMongoError
 except ImportError:
     raise ImportError("`pymongo` not installed. Please install it with `pip install pymongo`")
 
+from agno.embedder.base import Embedder
 from agno.memory.db import MemoryDb
+from agno.memory.db.base import decode_memory_cursor, get_memory_page, rank_by_similarity
 from agno.memory.row import MemoryRow
 from agno.utils.log import logger
 
@@ -21,6 +23,8 @@ class MongoMemoryDb(MemoryDb):
         db_url: Optional[str] = None,
         db_name: str = "agno",
         client: Optional[MongoClient] = None,
+        embedder: Optional[Embedder] = None,
+        vector_search_index: Optional[str] = None,
     ):
         """
         This class provides a memory store backed by a MongoDB collection.
@@ -30,6 +34,9 @@ class MongoMemoryDb(MemoryDb):
             db_url: MongoDB connection URL
             db_name: Name of the database
             client: Optional existing MongoDB client
+            embedder: Embedder used to embed memories on upsert, required for semantic retrieval
+            vector_search_index: Name of an Atlas Vector Search index on the `embedding` field.
+                Without it, memories are ranked by cosine similarity on the client.
         """
         self._client: Optional[MongoClient] = client
         if self._client is None and db_url is not None:
@@ -42,6 +49,8 @@ class MongoMemoryDb(MemoryDb):
         self.db_name: str = db_name
         self.db: Database = self._client[self.db_name]
         self.collection: Collection = self.db[self.collection_name]
+        self.embedder: Optional[Embedder] = embedder
+        self.vector_search_index: Optional[str] = vector_search_index
 
     def create(self) -> None:
         """Create indexes for the collection"""
@@ -50,6 +59,7 @@ class MongoMemoryDb(MemoryDb):
             self.collection.create_index("id", unique=True)
             self.collection.create_index("user_id")
             self.collection.create_index("created_at")
+            self.collection.create_index([("user_id", 1), ("created_at", -1), ("id", -1)])
         except PyMongoError as e:
             logger.error(f"Error creating indexes for collection '{self.collection_name}': {e}")
             raise
@@ -96,11 +106,138 @@ class MongoMemoryDb(MemoryDb):
             for doc in cursor:
                 # Remove MongoDB _id before converting to MemoryRow
                 doc.pop("_id", None)
+                memories.append(
+                    MemoryRow(
+                        id=doc["id"], user_id=doc["user_id"], memory=doc["memory"], embedding=doc.get("embedding")
+                    )
+                )
+        except PyMongoError as e:
+            logger.error(f"Error reading memories: {e}")
+        return memories
+
+    def read_memories_without_embedding(self, user_id: Optional[str] = None) -> List[MemoryRow]:
+        """Read the memories of the user that have no embedding
+        Args:
+            user_id: ID of the user to read
+        Returns:
+            List[MemoryRow]: List of memories
+        """
+        if self.embedder is None:
+            return []
+        query: Dict[str, Any] = {"embedding": None}
+        if user_id is not None:
+            query["user_id"] = user_id
+
+        memories: List[MemoryRow] = []
+        try:
+            for doc in self.collection.find(query):
                 memories.append(MemoryRow(id=doc["id"], user_id=doc["user_id"], memory=doc["memory"]))
         except PyMongoError as e:
             logger.error(f"Error reading memories: {e}")
         return memories
 
+    def search_memories(
+        self, query_embedding: List[float], user_id: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[MemoryRow]:
+        """Search memories by similarity to the query embedding
+        Args:
+            query_embedding: Embedding of the query
+            user_id: ID of the user to search
+            limit: Maximum number of memories to return
+        Returns:
+            List[MemoryRow]: List of memories, most similar first
+        """
+        if self.embedder is None:
+            return []
+        self.backfill_embeddings(user_id=user_id)
+        query: Dict[str, Any] = {"embedding": {"$exists": True}}
+        if user_id is not None:
+            query["user_id"] = user_id
+
+        memories: List[MemoryRow] = []
+        try:
+            if self.vector_search_index is None:
+                for doc in self.collection.find(query):
+                    memories.append(
+                        MemoryRow(
+                            id=doc["id"], user_id=doc["user_id"], memory=doc["memory"], embedding=doc["embedding"]
+                        )
+                    )
+                return rank_by_similarity(query_embedding, memories, limit)
+
+            num_results = limit or 10
+            vector_search: Dict[str, Any] = {
+                "index": self.vector_search_index,
+                "path": "embedding",
+                "queryVector": query_embedding,
+                "numCandidates": num_results * 10,
+                "limit": num_results,
+            }
+            if user_id is not None:
+                vector_search["filter"] = {"user_id": user_id}
+            for doc in self.collection.aggregate([{"$vectorSearch": vector_search}]):
+                memories.append(
+                    MemoryRow(id=doc["id"], user_id=doc["user_id"], memory=doc["memory"], embedding=doc["embedding"])
+                )
+        except PyMongoError as e:
+            logger.error(f"Error searching memories: {e}")
+        return memories
+
+    def read_memories_page(
+        self,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: Optional[str] = None,
+    ) -> Tuple[List[MemoryRow], Optional[str]]:
+        """Read a page of memories from the collection
+        Args:
+            user_id: ID of the user to read
+            limit: Maximum number of memories to read
+            cursor: Cursor returned with the previous page
+            sort: Sort order ("asc" or "desc")
+        Returns:
+            Tuple[List[MemoryRow], Optional[str]]: List of memories and the cursor of the next page
+        """
+        after = decode_memory_cursor(cursor) if cursor is not None else None
+        memories: List[MemoryRow] = []
+        try:
+            query: Dict[str, Any] = {}
+            if user_id is not None:
+                query["user_id"] = user_id
+            sort_order = -1 if sort != "asc" else 1
+            if after is not None:
+                # created_at is stored as a unix timestamp
+                after_created_at = int(after[0].timestamp()) if after[0] else 0
+                op = "$lt" if sort_order == -1 else "$gt"
+                query["$or"] = [
+                    {"created_at": {op: after_created_at}},
+                    {"created_at": after_created_at, "id": {op: after[1]}},
+                ]
+
+            cursor_ = self.collection.find(query).sort([("created_at", sort_order), ("id", sort_order)])
+            # Read one extra memory to know if there is a next page
+            if limit is not None:
+                cursor_ = cursor_.limit(limit + 1)
+
+            for doc in cursor_:
+                created_at = doc.get("created_at")
+                updated_at = doc.get("updated_at")
+                memories.append(
+                    MemoryRow(
+                        id=doc["id"],
+                        user_id=doc["user_id"],
+                        memory=doc["memory"],
+                        embedding=doc.get("embedding"),
+                        created_at=datetime.fromtimestamp(created_at, tz=timezone.utc) if created_at else None,
+                        updated_at=datetime.fromtimestamp(updated_at, tz=timezone.utc) if updated_at else None,
+                    )
+                )
+        except PyMongoError as e:
+            logger.error(f"Error reading memories: {e}")
+            return [], None
+        return get_memory_page(memories, limit)
+
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         """Upsert a memory into the collection
         Args:
@@ -109,31 +246,41 @@ class MongoMemoryDb(MemoryDb):
         Returns:
             None
         """
-        try:
-            now = datetime.now(timezone.utc)
-            timestamp = int(now.timestamp())
-
-            # Add version field for optimistic locking
-            memory_dict = memory.model_dump()
-            if "_version" not in memory_dict:
-                memory_dict["_version"] = 1
-            else:
-                memory_dict["_version"] += 1
+        self.upsert_memories([memory])
 
-            update_data = {
-                "user_id": memory.user_id,
-                "memory": memory.memory,
-                "updated_at": timestamp,
-                "_version": memory_dict["_version"],
-            }
+    def upsert_memories(self, memories: List[MemoryRow]) -> None:
+        """Upsert memories into the collection in a single bulk write
+        Args:
+            memories: MemoryRows to upsert
+        Returns:
+            None
+        """
+        if len(memories) == 0:
+            return
+        self.embed_memories(memories)
+        try:
+            timestamp = int(datetime.now(timezone.utc).timestamp())
 
-            # For new documents, set created_at
-            query = {"id": memory.id}
-            doc = self.collection.find_one(query)
-            if not doc:
-                update_data["created_at"] = timestamp
+            operations = []
+            for memory in memories:
+                update_data: Dict[str, Any] = {
+                    "user_id": memory.user_id,
+                    "memory": memory.memory,
+                    "updated_at": timestamp,
+                    "_version": 1,
+                }
+                if memory.embedding is not None:
+                    update_data["embedding"] = memory.embedding
+                # For new documents, set created_at
+                operations.append(
+                    UpdateOne(
+                        {"id": memory.id},
+                        {"$set": update_data, "$setOnInsert": {"created_at": timestamp}},
+                        upsert=True,
+                    )
+                )
 
-            result = self.collection.update_one(query, {"$set": update_data}, upsert=True)
+            result = self.collection.bulk_write(operations, ordered=False)
 
             if not result.acknowledged:
                 logger.error("Memory upsert not acknowledged")
@@ -159,6 +306,22 @@ class MongoMemoryDb(MemoryDb):
             logger.error(f"Error deleting memory: {e}")
             raise
 
+    def delete_memories(self, ids: List[str]) -> None:
+        """Delete memories from the collection in a single request
+        Args:
+            ids: IDs of the memories to delete
+        Returns:
+            None
+        """
+        if len(ids) == 0:
+            return
+        try:
+            result = self.collection.delete_many({"id": {"$in": ids}})
+            logger.debug(f"Deleted {result.deleted_count} memories")
+        except PyMongoError as e:
+            logger.error(f"Error deleting memories: {e}")
+            raise
+
     def drop_table(self) -> None:
         """Drop the collection
         Returns:
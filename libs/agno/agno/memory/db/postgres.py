@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 try:
     from sqlalchemy.dialects import postgresql
@@ -6,12 +6,14 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import scoped_session, sessionmaker
     from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import delete, select, text
+    from sqlalchemy.sql.expression import delete, select, text, tuple_
     from sqlalchemy.types import DateTime, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed")
 
+from agno.embedder.base import Embedder
 from agno.memory.db import MemoryDb
+from agno.memory.db.base import decode_memory_cursor, get_memory_page
 from agno.memory.row import MemoryRow
 from agno.utils.log import logger
 
@@ -23,6 +25,7 @@ class PgMemoryDb(MemoryDb):
         schema: Optional[str] = "ai",
         db_url: Optional[str] = None,
         db_engine: Optional[Engine] = None,
+        embedder: Optional[Embedder] = None,
     ):
         """
         This class provides a memory store backed by a postgres table.
@@ -36,6 +39,8 @@ class PgMemoryDb(MemoryDb):
             schema (Optional[str]): The schema to store the table in. Defaults to "ai".
             db_url (Optional[str]): The database URL to connect to. Defaults to None.
             db_engine (Optional[Engine]): The database engine to use. Defaults to None.
+            embedder (Optional[Embedder]): Embedder used to embed memories on upsert, required for semantic retrieval.
+                Embeddings are stored in a pgvector `embedding` column, which is added to existing tables.
         """
         _engine: Optional[Engine] = db_engine
         if _engine is None and db_url is not None:
@@ -48,27 +53,40 @@ class PgMemoryDb(MemoryDb):
         self.schema: Optional[str] = schema
         self.db_url: Optional[str] = db_url
         self.db_engine: Engine = _engine
+        self.embedder: Optional[Embedder] = embedder
         self.inspector = inspect(self.db_engine)
         self.metadata: MetaData = MetaData(schema=self.schema)
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
         self.table: Table = self.get_table()
+        # Upsert statement, built once and reused for every upsert
+        self._upsert_stmt: Optional[Any] = None
+        if self.embedder is not None and self.table_exists():
+            self.add_embedding_column()
 
     def get_table(self) -> Table:
-        return Table(
-            self.table_name,
-            self.metadata,
+        columns = [
             Column("id", String, primary_key=True),
             Column("user_id", String),
             Column("memory", postgresql.JSONB, server_default=text("'{}'::jsonb")),
             Column("created_at", DateTime(timezone=True), server_default=text("now()")),
             Column("updated_at", DateTime(timezone=True), onupdate=text("now()")),
-            extend_existing=True,
-        )
+        ]
+        # The embedding column is only part of the table when memories are embedded
+        if self.embedder is not None:
+            try:
+                from pgvector.sqlalchemy import Vector
+            except ImportError:
+                raise ImportError("`pgvector` not installed. Please install using `pip install pgvector`")
+            columns.append(Column("embedding", Vector(self.embedder.dimensions)))
+        return Table(self.table_name, self.metadata, *columns, extend_existing=True)
 
     def create(self) -> None:
         if not self.table_exists():
             try:
                 with self.Session() as sess, sess.begin():
+                    if self.embedder is not None:
+                        logger.debug("Creating extension: vector")
+                        sess.execute(text("CREATE EXTENSION IF NOT EXISTS vector;"))
                     if self.schema is not None:
                         logger.debug(f"Creating schema: {self.schema}")
                         sess.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.schema};"))
@@ -77,6 +95,36 @@ class PgMemoryDb(MemoryDb):
             except Exception as e:
                 logger.error(f"Error creating table '{self.table.fullname}': {e}")
                 raise
+        elif self.embedder is not None:
+            self.add_embedding_column()
+
+    def add_embedding_column(self) -> None:
+        """Add the embedding column to a table created without it."""
+        self.embedder = cast(Embedder, self.embedder)
+        columns = [c["name"] for c in inspect(self.db_engine).get_columns(self.table.name, schema=self.schema)]
+        if "embedding" in columns:
+            return
+        logger.debug(f"Adding embedding column to table: {self.table.fullname}")
+        with self.Session() as sess, sess.begin():
+            sess.execute(text("CREATE EXTENSION IF NOT EXISTS vector;"))
+            sess.execute(
+                text(
+                    f"ALTER TABLE {self.table.fullname} "
+                    f"ADD COLUMN IF NOT EXISTS embedding vector({self.embedder.dimensions});"
+                )
+            )
+
+    def _row_to_memory(self, row) -> MemoryRow:
+        embedding = getattr(row, "embedding", None)
+        return MemoryRow(
+            id=row.id,
+            user_id=row.user_id,
+            memory=row.memory,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            # pgvector returns embeddings as numpy arrays
+            embedding=[float(x) for x in embedding] if embedding is not None else None,
+        )
 
     def memory_exists(self, memory: MemoryRow) -> bool:
         columns = [self.table.c.id]
@@ -105,7 +153,7 @@ class PgMemoryDb(MemoryDb):
                 rows = sess.execute(stmt).fetchall()
                 for row in rows:
                     if row is not None:
-                        memories.append(MemoryRow.model_validate(row))
+                        memories.append(self._row_to_memory(row))
         except Exception as e:
             logger.debug(f"Exception reading from table: {e}")
             logger.debug(f"Table does not exist: {self.table.name}")
@@ -113,41 +161,131 @@ class PgMemoryDb(MemoryDb):
             self.create()
         return memories
 
-    def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
-        """Create a new memory if it does not exist, otherwise update the existing memory"""
+    def read_memories_without_embedding(self, user_id: Optional[str] = None) -> List[MemoryRow]:
+        if self.embedder is None:
+            return []
+        memories: List[MemoryRow] = []
+        try:
+            with self.Session() as sess, sess.begin():
+                stmt = select(self.table).where(self.table.c.embedding.is_(None))
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                for row in sess.execute(stmt).fetchall():
+                    memories.append(self._row_to_memory(row))
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+        return memories
 
+    def search_memories(
+        self, query_embedding: List[float], user_id: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[MemoryRow]:
+        if self.embedder is None:
+            return []
+        self.backfill_embeddings(user_id=user_id)
+        memories: List[MemoryRow] = []
         try:
             with self.Session() as sess, sess.begin():
-                # Create an insert statement
-                stmt = postgresql.insert(self.table).values(
-                    id=memory.id,
-                    user_id=memory.user_id,
-                    memory=memory.memory,
-                )
+                stmt = select(self.table).where(self.table.c.embedding.isnot(None))
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                stmt = stmt.order_by(self.table.c.embedding.cosine_distance(query_embedding))
+                if limit is not None:
+                    stmt = stmt.limit(limit)
 
-                # Define the upsert if the memory already exists
-                # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["id"],
-                    set_=dict(
-                        user_id=stmt.excluded.user_id,
-                        memory=stmt.excluded.memory,
-                    ),
-                )
+                rows = sess.execute(stmt).fetchall()
+                for row in rows:
+                    if row is not None:
+                        memories.append(self._row_to_memory(row))
+        except Exception as e:
+            logger.debug(f"Exception searching table: {e}")
+        return memories
+
+    def read_memories_page(
+        self,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: Optional[str] = None,
+    ) -> Tuple[List[MemoryRow], Optional[str]]:
+        after = decode_memory_cursor(cursor) if cursor is not None else None
+        memories: List[MemoryRow] = []
+        try:
+            with self.Session() as sess, sess.begin():
+                stmt = select(self.table)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+
+                key = tuple_(self.table.c.created_at, self.table.c.id)
+                if sort == "asc":
+                    if after is not None:
+                        stmt = stmt.where(key > tuple_(after[0], after[1]))
+                    stmt = stmt.order_by(self.table.c.created_at.asc(), self.table.c.id.asc())
+                else:
+                    if after is not None:
+                        stmt = stmt.where(key < tuple_(after[0], after[1]))
+                    stmt = stmt.order_by(self.table.c.created_at.desc(), self.table.c.id.desc())
+
+                # Read one extra memory to know if there is a next page
+                if limit is not None:
+                    stmt = stmt.limit(limit + 1)
 
-                sess.execute(stmt)
+                for row in sess.execute(stmt).fetchall():
+                    memories.append(self._row_to_memory(row))
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            return [], None
+        return get_memory_page(memories, limit)
+
+    def get_upsert_statement(self):
+        """Returns the statement that inserts a memory, or updates it if the id exists"""
+        if self._upsert_stmt is None:
+            # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+            stmt = postgresql.insert(self.table)
+            set_: Dict[str, Any] = dict(
+                user_id=stmt.excluded.user_id,
+                memory=stmt.excluded.memory,
+                updated_at=text("now()"),
+            )
+            if self.embedder is not None:
+                set_["embedding"] = stmt.excluded.embedding
+            self._upsert_stmt = stmt.on_conflict_do_update(index_elements=["id"], set_=set_)
+        return self._upsert_stmt
+
+    def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
+        """Create a new memory if it does not exist, otherwise update the existing memory"""
+        self.upsert_memories([memory], create_and_retry=create_and_retry)
+
+    def upsert_memories(self, memories: List[MemoryRow], create_and_retry: bool = True) -> None:
+        """Create or update memories in a single statement and transaction"""
+        if len(memories) == 0:
+            return
+        self.embed_memories(memories)
+        rows: List[Dict[str, Any]] = []
+        for memory in memories:
+            row = dict(id=memory.id, user_id=memory.user_id, memory=memory.memory)
+            if self.embedder is not None:
+                row["embedding"] = memory.embedding
+            rows.append(row)
+        try:
+            with self.Session() as sess, sess.begin():
+                sess.execute(self.get_upsert_statement(), rows)
         except Exception as e:
             logger.debug(f"Exception upserting into table: {e}")
             logger.debug(f"Table does not exist: {self.table.name}")
             logger.debug("Creating table for future transactions")
             self.create()
             if create_and_retry:
-                return self.upsert_memory(memory, create_and_retry=False)
+                return self.upsert_memories(memories, create_and_retry=False)
             return None
 
     def delete_memory(self, id: str) -> None:
+        self.delete_memories([id])
+
+    def delete_memories(self, ids: List[str]) -> None:
+        if len(ids) == 0:
+            return
         with self.Session() as sess, sess.begin():
-            stmt = delete(self.table).where(self.table.c.id == id)
+            stmt = delete(self.table).where(self.table.c.id.in_(ids))
             sess.execute(stmt)
 
     def drop_table(self) -> None:
@@ -188,7 +326,7 @@ class PgMemoryDb(MemoryDb):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"metadata", "table"}:
+            if k in {"metadata", "table", "_upsert_stmt"}:
                 continue
             # Reuse db_engine and Session without copying
             elif k in {"db_engine", "Session"}:
@@ -199,5 +337,6 @@ class PgMemoryDb(MemoryDb):
         # Recreate metadata and table for the copied instance
         copied_obj.metadata = MetaData(schema=copied_obj.schema)
         copied_obj.table = copied_obj.get_table()
+        copied_obj._upsert_stmt = None
 
         return copied_obj
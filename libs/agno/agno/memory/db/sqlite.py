@@ -1,5 +1,6 @@
+import json
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from sqlalchemy import (
@@ -9,18 +10,24 @@ try:
         MetaData,
         String,
         Table,
+        and_,
         create_engine,
         delete,
         inspect,
+        or_,
         select,
         text,
+        type_coerce,
     )
+    from sqlalchemy.dialects import sqlite
     from sqlalchemy.exc import SQLAlchemyError
     from sqlalchemy.orm import scoped_session, sessionmaker
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it with `pip install sqlalchemy`")
 
+from agno.embedder.base import Embedder
 from agno.memory.db import MemoryDb
+from agno.memory.db.base import decode_memory_cursor, get_memory_page, rank_by_similarity
 from agno.memory.row import MemoryRow
 from agno.utils.log import logger
 
@@ -32,6 +39,7 @@ class SqliteMemoryDb(MemoryDb):
         db_url: Optional[str] = None,
         db_file: Optional[str] = None,
         db_engine: Optional[Engine] = None,
+        embedder: Optional[Embedder] = None,
     ):
         """
         This class provides a memory store backed by a SQLite table.
@@ -47,6 +55,8 @@ class SqliteMemoryDb(MemoryDb):
             db_url: The database URL to connect to.
             db_file: The database file to connect to.
             db_engine: The database engine to use.
+            embedder: Embedder used to embed memories on upsert, required for semantic retrieval.
+                Embeddings are stored as JSON in an `embedding` column, which is added to existing tables.
         """
         _engine: Optional[Engine] = db_engine
         if _engine is None and db_url is not None:
@@ -67,6 +77,7 @@ class SqliteMemoryDb(MemoryDb):
         self.table_name: str = table_name
         self.db_url: Optional[str] = db_url
         self.db_engine: Engine = _engine
+        self.embedder: Optional[Embedder] = embedder
         self.metadata: MetaData = MetaData()
         self.inspector = inspect(self.db_engine)
 
@@ -74,11 +85,13 @@ class SqliteMemoryDb(MemoryDb):
         self.Session = scoped_session(sessionmaker(bind=self.db_engine))
         # Database table for memories
         self.table: Table = self.get_table()
+        # Upsert statement, built once and reused for every upsert
+        self._upsert_stmt: Optional[Any] = None
+        if self.embedder is not None and self.table_exists():
+            self.add_embedding_column()
 
     def get_table(self) -> Table:
-        return Table(
-            self.table_name,
-            self.metadata,
+        columns = [
             Column("id", String, primary_key=True),
             Column("user_id", String),
             Column("memory", String),
@@ -86,8 +99,11 @@ class SqliteMemoryDb(MemoryDb):
             Column(
                 "updated_at", DateTime, server_default=text("CURRENT_TIMESTAMP"), onupdate=text("CURRENT_TIMESTAMP")
             ),
-            extend_existing=True,
-        )
+        ]
+        # The embedding column is only part of the table when memories are embedded
+        if self.embedder is not None:
+            columns.append(Column("embedding", String))
+        return Table(self.table_name, self.metadata, *columns, extend_existing=True)
 
     def create(self) -> None:
         if not self.table_exists():
@@ -97,6 +113,29 @@ class SqliteMemoryDb(MemoryDb):
             except Exception as e:
                 logger.error(f"Error creating table '{self.table_name}': {e}")
                 raise
+        elif self.embedder is not None:
+            self.add_embedding_column()
+
+    def add_embedding_column(self) -> None:
+        """Add the embedding column to a table created without it."""
+        columns = [c["name"] for c in inspect(self.db_engine).get_columns(self.table_name)]
+        if "embedding" in columns:
+            return
+        logger.debug(f"Adding embedding column to table: {self.table_name}")
+        with self.Session() as session:
+            session.execute(text(f"ALTER TABLE {self.table_name} ADD COLUMN embedding VARCHAR"))
+            session.commit()
+
+    def _row_to_memory(self, row) -> MemoryRow:
+        embedding = getattr(row, "embedding", None)
+        return MemoryRow(
+            id=row.id,
+            user_id=row.user_id,
+            memory=eval(row.memory),
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            embedding=json.loads(embedding) if embedding else None,
+        )
 
     def memory_exists(self, memory: MemoryRow) -> bool:
         with self.Session() as session:
@@ -124,7 +163,7 @@ class SqliteMemoryDb(MemoryDb):
 
                 result = session.execute(stmt)
                 for row in result:
-                    memories.append(MemoryRow(id=row.id, user_id=row.user_id, memory=eval(row.memory)))
+                    memories.append(self._row_to_memory(row))
         except SQLAlchemyError as e:
             logger.debug(f"Exception reading from table: {e}")
             logger.debug(f"Table does not exist: {self.table_name}")
@@ -132,24 +171,121 @@ class SqliteMemoryDb(MemoryDb):
             self.create()
         return memories
 
-    def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
+    def read_memories_page(
+        self,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: Optional[str] = None,
+    ) -> Tuple[List[MemoryRow], Optional[str]]:
+        after = decode_memory_cursor(cursor) if cursor is not None else None
+        memories: List[MemoryRow] = []
         try:
             with self.Session() as session:
-                # Check if the memory already exists
-                existing = session.execute(select(self.table).where(self.table.c.id == memory.id)).first()
-
-                if existing:
-                    # Update existing memory
-                    stmt = (
-                        self.table.update()
-                        .where(self.table.c.id == memory.id)
-                        .values(user_id=memory.user_id, memory=str(memory.memory), updated_at=text("CURRENT_TIMESTAMP"))
-                    )
+                stmt = select(self.table)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+
+                if after is not None:
+                    # created_at is stored as text by CURRENT_TIMESTAMP, so compare it with a value in the same format
+                    created_at = type_coerce(self.table.c.created_at, String)
+                    after_created_at = after[0].strftime("%Y-%m-%d %H:%M:%S") if after[0] else ""
+                    if sort == "asc":
+                        stmt = stmt.where(
+                            or_(
+                                created_at > after_created_at,
+                                and_(created_at == after_created_at, self.table.c.id > after[1]),
+                            )
+                        )
+                    else:
+                        stmt = stmt.where(
+                            or_(
+                                created_at < after_created_at,
+                                and_(created_at == after_created_at, self.table.c.id < after[1]),
+                            )
+                        )
+
+                if sort == "asc":
+                    stmt = stmt.order_by(self.table.c.created_at.asc(), self.table.c.id.asc())
                 else:
-                    # Insert new memory
-                    stmt = self.table.insert().values(id=memory.id, user_id=memory.user_id, memory=str(memory.memory))  # type: ignore
+                    stmt = stmt.order_by(self.table.c.created_at.desc(), self.table.c.id.desc())
 
-                session.execute(stmt)
+                # Read one extra memory to know if there is a next page
+                if limit is not None:
+                    stmt = stmt.limit(limit + 1)
+
+                for row in session.execute(stmt):
+                    memories.append(self._row_to_memory(row))
+        except SQLAlchemyError as e:
+            logger.debug(f"Exception reading from table: {e}")
+            return [], None
+        return get_memory_page(memories, limit)
+
+    def read_memories_without_embedding(self, user_id: Optional[str] = None) -> List[MemoryRow]:
+        if self.embedder is None:
+            return []
+        memories: List[MemoryRow] = []
+        try:
+            with self.Session() as session:
+                stmt = select(self.table).where(self.table.c.embedding.is_(None))
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                for row in session.execute(stmt):
+                    memories.append(self._row_to_memory(row))
+        except SQLAlchemyError as e:
+            logger.debug(f"Exception reading from table: {e}")
+        return memories
+
+    def search_memories(
+        self, query_embedding: List[float], user_id: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[MemoryRow]:
+        if self.embedder is None:
+            return []
+        self.backfill_embeddings(user_id=user_id)
+        memories: List[MemoryRow] = []
+        try:
+            with self.Session() as session:
+                stmt = select(self.table).where(self.table.c.embedding.isnot(None))
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                for row in session.execute(stmt):
+                    memories.append(self._row_to_memory(row))
+        except SQLAlchemyError as e:
+            logger.debug(f"Exception searching table: {e}")
+            return []
+        return rank_by_similarity(query_embedding, memories, limit)
+
+    def get_upsert_statement(self):
+        """Returns the statement that inserts a memory, or updates it if the id exists"""
+        if self._upsert_stmt is None:
+            stmt = sqlite.insert(self.table)
+            set_: Dict[str, Any] = dict(
+                user_id=stmt.excluded.user_id,
+                memory=stmt.excluded.memory,
+                updated_at=text("CURRENT_TIMESTAMP"),
+            )
+            if self.embedder is not None:
+                set_["embedding"] = stmt.excluded.embedding
+            self._upsert_stmt = stmt.on_conflict_do_update(index_elements=["id"], set_=set_)
+        return self._upsert_stmt
+
+    def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
+        self.upsert_memories([memory], create_and_retry=create_and_retry)
+
+    def upsert_memories(self, memories: List[MemoryRow], create_and_retry: bool = True) -> None:
+        """Create or update memories in a single statement and transaction"""
+        if len(memories) == 0:
+            return
+        self.embed_memories(memories)
+        rows: List[Dict[str, Any]] = []
+        for memory in memories:
+            row = dict(id=memory.id, user_id=memory.user_id, memory=str(memory.memory))
+            if self.embedder is not None:
+                row["embedding"] = json.dumps(memory.embedding) if memory.embedding is not None else None
+            rows.append(row)
+        try:
+            with self.Session() as session:
+                session.execute(self.get_upsert_statement(), rows)
                 session.commit()
         except SQLAlchemyError as e:
             logger.error(f"Exception upserting into table: {e}")
@@ -158,14 +294,19 @@ class SqliteMemoryDb(MemoryDb):
                 logger.info("Creating table for future transactions")
                 self.create()
                 if create_and_retry:
-                    return self.upsert_memory(memory, create_and_retry=False)
+                    return self.upsert_memories(memories, create_and_retry=False)
             else:
                 raise
 
     def delete_memory(self, id: str) -> None:
+        self.delete_memories([id])
+
+    def delete_memories(self, ids: List[str]) -> None:
         with self.Session() as session:
-            stmt = delete(self.table).where(self.table.c.id == id)
-            session.execute(stmt)
+            # Stay below the SQLite limit on the number of bound parameters
+            for i in range(0, len(ids), 500):
+                stmt = delete(self.table).where(self.table.c.id.in_(ids[i : i + 500]))
+                session.execute(stmt)
             session.commit()
 
     def drop_table(self) -> None:
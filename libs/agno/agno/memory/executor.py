@@ -0,0 +1,129 @@
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from agno.utils.log import logger
+
+
+class MemoryExecutor:
+    """Runs memory maintenance (user memories and session summaries) after the response is returned.
+
+    Tasks submitted with the same key, usually the session_id, run one after another in the order they were
+    submitted. Tasks waiting for an earlier task of their key are queued, they do not hold a worker of the pool.
+    Async tasks run on their own event loop on the pool, so they are not cancelled when the caller's loop stops.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers: int = max_workers
+
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # Tasks of each key that did not finish, the first one is running. A key without tasks is removed.
+        self._queues: Dict[str, Deque[Tuple[Future, Callable[[], Any]]]] = {}
+        # The last future submitted for each key
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Run fn on the thread pool after the tasks previously submitted with the same key"""
+        future: Future = Future()
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="agno-memory")
+            queue = self._queues.get(key)
+            self._futures[key] = future
+            if queue is not None:
+                # An earlier task of this key is queued or running, this one is started after it
+                queue.append((future, partial(fn, *args, **kwargs)))
+            else:
+                self._queues[key] = deque([(future, partial(fn, *args, **kwargs))])
+                self._pool.submit(self._run_next, key)
+        future.add_done_callback(lambda f: self._forget_future(key, f))
+        return future
+
+    def asubmit(self, key: str, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Future:
+        """Run the coroutine function fn on the thread pool after the tasks previously submitted with the same key"""
+        return self.submit(key, lambda: asyncio.run(fn(*args, **kwargs)))
+
+    def flush(self, key: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+        """Wait for the tasks submitted with key, or all tasks, to finish.
+
+        Returns:
+            bool: True if all tasks finished, False if the timeout expired first.
+        """
+        with self._lock:
+            futures = [f for k, f in self._futures.items() if key is None or k == key]
+        _, not_done = wait(futures, timeout=timeout)
+        return len(not_done) == 0
+
+    async def aflush(self, key: Optional[str] = None) -> None:
+        """Wait for the tasks submitted with key, or all tasks, to finish without blocking the event loop"""
+        with self._lock:
+            futures = [f for k, f in self._futures.items() if key is None or k == key]
+        if futures:
+            await asyncio.gather(*(asyncio.wrap_future(f) for f in futures), return_exceptions=True)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the thread pool, waiting for pending tasks if wait is True"""
+        if wait:
+            self.flush()
+        with self._lock:
+            pool, self._pool = self._pool, None
+            queues, self._queues = self._queues, {}
+        # Tasks that did not start are cancelled
+        for queue in queues.values():
+            for future, _ in queue:
+                future.cancel()
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def _run_next(self, key: str) -> None:
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                return
+            future, fn = queue[0]
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(fn())
+            except Exception as e:
+                logger.warning(f"Error updating memory: {e}")
+                future.set_result(None)
+        with self._lock:
+            if self._queues.get(key) is not queue:
+                # The executor was shut down
+                return
+            queue.popleft()
+            if len(queue) == 0:
+                del self._queues[key]
+            elif self._pool is not None:
+                # Run the next task of this key as a new pool task, so tasks of other keys get their turn
+                self._pool.submit(self._run_next, key)
+
+    def _forget_future(self, key: str, future: Future) -> None:
+        with self._lock:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # Copies of an agent share the executor, so ordering holds across copies
+        return self
+
+
+_default_executor: Optional[MemoryExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def get_default_memory_executor() -> MemoryExecutor:
+    """Returns the MemoryExecutor shared by agents that defer memory updates without their own executor"""
+    global _default_executor
+
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = MemoryExecutor()
+        return _default_executor
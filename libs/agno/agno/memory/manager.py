@@ -1,4 +1,4 @@
-from typing import Any, List, Optional, cast
+from typing import Any, Dict, List, Optional, cast
 
 from pydantic import BaseModel, ConfigDict
 
@@ -22,6 +22,12 @@ class MemoryManager(BaseModel):
     # Do not set the input message here, it will be set by the run method
     input_message: Optional[str] = None
 
+    # Write the memories added, updated and deleted during a run to the db in one batch when the run ends
+    batch_writes: bool = True
+    # Do not set the pending writes here, they are set by the run method
+    pending_upserts: Optional[Dict[str, MemoryRow]] = None
+    pending_deletes: Optional[List[str]] = None
+
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     def update_model(self) -> None:
@@ -47,6 +53,47 @@ class MemoryManager(BaseModel):
 
         return self.db.read_memories(user_id=self.user_id)
 
+    def start_batch(self) -> None:
+        if self.batch_writes:
+            self.pending_upserts = {}
+            self.pending_deletes = []
+
+    def flush_batch(self) -> Optional[str]:
+        """Write the memories changed during the run to the db
+
+        Returns:
+            Optional[str]: A message with the error if the memories could not be written, None otherwise.
+        """
+        pending_upserts, pending_deletes = self.pending_upserts, self.pending_deletes
+        self.pending_upserts, self.pending_deletes = None, None
+        if self.db is None:
+            return None
+        try:
+            if pending_deletes:
+                self.db.delete_memories(pending_deletes)
+            if pending_upserts:
+                self.db.upsert_memories(list(pending_upserts.values()))
+        except Exception as e:
+            logger.warning(f"Error writing memories to db: {e}")
+            return f"Error writing memories: {e}"
+        return None
+
+    def write_memory(self, memory: MemoryRow) -> None:
+        if self.pending_upserts is None or self.pending_deletes is None:
+            self.db.upsert_memory(memory)  # type: ignore
+            return
+        if memory.id in self.pending_deletes:
+            self.pending_deletes.remove(memory.id)
+        self.pending_upserts[memory.id] = memory  # type: ignore
+
+    def remove_memory(self, id: str) -> None:
+        if self.pending_upserts is None or self.pending_deletes is None:
+            self.db.delete_memory(id=id)  # type: ignore
+            return
+        self.pending_upserts.pop(id, None)
+        if id not in self.pending_deletes:
+            self.pending_deletes.append(id)
+
     def add_memory(self, memory: str) -> str:
         """Use this function to add a memory to the database.
         Args:
@@ -56,7 +103,7 @@ class MemoryManager(BaseModel):
         """
         try:
             if self.db:
-                self.db.upsert_memory(
+                self.write_memory(
                     MemoryRow(user_id=self.user_id, memory=Memory(memory=memory, input=self.input_message).to_dict())
                 )
             return "Memory added successfully"
@@ -73,7 +120,7 @@ class MemoryManager(BaseModel):
         """
         try:
             if self.db:
-                self.db.delete_memory(id=id)
+                self.remove_memory(id=id)
             return "Memory deleted successfully"
         except Exception as e:
             logger.warning(f"Error deleting memory in db: {e}")
@@ -89,7 +136,7 @@ class MemoryManager(BaseModel):
         """
         try:
             if self.db:
-                self.db.upsert_memory(
+                self.write_memory(
                     MemoryRow(
                         id=id, user_id=self.user_id, memory=Memory(memory=memory, input=self.input_message).to_dict()
                     )
@@ -107,6 +154,9 @@ class MemoryManager(BaseModel):
         """
         try:
             if self.db:
+                # Clearing removes the memories changed earlier in the run as well
+                if self.pending_upserts is not None and self.pending_deletes is not None:
+                    self.pending_upserts, self.pending_deletes = {}, []
                 self.db.clear()
             return "Memory cleared successfully"
         except Exception as e:
@@ -160,8 +210,15 @@ class MemoryManager(BaseModel):
 
         # Generate a response from the Model (includes running function calls)
         self.model = cast(Model, self.model)
-        response = self.model.response(messages=messages_for_model)
+        self.start_batch()
+        try:
+            response = self.model.response(messages=messages_for_model)
+        finally:
+            flush_error = self.flush_batch()
         logger.debug("*********** MemoryManager End ***********")
+        # The tools reported success before the batch was written, so a failed write is returned instead
+        if flush_error is not None:
+            return flush_error
         return response.content
 
     async def arun(
@@ -186,6 +243,12 @@ class MemoryManager(BaseModel):
 
         # Generate a response from the Model (includes running function calls)
         self.model = cast(Model, self.model)
-        response = await self.model.aresponse(messages=messages_for_model)
+        self.start_batch()
+        try:
+            response = await self.model.aresponse(messages=messages_for_model)
+        finally:
+            flush_error = self.flush_batch()
         logger.debug("*********** Async MemoryManager End ***********")
+        if flush_error is not None:
+            return flush_error
         return response.content
@@ -33,16 +33,31 @@ class MemorySummarizer(BaseModel):
         else:
             self.model.response_format = {"type": "json_object"}
 
-    def get_system_message(self, messages_for_summarization: List[Dict[str, str]]) -> Message:
+    def get_system_message(
+        self, messages_for_summarization: List[Dict[str, str]], previous_summary: Optional[SessionSummary] = None
+    ) -> Message:
         # -*- Return a system message for summarization
-        system_prompt = dedent("""\
-        Analyze the following conversation between a user and an assistant, and extract the following details:
-          - Summary (str): Provide a concise summary of the session, focusing on important information that would be helpful for future interactions.
-          - Topics (Optional[List[str]]): List the topics discussed in the session.
-        Please ignore any frivolous information.
-
-        Conversation:
-        """)
+        if previous_summary is None:
+            system_prompt = dedent("""\
+            Analyze the following conversation between a user and an assistant, and extract the following details:
+              - Summary (str): Provide a concise summary of the session, focusing on important information that would be helpful for future interactions.
+              - Topics (Optional[List[str]]): List the topics discussed in the session.
+            Please ignore any frivolous information.
+
+            Conversation:
+            """)
+        else:
+            system_prompt = dedent("""\
+            Below is the summary of a session between a user and an assistant, followed by the conversation since that summary was written.
+            Update the summary with the new conversation, and extract the following details:
+              - Summary (str): Provide a concise summary of the whole session, focusing on important information that would be helpful for future interactions.
+              - Topics (Optional[List[str]]): List the topics discussed in the whole session.
+            Please ignore any frivolous information.
+
+            Summary so far:
+            """)
+            system_prompt += previous_summary.to_json()
+            system_prompt += "\n\nNew conversation:\n"
         conversation = []
         for message_pair in messages_for_summarization:
             conversation.append(f"User: {message_pair['user']}")
@@ -84,6 +99,7 @@ class MemorySummarizer(BaseModel):
     def run(
         self,
         message_pairs: List[Tuple[Message, Message]],
+        previous_summary: Optional[SessionSummary] = None,
         **kwargs: Any,
     ) -> Optional[SessionSummary]:
         logger.debug("*********** MemorySummarizer Start ***********")
@@ -107,7 +123,9 @@ class MemorySummarizer(BaseModel):
             )
 
         # Prepare the List of messages to send to the Model
-        messages_for_model: List[Message] = [self.get_system_message(messages_for_summarization)]
+        messages_for_model: List[Message] = [
+            self.get_system_message(messages_for_summarization, previous_summary=previous_summary)
+        ]
         # Generate a response from the Model (includes running function calls)
         self.model = cast(Model, self.model)
         response = self.model.response(messages=messages_for_model)
@@ -139,6 +157,7 @@ class MemorySummarizer(BaseModel):
     async def arun(
         self,
         message_pairs: List[Tuple[Message, Message]],
+        previous_summary: Optional[SessionSummary] = None,
         **kwargs: Any,
     ) -> Optional[SessionSummary]:
         logger.debug("*********** Async MemorySummarizer Start ***********")
@@ -162,7 +181,9 @@ class MemorySummarizer(BaseModel):
             )
 
         # Prepare the List of messages to send to the Model
-        messages_for_model: List[Message] = [self.get_system_message(messages_for_summarization)]
+        messages_for_model: List[Message] = [
+            self.get_system_message(messages_for_summarization, previous_summary=previous_summary)
+        ]
         # Generate a response from the Model (includes running function calls)
         self.model = cast(Model, self.model)
         response = await self.model.aresponse(messages=messages_for_model)
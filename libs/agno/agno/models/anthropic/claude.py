@@ -8,6 +8,7 @@ from agno.models.base import Metrics, Model
 from agno.models.message import Message
 from agno.models.response import ModelResponse, ModelResponseEvent
 from agno.utils.log import logger
+from agno.utils.stream import StreamBuffer
 
 try:
     from anthropic import Anthropic as AnthropicClient
@@ -142,6 +143,29 @@ def _format_messages(messages: List[Message]) -> Tuple[List[Dict[str, str]], str
     return chat_messages, " ".join(system_messages)
 
 
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def _add_cache_breakpoint(chat_message: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a copy of the message with a cache breakpoint on its last content block.
+    The original content is not modified, so breakpoints do not accumulate in the conversation history.
+    """
+    content = chat_message["content"]
+    if isinstance(content, str):
+        blocks: List[Any] = [{"type": "text", "text": content}]
+    else:
+        blocks = list(content)
+    if len(blocks) == 0:
+        return chat_message
+
+    last_block = blocks[-1]
+    if hasattr(last_block, "model_dump"):
+        last_block = last_block.model_dump(exclude_none=True)
+    blocks[-1] = {**last_block, "cache_control": CACHE_CONTROL}
+    return {**chat_message, "content": blocks}
+
+
 @dataclass
 class Claude(Model):
     """
@@ -162,6 +186,15 @@ class Claude(Model):
     top_k: Optional[int] = None
     request_params: Optional[Dict[str, Any]] = None
 
+    # Prompt caching: add cache breakpoints so the request prefix is read from the cache on later requests
+    # See: https://docs.anthropic.com/en/docs/build-with-claude/prompt-caching
+    # Add a breakpoint after the system prompt
+    cache_system_prompt: bool = False
+    # Add a breakpoint after the tool definitions
+    cache_tools: bool = False
+    # Add a breakpoint after the last message, so the conversation so far is cached for the next request
+    cache_history: bool = False
+
     # Client parameters
     api_key: Optional[str] = None
     client_params: Optional[Dict[str, Any]] = None
@@ -239,12 +272,33 @@ class Claude(Model):
             Dict[str, Any]: The request keyword arguments.
         """
         request_kwargs = self.request_kwargs.copy()
-        request_kwargs["system"] = system_message
+        if self.cache_system_prompt and system_message:
+            request_kwargs["system"] = [{"type": "text", "text": system_message, "cache_control": CACHE_CONTROL}]
+        else:
+            request_kwargs["system"] = system_message
 
         if self.tools:
-            request_kwargs["tools"] = self.format_tools_for_model()
+            tools = self.format_tools_for_model()
+            if self.cache_tools and tools:
+                tools[-1] = {**tools[-1], "cache_control": CACHE_CONTROL}
+            request_kwargs["tools"] = tools
         return request_kwargs
 
+    def prepare_request(self, messages: List[Message]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Format the messages and prepare the request keyword arguments for the API call.
+
+        Args:
+            messages (List[Message]): A list of messages to send to the model.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], Dict[str, Any]]: The chat messages and the request keyword arguments.
+        """
+        chat_messages, system_message = _format_messages(messages)
+        if self.cache_history and len(chat_messages) > 0:
+            chat_messages[-1] = _add_cache_breakpoint(chat_messages[-1])
+        return chat_messages, self.prepare_request_kwargs(system_message)
+
     def format_tools_for_model(self) -> Optional[List[Dict[str, Any]]]:
         """
         Transforms function definitions into a format accepted by the Anthropic API.
@@ -298,8 +352,7 @@ class Claude(Model):
         Returns:
             AnthropicMessage: The response from the model.
         """
-        chat_messages, system_message = _format_messages(messages)
-        request_kwargs = self.prepare_request_kwargs(system_message)
+        chat_messages, request_kwargs = self.prepare_request(messages)
 
         return self.get_client().messages.create(
             model=self.id,
@@ -317,8 +370,7 @@ class Claude(Model):
         Returns:
             Any: The streamed response from the model.
         """
-        chat_messages, system_message = _format_messages(messages)
-        request_kwargs = self.prepare_request_kwargs(system_message)
+        chat_messages, request_kwargs = self.prepare_request(messages)
 
         return self.get_client().messages.stream(
             model=self.id,
@@ -344,6 +396,9 @@ class Claude(Model):
             metrics.input_tokens = usage.input_tokens or 0
             metrics.output_tokens = usage.output_tokens or 0
             metrics.total_tokens = metrics.input_tokens + metrics.output_tokens
+            # input_tokens does not include the tokens read from or written to the prompt cache
+            metrics.cache_read_tokens = getattr(usage, "cache_read_input_tokens", None)
+            metrics.cache_write_tokens = getattr(usage, "cache_creation_input_tokens", None)
 
         self._update_model_metrics(metrics_for_run=metrics)
         self._update_assistant_message_metrics(assistant_message=assistant_message, metrics_for_run=metrics)
@@ -591,6 +646,7 @@ class Claude(Model):
         logger.debug("---------- Claude Response Start ----------")
         self._log_messages(messages)
         message_data = MessageData()
+        content_buffer = StreamBuffer()
         metrics = Metrics()
 
         # -*- Generate response
@@ -601,7 +657,7 @@ class Claude(Model):
                 if isinstance(delta, RawContentBlockDeltaEvent):
                     if isinstance(delta.delta, TextDelta):
                         yield ModelResponse(content=delta.delta.text)
-                        message_data.response_content += delta.delta.text
+                        content_buffer.append(delta.delta.text)
                         metrics.output_tokens += 1
                         if metrics.output_tokens == 1:
                             metrics.time_to_first_token = metrics.response_timer.elapsed
@@ -629,6 +685,7 @@ class Claude(Model):
                     message_data.response_usage = delta.message.usage
 
         metrics.stop_response_timer()
+        message_data.response_content = content_buffer.getvalue()
 
         # -*- Create assistant message
         assistant_message = Message(
@@ -674,8 +731,7 @@ class Claude(Model):
         Returns:
             AnthropicMessage: The response from the model.
         """
-        chat_messages, system_message = _format_messages(messages)
-        request_kwargs = self.prepare_request_kwargs(system_message)
+        chat_messages, request_kwargs = self.prepare_request(messages)
 
         return await self.get_async_client().messages.create(
             model=self.id,
@@ -693,8 +749,7 @@ class Claude(Model):
         Returns:
             Any: The streamed response from the model.
         """
-        chat_messages, system_message = _format_messages(messages)
-        request_kwargs = self.prepare_request_kwargs(system_message)
+        chat_messages, request_kwargs = self.prepare_request(messages)
 
         return self.get_async_client().messages.stream(
             model=self.id,
@@ -762,6 +817,7 @@ class Claude(Model):
         logger.debug("---------- Claude Async Response Start ----------")
         self._log_messages(messages)
         message_data = MessageData()
+        content_buffer = StreamBuffer()
         metrics = Metrics()
 
         # -*- Generate response
@@ -772,7 +828,7 @@ class Claude(Model):
                 if isinstance(delta, RawContentBlockDeltaEvent):
                     if isinstance(delta.delta, TextDelta):
                         yield ModelResponse(content=delta.delta.text)
-                        message_data.response_content += delta.delta.text
+                        content_buffer.append(delta.delta.text)
                         metrics.output_tokens += 1
                         if metrics.output_tokens == 1:
                             metrics.time_to_first_token = metrics.response_timer.elapsed
@@ -800,6 +856,7 @@ class Claude(Model):
                     message_data.response_usage = delta.message.usage
 
         metrics.stop_response_timer()
+        message_data.response_content = content_buffer.getvalue()
 
         # -*- Create assistant message
         assistant_message = Message(
@@ -263,6 +263,21 @@ class AwsBedrock(Model):
             assistant_message.metrics["total_tokens"] = total_tokens
             self.metrics["total_tokens"] = self.metrics.get("total_tokens", 0) + total_tokens
 
+        self._update_cache_metrics(
+            assistant_message, usage.get("cacheReadInputTokens"), usage.get("cacheWriteInputTokens")
+        )
+
+    def _update_cache_metrics(
+        self, assistant_message: Message, cache_read_tokens: Optional[int], cache_write_tokens: Optional[int]
+    ) -> None:
+        """Add the prompt tokens read from and written to the prompt cache, if reported, to the metrics."""
+        if cache_read_tokens is not None:
+            assistant_message.metrics["cache_read_tokens"] = cache_read_tokens
+            self.metrics["cache_read_tokens"] = self.metrics.get("cache_read_tokens", 0) + cache_read_tokens
+        if cache_write_tokens is not None:
+            assistant_message.metrics["cache_write_tokens"] = cache_write_tokens
+            self.metrics["cache_write_tokens"] = self.metrics.get("cache_write_tokens", 0) + cache_write_tokens
+
     def response(self, messages: List[Message]) -> ModelResponse:
         """
         Generate a response from the Bedrock API.
@@ -424,6 +439,10 @@ class AwsBedrock(Model):
         assistant_message.metrics["total_tokens"] = stream_data.response_total_tokens
         self.metrics["total_tokens"] = self.metrics.get("total_tokens", 0) + stream_data.response_total_tokens
 
+        self._update_cache_metrics(
+            assistant_message, stream_data.response_cache_read_tokens, stream_data.response_cache_write_tokens
+        )
+
     def response_stream(self, messages: List[Message]) -> Iterator[ModelResponse]:
         """
         Stream the response from the Bedrock API.
@@ -464,7 +483,7 @@ class AwsBedrock(Model):
                         tool_use["input"] = ""
                     tool_use["input"] += delta["toolUse"]["input"]
                 elif "text" in delta:
-                    stream_data.response_content += delta["text"]
+                    stream_data.response_content.append(delta["text"])
                     stream_data.completion_tokens += 1
                     if stream_data.completion_tokens == 1:
                         stream_data.time_to_first_token = stream_data.response_timer.elapsed
@@ -493,7 +512,7 @@ class AwsBedrock(Model):
                     tool_use = {}
                 else:
                     # Finish collecting text content
-                    content.append({"text": stream_data.response_content})
+                    content.append({"text": stream_data.response_content.getvalue()})
 
             elif "messageStop" in chunk:
                 stop_reason = chunk["messageStop"]["stopReason"]
@@ -505,12 +524,16 @@ class AwsBedrock(Model):
                     stream_data.response_prompt_tokens = metadata["usage"]["inputTokens"]
                     stream_data.response_total_tokens = metadata["usage"]["totalTokens"]
                     stream_data.completion_tokens = metadata["usage"]["outputTokens"]
+                    stream_data.response_cache_read_tokens = metadata["usage"].get("cacheReadInputTokens")
+                    stream_data.response_cache_write_tokens = metadata["usage"].get("cacheWriteInputTokens")
 
         stream_data.response_timer.stop()
 
         # Create assistant message
-        if stream_data.response_content != "":
-            assistant_message = Message(role="assistant", content=stream_data.response_content, tool_calls=tool_calls)
+        if stream_data.response_content:
+            assistant_message = Message(
+                role="assistant", content=stream_data.response_content.getvalue(), tool_calls=tool_calls
+            )
 
         if stream_data.completion_tokens > 0:
             logger.debug(
@@ -4,6 +4,8 @@ from typing import Any, Dict, List, Optional
 from agno.models.aws.bedrock import AwsBedrock
 from agno.models.message import Message
 
+CACHE_POINT = {"cachePoint": {"type": "default"}}
+
 
 @dataclass
 class Claude(AwsBedrock):
@@ -18,6 +20,9 @@ class Claude(AwsBedrock):
         top_k (Optional[int]): The top k to use.
         stop_sequences (Optional[List[str]]): The stop sequences to use.
         anthropic_version (str): The anthropic version to use.
+        cache_system_prompt (bool): Whether to add a cache point after the system prompt.
+        cache_tools (bool): Whether to add a cache point after the tool definitions.
+        cache_history (bool): Whether to add a cache point after the last message.
         request_params (Optional[Dict[str, Any]]): The request parameters to use.
         client_params (Optional[Dict[str, Any]]): The client parameters to use.
 
@@ -35,6 +40,12 @@ class Claude(AwsBedrock):
     stop_sequences: Optional[List[str]] = None
     anthropic_version: str = "bedrock-2023-05-31"
 
+    # -*- Prompt caching
+    # See: https://docs.aws.amazon.com/bedrock/latest/userguide/prompt-caching.html
+    cache_system_prompt: bool = False
+    cache_tools: bool = False
+    cache_history: bool = False
+
     # -*- Request parameters
     request_params: Optional[Dict[str, Any]] = None
     # -*- Client parameters
@@ -129,8 +140,13 @@ class Claude(AwsBedrock):
             "modelId": self.id,
         }
 
+        if self.cache_history and messages_for_api:
+            messages_for_api[-1]["content"].append(CACHE_POINT)
+
         if system_prompt:
             request_body["system"] = [{"text": system_prompt}]
+            if self.cache_system_prompt:
+                request_body["system"].append(CACHE_POINT)
 
         # Add inferenceConfig
         inference_config: Dict[str, Any] = {}
@@ -147,6 +163,8 @@ class Claude(AwsBedrock):
 
         if self.tools:
             tools = self.get_tools()
+            if self.cache_tools and tools:
+                tools["tools"].append(CACHE_POINT)
             request_body["toolConfig"] = tools  # type: ignore
 
         return request_body
@@ -178,6 +196,8 @@ class Claude(AwsBedrock):
                     "inputTokens": response.get("usage", {}).get("inputTokens"),
                     "outputTokens": response.get("usage", {}).get("outputTokens"),
                     "totalTokens": response.get("usage", {}).get("totalTokens"),
+                    "cacheReadInputTokens": response.get("usage", {}).get("cacheReadInputTokens"),
+                    "cacheWriteInputTokens": response.get("usage", {}).get("cacheWriteInputTokens"),
                 },
                 "metrics": {"latencyMs": response.get("metrics", {}).get("latencyMs")},
                 "role": role,
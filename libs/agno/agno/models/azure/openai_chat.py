@@ -2,8 +2,6 @@ from dataclasses import dataclass
 from os import getenv
 from typing import Any, Dict, Optional
 
-import httpx
-
 from agno.models.openai.like import OpenAILike
 
 try:
@@ -56,10 +54,13 @@ class AzureOpenAI(OpenAILike):
         """
         if self.openai_client:
             return self.openai_client
+        if self.client:
+            return self.client
 
         _client_params: Dict[str, Any] = self._get_client_params()
 
-        return AzureOpenAIClient(**_client_params)
+        self.client = AzureOpenAIClient(**_client_params)
+        return self.client
 
     def get_async_client(self) -> AsyncAzureOpenAIClient:
         """
@@ -68,17 +69,14 @@ class AzureOpenAI(OpenAILike):
         Returns:
             AsyncAzureOpenAIClient: An instance of the asynchronous OpenAI client.
         """
+        self._check_async_client_loop()
+        if self.async_client:
+            return self.async_client
 
         _client_params: Dict[str, Any] = self._get_client_params()
-
-        if self.http_client:
-            _client_params["http_client"] = self.http_client
-        else:
-            # Create a new async HTTP client with custom limits
-            _client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-            )
-        return AsyncAzureOpenAIClient(**_client_params)
+        _client_params["http_client"] = self._get_async_http_client()
+        self.async_client = AsyncAzureOpenAIClient(**_client_params)
+        return self.async_client
 
     def _get_client_params(self) -> Dict[str, Any]:
         _client_params: Dict[str, Any] = {}
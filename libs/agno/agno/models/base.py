@@ -1,6 +1,8 @@
 import asyncio
 import collections.abc
+import json
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from types import GeneratorType
@@ -8,12 +10,22 @@ from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tupl
 
 from agno.exceptions import AgentRunException
 from agno.media import Audio, Image
+from agno.models.cache import ResponseCache, wrap_response_methods
 from agno.models.message import Message
 from agno.models.response import ModelResponse, ModelResponseEvent
 from agno.tools import Toolkit
 from agno.tools.function import Function, FunctionCall
 from agno.utils.log import logger
+from agno.utils.rate_limit import (
+    RateLimit,
+    RateLimiter,
+    get_rate_limiter,
+    get_rate_limiter_key,
+    wrap_rate_limited_methods,
+)
+from agno.utils.stream import StreamBuffer
 from agno.utils.timer import Timer
+from agno.utils.tokens import estimate_message_tokens, estimate_tokens
 from agno.utils.tools import get_function_call_for_tool_call
 
 
@@ -28,6 +40,10 @@ class Metrics:
     prompt_tokens_details: Optional[dict] = None
     completion_tokens_details: Optional[dict] = None
 
+    # Prompt tokens read from and written to the provider's prompt cache, for providers that report them
+    cache_read_tokens: Optional[int] = None
+    cache_write_tokens: Optional[int] = None
+
     time_to_first_token: Optional[float] = None
     response_timer: Timer = field(default_factory=Timer)
 
@@ -56,6 +72,10 @@ class Metrics:
                 f"* Total tokens:                {self.total_tokens}",
             ]
         )
+        if self.cache_read_tokens is not None:
+            metric_lines.append(f"* Cache read tokens:           {self.cache_read_tokens}")
+        if self.cache_write_tokens is not None:
+            metric_lines.append(f"* Cache write tokens:          {self.cache_write_tokens}")
         if self.prompt_tokens_details is not None:
             metric_lines.append(f"* Prompt tokens details:       {self.prompt_tokens_details}")
         if self.completion_tokens_details is not None:
@@ -65,16 +85,37 @@ class Metrics:
 
 @dataclass
 class StreamData:
-    response_content: str = ""
+    response_content: StreamBuffer = field(default_factory=StreamBuffer)
     response_tool_calls: Optional[List[Any]] = None
     completion_tokens: int = 0
     response_prompt_tokens: int = 0
     response_completion_tokens: int = 0
     response_total_tokens: int = 0
+    response_cache_read_tokens: Optional[int] = None
+    response_cache_write_tokens: Optional[int] = None
     time_to_first_token: Optional[float] = None
     response_timer: Timer = field(default_factory=Timer)
 
 
+# Methods that send requests to the model provider
+INVOKE_METHODS = frozenset({"invoke", "ainvoke", "invoke_stream", "ainvoke_stream"})
+
+
+def count_request_tokens(*args, **kwargs) -> int:
+    """Estimates the input tokens of an invoke() call for the rate limiter"""
+    messages = kwargs.get("messages", args[0] if args else None)
+    if isinstance(messages, list) and all(isinstance(m, Message) for m in messages):
+        return sum(estimate_message_tokens(m) for m in messages)
+    return estimate_tokens(json.dumps([args, kwargs], default=str))
+
+
+def record_queue_wait(model: "Model", waited: float) -> None:
+    """Adds the time a request waited in the rate limiter to the model metrics"""
+    model.metrics["queue_wait_time"] = model.metrics.get("queue_wait_time", 0) + waited
+    if waited > 0.01:
+        logger.debug(f"Request waited {waited:.4f}s in the rate limiter")
+
+
 @dataclass
 class Model(ABC):
     # ID of the model to use.
@@ -107,6 +148,8 @@ class Model(ABC):
 
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # Maximum number of tool calls run concurrently by run_function_calls(). Set to 1 to run them sequentially.
+    max_parallel_tool_calls: int = 10
 
     # -*- Functions available to the Model to call -*-
     # Functions extracted from the tools.
@@ -131,6 +174,22 @@ class Model(ABC):
     # The role to map the system message to.
     system_message_role: str = "system"
 
+    # Cache for responses to identical requests. Cached responses replay their tool calls without running the tools.
+    response_cache: Optional[ResponseCache] = None
+    # Client-side rate limit for requests, shared by all models with the same provider, API key and id.
+    rate_limit: Optional[RateLimit] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        wrap_response_methods(cls)
+        wrap_rate_limited_methods(
+            cls,
+            INVOKE_METHODS,
+            get_limiter=lambda model: model.get_rate_limiter(),
+            count_tokens=count_request_tokens,
+            on_wait=record_queue_wait,
+        )
+
     def __post_init__(self):
         if self.provider is None and self.name is not None:
             self.provider = f"{self.name} ({self.id})"
@@ -147,6 +206,13 @@ class Model(ABC):
     def get_provider(self) -> str:
         return self.provider or self.name or self.__class__.__name__
 
+    def get_rate_limiter(self) -> Optional[RateLimiter]:
+        if self.rate_limit is None:
+            return None
+        api_key = getattr(self, "api_key", None)
+        key = get_rate_limiter_key(self.get_provider(), api_key if isinstance(api_key, str) else None, self.id)
+        return get_rate_limiter(key, self.rate_limit)
+
     @abstractmethod
     def invoke(self, *args, **kwargs) -> Any:
         pass
@@ -195,6 +261,10 @@ class Model(ABC):
             assistant_message.metrics["output_tokens"] = metrics_for_run.output_tokens
         if metrics_for_run.total_tokens is not None:
             assistant_message.metrics["total_tokens"] = metrics_for_run.total_tokens
+        if metrics_for_run.cache_read_tokens is not None:
+            assistant_message.metrics["cache_read_tokens"] = metrics_for_run.cache_read_tokens
+        if metrics_for_run.cache_write_tokens is not None:
+            assistant_message.metrics["cache_write_tokens"] = metrics_for_run.cache_write_tokens
         if metrics_for_run.time_to_first_token is not None:
             assistant_message.metrics["time_to_first_token"] = metrics_for_run.time_to_first_token
 
@@ -209,6 +279,14 @@ class Model(ABC):
             self.metrics["output_tokens"] = self.metrics.get("output_tokens", 0) + metrics_for_run.output_tokens
         if metrics_for_run.total_tokens is not None:
             self.metrics["total_tokens"] = self.metrics.get("total_tokens", 0) + metrics_for_run.total_tokens
+        if metrics_for_run.cache_read_tokens is not None:
+            self.metrics["cache_read_tokens"] = (
+                self.metrics.get("cache_read_tokens", 0) + metrics_for_run.cache_read_tokens
+            )
+        if metrics_for_run.cache_write_tokens is not None:
+            self.metrics["cache_write_tokens"] = (
+                self.metrics.get("cache_write_tokens", 0) + metrics_for_run.cache_write_tokens
+            )
         if metrics_for_run.time_to_first_token is not None:
             self.metrics.setdefault("time_to_first_token", []).append(metrics_for_run.time_to_first_token)
 
@@ -331,6 +409,9 @@ class Model(ABC):
         self, fc: FunctionCall, success: bool, output: Optional[Union[List[Any], str]], timer: Timer, tool_role: str
     ) -> Message:
         """Create a function call result message."""
+        metrics: Dict[str, Any] = {"time": timer.elapsed}
+        if fc.cache_hit is not None:
+            metrics["cache_hit"] = fc.cache_hit
         return Message(
             role=tool_role,
             content=output if success else fc.error,
@@ -339,7 +420,7 @@ class Model(ABC):
             tool_args=fc.arguments,
             tool_call_error=not success,
             stop_after_tool_call=fc.function.stop_after_tool_call,
-            metrics={"time": timer.elapsed},
+            metrics=metrics,
         )
 
     def _update_metrics(self, function_name: str, elapsed_time: float) -> None:
@@ -350,6 +431,36 @@ class Model(ABC):
             self.metrics["tool_call_times"][function_name] = []
         self.metrics["tool_call_times"][function_name].append(elapsed_time)
 
+    def _get_function_call_started_response(self, fc: FunctionCall, tool_role: str) -> ModelResponse:
+        return ModelResponse(
+            content=fc.get_call_str(),
+            tool_calls=[
+                {
+                    "role": tool_role,
+                    "tool_call_id": fc.call_id,
+                    "tool_name": fc.function.name,
+                    "tool_args": fc.arguments,
+                }
+            ],
+            event=ModelResponseEvent.tool_call_started.value,
+        )
+
+    def _run_function_call(self, function_call: FunctionCall) -> Tuple[Union[bool, AgentRunException], Timer]:
+        """Run a single function call and return its success status and timer."""
+        function_call_timer = Timer()
+        function_call_timer.start()
+        success: Union[bool, AgentRunException] = False
+        try:
+            success = function_call.execute()
+        except AgentRunException as e:
+            success = e  # Pass the exception through to be handled by caller
+        except Exception as e:
+            logger.error(f"Error executing function {function_call.function.name}: {e}")
+            raise e
+
+        function_call_timer.stop()
+        return success, function_call_timer
+
     def run_function_calls(
         self, function_calls: List[FunctionCall], function_call_results: List[Message], tool_role: str = "tool"
     ) -> Iterator[ModelResponse]:
@@ -359,86 +470,88 @@ class Model(ABC):
         # Additional messages from function calls that will be added to the function call results
         additional_messages: List[Message] = []
 
-        for fc in function_calls:
-            # Start function call
-            function_call_timer = Timer()
-            function_call_timer.start()
-            # Yield a tool_call_started event
-            yield ModelResponse(
-                content=fc.get_call_str(),
-                tool_calls=[
-                    {
-                        "role": tool_role,
-                        "tool_call_id": fc.call_id,
-                        "tool_name": fc.function.name,
-                        "tool_args": fc.arguments,
-                    }
-                ],
-                event=ModelResponseEvent.tool_call_started.value,
-            )
-
-            # Track if the function call was successful
-            function_call_success = False
-            # Run function calls sequentially
-            try:
-                function_call_success = fc.execute()
-            except AgentRunException as a_exc:
-                # Update additional messages from function call
-                self._handle_agent_exception(a_exc, additional_messages)
-                # Set function call success to False if an exception occurred
-                function_call_success = False
-            except Exception as e:
-                logger.error(f"Error executing function {fc.function.name}: {e}")
-                function_call_success = False
-                raise e
+        # Function calls that would exceed the tool call limit are never started,
+        # because calls running in parallel cannot be stopped once they are submitted
+        if self.tool_call_limit:
+            function_calls = function_calls[: max(self.tool_call_limit - len(self._function_call_stack), 1)]
 
-            # Stop function call timer
-            function_call_timer.stop()
+        executor: Optional[ThreadPoolExecutor] = None
+        if self.max_parallel_tool_calls > 1 and len(function_calls) > 1:
+            executor = ThreadPoolExecutor(max_workers=min(self.max_parallel_tool_calls, len(function_calls)))
+        futures: Dict[int, Future] = {}
 
-            # Process function call output
-            function_call_output: Optional[Union[List[Any], str]] = ""
-            if isinstance(fc.result, (GeneratorType, collections.abc.Iterator)):
-                for item in fc.result:
-                    function_call_output += item
+        try:
+            for index, fc in enumerate(function_calls):
+                if executor is not None and fc.function.run_in_parallel:
+                    if index not in futures:
+                        # Submit this function call and the ones after it, up to the next one that does not run in parallel
+                        next_index = index
+                        while next_index < len(function_calls) and function_calls[next_index].function.run_in_parallel:
+                            # Yield a tool_call_started event
+                            yield self._get_function_call_started_response(function_calls[next_index], tool_role)
+                            futures[next_index] = executor.submit(self._run_function_call, function_calls[next_index])
+                            next_index += 1
+                    function_call_success, function_call_timer = futures[index].result()
+                else:
+                    # Yield a tool_call_started event
+                    yield self._get_function_call_started_response(fc, tool_role)
+                    # Run the function call in this thread, after all previous function calls have completed
+                    function_call_success, function_call_timer = self._run_function_call(fc)
+
+                # Handle AgentRunException
+                if isinstance(function_call_success, AgentRunException):
+                    # Update additional messages from function call
+                    self._handle_agent_exception(function_call_success, additional_messages)
+                    # Set function call success to False if an exception occurred
+                    function_call_success = False
+
+                # Process function call output
+                function_call_output: Optional[Union[List[Any], str]] = ""
+                if isinstance(fc.result, (GeneratorType, collections.abc.Iterator)):
+                    for item in fc.result:
+                        function_call_output += item
+                        if fc.function.show_result:
+                            yield ModelResponse(content=item)
+                else:
+                    function_call_output = fc.result
                     if fc.function.show_result:
-                        yield ModelResponse(content=item)
-            else:
-                function_call_output = fc.result
-                if fc.function.show_result:
-                    yield ModelResponse(content=function_call_output)
+                        yield ModelResponse(content=function_call_output)
 
-            # Create and yield function call result
-            function_call_result = self._create_function_call_result(
-                fc, function_call_success, function_call_output, function_call_timer, tool_role
-            )
-            yield ModelResponse(
-                content=f"{fc.get_call_str()} completed in {function_call_timer.elapsed:.4f}s.",
-                tool_calls=[
-                    function_call_result.model_dump(
-                        include={
-                            "content",
-                            "tool_call_id",
-                            "tool_name",
-                            "tool_args",
-                            "tool_call_error",
-                            "metrics",
-                            "created_at",
-                        }
-                    )
-                ],
-                event=ModelResponseEvent.tool_call_completed.value,
-            )
+                # Create and yield function call result
+                function_call_result = self._create_function_call_result(
+                    fc, function_call_success, function_call_output, function_call_timer, tool_role
+                )
+                yield ModelResponse(
+                    content=f"{fc.get_call_str()} completed in {function_call_timer.elapsed:.4f}s.",
+                    tool_calls=[
+                        function_call_result.model_dump(
+                            include={
+                                "content",
+                                "tool_call_id",
+                                "tool_name",
+                                "tool_args",
+                                "tool_call_error",
+                                "metrics",
+                                "created_at",
+                            }
+                        )
+                    ],
+                    event=ModelResponseEvent.tool_call_completed.value,
+                )
 
-            # Update metrics and function call results
-            self._update_metrics(fc.function.name, function_call_timer.elapsed)
-            function_call_results.append(function_call_result)
-            self._function_call_stack.append(fc)
+                # Update metrics and function call results
+                self._update_metrics(fc.function.name, function_call_timer.elapsed)
+                function_call_results.append(function_call_result)
+                self._function_call_stack.append(fc)
 
-            # Check function call limit
-            if self.tool_call_limit and len(self._function_call_stack) >= self.tool_call_limit:
-                # Deactivate tool calls by setting future tool calls to "none"
-                self.tool_choice = "none"
-                break  # Exit early if we reach the function call limit
+                # Check function call limit
+                if self.tool_call_limit and len(self._function_call_stack) >= self.tool_call_limit:
+                    # Deactivate tool calls by setting future tool calls to "none"
+                    self.tool_choice = "none"
+                    break  # Exit early if we reach the function call limit
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
 
         # Add any additional messages at the end
         if additional_messages:
@@ -479,18 +592,7 @@ class Model(ABC):
 
         # Yield tool_call_started events for all function calls
         for fc in function_calls:
-            yield ModelResponse(
-                content=fc.get_call_str(),
-                tool_calls=[
-                    {
-                        "role": tool_role,
-                        "tool_call_id": fc.call_id,
-                        "tool_name": fc.function.name,
-                        "tool_args": fc.arguments,
-                    }
-                ],
-                event=ModelResponseEvent.tool_call_started.value,
-            )
+            yield self._get_function_call_started_response(fc, tool_role)
 
         # Create and run all function calls in parallel
         results = await asyncio.gather(*(self._arun_function_call(fc) for fc in function_calls), return_exceptions=True)
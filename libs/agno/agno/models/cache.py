@@ -0,0 +1,576 @@
+"""Response cache for Models.
+
+A Model with a response_cache serves response(), aresponse(), response_stream() and aresponse_stream() from the
+cache when it has already answered the same request. A request is identified by a hash of the messages, the tools
+and the request parameters of the model, so changing any of them is a cache miss.
+
+On a hit, the messages the model added to the conversation (assistant messages, tool calls and tool results) are
+appended to the messages again, and streamed responses replay the cached chunks in order, so callers see the same
+messages and events as on the original call. Tools are not executed again for a cached response.
+
+Only cache deterministic requests (for example temperature 0 in evals and tests): a cached answer is returned for
+every identical request until it expires.
+"""
+
+import json
+import pickle
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from contextvars import ContextVar
+from copy import deepcopy
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import wraps
+from hashlib import sha256
+from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+from agno.embedder.base import Embedder
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from agno.utils.cache import TTLCache
+from agno.utils.log import logger
+from agno.utils.similarity import cosine_similarity
+
+if TYPE_CHECKING:
+    from agno.models.base import Model
+
+# Model fields that are not part of the request, or hold credentials and clients
+IGNORED_MODEL_FIELDS = {
+    "name",
+    "metrics",
+    "tools",
+    "session_id",
+    "response_cache",
+    "rate_limit",
+    "system_prompt",
+    "instructions",
+}
+IGNORED_MODEL_FIELD_PARTS = ("client", "api_key", "secret", "password", "access_key", "session_token", "credentials")
+# Message fields sent to the model
+MESSAGE_FIELDS = {"role", "content", "name", "tool_call_id", "tool_calls", "audio", "images", "videos"}
+
+
+@dataclass
+class CachedResponse:
+    """A cached model response"""
+
+    # Messages the model added to the conversation
+    messages: List[Message] = field(default_factory=list)
+    # The response returned by response() or aresponse()
+    response: Optional[ModelResponse] = None
+    # The chunks yielded by response_stream() or aresponse_stream()
+    chunks: Optional[List[ModelResponse]] = None
+
+
+@dataclass
+class CacheLookup:
+    """Keys of a request, computed before the model is called"""
+
+    key: str
+    # Key of the request without the text of the last user message, used for semantic matching
+    context_key: Optional[str] = None
+    # Text of the last user message
+    query: Optional[str] = None
+    # Embedding of the query, if the cache has an embedder
+    embedding: Optional[List[float]] = None
+
+
+class ResponseCacheStore:
+    """Base class for response cache backends"""
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: Any) -> Any:
+        # Models are fields of pydantic models (e.g. MemoryClassifier), so stores are validated by type only
+        from pydantic_core import core_schema
+
+        return core_schema.is_instance_schema(cls)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        raise NotImplementedError
+
+    def set(
+        self,
+        key: str,
+        value: CachedResponse,
+        ttl: Optional[float] = None,
+        context_key: Optional[str] = None,
+        embedding: Optional[List[float]] = None,
+    ) -> None:
+        """Store a response. Responses stored with a context_key and embedding can be found by search()."""
+        raise NotImplementedError
+
+    def get_embeddings(self, context_key: str) -> List[Tuple[str, List[float]]]:
+        """Returns the (key, embedding) of the unexpired responses stored with the context_key"""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def search(self, context_key: str, embedding: List[float], threshold: float) -> Optional[CachedResponse]:
+        """Returns the response to the most similar query with the same context, if the similarity is above threshold"""
+        best_key, best_score = None, threshold
+        for key, cached_embedding in self.get_embeddings(context_key):
+            score = cosine_similarity(embedding, cached_embedding)
+            if score >= best_score:
+                best_key, best_score = key, score
+        return self.get(best_key) if best_key is not None else None
+
+    def __deepcopy__(self, memo):
+        # Stores hold locks and connections, copies of a model share the same store
+        return self
+
+
+class InMemoryResponseCacheStore(ResponseCacheStore):
+    """In-process LRU cache, bounded by max_size responses"""
+
+    def __init__(self, max_size: int = 1000):
+        self._responses = TTLCache(max_size=max_size)
+        self._embeddings: Dict[str, OrderedDict[str, List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        return self._responses.get(key)
+
+    def set(
+        self,
+        key: str,
+        value: CachedResponse,
+        ttl: Optional[float] = None,
+        context_key: Optional[str] = None,
+        embedding: Optional[List[float]] = None,
+    ) -> None:
+        self._responses.set(key, value, ttl=ttl)
+        if context_key is not None and embedding is not None:
+            with self._lock:
+                self._embeddings.setdefault(context_key, OrderedDict())[key] = embedding
+
+    def get_embeddings(self, context_key: str) -> List[Tuple[str, List[float]]]:
+        with self._lock:
+            embeddings = self._embeddings.get(context_key)
+            if embeddings is None:
+                return []
+            # Drop the embeddings of responses that expired or were evicted
+            for key in [key for key in embeddings if self._responses.get(key) is None]:
+                del embeddings[key]
+            return list(embeddings.items())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._responses.clear()
+            self._embeddings.clear()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+
+class SqliteResponseCacheStore(ResponseCacheStore):
+    """Persistent cache stored in a SQLite file. Responses are pickled, only read caches you wrote."""
+
+    def __init__(self, db_file: Union[str, Path] = "tmp/response_cache.db", table_name: str = "response_cache"):
+        self.db_file: Path = Path(db_file)
+        self.table_name: str = table_name
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} "
+                "(key TEXT PRIMARY KEY, context_key TEXT, embedding BLOB, response BLOB NOT NULL, expires_at REAL)"
+            )
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_context_key ON {self.table_name} (context_key)"
+            )
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT response, expires_at FROM {self.table_name} WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        if row[1] is not None and row[1] <= time():
+            with self._lock, self._connection:
+                self._connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+            return None
+        return pickle.loads(row[0])
+
+    def set(
+        self,
+        key: str,
+        value: CachedResponse,
+        ttl: Optional[float] = None,
+        context_key: Optional[str] = None,
+        embedding: Optional[List[float]] = None,
+    ) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, context_key, embedding, response, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    context_key,
+                    array("f", embedding).tobytes() if embedding is not None else None,
+                    pickle.dumps(value),
+                    time() + ttl if ttl is not None else None,
+                ),
+            )
+
+    def get_embeddings(self, context_key: str) -> List[Tuple[str, List[float]]]:
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT key, embedding FROM {self.table_name} "
+                "WHERE context_key = ? AND embedding IS NOT NULL AND (expires_at IS NULL OR expires_at > ?)",
+                (context_key, time()),
+            ).fetchall()
+        return [(key, array("f", blob).tolist()) for key, blob in rows]
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table_name}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()[0]
+
+
+class DiskResponseCacheStore(ResponseCacheStore):
+    """Persistent cache of one pickle file per response in a directory. Only read caches you wrote.
+
+    Embeddings for semantic matching are stored as json files in a subdirectory per context key.
+    """
+
+    def __init__(self, path: Union[str, Path] = "tmp/response_cache"):
+        self.path: Path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _get_response_file(self, key: str) -> Path:
+        return self.path / f"{key}.pkl"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        response_file = self._get_response_file(key)
+        try:
+            expires_at, value = pickle.loads(response_file.read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return None
+        if expires_at is not None and expires_at <= time():
+            response_file.unlink(missing_ok=True)
+            return None
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: CachedResponse,
+        ttl: Optional[float] = None,
+        context_key: Optional[str] = None,
+        embedding: Optional[List[float]] = None,
+    ) -> None:
+        expires_at = time() + ttl if ttl is not None else None
+        # Write to a temporary file and rename it, so readers never see a partial file
+        response_file = self._get_response_file(key)
+        tmp_file = response_file.with_suffix(".tmp")
+        tmp_file.write_bytes(pickle.dumps((expires_at, value)))
+        tmp_file.replace(response_file)
+        if context_key is not None and embedding is not None:
+            embeddings_dir = self.path / "embeddings" / context_key
+            embeddings_dir.mkdir(parents=True, exist_ok=True)
+            (embeddings_dir / f"{key}.json").write_text(json.dumps({"expires_at": expires_at, "embedding": embedding}))
+
+    def get_embeddings(self, context_key: str) -> List[Tuple[str, List[float]]]:
+        embeddings_dir = self.path / "embeddings" / context_key
+        if not embeddings_dir.exists():
+            return []
+        embeddings: List[Tuple[str, List[float]]] = []
+        now = time()
+        for embedding_file in embeddings_dir.glob("*.json"):
+            try:
+                data = json.loads(embedding_file.read_text())
+            except (OSError, ValueError):
+                continue
+            if data.get("expires_at") is not None and data["expires_at"] <= now:
+                embedding_file.unlink(missing_ok=True)
+                continue
+            embeddings.append((embedding_file.stem, data["embedding"]))
+        return embeddings
+
+    def clear(self) -> None:
+        import shutil
+
+        shutil.rmtree(self.path, ignore_errors=True)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+
+def _canonical(value: Any) -> Any:
+    """Returns a JSON serializable version of a request value. Raises TypeError for values that are not data."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, type) and hasattr(value, "model_json_schema"):
+        return value.model_json_schema()
+    if hasattr(value, "model_dump"):
+        return _canonical(value.model_dump(exclude_none=True))
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _canonical(getattr(value, f.name)) for f in fields(value)}
+    raise TypeError(f"Cannot use {type(value).__name__} in a cache key")
+
+
+def get_request_params(model: "Model") -> Dict[str, Any]:
+    """Returns the fields of the model that are sent with requests, leaving out clients and credentials"""
+    params: Dict[str, Any] = {"class": type(model).__name__}
+    for f in fields(model):
+        if f.name.startswith("_") or f.name in IGNORED_MODEL_FIELDS:
+            continue
+        if any(part in f.name for part in IGNORED_MODEL_FIELD_PARTS):
+            continue
+        try:
+            params[f.name] = _canonical(getattr(model, f.name))
+        except TypeError:
+            continue
+    return params
+
+
+def _hash(value: Any) -> str:
+    return sha256(json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode()).hexdigest()
+
+
+@dataclass
+class ResponseCache:
+    """Caches model responses by a hash of the messages, tools and request parameters.
+
+    With an embedder, a request that differs only in the text of the last user message is served the response
+    to the most similar cached message, if the cosine similarity is at least similarity_threshold.
+    """
+
+    store: ResponseCacheStore = field(default_factory=InMemoryResponseCacheStore)
+    # Number of seconds a response is cached for. None means responses do not expire.
+    ttl: Optional[float] = None
+    # Embedder used to match near-duplicate user messages. Exact matching only if None.
+    embedder: Optional[Embedder] = None
+    similarity_threshold: float = 0.95
+    # Number of requests served from the cache and sent to the model
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    def get_lookup(self, model: "Model", messages: List[Message], stream: bool) -> CacheLookup:
+        """Computes the keys of a request, before the model adds messages to the conversation"""
+        request = {
+            "stream": stream,
+            "params": get_request_params(model),
+            "tools": _canonical(model.tools or []),
+            "messages": [_canonical(m.model_dump(include=MESSAGE_FIELDS, exclude_none=True)) for m in messages],
+        }
+        lookup = CacheLookup(key=_hash(request))
+
+        if self.embedder is not None and len(messages) > 0:
+            last_message = messages[-1]
+            if last_message.role == "user" and isinstance(last_message.content, str) and last_message.content:
+                request["messages"][-1]["content"] = None
+                lookup.context_key = _hash(request)
+                lookup.query = last_message.content
+        return lookup
+
+    def get(self, lookup: CacheLookup) -> Optional[CachedResponse]:
+        cached = self.store.get(lookup.key)
+        if cached is None and lookup.context_key is not None and lookup.query is not None:
+            lookup.embedding = self.embedder.get_embedding(lookup.query)  # type: ignore
+            cached = self.store.search(lookup.context_key, lookup.embedding, self.similarity_threshold)
+        return self._record(cached)
+
+    async def aget(self, lookup: CacheLookup) -> Optional[CachedResponse]:
+        cached = self.store.get(lookup.key)
+        if cached is None and lookup.context_key is not None and lookup.query is not None:
+            lookup.embedding = await self.embedder.async_get_embedding(lookup.query)  # type: ignore
+            cached = self.store.search(lookup.context_key, lookup.embedding, self.similarity_threshold)
+        return self._record(cached)
+
+    def _record(self, cached: Optional[CachedResponse]) -> Optional[CachedResponse]:
+        if cached is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # Return a copy, so callers cannot modify the cached messages
+        return deepcopy(cached)
+
+    def set(self, lookup: CacheLookup, value: CachedResponse) -> None:
+        try:
+            self.store.set(
+                lookup.key, value, ttl=self.ttl, context_key=lookup.context_key, embedding=lookup.embedding
+            )
+        except Exception as e:
+            logger.warning(f"Could not cache model response: {e}")
+
+    def clear(self) -> None:
+        self.store.clear()
+
+    def cache_info(self) -> Dict[str, Union[int, float]]:
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / total if total else 0.0}
+
+    def __deepcopy__(self, memo):
+        # Copies of a model share the same cache
+        return self
+
+
+# Models currently answering a request in this context. Providers call response() again after running tools,
+# these nested calls are part of the cached response and are not cached on their own.
+_active_models: ContextVar[FrozenSet[int]] = ContextVar("active_models", default=frozenset())
+
+
+def _enter(model: "Model") -> FrozenSet[int]:
+    """Marks the model as active and returns the previously active models"""
+    active = _active_models.get()
+    _active_models.set(active | {id(model)})
+    return active
+
+
+def cache_response(fn: Callable) -> Callable:
+    @wraps(fn)
+    def wrapper(self: "Model", messages: List[Message], *args, **kwargs) -> ModelResponse:
+        cache = self.response_cache
+        if cache is None or id(self) in _active_models.get():
+            return fn(self, messages, *args, **kwargs)
+
+        lookup = cache.get_lookup(self, messages, stream=False)
+        cached = cache.get(lookup)
+        if cached is not None and cached.response is not None:
+            messages.extend(cached.messages)
+            return cached.response
+
+        previous = _enter(self)
+        num_messages = len(messages)
+        try:
+            response = fn(self, messages, *args, **kwargs)
+        finally:
+            _active_models.set(previous)
+        cache.set(lookup, CachedResponse(messages=deepcopy(messages[num_messages:]), response=deepcopy(response)))
+        return response
+
+    wrapper.__response_cache__ = True  # type: ignore
+    return wrapper
+
+
+def acache_response(fn: Callable) -> Callable:
+    @wraps(fn)
+    async def wrapper(self: "Model", messages: List[Message], *args, **kwargs) -> ModelResponse:
+        cache = self.response_cache
+        if cache is None or id(self) in _active_models.get():
+            return await fn(self, messages, *args, **kwargs)
+
+        lookup = cache.get_lookup(self, messages, stream=False)
+        cached = await cache.aget(lookup)
+        if cached is not None and cached.response is not None:
+            messages.extend(cached.messages)
+            return cached.response
+
+        previous = _enter(self)
+        num_messages = len(messages)
+        try:
+            response = await fn(self, messages, *args, **kwargs)
+        finally:
+            _active_models.set(previous)
+        cache.set(lookup, CachedResponse(messages=deepcopy(messages[num_messages:]), response=deepcopy(response)))
+        return response
+
+    wrapper.__response_cache__ = True  # type: ignore
+    return wrapper
+
+
+def cache_response_stream(fn: Callable) -> Callable:
+    @wraps(fn)
+    def wrapper(self: "Model", messages: List[Message], *args, **kwargs) -> Iterator[ModelResponse]:
+        cache = self.response_cache
+        if cache is None or id(self) in _active_models.get():
+            yield from fn(self, messages, *args, **kwargs)
+            return
+
+        lookup = cache.get_lookup(self, messages, stream=True)
+        cached = cache.get(lookup)
+        if cached is not None and cached.chunks is not None:
+            messages.extend(cached.messages)
+            yield from cached.chunks
+            return
+
+        num_messages = len(messages)
+        chunks: List[ModelResponse] = []
+        stream = fn(self, messages, *args, **kwargs)
+        while True:
+            # Only mark the model active while the provider runs, not while the caller handles a chunk
+            previous = _enter(self)
+            try:
+                chunk = next(stream)
+            except StopIteration:
+                break
+            finally:
+                _active_models.set(previous)
+            chunks.append(deepcopy(chunk))
+            yield chunk
+        # Only complete streams are cached
+        cache.set(lookup, CachedResponse(messages=deepcopy(messages[num_messages:]), chunks=chunks))
+
+    wrapper.__response_cache__ = True  # type: ignore
+    return wrapper
+
+
+def acache_response_stream(fn: Callable) -> Callable:
+    @wraps(fn)
+    async def wrapper(self: "Model", messages: List[Message], *args, **kwargs) -> AsyncIterator[ModelResponse]:
+        cache = self.response_cache
+        if cache is None or id(self) in _active_models.get():
+            async for chunk in fn(self, messages, *args, **kwargs):
+                yield chunk
+            return
+
+        lookup = cache.get_lookup(self, messages, stream=True)
+        cached = await cache.aget(lookup)
+        if cached is not None and cached.chunks is not None:
+            messages.extend(cached.messages)
+            for chunk in cached.chunks:
+                yield chunk
+            return
+
+        num_messages = len(messages)
+        chunks: List[ModelResponse] = []
+        stream = fn(self, messages, *args, **kwargs).__aiter__()
+        while True:
+            previous = _enter(self)
+            try:
+                chunk = await stream.__anext__()
+            except StopAsyncIteration:
+                break
+            finally:
+                _active_models.set(previous)
+            chunks.append(deepcopy(chunk))
+            yield chunk
+        cache.set(lookup, CachedResponse(messages=deepcopy(messages[num_messages:]), chunks=chunks))
+
+    wrapper.__response_cache__ = True  # type: ignore
+    return wrapper
+
+
+RESPONSE_METHOD_WRAPPERS = {
+    "response": cache_response,
+    "aresponse": acache_response,
+    "response_stream": cache_response_stream,
+    "aresponse_stream": acache_response_stream,
+}
+
+
+def wrap_response_methods(cls: type) -> None:
+    """Wraps the response methods defined on a Model subclass so they are served from the response cache"""
+    for name, wrap in RESPONSE_METHOD_WRAPPERS.items():
+        method = cls.__dict__.get(name)
+        if method is None or getattr(method, "__isabstractmethod__", False):
+            continue
+        if getattr(method, "__response_cache__", False):
+            continue
+        setattr(cls, name, wrap(method))
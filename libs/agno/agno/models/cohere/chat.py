@@ -473,7 +473,6 @@ class Cohere(Model):
         stream_data: StreamData = StreamData()
         stream_data.response_timer.start()
 
-        stream_data.response_content = ""
         tool_calls: List[Dict[str, Any]] = []
         stream_data.response_tool_calls = []
         last_delta: Optional[NonStreamedChatResponse] = None
@@ -484,7 +483,7 @@ class Cohere(Model):
 
             if isinstance(response, TextGenerationStreamedChatResponse):
                 if response.text is not None:
-                    stream_data.response_content += response.text
+                    stream_data.response_content.append(response.text)
                     stream_data.completion_tokens += 1
                     if stream_data.completion_tokens == 1:
                         stream_data.time_to_first_token = stream_data.response_timer.elapsed
@@ -518,7 +517,7 @@ class Cohere(Model):
         logger.debug(f"Time to generate response: {stream_data.response_timer.elapsed:.4f}s")
 
         # -*- Create assistant message
-        assistant_message = Message(role="assistant", content=stream_data.response_content)
+        assistant_message = Message(role="assistant", content=stream_data.response_content.getvalue())
         # -*- Add tool calls to assistant message
         if len(stream_data.response_tool_calls) > 0:
             assistant_message.tool_calls = tool_calls
@@ -727,7 +726,6 @@ class Cohere(Model):
         stream_data: StreamData = StreamData()
         stream_data.response_timer.start()
 
-        stream_data.response_content = ""
         tool_calls: List[Dict[str, Any]] = []
         stream_data.response_tool_calls = []
         last_delta: Optional[NonStreamedChatResponse] = None
@@ -738,7 +736,7 @@ class Cohere(Model):
 
             if isinstance(response, TextGenerationStreamedChatResponse):
                 if response.text is not None:
-                    stream_data.response_content += response.text
+                    stream_data.response_content.append(response.text)
                     stream_data.completion_tokens += 1
                     if stream_data.completion_tokens == 1:
                         stream_data.time_to_first_token = stream_data.response_timer.elapsed
@@ -772,7 +770,7 @@ class Cohere(Model):
         logger.debug(f"Time to generate response: {stream_data.response_timer.elapsed:.4f}s")
 
         # -*- Create assistant message
-        assistant_message = Message(role="assistant", content=stream_data.response_content)
+        assistant_message = Message(role="assistant", content=stream_data.response_content.getvalue())
         # -*- Add tool calls to assistant message
         if len(stream_data.response_tool_calls) > 0:
             assistant_message.tool_calls = tool_calls
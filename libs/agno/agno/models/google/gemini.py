@@ -12,6 +12,7 @@ from agno.models.message import Message
 from agno.models.response import ModelResponse, ModelResponseEvent
 from agno.tools import Function, Toolkit
 from agno.utils.log import logger
+from agno.utils.stream import StreamBuffer
 
 try:
     import google.generativeai as genai
@@ -750,6 +751,7 @@ class Gemini(Model):
         logger.debug("---------- Gemini Response Start ----------")
         self._log_messages(messages)
         message_data = MessageData()
+        content_buffer = StreamBuffer()
         metrics = Metrics()
 
         metrics.start_response_timer()
@@ -766,7 +768,7 @@ class Gemini(Model):
                     if "text" in part_dict:
                         text = part_dict.get("text")
                         yield ModelResponse(content=text)
-                        message_data.response_content += text
+                        content_buffer.append(text)
                         metrics.output_tokens += 1
                         if metrics.output_tokens == 1:
                             metrics.time_to_first_token = metrics.response_timer.elapsed
@@ -789,6 +791,7 @@ class Gemini(Model):
                         )
             message_data.response_usage = response.usage_metadata
         metrics.stop_response_timer()
+        message_data.response_content = content_buffer.getvalue()
 
         # -*- Create assistant message
         assistant_message = Message(
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from os import getenv
 from typing import Any, Dict, Iterator, List, Optional, Union
 
@@ -9,6 +9,7 @@ from agno.models.base import Model
 from agno.models.message import Message
 from agno.models.response import ModelResponse
 from agno.utils.log import logger
+from agno.utils.stream import StreamBuffer
 
 try:
     from groq import AsyncGroq as AsyncGroqClient
@@ -54,7 +55,7 @@ class Metrics(BaseMetrics):
 
 @dataclass
 class StreamData:
-    response_content: str = ""
+    response_content: StreamBuffer = field(default_factory=StreamBuffer)
     response_tool_calls: Optional[List[ChoiceDeltaToolCall]] = None
 
 
@@ -610,7 +611,7 @@ class Groq(Model):
                 response_tool_calls: Optional[List[ChoiceDeltaToolCall]] = response_delta.tool_calls
 
                 if response_content is not None:
-                    stream_data.response_content += response_content
+                    stream_data.response_content.append(response_content)
                     yield ModelResponse(content=response_content)
 
                 if response_tool_calls is not None:
@@ -624,8 +625,8 @@ class Groq(Model):
 
         # -*- Create assistant message
         assistant_message = Message(role="assistant")
-        if stream_data.response_content != "":
-            assistant_message.content = stream_data.response_content
+        if stream_data.response_content:
+            assistant_message.content = stream_data.response_content.getvalue()
 
         if stream_data.response_tool_calls is not None:
             _tool_calls = self.build_tool_calls(stream_data.response_tool_calls)
@@ -679,7 +680,7 @@ class Groq(Model):
                 response_tool_calls = response_delta.tool_calls
 
                 if response_content is not None:
-                    stream_data.response_content += response_content
+                    stream_data.response_content.append(response_content)
                     yield ModelResponse(content=response_content)
 
                 if response_tool_calls is not None:
@@ -693,8 +694,8 @@ class Groq(Model):
 
         # -*- Create assistant message
         assistant_message = Message(role="assistant")
-        if stream_data.response_content != "":
-            assistant_message.content = stream_data.response_content
+        if stream_data.response_content:
+            assistant_message.content = stream_data.response_content.getvalue()
 
         if stream_data.response_tool_calls is not None:
             _tool_calls = self.build_tool_calls(stream_data.response_tool_calls)
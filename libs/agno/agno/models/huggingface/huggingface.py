@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from os import getenv
 from typing import Any, Dict, Iterator, List, Optional, Union
 
@@ -10,6 +10,7 @@ from agno.models.message import Message
 from agno.models.response import ModelResponse
 from agno.tools.function import FunctionCall
 from agno.utils.log import logger
+from agno.utils.stream import StreamBuffer
 from agno.utils.tools import get_function_call_for_tool_call
 
 try:
@@ -29,7 +30,7 @@ except (ModuleNotFoundError, ImportError):
 
 @dataclass
 class StreamData:
-    response_content: str = ""
+    response_content: StreamBuffer = field(default_factory=StreamBuffer)
     response_tool_calls: Optional[List[ChatCompletionStreamOutputDeltaToolCall]] = None
 
 
@@ -683,7 +684,7 @@ class HuggingFace(Model):
                 response_tool_calls: Optional[List[ChatCompletionStreamOutputDeltaToolCall]] = response_delta.tool_calls
 
                 if response_content is not None:
-                    stream_data.response_content += response_content
+                    stream_data.response_content.append(response_content)
                     yield ModelResponse(content=response_content)
 
                 if response_tool_calls is not None:
@@ -693,8 +694,8 @@ class HuggingFace(Model):
 
         # -*- Create assistant message
         assistant_message = Message(role="assistant")
-        if stream_data.response_content != "":
-            assistant_message.content = stream_data.response_content
+        if stream_data.response_content:
+            assistant_message.content = stream_data.response_content.getvalue()
 
         if stream_data.response_tool_calls is not None:
             _tool_calls = self._build_tool_calls(stream_data.response_tool_calls)
@@ -738,7 +739,7 @@ class HuggingFace(Model):
                 response_tool_calls = response_delta.tool_calls
 
                 if response_content is not None:
-                    stream_data.response_content += response_content
+                    stream_data.response_content.append(response_content)
                     yield ModelResponse(content=response_content)
 
                 if response_tool_calls is not None:
@@ -749,8 +750,8 @@ class HuggingFace(Model):
 
         # -*- Create assistant message
         assistant_message = Message(role="assistant")
-        if stream_data.response_content != "":
-            assistant_message.content = stream_data.response_content
+        if stream_data.response_content:
+            assistant_message.content = stream_data.response_content.getvalue()
 
         if stream_data.response_tool_calls is not None:
             _tool_calls = self._build_tool_calls(stream_data.response_tool_calls)
@@ -7,6 +7,7 @@ from agno.models.base import Metrics, Model
 from agno.models.message import Message
 from agno.models.response import ModelResponse, ModelResponseEvent
 from agno.utils.log import logger
+from agno.utils.stream import StreamBuffer
 
 try:
     from mistralai import Mistral as MistralClient
@@ -475,6 +476,7 @@ class MistralChat(Model):
         self._log_messages(messages)
         metrics = Metrics()
         message_data = MessageData()
+        content_buffer = StreamBuffer()
 
         metrics.start_response_timer()
 
@@ -496,7 +498,7 @@ class MistralChat(Model):
 
             # -*- Return content if present, otherwise get tool call
             if response_content is not None:
-                message_data.response_content += response_content
+                content_buffer.append(response_content)
                 if response.data.usage is not None:
                     metrics.input_tokens += response.data.usage.prompt_tokens
                     metrics.output_tokens += response.data.usage.completion_tokens
@@ -513,6 +515,7 @@ class MistralChat(Model):
                 message_data.response_tool_calls.extend(response_tool_calls)
 
         metrics.stop_response_timer()
+        message_data.response_content = content_buffer.getvalue()
 
         # -*- Create assistant message
         assistant_message = Message(role=(assistant_message_role or "assistant"))
@@ -715,6 +718,7 @@ class MistralChat(Model):
         self._log_messages(messages)
         metrics = Metrics()
         message_data = MessageData()
+        content_buffer = StreamBuffer()
 
         metrics.start_response_timer()
 
@@ -737,7 +741,7 @@ class MistralChat(Model):
 
             # -*- Return content if present, otherwise get tool call
             if response_content is not None:
-                message_data.response_content += response_content
+                content_buffer.append(response_content)
                 if response.data.usage is not None:
                     metrics.input_tokens += response.data.usage.prompt_tokens
                     metrics.output_tokens += response.data.usage.completion_tokens
@@ -755,6 +759,7 @@ class MistralChat(Model):
                 message_data.response_tool_calls.extend(response_tool_calls)
 
         metrics.stop_response_timer()
+        message_data.response_content = content_buffer.getvalue()
 
         # -*- Create assistant message
         assistant_message = Message(role=(assistant_message_role or "assistant"))
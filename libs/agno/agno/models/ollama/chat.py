@@ -8,6 +8,7 @@ from agno.models.base import Metrics, Model
 from agno.models.message import Message
 from agno.models.response import ModelResponse, ModelResponseEvent
 from agno.utils.log import logger
+from agno.utils.stream import StreamBuffer
 
 try:
     from ollama import AsyncClient as AsyncOllamaClient
@@ -554,6 +555,7 @@ class Ollama(Model):
         logger.debug("---------- Ollama Response Start ----------")
         self._log_messages(messages)
         message_data = MessageData()
+        content_buffer = StreamBuffer()
         metrics: Metrics = Metrics()
 
         # -*- Generate response
@@ -567,7 +569,7 @@ class Ollama(Model):
 
                 message_data.response_content_chunk = message_data.response_message.get("content", "")
                 if message_data.response_content_chunk is not None and message_data.response_content_chunk != "":
-                    message_data.response_content += message_data.response_content_chunk
+                    content_buffer.append(message_data.response_content_chunk)
                     yield ModelResponse(content=message_data.response_content_chunk)
 
                 message_data.tool_call_blocks = message_data.response_message.get("tool_calls")  # type: ignore
@@ -585,6 +587,7 @@ class Ollama(Model):
             if response.get("done"):
                 message_data.response_usage = response
         metrics.stop_response_timer()
+        message_data.response_content = content_buffer.getvalue()
 
         # -*- Create assistant message
         assistant_message = Message(role="assistant", content=message_data.response_content)
@@ -623,6 +626,7 @@ class Ollama(Model):
         logger.debug("---------- Ollama Async Response Start ----------")
         self._log_messages(messages)
         message_data = MessageData()
+        content_buffer = StreamBuffer()
         metrics: Metrics = Metrics()
 
         # -*- Generate response
@@ -636,7 +640,7 @@ class Ollama(Model):
 
                 message_data.response_content_chunk = message_data.response_message.get("content", "")
                 if message_data.response_content_chunk is not None and message_data.response_content_chunk != "":
-                    message_data.response_content += message_data.response_content_chunk
+                    content_buffer.append(message_data.response_content_chunk)
                     yield ModelResponse(content=message_data.response_content_chunk)
 
                 message_data.tool_call_blocks = message_data.response_message.get("tool_calls")
@@ -654,6 +658,7 @@ class Ollama(Model):
             if response.get("done"):
                 message_data.response_usage = response
         metrics.stop_response_timer()
+        message_data.response_content = content_buffer.getvalue()
 
         # -*- Create assistant message
         assistant_message = Message(role="assistant", content=message_data.response_content)
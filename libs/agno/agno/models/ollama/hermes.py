@@ -6,6 +6,7 @@ from agno.models.message import Message
 from agno.models.ollama.chat import Metrics, Ollama
 from agno.models.response import ModelResponse
 from agno.utils.log import logger
+from agno.utils.stream import StreamBuffer
 
 
 @dataclass
@@ -85,6 +86,7 @@ class OllamaHermes(Ollama):
         logger.debug("---------- Ollama OllamaHermes Response Start ----------")
         self._log_messages(messages)
         message_data = MessageData()
+        content_buffer = StreamBuffer()
         metrics: Metrics = Metrics()
 
         # -*- Generate response
@@ -109,11 +111,12 @@ class OllamaHermes(Ollama):
                     message_data.in_tool_call = True
                 else:
                     yield ModelResponse(content=message_data.response_content_chunk)
-                    message_data.response_content += message_data.response_content_chunk
+                    content_buffer.append(message_data.response_content_chunk)
 
             if response.get("done"):
                 message_data.response_usage = response
         metrics.stop_response_timer()
+        message_data.response_content = content_buffer.getvalue()
 
         # Format tool calls
         message_data = self._format_tool_calls(message_data)
@@ -155,6 +158,7 @@ class OllamaHermes(Ollama):
         logger.debug("---------- Ollama OllamaHermes Async Response Start ----------")
         self._log_messages(messages)
         message_data = MessageData()
+        content_buffer = StreamBuffer()
         metrics: Metrics = Metrics()
 
         # -*- Generate response
@@ -185,11 +189,12 @@ class OllamaHermes(Ollama):
                     message_data.in_tool_call = True
                 else:
                     yield ModelResponse(content=message_data.response_content_chunk)
-                    message_data.response_content += message_data.response_content_chunk
+                    content_buffer.append(message_data.response_content_chunk)
 
             if response.get("done"):
                 message_data.response_usage = response
         metrics.stop_response_timer()
+        message_data.response_content = content_buffer.getvalue()
 
         # Format tool calls
         message_data = self._format_tool_calls(message_data)
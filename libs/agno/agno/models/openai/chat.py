@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 from os import getenv
 from typing import Any, Dict, Iterator, List, Optional, Union
 
@@ -10,6 +11,7 @@ from agno.models.base import Metrics, Model
 from agno.models.message import Message
 from agno.models.response import ModelResponse
 from agno.utils.log import logger
+from agno.utils.stream import StreamBuffer
 
 try:
     from openai import AsyncOpenAI as AsyncOpenAIClient
@@ -29,7 +31,7 @@ except ModuleNotFoundError:
 
 @dataclass
 class StreamData:
-    response_content: str = ""
+    response_content: StreamBuffer = field(default_factory=StreamBuffer)
     response_audio: Optional[ChatCompletionAudio] = None
     response_tool_calls: Optional[List[ChoiceDeltaToolCall]] = None
 
@@ -84,6 +86,12 @@ class OpenAIChat(Model):
     # OpenAI clients
     client: Optional[OpenAIClient] = None
     async_client: Optional[AsyncOpenAIClient] = None
+    # HTTP client for the async OpenAI client. If not provided, one pooled client is created and reused.
+    async_http_client: Optional[httpx.AsyncClient] = None
+    # If True, copies of this model created by Agent.deep_copy() share its clients and connection pools
+    share_clients: bool = True
+    # Event loop the async clients were created on, when they were created by this model
+    _async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
     # Internal parameters. Not used for API requests
     # Whether to use the structured outputs with this Model.
@@ -142,18 +150,77 @@ class OpenAIChat(Model):
         Returns:
             AsyncOpenAIClient: An instance of the asynchronous OpenAI client.
         """
+        self._check_async_client_loop()
         if self.async_client:
             return self.async_client
 
         client_params: Dict[str, Any] = self._get_client_params()
-        if self.http_client:
-            client_params["http_client"] = self.http_client
-        else:
-            # Create a new async HTTP client with custom limits
-            client_params["http_client"] = httpx.AsyncClient(
+        client_params["http_client"] = self._get_async_http_client()
+        self.async_client = AsyncOpenAIClient(**client_params)
+        return self.async_client
+
+    def _check_async_client_loop(self) -> None:
+        """
+        Drops the async clients created by this model if they were created on a different event loop.
+        Pooled connections are bound to the event loop they were opened on and cannot be reused on another.
+        """
+        if self._async_client_loop is None:
+            return
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not self._async_client_loop:
+            self.async_client = None
+            self.async_http_client = None
+            self._async_client_loop = None
+
+    def _get_async_http_client(self) -> httpx.AsyncClient:
+        """
+        Returns the HTTP client used by the async OpenAI client, creating a pooled client on first use.
+
+        Returns:
+            httpx.AsyncClient: The async HTTP client.
+        """
+        if isinstance(self.http_client, httpx.AsyncClient):
+            return self.http_client
+        if self.async_http_client is None:
+            self.async_http_client = httpx.AsyncClient(
                 limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
             )
-        return AsyncOpenAIClient(**client_params)
+            try:
+                self._async_client_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._async_client_loop = None
+        return self.async_http_client
+
+    def close(self) -> None:
+        """Closes the sync OpenAI client and its connection pool."""
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+
+    async def aclose(self) -> None:
+        """Closes the async OpenAI client and its connection pool."""
+        if self.async_client is not None:
+            await self.async_client.close()
+            self.async_client = None
+        if self.async_http_client is not None:
+            await self.async_http_client.aclose()
+            self.async_http_client = None
+        self._async_client_loop = None
+
+    def __deepcopy__(self, memo):
+        """
+        Creates a deep copy of the model. Clients hold connection pools that cannot be copied,
+        so the copy either shares them or creates its own on first use, depending on share_clients.
+        """
+        for shared in (self.client, self.async_client, self.http_client, self.async_http_client):
+            if shared is not None:
+                memo[id(shared)] = shared if self.share_clients else None
+        if self._async_client_loop is not None:
+            memo[id(self._async_client_loop)] = self._async_client_loop if self.share_clients else None
+        return super().__deepcopy__(memo)
 
     @property
     def request_kwargs(self) -> Dict[str, Any]:
@@ -706,7 +773,7 @@ class OpenAIChat(Model):
                 response_delta: ChoiceDelta = response.choices[0].delta
 
                 if response_delta.content is not None:
-                    stream_data.response_content += response_delta.content
+                    stream_data.response_content.append(response_delta.content)
                     yield ModelResponse(content=response_delta.content)
 
                 if hasattr(response_delta, "audio"):
@@ -733,8 +800,8 @@ class OpenAIChat(Model):
 
         # -*- Create assistant message
         assistant_message = Message(role="assistant")
-        if stream_data.response_content != "":
-            assistant_message.content = stream_data.response_content
+        if stream_data.response_content:
+            assistant_message.content = stream_data.response_content.getvalue()
 
         if stream_data.response_audio is not None:
             assistant_message.audio_output = AudioOutput(
@@ -794,7 +861,7 @@ class OpenAIChat(Model):
                 response_delta: ChoiceDelta = response.choices[0].delta
 
                 if response_delta.content is not None:
-                    stream_data.response_content += response_delta.content
+                    stream_data.response_content.append(response_delta.content)
                     yield ModelResponse(content=response_delta.content)
 
                 if hasattr(response_delta, "audio"):
@@ -821,8 +888,8 @@ class OpenAIChat(Model):
 
         # -*- Create assistant message
         assistant_message = Message(role="assistant")
-        if stream_data.response_content != "":
-            assistant_message.content = stream_data.response_content
+        if stream_data.response_content:
+            assistant_message.content = stream_data.response_content.getvalue()
 
         if stream_data.response_audio is not None:
             assistant_message.audio_output = AudioOutput(
@@ -69,7 +69,7 @@ class Together(OpenAILike):
                 response_tool_calls: Optional[List[ChoiceDeltaToolCall]] = response_delta.tool_calls
 
                 if response_content is not None:
-                    stream_data.response_content += response_content
+                    stream_data.response_content.append(response_content)
                     yield ModelResponse(content=response_content)
 
                 if response_tool_calls is not None:
@@ -7,6 +7,7 @@ from agno.models.message import Message
 from agno.models.response import ModelResponse, ModelResponseEvent
 from agno.tools import Function, Toolkit
 from agno.utils.log import logger
+from agno.utils.stream import StreamBuffer
 
 try:
     from vertexai.generative_models import (
@@ -507,6 +508,7 @@ class Gemini(Model):
         logger.debug("---------- VertexAI Response Start ----------")
         self._log_messages(messages)
         message_data = MessageData()
+        content_buffer = StreamBuffer()
         metrics = Metrics()
 
         metrics.start_response_timer()
@@ -527,7 +529,7 @@ class Gemini(Model):
                     if "text" in part_dict:
                         text = part_dict.get("text")
                         yield ModelResponse(content=text)
-                        message_data.response_content += text
+                        content_buffer.append(text)
 
                     # -*- Skip function calls if there are no parts
                     if not message_data.response_block.parts and message_data.response_parts:
@@ -547,6 +549,7 @@ class Gemini(Model):
             message_data.response_usage = response.usage_metadata
 
         metrics.stop_response_timer()
+        message_data.response_content = content_buffer.getvalue()
 
         # -*- Create assistant message
         assistant_message = Message(
@@ -3,7 +3,7 @@ from dataclasses import asdict
 from io import BytesIO
 from typing import AsyncGenerator, List, Optional, cast
 
-from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, Query, Response, UploadFile
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from agno.agent.agent import Agent, RunResponse
@@ -11,8 +11,6 @@ from agno.media import Audio, Image, Video
 from agno.playground.operator import (
     format_tools,
     get_agent_by_id,
-    get_session_title,
-    get_session_title_from_workflow_session,
     get_workflow_by_id,
 )
 from agno.playground.schemas import (
@@ -229,7 +227,13 @@ def get_async_playground_router(
             return run_response
 
     @playground_router.get("/agents/{agent_id}/sessions")
-    async def get_all_agent_sessions(agent_id: str, user_id: str = Query(..., min_length=1)):
+    async def get_all_agent_sessions(
+        agent_id: str,
+        response: Response,
+        user_id: str = Query(..., min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = None,
+    ):
         logger.debug(f"AgentSessionsRequest: {agent_id} {user_id}")
         agent = get_agent_by_id(agent_id, agents)
         if agent is None:
@@ -238,19 +242,25 @@ def get_async_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        agent_sessions: List[AgentSessionsResponse] = []
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id)
-        for session in all_agent_sessions:
-            title = get_session_title(session)
-            agent_sessions.append(
-                AgentSessionsResponse(
-                    title=title,
-                    session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
-                    created_at=session.created_at,
-                )
+        try:
+            summaries, next_cursor = await agent.storage.aget_session_summaries(
+                user_id=user_id, limit=limit, cursor=cursor
             )
-        return agent_sessions
+        except ValueError as e:
+            return JSONResponse(status_code=400, content=str(e))
+
+        # The cursor of the next page, if any, is returned in a header to keep the response a list
+        if next_cursor is not None:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return [
+            AgentSessionsResponse(
+                title=summary.title or "Unnamed session",
+                session_id=summary.session_id,
+                session_name=summary.session_name,
+                created_at=summary.created_at,
+            )
+            for summary in summaries
+        ]
 
     @playground_router.get("/agents/{agent_id}/sessions/{session_id}")
     async def get_agent_session(agent_id: str, session_id: str, user_id: str = Query(..., min_length=1)):
@@ -262,7 +272,7 @@ def get_async_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        agent_session: Optional[AgentSession] = agent.storage.read(session_id, user_id)
+        agent_session: Optional[AgentSession] = await agent.storage.aread(session_id, user_id)
         if agent_session is None:
             return JSONResponse(status_code=404, content="Session not found.")
 
@@ -277,7 +287,7 @@ def get_async_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=body.user_id)
+        all_agent_sessions: List[AgentSession] = await agent.storage.aget_all_sessions(user_id=body.user_id)
         for session in all_agent_sessions:
             if session.session_id == session_id:
                 agent.session_id = session_id
@@ -295,7 +305,7 @@ def get_async_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id)
+        all_agent_sessions: List[AgentSession] = await agent.storage.aget_all_sessions(user_id=user_id)
         for session in all_agent_sessions:
             if session.session_id == session_id:
                 agent.delete_session(session_id)
@@ -364,7 +374,13 @@ def get_async_playground_router(
             raise HTTPException(status_code=500, detail=f"Error running workflow: {str(e)}")
 
     @playground_router.get("/workflows/{workflow_id}/sessions", response_model=List[WorkflowSessionResponse])
-    async def get_all_workflow_sessions(workflow_id: str, user_id: str = Query(..., min_length=1)):
+    async def get_all_workflow_sessions(
+        workflow_id: str,
+        response: Response,
+        user_id: str = Query(..., min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = None,
+    ):
         # Retrieve the workflow by ID
         workflow = get_workflow_by_id(workflow_id, workflows)
         if not workflow:
@@ -374,23 +390,27 @@ def get_async_playground_router(
         if not workflow.storage:
             raise HTTPException(status_code=404, detail="Workflow does not have storage enabled")
 
-        # Retrieve all sessions for the given workflow and user
+        # Retrieve the sessions for the given workflow and user
         try:
-            all_workflow_sessions: List[WorkflowSession] = workflow.storage.get_all_sessions(
-                user_id=user_id, workflow_id=workflow_id
+            summaries, next_cursor = await workflow.storage.aget_session_summaries(
+                user_id=user_id, workflow_id=workflow_id, limit=limit, cursor=cursor
             )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
 
-        # Return the sessions
+        # Return the sessions, with the cursor of the next page in a header
+        if next_cursor is not None:
+            response.headers["X-Next-Cursor"] = next_cursor
         return [
             WorkflowSessionResponse(
-                title=get_session_title_from_workflow_session(session),
-                session_id=session.session_id,
-                session_name=session.session_data.get("session_name") if session.session_data else None,
-                created_at=session.created_at,
+                title=summary.title or "Unnamed session",
+                session_id=summary.session_id,
+                session_name=summary.session_name,
+                created_at=summary.created_at,
             )
-            for session in all_workflow_sessions
+            for summary in summaries
         ]
 
     @playground_router.get("/workflows/{workflow_id}/sessions/{session_id}")
@@ -406,7 +426,7 @@ def get_async_playground_router(
 
         # Retrieve the specific session
         try:
-            workflow_session: Optional[WorkflowSession] = workflow.storage.read(session_id, user_id)
+            workflow_session: Optional[WorkflowSession] = await workflow.storage.aread(session_id, user_id)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving session: {str(e)}")
 
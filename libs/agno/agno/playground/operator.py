@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from agno.agent.agent import Agent, AgentRun, Function, Toolkit
+from agno.agent.agent import Agent, Function, Toolkit
 from agno.storage.agent.session import AgentSession
 from agno.storage.workflow.session import WorkflowSession
 from agno.utils.log import logger
@@ -39,47 +39,13 @@ def get_agent_by_id(agent_id: str, agents: Optional[List[Agent]] = None) -> Opti
 def get_session_title(session: AgentSession) -> str:
     if session is None:
         return "Unnamed session"
-    session_name = session.session_data.get("session_name") if session.session_data is not None else None
-    if session_name is not None:
-        return session_name
-    memory = session.memory
-    if memory is not None:
-        runs = memory.get("runs") or memory.get("chats")
-        if isinstance(runs, list):
-            for _run in runs:
-                try:
-                    run_parsed = AgentRun.model_validate(_run)
-                    if run_parsed.message is not None and run_parsed.message.role == "user":
-                        content = run_parsed.message.get_content_string()
-                        if content:
-                            return content
-                        else:
-                            return "No title"
-                except Exception as e:
-                    logger.error(f"Error parsing chat: {e}")
-    return "Unnamed session"
+    return session.get_title() or "Unnamed session"
 
 
 def get_session_title_from_workflow_session(workflow_session: WorkflowSession) -> str:
     if workflow_session is None:
         return "Unnamed session"
-    session_name = (
-        workflow_session.session_data.get("session_name") if workflow_session.session_data is not None else None
-    )
-    if session_name is not None:
-        return session_name
-    memory = workflow_session.memory
-    if memory is not None:
-        runs = memory.get("runs")
-        if isinstance(runs, list):
-            for _run in runs:
-                try:
-                    response = _run.get("response")
-                    content = response.get("content") if response else None
-                    return content.split("\n")[0] if content else "No title"
-                except Exception as e:
-                    logger.error(f"Error parsing chat: {e}")
-    return "Unnamed session"
+    return workflow_session.get_title() or "Unnamed session"
 
 
 def get_workflow_by_id(workflow_id: str, workflows: Optional[List[Workflow]] = None) -> Optional[Workflow]:
@@ -3,7 +3,7 @@ from dataclasses import asdict
 from io import BytesIO
 from typing import Generator, List, Optional, cast
 
-from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, Query, Response, UploadFile
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from agno.agent.agent import Agent, RunResponse
@@ -11,8 +11,6 @@ from agno.media import Image
 from agno.playground.operator import (
     format_tools,
     get_agent_by_id,
-    get_session_title,
-    get_session_title_from_workflow_session,
     get_workflow_by_id,
 )
 from agno.playground.schemas import (
@@ -212,7 +210,13 @@ def get_sync_playground_router(
             return run_response
 
     @playground_router.get("/agents/{agent_id}/sessions")
-    def get_user_agent_sessions(agent_id: str, user_id: str = Query(..., min_length=1)):
+    def get_user_agent_sessions(
+        agent_id: str,
+        response: Response,
+        user_id: str = Query(..., min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = None,
+    ):
         logger.debug(f"AgentSessionsRequest: {agent_id} {user_id}")
         agent = get_agent_by_id(agent_id, agents)
         if agent is None:
@@ -221,19 +225,23 @@ def get_sync_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        agent_sessions: List[AgentSessionsResponse] = []
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id)
-        for session in all_agent_sessions:
-            title = get_session_title(session)
-            agent_sessions.append(
-                AgentSessionsResponse(
-                    title=title,
-                    session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
-                    created_at=session.created_at,
-                )
+        try:
+            summaries, next_cursor = agent.storage.get_session_summaries(user_id=user_id, limit=limit, cursor=cursor)
+        except ValueError as e:
+            return JSONResponse(status_code=400, content=str(e))
+
+        # The cursor of the next page, if any, is returned in a header to keep the response a list
+        if next_cursor is not None:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return [
+            AgentSessionsResponse(
+                title=summary.title or "Unnamed session",
+                session_id=summary.session_id,
+                session_name=summary.session_name,
+                created_at=summary.created_at,
             )
-        return agent_sessions
+            for summary in summaries
+        ]
 
     @playground_router.get("/agents/{agent_id}/sessions/{session_id}")
     def get_user_agent_session(agent_id: str, session_id: str, user_id: str = Query(..., min_length=1)):
@@ -342,7 +350,13 @@ def get_sync_playground_router(
             raise HTTPException(status_code=500, detail=f"Error running workflow: {str(e)}")
 
     @playground_router.get("/workflows/{workflow_id}/sessions", response_model=List[WorkflowSessionResponse])
-    def get_all_workflow_sessions(workflow_id: str, user_id: str = Query(..., min_length=1)):
+    def get_all_workflow_sessions(
+        workflow_id: str,
+        response: Response,
+        user_id: str = Query(..., min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = None,
+    ):
         # Retrieve the workflow by ID
         workflow = get_workflow_by_id(workflow_id, workflows)
         if not workflow:
@@ -352,23 +366,27 @@ def get_sync_playground_router(
         if not workflow.storage:
             raise HTTPException(status_code=404, detail="Workflow does not have storage enabled")
 
-        # Retrieve all sessions for the given workflow and user
+        # Retrieve the sessions for the given workflow and user
         try:
-            all_workflow_sessions: List[WorkflowSession] = workflow.storage.get_all_sessions(
-                user_id=user_id, workflow_id=workflow_id
+            summaries, next_cursor = workflow.storage.get_session_summaries(
+                user_id=user_id, workflow_id=workflow_id, limit=limit, cursor=cursor
             )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
 
-        # Return the sessions
+        # Return the sessions, with the cursor of the next page in a header
+        if next_cursor is not None:
+            response.headers["X-Next-Cursor"] = next_cursor
         return [
             WorkflowSessionResponse(
-                title=get_session_title_from_workflow_session(session),
-                session_id=session.session_id,
-                session_name=session.session_data.get("session_name") if session.session_data else None,
-                created_at=session.created_at,
+                title=summary.title or "Unnamed session",
+                session_id=summary.session_id,
+                session_name=summary.session_name,
+                created_at=summary.created_at,
             )
-            for session in all_workflow_sessions
+            for summary in summaries
         ]
 
     @playground_router.get("/workflows/{workflow_id}/sessions/{session_id}", response_model=WorkflowSession)
@@ -71,6 +71,15 @@ class RunResponse:
     extra_data: Optional[RunResponseExtraData] = None
     created_at: int = field(default_factory=lambda: int(time()))
 
+    def copy_with_content(self, content: Optional[Any], created_at: Optional[int] = None) -> "RunResponse":
+        """Returns a shallow copy with new content, without running __init__. Used for streamed chunks."""
+        chunk = self.__class__.__new__(self.__class__)
+        chunk.__dict__.update(self.__dict__)
+        chunk.content = content
+        if created_at is not None:
+            chunk.created_at = created_at
+        return chunk
+
     def to_dict(self) -> Dict[str, Any]:
         _dict = {k: v for k, v in asdict(self).items() if v is not None and k != "messages"}
         if self.messages is not None:
@@ -1,7 +1,9 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from agno.storage.agent.session import AgentSession
+from agno.storage.session_info import SessionInfo, paginate
 
 
 class AgentStorage(ABC):
@@ -21,6 +23,36 @@ class AgentStorage(ABC):
     def get_all_sessions(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[AgentSession]:
         raise NotImplementedError
 
+    def get_session_updated_at(self, session_id: str) -> Optional[int]:
+        """Returns the updated_at (or created_at, if never updated) of a session, or None if it does not exist"""
+        raise NotImplementedError
+
+    def get_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[SessionInfo], Optional[str]]:
+        """
+        Get a page of session summaries, newest first, without loading the session memory.
+        Backends override this default, which reads and pages all sessions in memory.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            agent_id (Optional[str]): The ID of the agent to filter by.
+            limit (Optional[int]): Maximum number of sessions to return. Returns all sessions if None.
+            cursor (Optional[str]): Cursor returned with the previous page.
+
+        Returns:
+            Tuple[List[SessionInfo], Optional[str]]: The sessions and the cursor of the next page, None on the last page.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        sessions = self.get_all_sessions(user_id=user_id, agent_id=agent_id)
+        return paginate([session.to_session_info() for session in sessions], limit=limit, cursor=cursor)
+
     @abstractmethod
     def upsert(self, session: AgentSession) -> Optional[AgentSession]:
         raise NotImplementedError
@@ -29,6 +61,35 @@ class AgentStorage(ABC):
     def delete_session(self, session_id: Optional[str] = None):
         raise NotImplementedError
 
+    # The async methods below run the sync methods in a thread so they do not block the event loop.
+    # Backends with a native async client override them.
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
+        return await asyncio.to_thread(self.read, session_id, user_id)
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[str]:
+        return await asyncio.to_thread(self.get_all_session_ids, user_id, agent_id)
+
+    async def aget_all_sessions(
+        self, user_id: Optional[str] = None, agent_id: Optional[str] = None
+    ) -> List[AgentSession]:
+        return await asyncio.to_thread(self.get_all_sessions, user_id, agent_id)
+
+    async def aget_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[SessionInfo], Optional[str]]:
+        return await asyncio.to_thread(self.get_session_summaries, user_id, agent_id, limit, cursor)
+
+    async def aupsert(self, session: AgentSession) -> Optional[AgentSession]:
+        return await asyncio.to_thread(self.upsert, session)
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        return await asyncio.to_thread(self.delete_session, session_id)
+
     @abstractmethod
     def drop(self) -> None:
         raise NotImplementedError
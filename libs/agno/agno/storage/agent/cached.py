@@ -0,0 +1,316 @@
+import asyncio
+import atexit
+import threading
+import time
+from collections import OrderedDict
+from copy import copy, deepcopy
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from agno.storage.agent.base import AgentStorage
+from agno.storage.agent.session import AgentSession
+from agno.storage.session_info import SessionInfo
+from agno.utils.log import logger
+
+
+@dataclass
+class _CacheEntry:
+    session: AgentSession
+    # updated_at of the session in storage when it was cached
+    updated_at: Optional[int] = None
+    # time.monotonic() of when the session was last read, written or validated against storage
+    validated_at: float = 0.0
+
+
+class CachedAgentStorage(AgentStorage):
+    def __init__(
+        self,
+        storage: AgentStorage,
+        max_size: int = 1000,
+        validate_sessions: bool = True,
+        validate_interval: float = 1.0,
+        write_behind: bool = False,
+        flush_interval: float = 1.0,
+        max_pending_writes: int = 100,
+    ):
+        """
+        Wraps an AgentStorage and keeps recently used AgentSessions in an in-process LRU cache.
+
+        Args:
+            storage (AgentStorage): The storage backend to wrap.
+            max_size (int): Maximum number of sessions to keep in the cache.
+            validate_sessions (bool): Before serving a cached session, check that its updated_at in storage has not
+                moved on, i.e. that no other worker wrote the session. Requires get_session_updated_at() support
+                from the backend, otherwise cached sessions are served as-is. updated_at has a resolution of
+                one second, so writes from two workers within the same second are not detected.
+            validate_interval (float): Serve a cached session without checking storage if it was read, written or
+                validated less than this many seconds ago. Set to 0 to check storage on every read.
+            write_behind (bool): Return from upsert() immediately and write sessions to storage from a background
+                thread. Multiple writes to the same session between flushes are coalesced into one.
+            flush_interval (float): Maximum number of seconds a write stays pending when write_behind is enabled.
+            max_pending_writes (int): Flush as soon as this many sessions have pending writes.
+        """
+        self.storage: AgentStorage = storage
+        self.max_size: int = max_size
+        self.validate_sessions: bool = validate_sessions
+        self.validate_interval: float = validate_interval
+        self.write_behind: bool = write_behind
+        self.flush_interval: float = flush_interval
+        self.max_pending_writes: int = max_pending_writes
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._pending: Dict[str, _CacheEntry] = {}
+        self._lock = threading.RLock()
+        # Serializes flushes so pending writes reach storage in order
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if self.write_behind:
+            self._thread = threading.Thread(target=self._run, name="agno-agent-storage-writer", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    def create(self) -> None:
+        self.storage.create()
+
+    def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
+        entry, pending = self._get_entry(session_id, user_id)
+        # Sessions with pending writes are always newer than storage
+        if entry is not None and (pending or self._is_fresh(session_id, entry)):
+            self.hits += 1
+            return self._copy(entry.session)
+
+        self.misses += 1
+        session = self.storage.read(session_id=session_id, user_id=user_id)
+        if session is not None:
+            self._put(session, updated_at=session.updated_at or session.created_at)
+        return session
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
+        entry, pending = self._get_entry(session_id, user_id)
+        if entry is not None and (pending or await asyncio.to_thread(self._is_fresh, session_id, entry)):
+            self.hits += 1
+            return self._copy(entry.session)
+
+        self.misses += 1
+        session = await self.storage.aread(session_id=session_id, user_id=user_id)
+        if session is not None:
+            self._put(session, updated_at=session.updated_at or session.created_at)
+        return session
+
+    def get_all_session_ids(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[str]:
+        self.flush()
+        return self.storage.get_all_session_ids(user_id=user_id, agent_id=agent_id)
+
+    def get_all_sessions(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[AgentSession]:
+        self.flush()
+        return self.storage.get_all_sessions(user_id=user_id, agent_id=agent_id)
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[str]:
+        await asyncio.to_thread(self.flush)
+        return await self.storage.aget_all_session_ids(user_id=user_id, agent_id=agent_id)
+
+    async def aget_all_sessions(
+        self, user_id: Optional[str] = None, agent_id: Optional[str] = None
+    ) -> List[AgentSession]:
+        await asyncio.to_thread(self.flush)
+        return await self.storage.aget_all_sessions(user_id=user_id, agent_id=agent_id)
+
+    def get_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[SessionInfo], Optional[str]]:
+        self.flush()
+        return self.storage.get_session_summaries(user_id=user_id, agent_id=agent_id, limit=limit, cursor=cursor)
+
+    async def aget_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[SessionInfo], Optional[str]]:
+        await asyncio.to_thread(self.flush)
+        return await self.storage.aget_session_summaries(user_id=user_id, agent_id=agent_id, limit=limit, cursor=cursor)
+
+    def upsert(self, session: AgentSession) -> Optional[AgentSession]:
+        if self.write_behind:
+            return self._put_pending(session)
+
+        saved = self.storage.upsert(session=session)
+        if saved is not None:
+            self._put_saved(session, saved)
+        return saved
+
+    async def aupsert(self, session: AgentSession) -> Optional[AgentSession]:
+        if self.write_behind:
+            return self._put_pending(session)
+
+        saved = await self.storage.aupsert(session=session)
+        if saved is not None:
+            self._put_saved(session, saved)
+        return saved
+
+    def delete_session(self, session_id: Optional[str] = None):
+        # Wait for a flush that is writing the session, otherwise it would write the session back after the delete
+        with self._flush_lock:
+            self._evict(session_id)
+            self.storage.delete_session(session_id=session_id)
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        await asyncio.to_thread(self._flush_lock.acquire)
+        try:
+            self._evict(session_id)
+            await self.storage.adelete_session(session_id=session_id)
+        finally:
+            self._flush_lock.release()
+
+    def drop(self) -> None:
+        self.clear()
+        self.storage.drop()
+
+    def upgrade_schema(self) -> None:
+        self.flush()
+        self.storage.upgrade_schema()
+
+    def clear(self) -> None:
+        """Remove all sessions from the cache, discarding pending writes"""
+        with self._lock:
+            self._entries.clear()
+            self._pending.clear()
+
+    def flush(self) -> None:
+        """Write all pending sessions to storage"""
+        with self._flush_lock:
+            with self._lock:
+                pending = list(self._pending.items())
+            for session_id, entry in pending:
+                saved: Optional[AgentSession] = None
+                try:
+                    saved = self.storage.upsert(session=entry.session)
+                except Exception as e:
+                    logger.error(f"Error writing session {session_id} to storage: {e}")
+                if saved is None:
+                    # Keep the write pending and retry on the next flush
+                    continue
+                with self._lock:
+                    # Keep the write pending if the session changed while it was being written
+                    if self._pending.get(session_id) is entry:
+                        del self._pending[session_id]
+                        entry.updated_at = saved.updated_at or saved.created_at or entry.updated_at
+
+    def close(self) -> None:
+        """Flush pending writes and stop the background writer"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.flush_interval + 10)
+        self.flush()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def cache_info(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "size": len(self._entries),
+            "pending_writes": len(self._pending),
+        }
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def _get_entry(self, session_id: str, user_id: Optional[str]) -> Tuple[Optional[_CacheEntry], bool]:
+        """Returns the cached entry for a session, if any, and whether it has a pending write"""
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None or (user_id is not None and entry.session.user_id != user_id):
+                return None, False
+            self._entries.move_to_end(session_id)
+            return entry, session_id in self._pending
+
+    def _put_pending(self, session: AgentSession) -> AgentSession:
+        # Snapshot the session, the agent keeps mutating its session_state and extra_data
+        entry = self._put(self._copy(session), updated_at=int(time.time()), pending=True)
+        if len(self._pending) >= self.max_pending_writes:
+            self._wakeup.set()
+        return entry.session
+
+    def _put_saved(self, session: AgentSession, saved: AgentSession) -> None:
+        # Backends that return the session they were given (instead of re-reading it) need a snapshot
+        self._put(saved if saved is not session else self._copy(saved), updated_at=saved.updated_at or saved.created_at)
+
+    def _evict(self, session_id: Optional[str]) -> None:
+        if session_id is not None:
+            with self._lock:
+                self._entries.pop(session_id, None)
+                self._pending.pop(session_id, None)
+
+    def _is_fresh(self, session_id: str, entry: _CacheEntry) -> bool:
+        if not self.validate_sessions:
+            return True
+        now = time.monotonic()
+        if now - entry.validated_at < self.validate_interval:
+            return True
+        try:
+            updated_at = self.storage.get_session_updated_at(session_id)
+        except NotImplementedError:
+            # The backend cannot be checked cheaply, serve the cached session
+            return True
+        except Exception as e:
+            logger.debug(f"Could not validate cached session {session_id}: {e}")
+            return False
+        if updated_at is None:
+            # The session was deleted by another worker
+            return False
+        if entry.updated_at is None or updated_at > entry.updated_at:
+            return False
+        entry.validated_at = now
+        return True
+
+    def _put(self, session: AgentSession, updated_at: Optional[int], pending: bool = False) -> _CacheEntry:
+        with self._lock:
+            entry = _CacheEntry(session=session, updated_at=updated_at, validated_at=time.monotonic())
+            self._entries[session.session_id] = entry
+            self._entries.move_to_end(session.session_id)
+            if pending:
+                self._pending[session.session_id] = entry
+            # Sessions with pending writes are not evicted until they are flushed
+            if len(self._entries) > self.max_size:
+                for session_id in list(self._entries.keys()):
+                    if len(self._entries) <= self.max_size:
+                        break
+                    if session_id not in self._pending:
+                        del self._entries[session_id]
+            return entry
+
+    @staticmethod
+    def _copy(session: AgentSession) -> AgentSession:
+        """
+        Return a copy of a session that can be loaded into an agent or kept in the cache.
+        session_data and extra_data are merged in place by Agent.load_agent_session(), so they are copied.
+        The memory is shared with the cache and must be treated as read-only. Agent.get_agent_session() builds a new
+        memory dictionary for every write, and an agent skips rebuilding its memory if it gets the same one back.
+        """
+        _session = copy(session)
+        _session.session_data = deepcopy(session.session_data)
+        _session.extra_data = deepcopy(session.extra_data)
+        return _session
+
+    def __deepcopy__(self, memo):
+        # Copies of an agent share the same cache
+        return self
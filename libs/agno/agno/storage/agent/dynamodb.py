@@ -1,15 +1,16 @@
 import time
 from dataclasses import asdict
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from agno.storage.agent.base import AgentStorage
 from agno.storage.agent.session import AgentSession
+from agno.storage.session_info import SessionInfo, decode_cursor, get_page, paginate
 from agno.utils.log import logger
 
 try:
     import boto3
-    from boto3.dynamodb.conditions import Key
+    from boto3.dynamodb.conditions import Attr, Key
     from botocore.exceptions import ClientError
 except ImportError:
     raise ImportError("`boto3` not installed. Please install using `pip install boto3`.")
@@ -237,6 +238,86 @@ class DynamoDbAgentStorage(AgentStorage):
             logger.error(f"Error retrieving sessions: {e}")
         return sessions
 
+    def _to_session_info(self, item: Dict[str, Any]) -> SessionInfo:
+        item = self._deserialize_item(item)
+        session_data = item.get("session_data")
+        title = item.get("title")
+        if title is None:
+            # Sessions written before titles were stored
+            title = AgentSession(
+                session_id=item["session_id"], memory=item.get("memory"), session_data=session_data
+            ).get_title()
+        return SessionInfo(
+            session_id=item["session_id"],
+            title=title,
+            session_name=session_data.get("session_name") if isinstance(session_data, dict) else None,
+            user_id=item.get("user_id"),
+            created_at=item.get("created_at"),
+            updated_at=item.get("updated_at"),
+        )
+
+    def get_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[SessionInfo], Optional[str]]:
+        """
+        Get a page of session summaries, newest first, reading only the summary attributes.
+        Sessions of a user or agent are paged with the created_at sort key of the user_id or agent_id index.
+
+        Args:
+            user_id (Optional[str], optional): User ID to filter by. Defaults to None.
+            agent_id (Optional[str], optional): Agent ID to filter by. Defaults to None.
+            limit (Optional[int], optional): Maximum number of sessions to return. Returns all sessions if None.
+            cursor (Optional[str], optional): Cursor returned with the previous page.
+
+        Returns:
+            Tuple[List[SessionInfo], Optional[str]]: The sessions and the cursor of the next page, None on the last page.
+        """
+        after = decode_cursor(cursor) if cursor is not None else None
+        request: Dict[str, Any] = {
+            "ProjectionExpression": (
+                "session_id, user_id, #title, session_data.session_name, memory.runs[0].message, created_at, updated_at"
+            ),
+            "ExpressionAttributeNames": {"#title": "title"},
+        }
+        sessions: List[SessionInfo] = []
+        try:
+            if user_id is None and agent_id is None:
+                # Without a partition key the table is scanned and paged in memory
+                while True:
+                    response = self.table.scan(**request)
+                    sessions.extend(self._to_session_info(item) for item in response.get("Items", []))
+                    if "LastEvaluatedKey" not in response:
+                        break
+                    request["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+                return paginate(sessions, limit=limit, cursor=cursor)
+
+            key_name, key_value = ("user_id", user_id) if user_id is not None else ("agent_id", agent_id)
+            request.update(
+                IndexName=f"{key_name}-index",
+                KeyConditionExpression=Key(key_name).eq(key_value),
+                # Newest first
+                ScanIndexForward=False,
+            )
+            if user_id is not None and agent_id is not None:
+                request["FilterExpression"] = Attr("agent_id").eq(agent_id)
+            if limit is not None:
+                request["Limit"] = limit + 1
+            if after is not None:
+                request["ExclusiveStartKey"] = {"session_id": after[1], key_name: key_value, "created_at": after[0]}
+            while limit is None or len(sessions) <= limit:
+                response = self.table.query(**request)
+                sessions.extend(self._to_session_info(item) for item in response.get("Items", []))
+                if "LastEvaluatedKey" not in response:
+                    break
+                request["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        except Exception as e:
+            logger.error(f"Error retrieving session summaries: {e}")
+        return get_page(sessions, limit)
+
     def upsert(self, session: AgentSession) -> Optional[AgentSession]:
         """
         Create or update an AgentSession in the database.
@@ -255,6 +336,8 @@ class DynamoDbAgentStorage(AgentStorage):
             if "created_at" not in item or item["created_at"] is None:
                 item["created_at"] = current_time
             item["updated_at"] = current_time
+            # Store the title to list sessions without reading their memory
+            item["title"] = session.get_title()
 
             # Convert data to DynamoDB compatible format
             item = self._serialize_item(item)
@@ -0,0 +1,364 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows
+    fcntl = None  # type: ignore
+
+from agno.storage.agent.base import AgentStorage
+from agno.storage.agent.session import AgentSession
+from agno.storage.session_info import SessionInfo, paginate
+from agno.utils.log import logger
+
+# Name of the sidecar index file in the storage directory
+INDEX_FILE_NAME = ".index.jsonl"
+
+
+def write_atomic(path: Path, data: str) -> None:
+    """Write a file by renaming a temporary file over it, so readers never see a partially written file"""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class SessionIndex:
+    """Sidecar index of the sessions in a storage directory: user_id, agent_id, timestamps, name and title.
+
+    The index is an append-only JSON lines log, so an upsert or delete appends one line instead of rewriting the
+    index. The log is replayed into a dict in memory and compacted to one line per session once it holds more
+    than twice as many lines as sessions. Lines appended by other processes are read before each access.
+
+    Appends and compactions hold an exclusive lock on the directory of the index, so a compaction by one process
+    does not drop the lines another process is appending. File locks are not available on Windows, where only
+    one process should write to a storage directory.
+    """
+
+    def __init__(self, path: Path, min_compact_lines: int = 1000):
+        self.path: Path = path
+        self.min_compact_lines: int = min_compact_lines
+
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # Number of lines in the log and position up to which it was read
+        self._lines: int = 0
+        self._offset: int = 0
+        # The log that was read. It is kept open, so its inode is not reused by the log that replaces it.
+        self._file: Optional[IO[bytes]] = None
+        self._lock = threading.RLock()
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Returns the index entries. The entries must not be modified."""
+        with self._lock:
+            self._sync()
+            return list(self._entries.values())
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._sync()
+            return self._entries.get(session_id)
+
+    def put(self, entry: Dict[str, Any]) -> None:
+        self._append(entry)
+
+    def remove(self, session_id: str) -> None:
+        with self._lock:
+            self._sync()
+            if session_id in self._entries:
+                self._append({"session_id": session_id, "deleted": True})
+
+    def rebuild(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """Replace the index with the given entries"""
+        with self._lock, self._file_lock():
+            self._entries = {entry["session_id"]: entry for entry in entries}
+            self._write()
+
+    def clear(self) -> None:
+        with self._lock, self._file_lock():
+            self._reset()
+            self.path.unlink(missing_ok=True)
+
+    def _reset(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._entries = {}
+        self._lines = self._offset = 0
+
+    def _sync(self) -> None:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._reset()
+            return
+        if self._file is None or os.fstat(self._file.fileno()).st_ino != stat.st_ino:
+            # The log was compacted or replaced, read it from the start
+            self._reset()
+            try:
+                self._file = open(self.path, "rb")
+            except FileNotFoundError:
+                return
+        self._file.seek(self._offset)
+        data = self._file.read()
+        # Only read complete lines, a line that is being appended is read on the next sync
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            self._apply(line)
+        self._offset += end
+
+    def _apply(self, line: bytes) -> None:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            return
+        self._lines += 1
+        if entry.get("deleted"):
+            self._entries.pop(entry["session_id"], None)
+        else:
+            self._entries[entry["session_id"]] = entry
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the directory of the index, shared by all processes writing to the index"""
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(self.path.parent, os.O_RDONLY)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            # Closing the file descriptor releases the lock
+            os.close(fd)
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock, self._file_lock():
+            with open(self.path, "ab") as f:
+                f.write(line.encode("utf-8"))
+            self._sync()
+            if self._lines > max(self.min_compact_lines, 2 * len(self._entries)):
+                self._write()
+
+    def _write(self) -> None:
+        entries = self._entries
+        # Close the log before replacing it, open files cannot be replaced on Windows
+        self._reset()
+        write_atomic(
+            self.path,
+            "".join(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n" for entry in entries.values()),
+        )
+        self._sync()
+
+    def __deepcopy__(self, memo):
+        # The index holds a lock, and copies of an agent should share it
+        return self
+
+
+class FileAgentStorage(AgentStorage):
+    """Stores each AgentSession in a file named <session_id>.<extension> in a directory.
+
+    A sidecar index keeps the user_id, agent_id, timestamps, name and title of each session, so listing
+    sessions does not open the session files. Session files are written atomically by renaming a temporary file.
+    The index is repaired from the names of the session files when the storage is created.
+    """
+
+    # File extension of the session files, set by subclasses
+    extension: str = ""
+
+    def __init__(self, dir_path: Union[str, Path]):
+        self.dir_path = Path(dir_path)
+        self.dir_path.mkdir(parents=True, exist_ok=True)
+        self.index: SessionIndex = SessionIndex(self.dir_path / INDEX_FILE_NAME)
+        if not self.index.exists():
+            # Index the sessions stored before the index existed
+            if next(self.get_session_files(), None) is not None:
+                self.rebuild_index()
+        else:
+            self.repair_index()
+
+    def serialize(self, data: dict) -> str:
+        raise NotImplementedError
+
+    def deserialize(self, data: str) -> dict:
+        raise NotImplementedError
+
+    def get_session_path(self, session_id: str) -> Path:
+        return self.dir_path / f"{session_id}.{self.extension}"
+
+    def get_session_files(self) -> Iterator[Path]:
+        # Skip the index and temporary files
+        return (file for file in self.dir_path.glob(f"*.{self.extension}") if not file.name.startswith("."))
+
+    def create(self) -> None:
+        """Create the storage if it doesn't exist."""
+        if not self.dir_path.exists():
+            self.dir_path.mkdir(parents=True, exist_ok=True)
+
+    def _read_file(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return self.deserialize(f.read())
+        except FileNotFoundError:
+            return None
+
+    def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
+        """Read an AgentSession from storage."""
+        data = self._read_file(self.get_session_path(session_id))
+        if data is None or (user_id and data.get("user_id") != user_id):
+            return None
+        return AgentSession.from_dict(data)
+
+    def _get_index_entries(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Returns the index entries matching user_id and agent_id, newest first"""
+        entries = [
+            entry
+            for entry in self.index.entries()
+            if (not user_id or entry.get("user_id") == user_id) and (not agent_id or entry.get("agent_id") == agent_id)
+        ]
+        entries.sort(key=lambda entry: (entry.get("created_at") or 0, entry["session_id"]), reverse=True)
+        return entries
+
+    def get_all_session_ids(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[str]:
+        """Get all session IDs, optionally filtered by user_id and/or agent_id."""
+        return [entry["session_id"] for entry in self._get_index_entries(user_id=user_id, agent_id=agent_id)]
+
+    def get_all_sessions(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[AgentSession]:
+        """Get all sessions, optionally filtered by user_id and/or agent_id."""
+        sessions = []
+        for entry in self._get_index_entries(user_id=user_id, agent_id=agent_id):
+            data = self._read_file(self.get_session_path(entry["session_id"]))
+            if data is not None:
+                _agent_session = AgentSession.from_dict(data)
+                if _agent_session is not None:
+                    sessions.append(_agent_session)
+        return sessions
+
+    def get_session_updated_at(self, session_id: str) -> Optional[int]:
+        """Get the timestamp of the last write to a session from the index."""
+        entry = self.index.get(session_id)
+        if entry is None:
+            return None
+        return entry.get("updated_at") or entry.get("created_at")
+
+    def get_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[SessionInfo], Optional[str]]:
+        """Get a page of session summaries, newest first, from the index."""
+        return paginate(
+            [
+                SessionInfo(
+                    session_id=entry["session_id"],
+                    title=entry.get("title"),
+                    session_name=entry.get("name"),
+                    user_id=entry.get("user_id"),
+                    created_at=entry.get("created_at"),
+                    updated_at=entry.get("updated_at"),
+                )
+                for entry in self._get_index_entries(user_id=user_id, agent_id=agent_id)
+            ],
+            limit=limit,
+            cursor=cursor,
+        )
+
+    @staticmethod
+    def _get_index_entry(data: Dict[str, Any]) -> Dict[str, Any]:
+        session = AgentSession.from_dict(data)
+        session_data = data.get("session_data")
+        return {
+            "session_id": data["session_id"],
+            "user_id": data.get("user_id"),
+            "agent_id": data.get("agent_id"),
+            "created_at": data.get("created_at"),
+            "updated_at": data.get("updated_at"),
+            "name": session_data.get("session_name") if isinstance(session_data, dict) else None,
+            "title": session.get_title() if session is not None else None,
+        }
+
+    def upsert(self, session: AgentSession) -> Optional[AgentSession]:
+        """Insert or update an AgentSession in storage."""
+        try:
+            data = asdict(session)
+            data["updated_at"] = int(time.time())
+            if data.get("created_at") is None:
+                existing = self.index.get(session.session_id)
+                data["created_at"] = existing.get("created_at") if existing is not None else None
+                if data["created_at"] is None:
+                    data["created_at"] = data["updated_at"]
+
+            write_atomic(self.get_session_path(session.session_id), self.serialize(data))
+            self.index.put(self._get_index_entry(data))
+            session.created_at, session.updated_at = data["created_at"], data["updated_at"]
+            return session
+        except Exception as e:
+            logger.error(f"Error upserting session: {e}")
+            return None
+
+    def delete_session(self, session_id: Optional[str] = None):
+        """Delete a session from storage."""
+        if session_id is None:
+            return
+        try:
+            self.get_session_path(session_id).unlink(missing_ok=True)
+            self.index.remove(session_id)
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
+
+    def drop(self) -> None:
+        """Drop all sessions from storage."""
+        for file in self.get_session_files():
+            file.unlink()
+        self.index.clear()
+
+    def rebuild_index(self) -> None:
+        """Rebuild the index by reading every session file."""
+        entries = []
+        for file in self.get_session_files():
+            try:
+                data = self._read_file(file)
+                if data is not None and data.get("session_id") is not None:
+                    entries.append(self._get_index_entry(data))
+            except Exception as e:
+                logger.warning(f"Could not index session file {file}: {e}")
+        self.index.rebuild(entries)
+        logger.debug(f"Indexed {len(entries)} sessions in {self.dir_path}")
+
+    def repair_index(self) -> None:
+        """Index session files missing from the index and remove entries of missing files.
+
+        A process that stops between writing or deleting a session file and updating the index leaves them out of
+        sync. Only the names of the session files are listed, files are read only if they are missing from the index.
+        """
+        session_files = {file.name[: -len(self.extension) - 1]: file for file in self.get_session_files()}
+        indexed_session_ids = {entry["session_id"] for entry in self.index.entries()}
+        for session_id in indexed_session_ids - session_files.keys():
+            self.index.remove(session_id)
+        for session_id in session_files.keys() - indexed_session_ids:
+            try:
+                data = self._read_file(session_files[session_id])
+                if data is not None and data.get("session_id") is not None:
+                    self.index.put(self._get_index_entry(data))
+            except Exception as e:
+                logger.warning(f"Could not index session file {session_files[session_id]}: {e}")
+
+    def upgrade_schema(self) -> None:
+        """Upgrade the schema of the storage by rebuilding the index."""
+        self.rebuild_index()
@@ -0,0 +1,155 @@
+"""Helpers to store AgentMemory as append-only run and message rows (schema version 2).
+
+In schema version 1 the whole AgentMemory is stored as one JSON blob. In schema version 2 the session row keeps
+the memory without its runs and messages, each run is stored as a row keyed by (session_id, run_index) and each
+distinct message is stored once per session, keyed by its hash. Runs and the memory reference messages by hash.
+"""
+
+import json
+from dataclasses import dataclass, field
+from hashlib import md5
+from typing import Any, Callable, Dict, List, Optional
+
+# Key in the session memory holding the hashes of the memory messages
+MESSAGE_HASHES_KEY = "message_hashes"
+# Keys of the message lists in the extra_data of a run response. The history replays earlier messages of the session.
+EXTRA_DATA_MESSAGE_KEYS = ("add_messages", "history", "reasoning_messages")
+
+
+@dataclass
+class NormalizedMemory:
+    """AgentMemory split into rows"""
+
+    # The memory without runs and messages, stored in the session row
+    memory: Optional[Dict[str, Any]] = None
+    # The runs with their messages replaced by message hashes
+    runs: List[Dict[str, Any]] = field(default_factory=list)
+    # The hash of each run, used to only rewrite runs that changed
+    run_hashes: List[str] = field(default_factory=list)
+    # Distinct messages by hash. Messages of runs reused from the previous write are not included.
+    messages: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # The memory that was normalized, compared with the next write to skip runs and messages that did not change
+    source: Optional[Dict[str, Any]] = None
+    # The hashes of the memory messages
+    message_hashes: List[str] = field(default_factory=list)
+    # Number of leading runs reused from the previous write
+    num_reused_runs: int = 0
+
+
+def get_hash(data: Any) -> str:
+    return md5(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def is_legacy_memory(memory: Optional[Dict[str, Any]]) -> bool:
+    """Returns True if the memory is a schema version 1 blob with runs and messages inline"""
+    if memory is None or MESSAGE_HASHES_KEY in memory:
+        return False
+    return "runs" in memory or "messages" in memory
+
+
+def _map_run_messages(run: Dict[str, Any], map_messages: Callable[[List[Any]], List[Any]]) -> Dict[str, Any]:
+    """Returns a copy of the run with map_messages applied to each of its message lists"""
+    run = dict(run)
+    if run.get("message") is not None:
+        run["message"] = (map_messages([run["message"]]) or [None])[0]
+    if run.get("messages") is not None:
+        run["messages"] = map_messages(run["messages"])
+    response = run.get("response")
+    if isinstance(response, dict):
+        response = dict(response)
+        if response.get("messages") is not None:
+            response["messages"] = map_messages(response["messages"])
+        extra_data = response.get("extra_data")
+        if isinstance(extra_data, dict):
+            extra_data = dict(extra_data)
+            for key in EXTRA_DATA_MESSAGE_KEYS:
+                if extra_data.get(key) is not None:
+                    extra_data[key] = map_messages(extra_data[key])
+            response["extra_data"] = extra_data
+        run["response"] = response
+    return run
+
+
+def _count_equal_prefix(items: List[Any], previous_items: List[Any]) -> int:
+    """Returns the number of leading items that are equal to the previous items"""
+    num_equal = 0
+    for item, previous_item in zip(items, previous_items):
+        if item != previous_item:
+            break
+        num_equal += 1
+    return num_equal
+
+
+def normalize_memory(
+    memory: Optional[Dict[str, Any]], previous: Optional[NormalizedMemory] = None
+) -> NormalizedMemory:
+    """Split a memory dictionary (AgentMemory.to_dict()) into the session memory, runs and messages.
+
+    Runs are appended to a session, so with the previous write of the session only the runs and memory messages
+    after those that are equal to the previous write are hashed. Comparing dictionaries is much cheaper than hashing.
+    """
+    if memory is None:
+        return NormalizedMemory()
+
+    messages: Dict[str, Dict[str, Any]] = {}
+
+    def add_messages(_messages: List[Dict[str, Any]]) -> List[str]:
+        message_hashes = []
+        for message in _messages:
+            message_hash = get_hash(message)
+            messages[message_hash] = message
+            message_hashes.append(message_hash)
+        return message_hashes
+
+    source_runs: List[Dict[str, Any]] = memory.get("runs") or []
+    source_messages: List[Dict[str, Any]] = memory.get("messages") or []
+    num_reused_runs = num_reused_messages = 0
+    if previous is not None and previous.source is not None:
+        num_reused_runs = _count_equal_prefix(source_runs, previous.source.get("runs") or [])
+        num_reused_messages = _count_equal_prefix(source_messages, previous.source.get("messages") or [])
+
+    message_hashes = previous.message_hashes[:num_reused_messages] if previous is not None else []
+    message_hashes += add_messages(source_messages[num_reused_messages:])
+    session_memory = {k: v for k, v in memory.items() if k not in ("runs", "messages")}
+    session_memory[MESSAGE_HASHES_KEY] = message_hashes
+
+    runs = previous.runs[:num_reused_runs] if previous is not None else []
+    run_hashes = previous.run_hashes[:num_reused_runs] if previous is not None else []
+    for run in source_runs[num_reused_runs:]:
+        normalized_run = _map_run_messages(run, add_messages)
+        runs.append(normalized_run)
+        run_hashes.append(get_hash(normalized_run))
+
+    return NormalizedMemory(
+        memory=session_memory,
+        runs=runs,
+        run_hashes=run_hashes,
+        messages=messages,
+        # Copy the lists, so runs appended to the memory after this write are not mistaken for written runs
+        source={"runs": list(source_runs), "messages": list(source_messages)},
+        message_hashes=message_hashes,
+        num_reused_runs=num_reused_runs,
+    )
+
+
+def denormalize_memory(
+    memory: Optional[Dict[str, Any]], runs: List[Dict[str, Any]], messages: Dict[str, Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Rebuild the memory dictionary from the session memory, run rows and message rows.
+
+    A message replayed in the history of many runs is one dictionary referenced from each run, not a copy per run.
+    """
+    if memory is None or MESSAGE_HASHES_KEY not in memory:
+        # Memory written with schema version 1 already holds its runs and messages
+        return memory
+
+    def get_messages(message_hashes: List[Any]) -> List[Dict[str, Any]]:
+        # Runs written before their history was normalized hold those messages inline
+        return [
+            messages[h] if isinstance(h, str) else h for h in message_hashes if not isinstance(h, str) or h in messages
+        ]
+
+    memory = dict(memory)
+    memory["messages"] = get_messages(memory.pop(MESSAGE_HASHES_KEY))
+    memory["runs"] = [_map_run_messages(run, get_messages) for run in runs]
+    return memory
@@ -1,19 +1,32 @@
+import asyncio
 import time
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 try:
     from sqlalchemy.dialects import postgresql
-    from sqlalchemy.engine import Engine, create_engine
+    from sqlalchemy.engine import Engine, create_engine, make_url
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import scoped_session, sessionmaker
     from sqlalchemy.schema import Column, Index, MetaData, Table
-    from sqlalchemy.sql.expression import select, text
-    from sqlalchemy.types import BigInteger, String
+    from sqlalchemy.sql.expression import and_, func, or_, select, text, update
+    from sqlalchemy.types import BigInteger, Integer, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
 from agno.storage.agent.base import AgentStorage
+from agno.storage.agent.normalize import (
+    MESSAGE_HASHES_KEY,
+    NormalizedMemory,
+    denormalize_memory,
+    is_legacy_memory,
+    normalize_memory,
+)
 from agno.storage.agent.session import AgentSession
+from agno.storage.session_info import SessionInfo, decode_cursor, get_page
+from agno.utils.cache import TTLCache
 from agno.utils.log import logger
 
 
@@ -26,6 +39,7 @@ class PostgresAgentStorage(AgentStorage):
         db_engine: Optional[Engine] = None,
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
+        async_db_engine: Optional["AsyncEngine"] = None,
     ):
         """
         This class provides agent storage using a PostgreSQL table.
@@ -41,7 +55,10 @@ class PostgresAgentStorage(AgentStorage):
             db_url (Optional[str]): The database URL to connect to.
             db_engine (Optional[Engine]): The SQLAlchemy database engine to use.
             schema_version (int): Version of the schema. Defaults to 1.
-            auto_upgrade_schema (bool): Whether to automatically upgrade the schema.
+                Version 2 stores runs and messages as separate rows.
+            auto_upgrade_schema (bool): Whether to migrate sessions stored with an older schema version on init.
+            async_db_engine (Optional[AsyncEngine]): The SQLAlchemy async engine used by the async methods.
+                Created from db_url (or the db_engine URL) if not provided.
 
         Raises:
             ValueError: If neither db_url nor db_engine is provided.
@@ -68,10 +85,64 @@ class PostgresAgentStorage(AgentStorage):
 
         # Database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+        # Async database engine and session, created lazily
+        self._async_db_engine: Optional["AsyncEngine"] = async_db_engine
+        self._async_session: Optional["async_sessionmaker[AsyncSession]"] = None
         # Database table for storage
         self.table: Table = self.get_table()
+        # Database tables for runs and messages (schema version 2)
+        self.runs_table: Optional[Table] = None
+        self.messages_table: Optional[Table] = None
+        if self.schema_version >= 2:
+            self.runs_table = self.get_runs_table()
+            self.messages_table = self.get_messages_table()
+        # The last write of recently written sessions, so the next write only hashes the runs added since
+        self._written_memory: TTLCache = TTLCache(max_size=128)
+
+        if self.schema_version >= 2 and self.inspector.has_table(self.table.name, schema=self.schema):
+            # Add the title column to tables created with schema version 1, so they can be read before migrating
+            self._create_missing_columns_and_indexes()
+        if self.auto_upgrade_schema:
+            self.upgrade_schema()
         logger.debug(f"Created PostgresAgentStorage: '{self.schema}.{self.table_name}'")
 
+    @property
+    def async_db_engine(self) -> "AsyncEngine":
+        """
+        Get the async database engine, creating it from the sync engine's URL if needed.
+
+        Returns:
+            AsyncEngine: SQLAlchemy async database engine.
+        """
+        if self._async_db_engine is None:
+            try:
+                from sqlalchemy.ext.asyncio import create_async_engine
+            except ImportError:
+                raise ImportError(
+                    "`sqlalchemy[asyncio]` not installed. Please install using `pip install 'sqlalchemy[asyncio]'`"
+                )
+
+            url = make_url(self.db_url) if self.db_url is not None else self.db_engine.url
+            # psycopg2 has no async support, psycopg (v3) and asyncpg do
+            if url.drivername in ("postgresql", "postgresql+psycopg2"):
+                url = url.set(drivername="postgresql+psycopg")
+            self._async_db_engine = create_async_engine(url)
+        return self._async_db_engine
+
+    @property
+    def AsyncSession(self) -> "async_sessionmaker[AsyncSession]":
+        """
+        Get the async session factory bound to the async database engine.
+
+        Returns:
+            async_sessionmaker[AsyncSession]: Factory for async database sessions.
+        """
+        if self._async_session is None:
+            from sqlalchemy.ext.asyncio import async_sessionmaker
+
+            self._async_session = async_sessionmaker(bind=self.async_db_engine)
+        return self._async_session
+
     def get_table_v1(self) -> Table:
         """
         Define the table schema for version 1.
@@ -107,9 +178,109 @@ class PostgresAgentStorage(AgentStorage):
         Index(f"idx_{self.table_name}_session_id", table.c.session_id)
         Index(f"idx_{self.table_name}_agent_id", table.c.agent_id)
         Index(f"idx_{self.table_name}_user_id", table.c.user_id)
+        # Add indexes used to list sessions
+        Index(f"idx_{self.table_name}_user_id_created_at", table.c.user_id, table.c.created_at)
+        Index(f"idx_{self.table_name}_agent_id_created_at", table.c.agent_id, table.c.created_at)
 
         return table
 
+    def get_table_v2(self) -> Table:
+        """
+        Define the table schema for version 2.
+        The memory column no longer holds runs and messages, and the session title is stored to list sessions.
+
+        Returns:
+            Table: SQLAlchemy Table object representing the schema.
+        """
+        table = Table(
+            self.table_name,
+            self.metadata,
+            # Session UUID: Primary Key
+            Column("session_id", String, primary_key=True),
+            # ID of the agent that this session is associated with
+            Column("agent_id", String),
+            # ID of the user interacting with this agent
+            Column("user_id", String),
+            # Session name, or the first user message if the session is not named
+            Column("title", String),
+            # Agent Memory
+            Column("memory", postgresql.JSONB),
+            # Agent Data
+            Column("agent_data", postgresql.JSONB),
+            # Session Data
+            Column("session_data", postgresql.JSONB),
+            # Extra Data stored with this agent
+            Column("extra_data", postgresql.JSONB),
+            # The Unix timestamp of when this session was created.
+            Column("created_at", BigInteger, server_default=text("(extract(epoch from now()))::bigint")),
+            # The Unix timestamp of when this session was last updated.
+            Column("updated_at", BigInteger, server_onupdate=text("(extract(epoch from now()))::bigint")),
+            extend_existing=True,
+        )
+
+        # Add indexes
+        Index(f"idx_{self.table_name}_session_id", table.c.session_id)
+        Index(f"idx_{self.table_name}_agent_id", table.c.agent_id)
+        Index(f"idx_{self.table_name}_user_id", table.c.user_id)
+        # Add indexes used to list sessions
+        Index(f"idx_{self.table_name}_user_id_created_at", table.c.user_id, table.c.created_at)
+        Index(f"idx_{self.table_name}_agent_id_created_at", table.c.agent_id, table.c.created_at)
+
+        return table
+
+    def get_runs_table(self) -> Table:
+        """
+        Define the table storing one row per run (schema version 2).
+
+        Returns:
+            Table: SQLAlchemy Table object for the runs.
+        """
+        table = Table(
+            f"{self.table_name}_runs",
+            self.metadata,
+            # Session UUID
+            Column("session_id", String, primary_key=True),
+            # Position of the run in the session
+            Column("run_index", Integer, primary_key=True, autoincrement=False),
+            # Run UUID
+            Column("run_id", String),
+            # Hash of the run, used to skip writing runs that did not change
+            Column("run_hash", String),
+            # The run, with messages replaced by their hashes
+            Column("run", postgresql.JSONB),
+            # The Unix timestamp of when this run was created.
+            Column("created_at", BigInteger, server_default=text("(extract(epoch from now()))::bigint")),
+            # The Unix timestamp of when this run was last updated.
+            Column("updated_at", BigInteger, server_onupdate=text("(extract(epoch from now()))::bigint")),
+            extend_existing=True,
+        )
+
+        # Add indexes
+        Index(f"idx_{self.table_name}_runs_run_id", table.c.run_id)
+
+        return table
+
+    def get_messages_table(self) -> Table:
+        """
+        Define the table storing each distinct message of a session once (schema version 2).
+
+        Returns:
+            Table: SQLAlchemy Table object for the messages.
+        """
+        return Table(
+            f"{self.table_name}_messages",
+            self.metadata,
+            # Session UUID
+            Column("session_id", String, primary_key=True),
+            # Hash of the message
+            Column("message_hash", String, primary_key=True),
+            # The message
+            Column("message", postgresql.JSONB),
+            # The Unix timestamp of when this message was created.
+            Column("created_at", BigInteger, server_default=text("(extract(epoch from now()))::bigint")),
+            extend_existing=True,
+        )
+
     def get_table(self) -> Table:
         """
         Get the table schema based on the schema version.
@@ -122,6 +293,8 @@ class PostgresAgentStorage(AgentStorage):
         """
         if self.schema_version == 1:
             return self.get_table_v1()
+        elif self.schema_version == 2:
+            return self.get_table_v2()
         else:
             raise ValueError(f"Unsupported schema version: {self.schema_version}")
 
@@ -134,6 +307,11 @@ class PostgresAgentStorage(AgentStorage):
         """
         logger.debug(f"Checking if table exists: {self.table.name}")
         try:
+            if self.runs_table is not None and self.messages_table is not None:
+                return all(
+                    self.inspector.has_table(table.name, schema=self.schema)
+                    for table in (self.table, self.runs_table, self.messages_table)
+                )
             return self.inspector.has_table(self.table.name, schema=self.schema)
         except Exception as e:
             logger.error(f"Error checking if table exists: {e}")
@@ -151,9 +329,138 @@ class PostgresAgentStorage(AgentStorage):
                         sess.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.schema};"))
                 logger.debug(f"Creating table: {self.table_name}")
                 self.table.create(self.db_engine, checkfirst=True)
+                if self.runs_table is not None and self.messages_table is not None:
+                    self.runs_table.create(self.db_engine, checkfirst=True)
+                    self.messages_table.create(self.db_engine, checkfirst=True)
             except Exception as e:
                 logger.error(f"Could not create table: '{self.table.fullname}': {e}")
 
+    def _read_memory_rows(self, sess, session_ids: List[str]) -> Dict[str, Tuple[List[Dict], Dict[str, Dict]]]:
+        """
+        Read the runs and messages of the given sessions.
+
+        Args:
+            sess: The database session.
+            session_ids (List[str]): IDs of the sessions to read.
+
+        Returns:
+            Dict[str, Tuple[List[Dict], Dict[str, Dict]]]: The runs and messages by hash for each session.
+        """
+        if self.runs_table is None or self.messages_table is None or len(session_ids) == 0:
+            return {}
+
+        memory_rows: Dict[str, Tuple[List[Dict], Dict[str, Dict]]] = {
+            session_id: ([], {}) for session_id in session_ids
+        }
+        run_rows = sess.execute(
+            select(self.runs_table.c.session_id, self.runs_table.c.run)
+            .where(self.runs_table.c.session_id.in_(session_ids))
+            .order_by(self.runs_table.c.session_id, self.runs_table.c.run_index)
+        ).fetchall()
+        for row in run_rows:
+            memory_rows[row.session_id][0].append(row.run)
+        message_rows = sess.execute(
+            select(
+                self.messages_table.c.session_id, self.messages_table.c.message_hash, self.messages_table.c.message
+            ).where(self.messages_table.c.session_id.in_(session_ids))
+        ).fetchall()
+        for row in message_rows:
+            memory_rows[row.session_id][1][row.message_hash] = row.message
+        return memory_rows
+
+    def _to_sessions(self, sess, rows) -> List[AgentSession]:
+        """Convert session rows to AgentSessions, rebuilding the memory from the run and message rows"""
+        sessions = [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
+        _sessions: List[AgentSession] = [session for session in sessions if session is not None]
+        if self.schema_version >= 2:
+            # Sessions that have not been migrated from schema version 1 keep their runs and messages inline
+            normalized_sessions = [s for s in _sessions if s.memory is not None and MESSAGE_HASHES_KEY in s.memory]
+            memory_rows = self._read_memory_rows(sess, [s.session_id for s in normalized_sessions])
+            for session in normalized_sessions:
+                runs, messages = memory_rows.get(session.session_id, ([], {}))
+                session.memory = denormalize_memory(session.memory, runs, messages)
+        return _sessions
+
+    def _read_run_hashes(self, sess, session_id: str, first_index: int) -> Dict[int, str]:
+        """Read the hashes of the runs of a session from the given run index on"""
+        if self.runs_table is None:
+            return {}
+        return {
+            row.run_index: row.run_hash
+            for row in sess.execute(
+                select(self.runs_table.c.run_index, self.runs_table.c.run_hash).where(
+                    self.runs_table.c.session_id == session_id, self.runs_table.c.run_index >= first_index
+                )
+            ).fetchall()
+        }
+
+    def _count_runs(self, sess, session_id: str, before_index: int) -> int:
+        """Count the runs of a session before the given run index"""
+        if self.runs_table is None or before_index == 0:
+            return 0
+        return sess.execute(
+            select(func.count()).where(
+                self.runs_table.c.session_id == session_id, self.runs_table.c.run_index < before_index
+            )
+        ).scalar_one()
+
+    def _write_memory_rows(self, sess, session_id: str, normalized: NormalizedMemory) -> NormalizedMemory:
+        """
+        Write the runs that changed and the messages that are not stored yet.
+
+        Args:
+            sess: The database session.
+            session_id (str): ID of the session.
+            normalized (NormalizedMemory): The memory split into rows.
+
+        Returns:
+            NormalizedMemory: The memory that was written.
+        """
+        if self.runs_table is None or self.messages_table is None:
+            return normalized
+
+        # Runs are appended to a session, so only the hashes from the last reused run on are read. The last reused run
+        # and the number of runs before it tell whether another writer changed the session since the previous write.
+        first_index = max(normalized.num_reused_runs - 1, 0)
+        stored_run_hashes = self._read_run_hashes(sess, session_id, first_index)
+        if normalized.num_reused_runs > 0 and (
+            stored_run_hashes.get(first_index) != normalized.run_hashes[first_index]
+            or self._count_runs(sess, session_id, first_index) != first_index
+        ):
+            # The session was changed by another writer since the previous write, so normalize all runs and messages
+            normalized = normalize_memory(normalized.source)
+            first_index = 0
+            stored_run_hashes = self._read_run_hashes(sess, session_id, first_index)
+        for run_index in range(first_index, len(normalized.runs)):
+            run, run_hash = normalized.runs[run_index], normalized.run_hashes[run_index]
+            if stored_run_hashes.get(run_index) == run_hash:
+                continue
+            run_id = run.get("response", {}).get("run_id") if isinstance(run.get("response"), dict) else None
+            stmt = postgresql.insert(self.runs_table).values(
+                session_id=session_id, run_index=run_index, run_id=run_id, run_hash=run_hash, run=run
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id", "run_index"],
+                set_=dict(run_id=run_id, run_hash=run_hash, run=run, updated_at=int(time.time())),
+            )
+            sess.execute(stmt)
+        # Remove runs that are no longer in memory
+        if any(run_index >= len(normalized.runs) for run_index in stored_run_hashes):
+            sess.execute(
+                self.runs_table.delete().where(
+                    self.runs_table.c.session_id == session_id, self.runs_table.c.run_index >= len(normalized.runs)
+                )
+            )
+
+        # Only the messages of the runs that were not reused are normalized, stored messages are skipped on conflict
+        new_messages = [
+            {"session_id": session_id, "message_hash": message_hash, "message": message}
+            for message_hash, message in normalized.messages.items()
+        ]
+        if new_messages:
+            sess.execute(postgresql.insert(self.messages_table).on_conflict_do_nothing(), new_messages)
+        return normalized
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
         """
         Read an AgentSession from the database.
@@ -171,7 +478,10 @@ class PostgresAgentStorage(AgentStorage):
                 if user_id:
                     stmt = stmt.where(self.table.c.user_id == user_id)
                 result = sess.execute(stmt).fetchone()
-                return AgentSession.from_dict(result._mapping) if result is not None else None
+                if result is None:
+                    return None
+                sessions = self._to_sessions(sess, [result])
+                return sessions[0] if sessions else None
         except Exception as e:
             logger.debug(f"Exception reading from table: {e}")
             logger.debug(f"Table does not exist: {self.table.name}")
@@ -233,7 +543,7 @@ class PostgresAgentStorage(AgentStorage):
                 stmt = stmt.order_by(self.table.c.created_at.desc())
                 # execute query
                 rows = sess.execute(stmt).fetchall()
-                return [AgentSession.from_dict(row._mapping) for row in rows] if rows is not None else []  # type: ignore
+                return self._to_sessions(sess, rows) if rows is not None else []
         except Exception as e:
             logger.debug(f"Exception reading from table: {e}")
             logger.debug(f"Table does not exist: {self.table.name}")
@@ -241,6 +551,137 @@ class PostgresAgentStorage(AgentStorage):
             self.create()
         return []
 
+    def _get_summaries_stmt(
+        self, user_id: Optional[str], agent_id: Optional[str], limit: Optional[int], cursor: Optional[str]
+    ):
+        """
+        Build the statement that selects a page of session summaries, newest first.
+        Schema version 1 does not store the title, the first user message is read from the JSON to build the title.
+        """
+        title = (
+            self.table.c.title.label("title")
+            if "title" in self.table.c
+            else self.table.c.memory[("runs", 0, "message")].label("first_message")
+        )
+        stmt = select(
+            self.table.c.session_id,
+            title,
+            self.table.c.session_data["session_name"].astext.label("session_name"),
+            self.table.c.user_id,
+            self.table.c.created_at,
+            self.table.c.updated_at,
+        )
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if agent_id is not None:
+            stmt = stmt.where(self.table.c.agent_id == agent_id)
+        if cursor is not None:
+            # Keyset pagination: continue after the last session of the previous page
+            created_at, session_id = decode_cursor(cursor)
+            stmt = stmt.where(
+                or_(
+                    self.table.c.created_at < created_at,
+                    and_(self.table.c.created_at == created_at, self.table.c.session_id < session_id),
+                )
+            )
+        stmt = stmt.order_by(self.table.c.created_at.desc(), self.table.c.session_id.desc())
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        return stmt
+
+    @staticmethod
+    def _to_session_info(row) -> SessionInfo:
+        data = dict(row._mapping)
+        if "first_message" in data:
+            # The title of a message with a list of content parts is built like AgentSession.get_title()
+            first_message = data.pop("first_message")
+            data["title"] = AgentSession(
+                session_id=data["session_id"],
+                session_data={"session_name": data["session_name"]},
+                memory={"runs": [{"message": first_message}]},
+            ).get_title()
+        return SessionInfo(**data)
+
+    def get_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[SessionInfo], Optional[str]]:
+        """
+        Get a page of session summaries, newest first, without reading the session memory.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            agent_id (Optional[str]): The ID of the agent to filter by.
+            limit (Optional[int]): Maximum number of sessions to return. Returns all sessions if None.
+            cursor (Optional[str]): Cursor returned with the previous page.
+
+        Returns:
+            Tuple[List[SessionInfo], Optional[str]]: The sessions and the cursor of the next page, None on the last page.
+        """
+        stmt = self._get_summaries_stmt(user_id, agent_id, limit, cursor)
+        try:
+            with self.Session() as sess:
+                rows = sess.execute(stmt).fetchall()
+                return get_page([self._to_session_info(row) for row in rows], limit)
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            self.create()
+        return [], None
+
+    def get_session_updated_at(self, session_id: str) -> Optional[int]:
+        """
+        Get the timestamp of the last write to a session, without reading the session.
+
+        Args:
+            session_id (str): ID of the session.
+
+        Returns:
+            Optional[int]: updated_at, or created_at if the session was never updated. None if not found.
+        """
+        try:
+            with self.Session() as sess:
+                stmt = select(func.coalesce(self.table.c.updated_at, self.table.c.created_at)).where(
+                    self.table.c.session_id == session_id
+                )
+                return sess.execute(stmt).scalar()
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+        return None
+
+    def _get_upsert_stmt(self, session: AgentSession, memory: Optional[Dict[str, Any]]):
+        """
+        Build the statement that inserts the session row, or updates it if the session_id already exists.
+
+        Args:
+            session (AgentSession): The session to upsert.
+            memory (Optional[Dict[str, Any]]): The memory to store in the session row.
+        """
+        values = dict(
+            agent_id=session.agent_id,
+            user_id=session.user_id,
+            memory=memory,
+            agent_data=session.agent_data,
+            session_data=session.session_data,
+            extra_data=session.extra_data,
+        )
+        if "title" in self.table.c:
+            values["title"] = session.get_title()
+
+        # Create an insert statement
+        stmt = postgresql.insert(self.table).values(session_id=session.session_id, **values)
+
+        # Define the upsert if the session_id already exists
+        # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+        return stmt.on_conflict_do_update(
+            index_elements=["session_id"],
+            set_=dict(**values, updated_at=int(time.time())),  # The updated value for each column
+        )
+
     def upsert(self, session: AgentSession, create_and_retry: bool = True) -> Optional[AgentSession]:
         """
         Insert or update an AgentSession in the database.
@@ -252,35 +693,26 @@ class PostgresAgentStorage(AgentStorage):
         Returns:
             Optional[AgentSession]: The upserted AgentSession, or None if operation failed.
         """
+        normalized: Optional[NormalizedMemory] = None
+        memory = session.memory
+        if self.schema_version >= 2:
+            normalized = normalize_memory(session.memory, self._written_memory.get(session.session_id))
+            memory = normalized.memory
+
+        timestamps = None
+        written: Optional[NormalizedMemory] = None
         try:
             with self.Session() as sess, sess.begin():
-                # Create an insert statement
-                stmt = postgresql.insert(self.table).values(
-                    session_id=session.session_id,
-                    agent_id=session.agent_id,
-                    user_id=session.user_id,
-                    memory=session.memory,
-                    agent_data=session.agent_data,
-                    session_data=session.session_data,
-                    extra_data=session.extra_data,
-                )
+                sess.execute(self._get_upsert_stmt(session, memory))
 
-                # Define the upsert if the session_id already exists
-                # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["session_id"],
-                    set_=dict(
-                        agent_id=session.agent_id,
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        agent_data=session.agent_data,
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                        updated_at=int(time.time()),
-                    ),  # The updated value for each column
-                )
-
-                sess.execute(stmt)
+                if normalized is not None:
+                    written = self._write_memory_rows(sess, session.session_id, normalized)
+                # Only the timestamps are read back, the session that was written is not read again
+                timestamps = sess.execute(
+                    select(self.table.c.created_at, self.table.c.updated_at).where(
+                        self.table.c.session_id == session.session_id
+                    )
+                ).fetchone()
         except Exception as e:
             logger.debug(f"Exception upserting into table: {e}")
             if create_and_retry and not self.table_exists():
@@ -289,7 +721,11 @@ class PostgresAgentStorage(AgentStorage):
                 self.create()
                 return self.upsert(session, create_and_retry=False)
             return None
-        return self.read(session_id=session.session_id)
+        if written is not None:
+            self._written_memory.set(session.session_id, written)
+        if timestamps is not None:
+            session.created_at, session.updated_at = timestamps.created_at, timestamps.updated_at
+        return session
 
     def delete_session(self, session_id: Optional[str] = None):
         """
@@ -310,6 +746,200 @@ class PostgresAgentStorage(AgentStorage):
                 # Delete the session with the given session_id
                 delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if self.runs_table is not None and self.messages_table is not None:
+                    self._written_memory.delete(session_id)
+                    sess.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))
+                    sess.execute(self.messages_table.delete().where(self.messages_table.c.session_id == session_id))
+                if result.rowcount == 0:
+                    logger.debug(f"No session found with session_id: {session_id}")
+                else:
+                    logger.debug(f"Successfully deleted session with session_id: {session_id}")
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
+        """
+        Async version of read(), using the async database engine.
+
+        Args:
+            session_id (str): ID of the session to read.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+
+        Returns:
+            Optional[AgentSession]: AgentSession object if found, None otherwise.
+        """
+        try:
+            async with self.AsyncSession() as sess:
+                stmt = select(self.table).where(self.table.c.session_id == session_id)
+                if user_id:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                result = (await sess.execute(stmt)).fetchone()
+                if result is None:
+                    return None
+                sessions = await sess.run_sync(self._to_sessions, [result])
+                return sessions[0] if sessions else None
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await asyncio.to_thread(self.create)
+        return None
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[str]:
+        """
+        Async version of get_all_session_ids(), using the async database engine.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            agent_id (Optional[str]): The ID of the agent to filter by.
+
+        Returns:
+            List[str]: List of session IDs matching the criteria.
+        """
+        try:
+            async with self.AsyncSession() as sess:
+                stmt = select(self.table.c.session_id)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                if agent_id is not None:
+                    stmt = stmt.where(self.table.c.agent_id == agent_id)
+                stmt = stmt.order_by(self.table.c.created_at.desc())
+                rows = (await sess.execute(stmt)).fetchall()
+                return [row[0] for row in rows] if rows is not None else []
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await asyncio.to_thread(self.create)
+        return []
+
+    async def aget_all_sessions(
+        self, user_id: Optional[str] = None, agent_id: Optional[str] = None
+    ) -> List[AgentSession]:
+        """
+        Async version of get_all_sessions(), using the async database engine.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            agent_id (Optional[str]): The ID of the agent to filter by.
+
+        Returns:
+            List[AgentSession]: List of AgentSession objects matching the criteria.
+        """
+        try:
+            async with self.AsyncSession() as sess:
+                stmt = select(self.table)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                if agent_id is not None:
+                    stmt = stmt.where(self.table.c.agent_id == agent_id)
+                stmt = stmt.order_by(self.table.c.created_at.desc())
+                rows = (await sess.execute(stmt)).fetchall()
+                return await sess.run_sync(self._to_sessions, rows) if rows is not None else []
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await asyncio.to_thread(self.create)
+        return []
+
+    async def aget_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[SessionInfo], Optional[str]]:
+        """
+        Async version of get_session_summaries(), using the async database engine.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            agent_id (Optional[str]): The ID of the agent to filter by.
+            limit (Optional[int]): Maximum number of sessions to return. Returns all sessions if None.
+            cursor (Optional[str]): Cursor returned with the previous page.
+
+        Returns:
+            Tuple[List[SessionInfo], Optional[str]]: The sessions and the cursor of the next page, None on the last page.
+        """
+        stmt = self._get_summaries_stmt(user_id, agent_id, limit, cursor)
+        try:
+            async with self.AsyncSession() as sess:
+                rows = (await sess.execute(stmt)).fetchall()
+                return get_page([self._to_session_info(row) for row in rows], limit)
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await asyncio.to_thread(self.create)
+        return [], None
+
+    async def aupsert(self, session: AgentSession, create_and_retry: bool = True) -> Optional[AgentSession]:
+        """
+        Async version of upsert(), using the async database engine.
+
+        Args:
+            session (AgentSession): The session data to upsert.
+            create_and_retry (bool): Retry upsert if table does not exist.
+
+        Returns:
+            Optional[AgentSession]: The upserted AgentSession, or None if operation failed.
+        """
+        normalized: Optional[NormalizedMemory] = None
+        memory = session.memory
+        if self.schema_version >= 2:
+            normalized = normalize_memory(session.memory, self._written_memory.get(session.session_id))
+            memory = normalized.memory
+
+        timestamps = None
+        written: Optional[NormalizedMemory] = None
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                await sess.execute(self._get_upsert_stmt(session, memory))
+
+                if normalized is not None:
+                    written = await sess.run_sync(self._write_memory_rows, session.session_id, normalized)
+                timestamps = (
+                    await sess.execute(
+                        select(self.table.c.created_at, self.table.c.updated_at).where(
+                            self.table.c.session_id == session.session_id
+                        )
+                    )
+                ).fetchone()
+        except Exception as e:
+            logger.debug(f"Exception upserting into table: {e}")
+            if create_and_retry and not await asyncio.to_thread(self.table_exists):
+                logger.debug(f"Table does not exist: {self.table.name}")
+                logger.debug("Creating table and retrying upsert")
+                await asyncio.to_thread(self.create)
+                return await self.aupsert(session, create_and_retry=False)
+            return None
+        if written is not None:
+            self._written_memory.set(session.session_id, written)
+        if timestamps is not None:
+            session.created_at, session.updated_at = timestamps.created_at, timestamps.updated_at
+        return session
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        """
+        Async version of delete_session(), using the async database engine.
+
+        Args:
+            session_id (Optional[str], optional): ID of the session to delete. Defaults to None.
+        """
+        if session_id is None:
+            logger.warning("No session_id provided for deletion.")
+            return
+
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                result = await sess.execute(self.table.delete().where(self.table.c.session_id == session_id))
+                if self.runs_table is not None and self.messages_table is not None:
+                    self._written_memory.delete(session_id)
+                    await sess.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))
+                    await sess.execute(
+                        self.messages_table.delete().where(self.messages_table.c.session_id == session_id)
+                    )
                 if result.rowcount == 0:
                     logger.debug(f"No session found with session_id: {session_id}")
                 else:
@@ -324,13 +954,69 @@ class PostgresAgentStorage(AgentStorage):
         if self.table_exists():
             logger.debug(f"Deleting table: {self.table_name}")
             self.table.drop(self.db_engine)
+        self._written_memory.clear()
+        if self.runs_table is not None and self.messages_table is not None:
+            self.runs_table.drop(self.db_engine, checkfirst=True)
+            self.messages_table.drop(self.db_engine, checkfirst=True)
 
     def upgrade_schema(self) -> None:
         """
-        Upgrade the schema to the latest version.
-        This method is currently a placeholder and does not perform any actions.
+        Upgrade the stored sessions to the current schema version.
+
+        Indexes missing from tables created by an older version are added.
+        For schema version 2, the title column is added and filled, and sessions whose memory was stored as
+        a single JSON blob (schema version 1) are split into run and message rows.
         """
-        pass
+        self.create()
+        self._create_missing_columns_and_indexes()
+        if self.schema_version < 2:
+            return
+
+        migrated = 0
+        for session_id in self.get_all_session_ids():
+            try:
+                with self.Session() as sess, sess.begin():
+                    row = sess.execute(select(self.table).where(self.table.c.session_id == session_id)).fetchone()
+                    if row is None or (row.title is not None and not is_legacy_memory(row.memory)):
+                        continue
+                    values = {}
+                    if row.title is None:
+                        sessions = self._to_sessions(sess, [row])
+                        title = sessions[0].get_title() if sessions else None
+                        if title is not None:
+                            values["title"] = title
+                    if is_legacy_memory(row.memory):
+                        normalized = normalize_memory(row.memory)
+                        values["memory"] = normalized.memory
+                        self._write_memory_rows(sess, session_id, normalized)
+                    if not values:
+                        continue
+                    sess.execute(update(self.table).where(self.table.c.session_id == session_id).values(**values))
+                    migrated += 1
+            except Exception as e:
+                logger.error(f"Error migrating session {session_id}: {e}")
+        if migrated > 0:
+            logger.info(f"Migrated {migrated} sessions in {self.table_name} to schema version {self.schema_version}")
+
+    def _create_missing_columns_and_indexes(self) -> None:
+        """Add the columns and indexes of the current schema version that are missing from the existing table"""
+        # Use a new inspector, the table was possibly created after self.inspector cached its columns
+        inspector = inspect(self.db_engine)
+        existing_columns = {column["name"] for column in inspector.get_columns(self.table.name, schema=self.schema)}
+        preparer = self.db_engine.dialect.identifier_preparer
+        with self.db_engine.begin() as connection:
+            for column in self.table.columns:
+                if column.name not in existing_columns:
+                    logger.debug(f"Adding column {column.name} to table: {self.table.fullname}")
+                    column_type = column.type.compile(dialect=self.db_engine.dialect)
+                    connection.execute(
+                        text(
+                            f"ALTER TABLE {preparer.format_table(self.table)} "
+                            f"ADD COLUMN IF NOT EXISTS {preparer.format_column(column)} {column_type}"
+                        )
+                    )
+            for index in self.table.indexes:
+                index.create(connection, checkfirst=True)
 
     def __deepcopy__(self, memo):
         """
@@ -351,10 +1037,10 @@ class PostgresAgentStorage(AgentStorage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"metadata", "table", "inspector"}:
+            if k in {"metadata", "table", "runs_table", "messages_table", "inspector"}:
                 continue
             # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "Session"}:
+            elif k in {"db_engine", "Session", "_async_db_engine", "_async_session"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
@@ -363,5 +1049,11 @@ class PostgresAgentStorage(AgentStorage):
         copied_obj.metadata = MetaData(schema=copied_obj.schema)
         copied_obj.inspector = inspect(copied_obj.db_engine)
         copied_obj.table = copied_obj.get_table()
+        if copied_obj.schema_version >= 2:
+            copied_obj.runs_table = copied_obj.get_runs_table()
+            copied_obj.messages_table = copied_obj.get_messages_table()
+        else:
+            copied_obj.runs_table = None
+            copied_obj.messages_table = None
 
         return copied_obj
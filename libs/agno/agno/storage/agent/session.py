@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, Mapping, Optional
 
+from agno.storage.session_info import SessionInfo
 from agno.utils.log import logger
 
 
@@ -61,6 +62,35 @@ class AgentSession:
             "updated_at": self.updated_at,
         }
 
+    def get_title(self) -> Optional[str]:
+        """Returns the session name, or the first user message if the session is not named"""
+        session_name = self.session_data.get("session_name") if self.session_data is not None else None
+        if session_name is not None:
+            return session_name
+        if self.memory is not None:
+            runs = self.memory.get("runs") or self.memory.get("chats")
+            if isinstance(runs, list):
+                for _run in runs:
+                    message = _run.get("message") if isinstance(_run, dict) else None
+                    if isinstance(message, dict) and message.get("role") == "user":
+                        content = message.get("content")
+                        if isinstance(content, list):
+                            # Use the text parts of a message with a list of content parts, e.g. text and images
+                            texts = [part.get("text") if isinstance(part, dict) else part for part in content]
+                            content = " ".join(text for text in texts if isinstance(text, str))
+                        return content if isinstance(content, str) and content else "No title"
+        return None
+
+    def to_session_info(self) -> SessionInfo:
+        return SessionInfo(
+            session_id=self.session_id,
+            title=self.get_title(),
+            session_name=self.session_data.get("session_name") if self.session_data is not None else None,
+            user_id=self.user_id,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
+
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> Optional[AgentSession]:
         if data is None or data.get("session_id") is None:
@@ -1,5 +1,5 @@
 import json
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
 
 try:
     from sqlalchemy.dialects import mysql
@@ -8,12 +8,13 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, sessionmaker
     from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import select, text
+    from sqlalchemy.sql.expression import and_, func, or_, select, text
 except ImportError:
     raise ImportError("`sqlalchemy` not installed")
 
 from agno.storage.agent.base import AgentStorage
 from agno.storage.agent.session import AgentSession
+from agno.storage.session_info import SessionInfo, decode_cursor, get_page
 from agno.utils.log import logger
 
 
@@ -172,6 +173,62 @@ class SingleStoreAgentStorage(AgentStorage):
             logger.debug(f"Table does not exist: {self.table.name}")
         return sessions
 
+    @staticmethod
+    def _to_session_info(row) -> SessionInfo:
+        data = dict(row._mapping)
+        first_message = data.pop("first_message")
+        # The title of a message with a list of content parts is built like AgentSession.get_title()
+        data["title"] = AgentSession(
+            session_id=data["session_id"],
+            session_data={"session_name": data["session_name"]},
+            memory={"runs": [{"message": json.loads(first_message) if first_message is not None else None}]},
+        ).get_title()
+        return SessionInfo(**data)
+
+    def get_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[SessionInfo], Optional[str]]:
+        """
+        Get a page of session summaries, newest first. The session name and first user message are extracted from
+        the JSON columns in the database, so the session memory is not sent to the client.
+        """
+        after = decode_cursor(cursor) if cursor is not None else None
+        try:
+            with self.Session.begin() as sess:
+                session_name = func.JSON_EXTRACT_STRING(self.table.c.session_data, "session_name")
+                stmt = select(
+                    self.table.c.session_id,
+                    func.JSON_EXTRACT_JSON(self.table.c.memory, "runs", 0, "message").label("first_message"),
+                    session_name.label("session_name"),
+                    self.table.c.user_id,
+                    self.table.c.created_at,
+                    self.table.c.updated_at,
+                )
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                if agent_id is not None:
+                    stmt = stmt.where(self.table.c.agent_id == agent_id)
+                if after is not None:
+                    # Keyset pagination: continue after the last session of the previous page
+                    stmt = stmt.where(
+                        or_(
+                            self.table.c.created_at < after[0],
+                            and_(self.table.c.created_at == after[0], self.table.c.session_id < after[1]),
+                        )
+                    )
+                stmt = stmt.order_by(self.table.c.created_at.desc(), self.table.c.session_id.desc())
+                if limit is not None:
+                    stmt = stmt.limit(limit + 1)
+                rows = sess.execute(stmt).fetchall()
+                return get_page([self._to_session_info(row) for row in rows], limit)
+        except Exception:
+            logger.debug(f"Table does not exist: {self.table.name}")
+        return [], None
+
     def upsert(self, session: AgentSession) -> Optional[AgentSession]:
         """
         Create a new session if it does not exist, otherwise update the existing session.
@@ -1,20 +1,29 @@
 import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 try:
     from sqlalchemy.dialects import sqlite
     from sqlalchemy.engine import Engine, create_engine
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, sessionmaker
-    from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import select
+    from sqlalchemy.schema import Column, Index, MetaData, Table
+    from sqlalchemy.sql.expression import and_, func, or_, select, text, update
     from sqlalchemy.types import String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
 from agno.storage.agent.base import AgentStorage
+from agno.storage.agent.normalize import (
+    MESSAGE_HASHES_KEY,
+    NormalizedMemory,
+    denormalize_memory,
+    is_legacy_memory,
+    normalize_memory,
+)
 from agno.storage.agent.session import AgentSession
+from agno.storage.session_info import SessionInfo, decode_cursor, get_page
+from agno.utils.cache import TTLCache
 from agno.utils.log import logger
 
 
@@ -42,6 +51,8 @@ class SqliteAgentStorage(AgentStorage):
             db_url: The database URL to connect to.
             db_file: The database file to connect to.
             db_engine: The SQLAlchemy database engine to use.
+            schema_version: Version of the schema. Version 2 stores runs and messages as separate rows.
+            auto_upgrade_schema: Whether to migrate sessions stored with an older schema version on init.
         """
         _engine: Optional[Engine] = db_engine
         if _engine is None and db_url is not None:
@@ -74,6 +85,20 @@ class SqliteAgentStorage(AgentStorage):
         self.Session: sessionmaker[Session] = sessionmaker(bind=self.db_engine)
         # Database table for storage
         self.table: Table = self.get_table()
+        # Database tables for runs and messages (schema version 2)
+        self.runs_table: Optional[Table] = None
+        self.messages_table: Optional[Table] = None
+        if self.schema_version >= 2:
+            self.runs_table = self.get_runs_table()
+            self.messages_table = self.get_messages_table()
+        # The last write of recently written sessions, so the next write only hashes the runs added since
+        self._written_memory: TTLCache = TTLCache(max_size=128)
+
+        if self.schema_version >= 2 and self.inspector.has_table(self.table.name):
+            # Add the title column to tables created with schema version 1, so they can be read before migrating
+            self._create_missing_columns_and_indexes()
+        if self.auto_upgrade_schema:
+            self.upgrade_schema()
 
     def get_table_v1(self) -> Table:
         """
@@ -82,7 +107,45 @@ class SqliteAgentStorage(AgentStorage):
         Returns:
             Table: SQLAlchemy Table object representing the schema.
         """
-        return Table(
+        table = Table(
+            self.table_name,
+            self.metadata,
+            # Session UUID: Primary Key
+            Column("session_id", String, primary_key=True),
+            # ID of the agent that this session is associated with
+            Column("agent_id", String),
+            # ID of the user interacting with this agent
+            Column("user_id", String),
+            # Agent Memory
+            Column("memory", sqlite.JSON),
+            # Agent Data
+            Column("agent_data", sqlite.JSON),
+            # Session Data
+            Column("session_data", sqlite.JSON),
+            # Extra Data stored with this agent
+            Column("extra_data", sqlite.JSON),
+            # The Unix timestamp of when this session was created.
+            Column("created_at", sqlite.INTEGER, default=lambda: int(time.time())),
+            # The Unix timestamp of when this session was last updated.
+            Column("updated_at", sqlite.INTEGER, onupdate=lambda: int(time.time())),
+            extend_existing=True,
+            sqlite_autoincrement=True,
+        )
+
+        # Add indexes used to list sessions
+        self._add_listing_indexes(table)
+
+        return table
+
+    def get_table_v2(self) -> Table:
+        """
+        Define the table schema for version 2.
+        The memory column no longer holds runs and messages, and the session title is stored to list sessions.
+
+        Returns:
+            Table: SQLAlchemy Table object representing the schema.
+        """
+        table = Table(
             self.table_name,
             self.metadata,
             # Session UUID: Primary Key
@@ -91,6 +154,8 @@ class SqliteAgentStorage(AgentStorage):
             Column("agent_id", String),
             # ID of the user interacting with this agent
             Column("user_id", String),
+            # Session name, or the first user message if the session is not named
+            Column("title", String),
             # Agent Memory
             Column("memory", sqlite.JSON),
             # Agent Data
@@ -107,6 +172,63 @@ class SqliteAgentStorage(AgentStorage):
             sqlite_autoincrement=True,
         )
 
+        # Add indexes used to list sessions
+        self._add_listing_indexes(table)
+
+        return table
+
+    def _add_listing_indexes(self, table: Table) -> None:
+        Index(f"idx_{self.table_name}_user_id_created_at", table.c.user_id, table.c.created_at)
+        Index(f"idx_{self.table_name}_agent_id_created_at", table.c.agent_id, table.c.created_at)
+
+    def get_runs_table(self) -> Table:
+        """
+        Define the table storing one row per run (schema version 2).
+
+        Returns:
+            Table: SQLAlchemy Table object for the runs.
+        """
+        return Table(
+            f"{self.table_name}_runs",
+            self.metadata,
+            # Session UUID
+            Column("session_id", String, primary_key=True),
+            # Position of the run in the session
+            Column("run_index", sqlite.INTEGER, primary_key=True, autoincrement=False),
+            # Run UUID
+            Column("run_id", String),
+            # Hash of the run, used to skip writing runs that did not change
+            Column("run_hash", String),
+            # The run, with messages replaced by their hashes
+            Column("run", sqlite.JSON),
+            # The Unix timestamp of when this run was created.
+            Column("created_at", sqlite.INTEGER, default=lambda: int(time.time())),
+            # The Unix timestamp of when this run was last updated.
+            Column("updated_at", sqlite.INTEGER, onupdate=lambda: int(time.time())),
+            extend_existing=True,
+        )
+
+    def get_messages_table(self) -> Table:
+        """
+        Define the table storing each distinct message of a session once (schema version 2).
+
+        Returns:
+            Table: SQLAlchemy Table object for the messages.
+        """
+        return Table(
+            f"{self.table_name}_messages",
+            self.metadata,
+            # Session UUID
+            Column("session_id", String, primary_key=True),
+            # Hash of the message
+            Column("message_hash", String, primary_key=True),
+            # The message
+            Column("message", sqlite.JSON),
+            # The Unix timestamp of when this message was created.
+            Column("created_at", sqlite.INTEGER, default=lambda: int(time.time())),
+            extend_existing=True,
+        )
+
     def get_table(self) -> Table:
         """
         Get the table schema based on the schema version.
@@ -119,6 +241,8 @@ class SqliteAgentStorage(AgentStorage):
         """
         if self.schema_version == 1:
             return self.get_table_v1()
+        elif self.schema_version == 2:
+            return self.get_table_v2()
         else:
             raise ValueError(f"Unsupported schema version: {self.schema_version}")
 
@@ -131,6 +255,10 @@ class SqliteAgentStorage(AgentStorage):
         """
         logger.debug(f"Checking if table exists: {self.table.name}")
         try:
+            if self.runs_table is not None and self.messages_table is not None:
+                return all(
+                    self.inspector.has_table(table.name) for table in (self.table, self.runs_table, self.messages_table)
+                )
             return self.inspector.has_table(self.table.name)
         except Exception as e:
             logger.error(f"Error checking if table exists: {e}")
@@ -143,6 +271,138 @@ class SqliteAgentStorage(AgentStorage):
         if not self.table_exists():
             logger.debug(f"Creating table: {self.table.name}")
             self.table.create(self.db_engine, checkfirst=True)
+        if self.runs_table is not None and self.messages_table is not None:
+            self.runs_table.create(self.db_engine, checkfirst=True)
+            self.messages_table.create(self.db_engine, checkfirst=True)
+
+    def _read_memory_rows(self, sess: Session, session_ids: List[str]) -> Dict[str, Tuple[List[Dict], Dict[str, Dict]]]:
+        """
+        Read the runs and messages of the given sessions.
+
+        Args:
+            sess (Session): The database session.
+            session_ids (List[str]): IDs of the sessions to read.
+
+        Returns:
+            Dict[str, Tuple[List[Dict], Dict[str, Dict]]]: The runs and messages by hash for each session.
+        """
+        if self.runs_table is None or self.messages_table is None or len(session_ids) == 0:
+            return {}
+
+        memory_rows: Dict[str, Tuple[List[Dict], Dict[str, Dict]]] = {
+            session_id: ([], {}) for session_id in session_ids
+        }
+        # Batch the session ids to stay under the sqlite variable limit
+        for i in range(0, len(session_ids), 500):
+            batch = session_ids[i : i + 500]
+            run_rows = sess.execute(
+                select(self.runs_table.c.session_id, self.runs_table.c.run)
+                .where(self.runs_table.c.session_id.in_(batch))
+                .order_by(self.runs_table.c.session_id, self.runs_table.c.run_index)
+            ).fetchall()
+            for row in run_rows:
+                memory_rows[row.session_id][0].append(row.run)
+            message_rows = sess.execute(
+                select(
+                    self.messages_table.c.session_id, self.messages_table.c.message_hash, self.messages_table.c.message
+                ).where(self.messages_table.c.session_id.in_(batch))
+            ).fetchall()
+            for row in message_rows:
+                memory_rows[row.session_id][1][row.message_hash] = row.message
+        return memory_rows
+
+    def _to_sessions(self, sess: Session, rows) -> List[AgentSession]:
+        """Convert session rows to AgentSessions, rebuilding the memory from the run and message rows"""
+        sessions = [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
+        _sessions: List[AgentSession] = [session for session in sessions if session is not None]
+        if self.schema_version >= 2:
+            # Sessions that have not been migrated from schema version 1 keep their runs and messages inline
+            normalized_sessions = [s for s in _sessions if s.memory is not None and MESSAGE_HASHES_KEY in s.memory]
+            memory_rows = self._read_memory_rows(sess, [s.session_id for s in normalized_sessions])
+            for session in normalized_sessions:
+                runs, messages = memory_rows.get(session.session_id, ([], {}))
+                session.memory = denormalize_memory(session.memory, runs, messages)
+        return _sessions
+
+    def _read_run_hashes(self, sess: Session, session_id: str, first_index: int) -> Dict[int, str]:
+        """Read the hashes of the runs of a session from the given run index on"""
+        if self.runs_table is None:
+            return {}
+        return {
+            row.run_index: row.run_hash
+            for row in sess.execute(
+                select(self.runs_table.c.run_index, self.runs_table.c.run_hash).where(
+                    self.runs_table.c.session_id == session_id, self.runs_table.c.run_index >= first_index
+                )
+            ).fetchall()
+        }
+
+    def _count_runs(self, sess: Session, session_id: str, before_index: int) -> int:
+        """Count the runs of a session before the given run index"""
+        if self.runs_table is None or before_index == 0:
+            return 0
+        return sess.execute(
+            select(func.count()).where(
+                self.runs_table.c.session_id == session_id, self.runs_table.c.run_index < before_index
+            )
+        ).scalar_one()
+
+    def _write_memory_rows(self, sess: Session, session_id: str, normalized: NormalizedMemory) -> NormalizedMemory:
+        """
+        Write the runs that changed and the messages that are not stored yet.
+
+        Args:
+            sess (Session): The database session.
+            session_id (str): ID of the session.
+            normalized (NormalizedMemory): The memory split into rows.
+
+        Returns:
+            NormalizedMemory: The memory that was written.
+        """
+        if self.runs_table is None or self.messages_table is None:
+            return normalized
+
+        # Runs are appended to a session, so only the hashes from the last reused run on are read. The last reused run
+        # and the number of runs before it tell whether another writer changed the session since the previous write.
+        first_index = max(normalized.num_reused_runs - 1, 0)
+        stored_run_hashes = self._read_run_hashes(sess, session_id, first_index)
+        if normalized.num_reused_runs > 0 and (
+            stored_run_hashes.get(first_index) != normalized.run_hashes[first_index]
+            or self._count_runs(sess, session_id, first_index) != first_index
+        ):
+            # The session was changed by another writer since the previous write, so normalize all runs and messages
+            normalized = normalize_memory(normalized.source)
+            first_index = 0
+            stored_run_hashes = self._read_run_hashes(sess, session_id, first_index)
+        for run_index in range(first_index, len(normalized.runs)):
+            run, run_hash = normalized.runs[run_index], normalized.run_hashes[run_index]
+            if stored_run_hashes.get(run_index) == run_hash:
+                continue
+            run_id = run.get("response", {}).get("run_id") if isinstance(run.get("response"), dict) else None
+            stmt = sqlite.insert(self.runs_table).values(
+                session_id=session_id, run_index=run_index, run_id=run_id, run_hash=run_hash, run=run
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id", "run_index"],
+                set_=dict(run_id=run_id, run_hash=run_hash, run=run, updated_at=int(time.time())),
+            )
+            sess.execute(stmt)
+        # Remove runs that are no longer in memory
+        if any(run_index >= len(normalized.runs) for run_index in stored_run_hashes):
+            sess.execute(
+                self.runs_table.delete().where(
+                    self.runs_table.c.session_id == session_id, self.runs_table.c.run_index >= len(normalized.runs)
+                )
+            )
+
+        # Only the messages of the runs that were not reused are normalized, stored messages are skipped on conflict
+        new_messages = [
+            {"session_id": session_id, "message_hash": message_hash, "message": message}
+            for message_hash, message in normalized.messages.items()
+        ]
+        if new_messages:
+            sess.execute(sqlite.insert(self.messages_table).on_conflict_do_nothing(), new_messages)
+        return normalized
 
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
         """
@@ -161,7 +421,10 @@ class SqliteAgentStorage(AgentStorage):
                 if user_id:
                     stmt = stmt.where(self.table.c.user_id == user_id)
                 result = sess.execute(stmt).fetchone()
-                return AgentSession.from_dict(result._mapping) if result is not None else None  # type: ignore
+                if result is None:
+                    return None
+                sessions = self._to_sessions(sess, [result])
+                return sessions[0] if sessions else None
         except Exception as e:
             logger.debug(f"Exception reading from table: {e}")
             logger.debug(f"Table does not exist: {self.table.name}")
@@ -223,7 +486,7 @@ class SqliteAgentStorage(AgentStorage):
                 stmt = stmt.order_by(self.table.c.created_at.desc())
                 # execute query
                 rows = sess.execute(stmt).fetchall()
-                return [AgentSession.from_dict(row._mapping) for row in rows] if rows is not None else []  # type: ignore
+                return self._to_sessions(sess, rows) if rows is not None else []
         except Exception as e:
             logger.debug(f"Exception reading from table: {e}")
             logger.debug(f"Table does not exist: {self.table.name}")
@@ -231,6 +494,99 @@ class SqliteAgentStorage(AgentStorage):
             self.create()
         return []
 
+    def _get_title_column(self):
+        """The stored title, or for schema version 1 the first user message, read from the JSON to build the title"""
+        if "title" in self.table.c:
+            return self.table.c.title.label("title")
+        return self.table.c.memory[("runs", 0, "message")].label("first_message")
+
+    @staticmethod
+    def _to_session_info(row) -> SessionInfo:
+        data = dict(row._mapping)
+        if "first_message" in data:
+            # The title of a message with a list of content parts is built like AgentSession.get_title()
+            first_message = data.pop("first_message")
+            data["title"] = AgentSession(
+                session_id=data["session_id"],
+                session_data={"session_name": data["session_name"]},
+                memory={"runs": [{"message": first_message}]},
+            ).get_title()
+        return SessionInfo(**data)
+
+    def get_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[SessionInfo], Optional[str]]:
+        """
+        Get a page of session summaries, newest first, without reading the session memory.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            agent_id (Optional[str]): The ID of the agent to filter by.
+            limit (Optional[int]): Maximum number of sessions to return. Returns all sessions if None.
+            cursor (Optional[str]): Cursor returned with the previous page.
+
+        Returns:
+            Tuple[List[SessionInfo], Optional[str]]: The sessions and the cursor of the next page, None on the last page.
+        """
+        after = decode_cursor(cursor) if cursor is not None else None
+        try:
+            with self.Session() as sess:
+                stmt = select(
+                    self.table.c.session_id,
+                    self._get_title_column(),
+                    self.table.c.session_data["session_name"].as_string().label("session_name"),
+                    self.table.c.user_id,
+                    self.table.c.created_at,
+                    self.table.c.updated_at,
+                )
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                if agent_id is not None:
+                    stmt = stmt.where(self.table.c.agent_id == agent_id)
+                if after is not None:
+                    # Keyset pagination: continue after the last session of the previous page
+                    stmt = stmt.where(
+                        or_(
+                            self.table.c.created_at < after[0],
+                            and_(self.table.c.created_at == after[0], self.table.c.session_id < after[1]),
+                        )
+                    )
+                stmt = stmt.order_by(self.table.c.created_at.desc(), self.table.c.session_id.desc())
+                if limit is not None:
+                    stmt = stmt.limit(limit + 1)
+                rows = sess.execute(stmt).fetchall()
+                return get_page([self._to_session_info(row) for row in rows], limit)
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            self.create()
+        return [], None
+
+    def get_session_updated_at(self, session_id: str) -> Optional[int]:
+        """
+        Get the timestamp of the last write to a session, without reading the session.
+
+        Args:
+            session_id (str): ID of the session.
+
+        Returns:
+            Optional[int]: updated_at, or created_at if the session was never updated. None if not found.
+        """
+        try:
+            with self.Session() as sess:
+                stmt = select(func.coalesce(self.table.c.updated_at, self.table.c.created_at)).where(
+                    self.table.c.session_id == session_id
+                )
+                return sess.execute(stmt).scalar()
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+        return None
+
     def upsert(self, session: AgentSession, create_and_retry: bool = True) -> Optional[AgentSession]:
         """
         Insert or update an AgentSession in the database.
@@ -242,35 +598,44 @@ class SqliteAgentStorage(AgentStorage):
         Returns:
             Optional[AgentSession]: The upserted AgentSession, or None if operation failed.
         """
+        normalized: Optional[NormalizedMemory] = None
+        values = dict(
+            agent_id=session.agent_id,
+            user_id=session.user_id,
+            memory=session.memory,
+            agent_data=session.agent_data,
+            session_data=session.session_data,
+            extra_data=session.extra_data,
+        )
+        if self.schema_version >= 2:
+            normalized = normalize_memory(session.memory, self._written_memory.get(session.session_id))
+            values["memory"] = normalized.memory
+            values["title"] = session.get_title()
+
+        timestamps = None
+        written: Optional[NormalizedMemory] = None
         try:
             with self.Session() as sess, sess.begin():
                 # Create an insert statement
-                stmt = sqlite.insert(self.table).values(
-                    session_id=session.session_id,
-                    agent_id=session.agent_id,
-                    user_id=session.user_id,
-                    memory=session.memory,
-                    agent_data=session.agent_data,
-                    session_data=session.session_data,
-                    extra_data=session.extra_data,
-                )
+                stmt = sqlite.insert(self.table).values(session_id=session.session_id, **values)
 
                 # Define the upsert if the session_id already exists
                 # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
                 stmt = stmt.on_conflict_do_update(
                     index_elements=["session_id"],
-                    set_=dict(
-                        agent_id=session.agent_id,
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        agent_data=session.agent_data,
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                        updated_at=int(time.time()),
-                    ),  # The updated value for each column
+                    set_=dict(**values, updated_at=int(time.time())),  # The updated value for each column
                 )
 
                 sess.execute(stmt)
+
+                if normalized is not None:
+                    written = self._write_memory_rows(sess, session.session_id, normalized)
+                # Only the timestamps are read back, the session that was written is not read again
+                timestamps = sess.execute(
+                    select(self.table.c.created_at, self.table.c.updated_at).where(
+                        self.table.c.session_id == session.session_id
+                    )
+                ).fetchone()
         except Exception as e:
             logger.debug(f"Exception upserting into table: {e}")
             if create_and_retry and not self.table_exists():
@@ -279,7 +644,11 @@ class SqliteAgentStorage(AgentStorage):
                 self.create()
                 return self.upsert(session, create_and_retry=False)
             return None
-        return self.read(session_id=session.session_id)
+        if written is not None:
+            self._written_memory.set(session.session_id, written)
+        if timestamps is not None:
+            session.created_at, session.updated_at = timestamps.created_at, timestamps.updated_at
+        return session
 
     def delete_session(self, session_id: Optional[str] = None):
         """
@@ -300,6 +669,10 @@ class SqliteAgentStorage(AgentStorage):
                 # Delete the session with the given session_id
                 delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if self.runs_table is not None and self.messages_table is not None:
+                    self._written_memory.delete(session_id)
+                    sess.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))
+                    sess.execute(self.messages_table.delete().where(self.messages_table.c.session_id == session_id))
                 if result.rowcount == 0:
                     logger.debug(f"No session found with session_id: {session_id}")
                 else:
@@ -314,13 +687,69 @@ class SqliteAgentStorage(AgentStorage):
         if self.table_exists():
             logger.debug(f"Deleting table: {self.table_name}")
             self.table.drop(self.db_engine)
+        self._written_memory.clear()
+        if self.runs_table is not None and self.messages_table is not None:
+            self.runs_table.drop(self.db_engine, checkfirst=True)
+            self.messages_table.drop(self.db_engine, checkfirst=True)
 
     def upgrade_schema(self) -> None:
         """
-        Upgrade the schema of the workflow storage table.
-        This method is currently a placeholder and does not perform any actions.
+        Upgrade the stored sessions to the current schema version.
+
+        Indexes missing from tables created by an older version are added.
+        For schema version 2, the title column is added and filled, and sessions whose memory was stored as
+        a single JSON blob (schema version 1) are split into run and message rows.
         """
-        pass
+        self.create()
+        self._create_missing_columns_and_indexes()
+        if self.schema_version < 2:
+            return
+
+        migrated = 0
+        for session_id in self.get_all_session_ids():
+            try:
+                with self.Session() as sess, sess.begin():
+                    row = sess.execute(select(self.table).where(self.table.c.session_id == session_id)).fetchone()
+                    if row is None or (row.title is not None and not is_legacy_memory(row.memory)):
+                        continue
+                    values = {}
+                    if row.title is None:
+                        sessions = self._to_sessions(sess, [row])
+                        title = sessions[0].get_title() if sessions else None
+                        if title is not None:
+                            values["title"] = title
+                    if is_legacy_memory(row.memory):
+                        normalized = normalize_memory(row.memory)
+                        values["memory"] = normalized.memory
+                        self._write_memory_rows(sess, session_id, normalized)
+                    if not values:
+                        continue
+                    sess.execute(update(self.table).where(self.table.c.session_id == session_id).values(**values))
+                    migrated += 1
+            except Exception as e:
+                logger.error(f"Error migrating session {session_id}: {e}")
+        if migrated > 0:
+            logger.info(f"Migrated {migrated} sessions in {self.table_name} to schema version {self.schema_version}")
+
+    def _create_missing_columns_and_indexes(self) -> None:
+        """Add the columns and indexes of the current schema version that are missing from the existing table"""
+        # Use a new inspector, the table was possibly created after self.inspector cached its columns
+        inspector = inspect(self.db_engine)
+        existing_columns = {column["name"] for column in inspector.get_columns(self.table.name)}
+        preparer = self.db_engine.dialect.identifier_preparer
+        with self.db_engine.begin() as connection:
+            for column in self.table.columns:
+                if column.name not in existing_columns:
+                    logger.debug(f"Adding column {column.name} to table: {self.table.name}")
+                    column_type = column.type.compile(dialect=self.db_engine.dialect)
+                    connection.execute(
+                        text(
+                            f"ALTER TABLE {preparer.format_table(self.table)} "
+                            f"ADD COLUMN {preparer.format_column(column)} {column_type}"
+                        )
+                    )
+            for index in self.table.indexes:
+                index.create(connection, checkfirst=True)
 
     def __deepcopy__(self, memo):
         """
@@ -341,7 +770,7 @@ class SqliteAgentStorage(AgentStorage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"metadata", "table", "inspector"}:
+            if k in {"metadata", "table", "runs_table", "messages_table", "inspector"}:
                 continue
             # Reuse db_engine and Session without copying
             elif k in {"db_engine", "Session"}:
@@ -353,5 +782,11 @@ class SqliteAgentStorage(AgentStorage):
         copied_obj.metadata = MetaData()
         copied_obj.inspector = inspect(copied_obj.db_engine)
         copied_obj.table = copied_obj.get_table()
+        if copied_obj.schema_version >= 2:
+            copied_obj.runs_table = copied_obj.get_runs_table()
+            copied_obj.messages_table = copied_obj.get_messages_table()
+        else:
+            copied_obj.runs_table = None
+            copied_obj.messages_table = None
 
         return copied_obj
@@ -0,0 +1,70 @@
+"""Lightweight session listings used to page through sessions without loading their memory.
+
+Listings are ordered by (created_at, session_id), newest first. A page is returned with an opaque cursor that
+points after its last session (keyset pagination), so the next page is read by an indexed range scan instead of
+skipping over an offset.
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+
+@dataclass
+class SessionInfo:
+    """Summary of a stored session, used to list sessions"""
+
+    # Session UUID
+    session_id: str
+    # Session name if set, otherwise the first user message (agents) or first line of the first response (workflows)
+    title: Optional[str] = None
+    # Session name
+    session_name: Optional[str] = None
+    # ID of the user the session belongs to
+    user_id: Optional[str] = None
+    # The unix timestamp when this session was created
+    created_at: Optional[int] = None
+    # The unix timestamp when this session was last updated
+    updated_at: Optional[int] = None
+
+
+def encode_cursor(created_at: Optional[int], session_id: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps([int(created_at or 0), session_id]).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[int, str]:
+    """Returns the (created_at, session_id) a cursor points after. Raises ValueError for an invalid cursor."""
+    try:
+        created_at, session_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return int(created_at), str(session_id)
+    except Exception:
+        raise ValueError(f"Invalid session cursor: {cursor}")
+
+
+def get_page(sessions: List[SessionInfo], limit: Optional[int]) -> Tuple[List[SessionInfo], Optional[str]]:
+    """
+    Trim sessions read with limit + 1 to a page and return it with the cursor of the next page.
+
+    Args:
+        sessions (List[SessionInfo]): Sessions in listing order, after the cursor.
+        limit (Optional[int]): Maximum number of sessions in the page, or None for all sessions.
+
+    Returns:
+        Tuple[List[SessionInfo], Optional[str]]: The page and the cursor of the next page, None on the last page.
+    """
+    if limit is None or len(sessions) <= limit:
+        return sessions, None
+    page = sessions[:limit]
+    return page, encode_cursor(page[-1].created_at, page[-1].session_id) if page else None
+
+
+def paginate(
+    sessions: Iterable[SessionInfo], limit: Optional[int] = None, cursor: Optional[str] = None
+) -> Tuple[List[SessionInfo], Optional[str]]:
+    """Sort, filter and page sessions in memory, for backends that cannot do it in the database"""
+    _sessions = sorted(sessions, key=lambda s: (s.created_at or 0, s.session_id), reverse=True)
+    if cursor is not None:
+        after = decode_cursor(cursor)
+        _sessions = [s for s in _sessions if (s.created_at or 0, s.session_id) < after]
+    return get_page(_sessions, limit)
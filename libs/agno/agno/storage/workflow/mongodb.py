@@ -1,5 +1,6 @@
+import asyncio
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 try:
@@ -10,10 +11,24 @@ try:
 except ImportError:
     raise ImportError("`pymongo` not installed. Please install it with `pip install pymongo`")
 
+from agno.storage.session_info import SessionInfo, decode_cursor, get_page
 from agno.storage.workflow.base import WorkflowStorage
 from agno.storage.workflow.session import WorkflowSession
 from agno.utils.log import logger
 
+# Only the stored title is read, sessions written before titles were stored read their first run instead
+_SUMMARY_PROJECTION: Dict[str, Any] = {
+    "_id": 0,
+    "session_id": 1,
+    "title": 1,
+    "session_data.session_name": 1,
+    "memory.runs": {"$slice": 1},
+    "user_id": 1,
+    "created_at": 1,
+    "updated_at": 1,
+}
+_SUMMARY_SORT = [("created_at", -1), ("session_id", -1)]
+
 
 class MongoDbWorkflowStorage(WorkflowStorage):
     def __init__(
@@ -22,6 +37,7 @@ class MongoDbWorkflowStorage(WorkflowStorage):
         db_url: Optional[str] = None,
         db_name: str = "agno",
         client: Optional[MongoClient] = None,
+        async_client: Optional[Any] = None,
     ):
         """
         This class provides workflow storage using MongoDB.
@@ -31,6 +47,8 @@ class MongoDbWorkflowStorage(WorkflowStorage):
             db_url: MongoDB connection URL
             db_name: Name of the database
             client: Optional existing MongoDB client
+            async_client: Optional existing async (motor) MongoDB client, used by the async methods.
+                Created from db_url if motor is installed, otherwise the async methods run in a thread.
             schema_version: Version of the schema to use
             auto_upgrade_schema: Whether to automatically upgrade the schema
         """
@@ -43,8 +61,12 @@ class MongoDbWorkflowStorage(WorkflowStorage):
         if self._client is None:
             raise ValueError("Must provide either db_url or client")
 
+        self.db_url: Optional[str] = db_url
         self.collection_name: str = collection_name
         self.db_name: str = db_name
+        self._async_client: Optional[Any] = async_client
+        # The event loop the async client was created on
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
         self.db: Database = self._client[self.db_name]
         self.collection: Collection = self.db[self.collection_name]
@@ -57,6 +79,9 @@ class MongoDbWorkflowStorage(WorkflowStorage):
             self.collection.create_index("user_id")
             self.collection.create_index("workflow_id")
             self.collection.create_index("created_at")
+            # Indexes used to list sessions
+            self.collection.create_index([("user_id", 1), ("created_at", -1), ("session_id", -1)])
+            self.collection.create_index([("workflow_id", 1), ("created_at", -1), ("session_id", -1)])
         except PyMongoError as e:
             logger.error(f"Error creating indexes: {e}")
             raise
@@ -136,6 +161,91 @@ class MongoDbWorkflowStorage(WorkflowStorage):
             logger.error(f"Error getting sessions: {e}")
             return []
 
+    def _get_session_update(self, session: WorkflowSession) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Returns the query matching the session document and the fields to set on it"""
+        # Convert session to dict and add timestamps
+        session_dict = session.to_dict()
+        now = datetime.now(timezone.utc)
+        timestamp = int(now.timestamp())
+
+        # Handle UUID serialization
+        if isinstance(session.session_id, UUID):
+            session_dict["session_id"] = str(session.session_id)
+
+        # Add version field for optimistic locking
+        if "_version" not in session_dict:
+            session_dict["_version"] = 1
+        else:
+            session_dict["_version"] += 1
+
+        # Store the title to list sessions without reading their memory
+        update_data = {**session_dict, "title": session.get_title(), "updated_at": timestamp}
+        return {"session_id": session_dict["session_id"]}, update_data
+
+    @staticmethod
+    def _get_summaries_query(
+        user_id: Optional[str], workflow_id: Optional[str], cursor: Optional[str]
+    ) -> Dict[str, Any]:
+        """Returns the query matching the sessions after the cursor"""
+        query: Dict[str, Any] = {}
+        if user_id is not None:
+            query["user_id"] = user_id
+        if workflow_id is not None:
+            query["workflow_id"] = workflow_id
+        if cursor is not None:
+            # Keyset pagination: continue after the last session of the previous page
+            created_at, session_id = decode_cursor(cursor)
+            query["$or"] = [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "session_id": {"$lt": session_id}},
+            ]
+        return query
+
+    @staticmethod
+    def _to_session_info(doc: Dict[str, Any]) -> SessionInfo:
+        session_data = doc.get("session_data")
+        title = (
+            doc["title"]
+            if "title" in doc
+            else WorkflowSession(
+                session_id=doc["session_id"], memory=doc.get("memory"), session_data=session_data
+            ).get_title()
+        )
+        return SessionInfo(
+            session_id=doc["session_id"],
+            title=title,
+            session_name=session_data.get("session_name") if isinstance(session_data, dict) else None,
+            user_id=doc.get("user_id"),
+            created_at=doc.get("created_at"),
+            updated_at=doc.get("updated_at"),
+        )
+
+    def get_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[SessionInfo], Optional[str]]:
+        """Get a page of session summaries, newest first, without reading the session memory
+        Args:
+            user_id: ID of the user to read
+            workflow_id: ID of the workflow to read
+            limit: Maximum number of sessions to return, all sessions if None
+            cursor: Cursor returned with the previous page
+        Returns:
+            Tuple[List[SessionInfo], Optional[str]]: The sessions and the cursor of the next page
+        """
+        query = self._get_summaries_query(user_id, workflow_id, cursor)
+        try:
+            docs = self.collection.find(query, _SUMMARY_PROJECTION).sort(_SUMMARY_SORT)
+            if limit is not None:
+                docs = docs.limit(limit + 1)
+            return get_page([self._to_session_info(doc) for doc in docs], limit)
+        except PyMongoError as e:
+            logger.error(f"Error getting session summaries: {e}")
+            return [], None
+
     def upsert(self, session: WorkflowSession, create_and_retry: bool = True) -> Optional[WorkflowSession]:
         """Upsert a workflow session
         Args:
@@ -145,34 +255,17 @@ class MongoDbWorkflowStorage(WorkflowStorage):
             WorkflowSession: The session if upserted, otherwise None
         """
         try:
-            # Convert session to dict and add timestamps
-            session_dict = session.to_dict()
-            now = datetime.now(timezone.utc)
-            timestamp = int(now.timestamp())
-
-            # Handle UUID serialization
-            if isinstance(session.session_id, UUID):
-                session_dict["session_id"] = str(session.session_id)
-
-            # Add version field for optimistic locking
-            if "_version" not in session_dict:
-                session_dict["_version"] = 1
-            else:
-                session_dict["_version"] += 1
-
-            update_data = {**session_dict, "updated_at": timestamp}
+            query, update_data = self._get_session_update(session)
 
             # For new documents, set created_at
-            query = {"session_id": session_dict["session_id"]}
-
             doc = self.collection.find_one(query)
             if not doc:
-                update_data["created_at"] = timestamp
+                update_data["created_at"] = update_data["updated_at"]
 
             result = self.collection.update_one(query, {"$set": update_data}, upsert=True)
 
             if result.acknowledged:
-                return self.read(session_id=session_dict["session_id"])
+                return self.read(session_id=query["session_id"])
             return None
 
         except PyMongoError as e:
@@ -199,6 +292,159 @@ class MongoDbWorkflowStorage(WorkflowStorage):
         except PyMongoError as e:
             logger.error(f"Error deleting session: {e}")
 
+    def get_async_collection(self) -> Optional[Any]:
+        """Get the collection from an async (motor) MongoDB client, or None if motor is not available"""
+        loop = asyncio.get_running_loop()
+        # Motor clients are bound to the event loop they were first used on
+        if self._async_client is not None and self._async_client_loop not in (None, loop):
+            self._async_client = None
+        if self._async_client is None:
+            if self.db_url is None:
+                return None
+            try:
+                from motor.motor_asyncio import AsyncIOMotorClient
+            except ImportError:
+                return None
+
+            logger.debug("Creating async MongoDB Client")
+            self._async_client = AsyncIOMotorClient(self.db_url)
+            self._async_client_loop = loop
+        return self._async_client[self.db_name][self.collection_name]
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[WorkflowSession]:
+        """Async version of read()"""
+        collection = self.get_async_collection()
+        if collection is None:
+            return await super().aread(session_id=session_id, user_id=user_id)
+
+        try:
+            query = {"session_id": session_id}
+            if user_id:
+                query["user_id"] = user_id
+
+            doc = await collection.find_one(query)
+            if doc:
+                # Remove MongoDB _id before converting to WorkflowSession
+                doc.pop("_id", None)
+                return WorkflowSession.from_dict(doc)
+            return None
+        except PyMongoError as e:
+            logger.error(f"Error reading session: {e}")
+            return None
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, workflow_id: Optional[str] = None) -> List[str]:
+        """Async version of get_all_session_ids()"""
+        collection = self.get_async_collection()
+        if collection is None:
+            return await super().aget_all_session_ids(user_id=user_id, workflow_id=workflow_id)
+
+        try:
+            query = {}
+            if user_id is not None:
+                query["user_id"] = user_id
+            if workflow_id is not None:
+                query["workflow_id"] = workflow_id
+
+            cursor = collection.find(query, {"session_id": 1}).sort("created_at", -1)
+            return [str(doc["session_id"]) async for doc in cursor]
+        except PyMongoError as e:
+            logger.error(f"Error getting session IDs: {e}")
+            return []
+
+    async def aget_all_sessions(
+        self, user_id: Optional[str] = None, workflow_id: Optional[str] = None
+    ) -> List[WorkflowSession]:
+        """Async version of get_all_sessions()"""
+        collection = self.get_async_collection()
+        if collection is None:
+            return await super().aget_all_sessions(user_id=user_id, workflow_id=workflow_id)
+
+        try:
+            query = {}
+            if user_id is not None:
+                query["user_id"] = user_id
+            if workflow_id is not None:
+                query["workflow_id"] = workflow_id
+
+            sessions = []
+            async for doc in collection.find(query).sort("created_at", -1):
+                # Remove MongoDB _id before converting to WorkflowSession
+                doc.pop("_id", None)
+                _workflow_session = WorkflowSession.from_dict(doc)
+                if _workflow_session is not None:
+                    sessions.append(_workflow_session)
+            return sessions
+        except PyMongoError as e:
+            logger.error(f"Error getting sessions: {e}")
+            return []
+
+    async def aget_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[SessionInfo], Optional[str]]:
+        """Async version of get_session_summaries()"""
+        collection = self.get_async_collection()
+        if collection is None:
+            return await super().aget_session_summaries(
+                user_id=user_id, workflow_id=workflow_id, limit=limit, cursor=cursor
+            )
+
+        query = self._get_summaries_query(user_id, workflow_id, cursor)
+        try:
+            docs = collection.find(query, _SUMMARY_PROJECTION).sort(_SUMMARY_SORT)
+            if limit is not None:
+                docs = docs.limit(limit + 1)
+            return get_page([self._to_session_info(doc) async for doc in docs], limit)
+        except PyMongoError as e:
+            logger.error(f"Error getting session summaries: {e}")
+            return [], None
+
+    async def aupsert(self, session: WorkflowSession) -> Optional[WorkflowSession]:
+        """Async version of upsert()"""
+        collection = self.get_async_collection()
+        if collection is None:
+            return await super().aupsert(session=session)
+
+        try:
+            query, update_data = self._get_session_update(session)
+
+            # For new documents, set created_at
+            doc = await collection.find_one(query)
+            if not doc:
+                update_data["created_at"] = update_data["updated_at"]
+
+            result = await collection.update_one(query, {"$set": update_data}, upsert=True)
+
+            if result.acknowledged:
+                return await self.aread(session_id=query["session_id"])
+            return None
+
+        except PyMongoError as e:
+            logger.error(f"Error upserting session: {e}")
+            return None
+
+    async def adelete_session(self, session_id: Optional[str] = None) -> None:
+        """Async version of delete_session()"""
+        collection = self.get_async_collection()
+        if collection is None:
+            return await super().adelete_session(session_id=session_id)
+
+        if session_id is None:
+            logger.warning("No session_id provided for deletion")
+            return
+
+        try:
+            result = await collection.delete_one({"session_id": session_id})
+            if result.deleted_count == 0:
+                logger.debug(f"No session found with session_id: {session_id}")
+            else:
+                logger.debug(f"Successfully deleted session with session_id: {session_id}")
+        except PyMongoError as e:
+            logger.error(f"Error deleting session: {e}")
+
     def drop(self) -> None:
         """Drop the collection
         Returns:
@@ -210,8 +456,18 @@ class MongoDbWorkflowStorage(WorkflowStorage):
             logger.error(f"Error dropping collection: {e}")
 
     def upgrade_schema(self) -> None:
-        """Placeholder for schema upgrades"""
-        pass
+        """Create missing indexes and store the title of sessions written before titles were stored
+        Returns:
+            None
+        """
+        self.create()
+        try:
+            for doc in self.collection.find({"title": {"$exists": False}}, _SUMMARY_PROJECTION):
+                self.collection.update_one(
+                    {"session_id": doc["session_id"]}, {"$set": {"title": self._to_session_info(doc).title}}
+                )
+        except PyMongoError as e:
+            logger.error(f"Error storing session titles: {e}")
 
     def __deepcopy__(self, memo):
         """Create a deep copy of the MongoDbWorkflowStorage instance"""
@@ -224,7 +480,7 @@ class MongoDbWorkflowStorage(WorkflowStorage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"_client", "db", "collection"}:
+            if k in {"_client", "db", "collection", "_async_client", "_async_client_loop"}:
                 # Reuse MongoDB connections without copying
                 setattr(copied_obj, k, v)
             else:
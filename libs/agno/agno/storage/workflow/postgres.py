@@ -1,15 +1,21 @@
+import asyncio
 import time
 import traceback
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 try:
     from sqlalchemy import BigInteger, Column, Engine, Index, MetaData, String, Table, create_engine, inspect
     from sqlalchemy.dialects import postgresql
+    from sqlalchemy.engine import make_url
     from sqlalchemy.orm import scoped_session, sessionmaker
-    from sqlalchemy.sql.expression import select, text
+    from sqlalchemy.sql.expression import and_, func, or_, select, text, update
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it with `pip install sqlalchemy`")
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from agno.storage.session_info import SessionInfo, decode_cursor, get_page
 from agno.storage.workflow.base import WorkflowStorage
 from agno.storage.workflow.session import WorkflowSession
 from agno.utils.log import logger
@@ -24,6 +30,7 @@ class PostgresWorkflowStorage(WorkflowStorage):
         db_engine: Optional[Engine] = None,
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
+        async_db_engine: Optional["AsyncEngine"] = None,
     ):
         """
         This class provides workflow storage using a PostgreSQL database.
@@ -39,7 +46,10 @@ class PostgresWorkflowStorage(WorkflowStorage):
             db_url (Optional[str]): The database URL to connect to.
             db_engine (Optional[Engine]): The SQLAlchemy database engine to use.
             schema_version (int): Version of the schema. Defaults to 1.
+                Version 2 stores the session title to list sessions.
             auto_upgrade_schema (bool): Whether to automatically upgrade the schema.
+            async_db_engine (Optional[AsyncEngine]): The SQLAlchemy async engine used by the async methods.
+                Created from db_url (or the db_engine URL) if not provided.
 
         Raises:
             ValueError: If neither db_url nor db_engine is provided.
@@ -66,10 +76,56 @@ class PostgresWorkflowStorage(WorkflowStorage):
 
         # Database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+        # Async database engine and session, created lazily
+        self._async_db_engine: Optional["AsyncEngine"] = async_db_engine
+        self._async_session: Optional["async_sessionmaker[AsyncSession]"] = None
         # Database table for storage
         self.table: Table = self.get_table()
+
+        if self.schema_version >= 2 and self.inspector.has_table(self.table.name, schema=self.schema):
+            # Add the title column to tables created with schema version 1, so they can be read before upgrading
+            self._create_missing_columns_and_indexes()
+        if self.auto_upgrade_schema:
+            self.upgrade_schema()
         logger.debug(f"Created PostgresWorkflowStorage: '{self.schema}.{self.table_name}'")
 
+    @property
+    def async_db_engine(self) -> "AsyncEngine":
+        """
+        Get the async database engine, creating it from the sync engine's URL if needed.
+
+        Returns:
+            AsyncEngine: SQLAlchemy async database engine.
+        """
+        if self._async_db_engine is None:
+            try:
+                from sqlalchemy.ext.asyncio import create_async_engine
+            except ImportError:
+                raise ImportError(
+                    "`sqlalchemy[asyncio]` not installed. Please install using `pip install 'sqlalchemy[asyncio]'`"
+                )
+
+            url = make_url(self.db_url) if self.db_url is not None else self.db_engine.url
+            # psycopg2 has no async support, psycopg (v3) and asyncpg do
+            if url.drivername in ("postgresql", "postgresql+psycopg2"):
+                url = url.set(drivername="postgresql+psycopg")
+            self._async_db_engine = create_async_engine(url)
+        return self._async_db_engine
+
+    @property
+    def AsyncSession(self) -> "async_sessionmaker[AsyncSession]":
+        """
+        Get the async session factory bound to the async database engine.
+
+        Returns:
+            async_sessionmaker[AsyncSession]: Factory for async database sessions.
+        """
+        if self._async_session is None:
+            from sqlalchemy.ext.asyncio import async_sessionmaker
+
+            self._async_session = async_sessionmaker(bind=self.async_db_engine)
+        return self._async_session
+
     def get_table_v1(self) -> Table:
         """
         Define the table schema for version 1.
@@ -105,6 +161,52 @@ class PostgresWorkflowStorage(WorkflowStorage):
         Index(f"idx_{self.table_name}_session_id", table.c.session_id)
         Index(f"idx_{self.table_name}_workflow_id", table.c.workflow_id)
         Index(f"idx_{self.table_name}_user_id", table.c.user_id)
+        # Add indexes used to list sessions
+        Index(f"idx_{self.table_name}_user_id_created_at", table.c.user_id, table.c.created_at)
+        Index(f"idx_{self.table_name}_workflow_id_created_at", table.c.workflow_id, table.c.created_at)
+
+        return table
+
+    def get_table_v2(self) -> Table:
+        """
+        Define the table schema for version 2, which stores the session title to list sessions.
+
+        Returns:
+            Table: SQLAlchemy Table object representing the schema.
+        """
+        table = Table(
+            self.table_name,
+            self.metadata,
+            # Session UUID: Primary Key
+            Column("session_id", String, primary_key=True),
+            # ID of the workflow that this session is associated with
+            Column("workflow_id", String),
+            # ID of the user interacting with this workflow
+            Column("user_id", String),
+            # Session name, or the first line of the first response if the session is not named
+            Column("title", String),
+            # Workflow Memory
+            Column("memory", postgresql.JSONB),
+            # Workflow Data
+            Column("workflow_data", postgresql.JSONB),
+            # Session Data
+            Column("session_data", postgresql.JSONB),
+            # Extra Data
+            Column("extra_data", postgresql.JSONB),
+            # The Unix timestamp of when this session was created.
+            Column("created_at", BigInteger, default=lambda: int(time.time())),
+            # The Unix timestamp of when this session was last updated.
+            Column("updated_at", BigInteger, onupdate=lambda: int(time.time())),
+            extend_existing=True,
+        )
+
+        # Add indexes
+        Index(f"idx_{self.table_name}_session_id", table.c.session_id)
+        Index(f"idx_{self.table_name}_workflow_id", table.c.workflow_id)
+        Index(f"idx_{self.table_name}_user_id", table.c.user_id)
+        # Add indexes used to list sessions
+        Index(f"idx_{self.table_name}_user_id_created_at", table.c.user_id, table.c.created_at)
+        Index(f"idx_{self.table_name}_workflow_id_created_at", table.c.workflow_id, table.c.created_at)
 
         return table
 
@@ -120,6 +222,8 @@ class PostgresWorkflowStorage(WorkflowStorage):
         """
         if self.schema_version == 1:
             return self.get_table_v1()
+        elif self.schema_version == 2:
+            return self.get_table_v2()
         else:
             raise ValueError(f"Unsupported schema version: {self.schema_version}")
 
@@ -241,6 +345,114 @@ class PostgresWorkflowStorage(WorkflowStorage):
             self.create()
         return []
 
+    def _get_summaries_stmt(
+        self, user_id: Optional[str], workflow_id: Optional[str], limit: Optional[int], cursor: Optional[str]
+    ):
+        """
+        Build the statement that selects a page of session summaries, newest first.
+        Schema version 1 does not store the title, it is read from the session name or first response in the JSON.
+        """
+        title = (
+            self.table.c.title
+            if "title" in self.table.c
+            else func.coalesce(
+                self.table.c.session_data["session_name"].astext,
+                self.table.c.memory[("runs", 0, "response", "content")].astext,
+            )
+        )
+        stmt = select(
+            self.table.c.session_id,
+            title.label("title"),
+            self.table.c.session_data["session_name"].astext.label("session_name"),
+            self.table.c.user_id,
+            self.table.c.created_at,
+            self.table.c.updated_at,
+        )
+        if user_id is not None and user_id != "":
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if workflow_id is not None:
+            stmt = stmt.where(self.table.c.workflow_id == workflow_id)
+        if cursor is not None:
+            # Keyset pagination: continue after the last session of the previous page
+            created_at, session_id = decode_cursor(cursor)
+            stmt = stmt.where(
+                or_(
+                    self.table.c.created_at < created_at,
+                    and_(self.table.c.created_at == created_at, self.table.c.session_id < session_id),
+                )
+            )
+        stmt = stmt.order_by(self.table.c.created_at.desc(), self.table.c.session_id.desc())
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        return stmt
+
+    @staticmethod
+    def _to_summaries(rows, limit: Optional[int]) -> Tuple[List[SessionInfo], Optional[str]]:
+        sessions = [SessionInfo(**row._mapping) for row in rows]
+        for session in sessions:
+            # Schema version 1 reads the whole first response
+            if session.title is not None and session.session_name is None:
+                session.title = session.title.split("\n")[0]
+        return get_page(sessions, limit)
+
+    def get_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[SessionInfo], Optional[str]]:
+        """
+        Get a page of session summaries, newest first, without reading the session memory.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            workflow_id (Optional[str]): The ID of the workflow to filter by.
+            limit (Optional[int]): Maximum number of sessions to return. Returns all sessions if None.
+            cursor (Optional[str]): Cursor returned with the previous page.
+
+        Returns:
+            Tuple[List[SessionInfo], Optional[str]]: The sessions and the cursor of the next page, None on the last page.
+        """
+        stmt = self._get_summaries_stmt(user_id, workflow_id, limit, cursor)
+        try:
+            with self.Session() as sess:
+                return self._to_summaries(sess.execute(stmt).fetchall(), limit)
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            self.create()
+        return [], None
+
+    def _get_upsert_stmt(self, session: WorkflowSession):
+        """
+        Build the statement that inserts the session row, or updates it if the session_id already exists.
+
+        Args:
+            session (WorkflowSession): The session to upsert.
+        """
+        values = dict(
+            workflow_id=session.workflow_id,
+            user_id=session.user_id,
+            memory=session.memory,
+            workflow_data=session.workflow_data,
+            session_data=session.session_data,
+            extra_data=session.extra_data,
+        )
+        if "title" in self.table.c:
+            values["title"] = session.get_title()
+
+        # Create an insert statement
+        stmt = postgresql.insert(self.table).values(session_id=session.session_id, **values)
+
+        # Define the upsert if the session_id already exists
+        # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+        return stmt.on_conflict_do_update(
+            index_elements=["session_id"],
+            set_=dict(**values, updated_at=int(time.time())),  # The updated value for each column
+        )
+
     def upsert(self, session: WorkflowSession, create_and_retry: bool = True) -> Optional[WorkflowSession]:
         """
         Insert or update a WorkflowSession in the database.
@@ -254,33 +466,7 @@ class PostgresWorkflowStorage(WorkflowStorage):
         """
         try:
             with self.Session() as sess, sess.begin():
-                # Create an insert statement
-                stmt = postgresql.insert(self.table).values(
-                    session_id=session.session_id,
-                    workflow_id=session.workflow_id,
-                    user_id=session.user_id,
-                    memory=session.memory,
-                    workflow_data=session.workflow_data,
-                    session_data=session.session_data,
-                    extra_data=session.extra_data,
-                )
-
-                # Define the upsert if the session_id already exists
-                # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["session_id"],
-                    set_=dict(
-                        workflow_id=session.workflow_id,
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        workflow_data=session.workflow_data,
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                        updated_at=int(time.time()),
-                    ),  # The updated value for each column
-                )
-
-                sess.execute(stmt)
+                sess.execute(self._get_upsert_stmt(session))
         except TypeError as e:
             traceback.print_exc()
             logger.error(f"Exception upserting into table: {e}")
@@ -321,6 +507,168 @@ class PostgresWorkflowStorage(WorkflowStorage):
         except Exception as e:
             logger.error(f"Error deleting session: {e}")
 
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[WorkflowSession]:
+        """
+        Async version of read(), using the async database engine.
+
+        Args:
+            session_id (str): The ID of the session to read.
+            user_id (Optional[str]): The ID of the user associated with the session.
+
+        Returns:
+            Optional[WorkflowSession]: The WorkflowSession object if found, None otherwise.
+        """
+        try:
+            async with self.AsyncSession() as sess:
+                stmt = select(self.table).where(self.table.c.session_id == session_id)
+                if user_id:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                result = (await sess.execute(stmt)).fetchone()
+                return WorkflowSession.from_dict(result._mapping) if result is not None else None  # type: ignore
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await asyncio.to_thread(self.create)
+        return None
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, workflow_id: Optional[str] = None) -> List[str]:
+        """
+        Async version of get_all_session_ids(), using the async database engine.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            workflow_id (Optional[str]): The ID of the workflow to filter by.
+
+        Returns:
+            List[str]: List of session IDs matching the criteria.
+        """
+        try:
+            async with self.AsyncSession() as sess:
+                stmt = select(self.table.c.session_id)
+                if user_id is not None and user_id != "":
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                if workflow_id is not None:
+                    stmt = stmt.where(self.table.c.workflow_id == workflow_id)
+                stmt = stmt.order_by(self.table.c.created_at.desc())
+                rows = (await sess.execute(stmt)).fetchall()
+                return [row[0] for row in rows] if rows is not None else []
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await asyncio.to_thread(self.create)
+        return []
+
+    async def aget_all_sessions(
+        self, user_id: Optional[str] = None, workflow_id: Optional[str] = None
+    ) -> List[WorkflowSession]:
+        """
+        Async version of get_all_sessions(), using the async database engine.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            workflow_id (Optional[str]): The ID of the workflow to filter by.
+
+        Returns:
+            List[WorkflowSession]: List of WorkflowSession objects matching the criteria.
+        """
+        try:
+            async with self.AsyncSession() as sess:
+                stmt = select(self.table)
+                if user_id is not None and user_id != "":
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                if workflow_id is not None:
+                    stmt = stmt.where(self.table.c.workflow_id == workflow_id)
+                stmt = stmt.order_by(self.table.c.created_at.desc())
+                rows = (await sess.execute(stmt)).fetchall()
+                return [WorkflowSession.from_dict(row._mapping) for row in rows] if rows is not None else []  # type: ignore
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await asyncio.to_thread(self.create)
+        return []
+
+    async def aget_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[SessionInfo], Optional[str]]:
+        """
+        Async version of get_session_summaries(), using the async database engine.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            workflow_id (Optional[str]): The ID of the workflow to filter by.
+            limit (Optional[int]): Maximum number of sessions to return. Returns all sessions if None.
+            cursor (Optional[str]): Cursor returned with the previous page.
+
+        Returns:
+            Tuple[List[SessionInfo], Optional[str]]: The sessions and the cursor of the next page, None on the last page.
+        """
+        stmt = self._get_summaries_stmt(user_id, workflow_id, limit, cursor)
+        try:
+            async with self.AsyncSession() as sess:
+                return self._to_summaries((await sess.execute(stmt)).fetchall(), limit)
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await asyncio.to_thread(self.create)
+        return [], None
+
+    async def aupsert(self, session: WorkflowSession, create_and_retry: bool = True) -> Optional[WorkflowSession]:
+        """
+        Async version of upsert(), using the async database engine.
+
+        Args:
+            session (WorkflowSession): The WorkflowSession object to upsert.
+            create_and_retry (bool): Retry upsert if table does not exist.
+
+        Returns:
+            Optional[WorkflowSession]: The upserted WorkflowSession object.
+        """
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                await sess.execute(self._get_upsert_stmt(session))
+        except TypeError as e:
+            traceback.print_exc()
+            logger.error(f"Exception upserting into table: {e}")
+            return None
+        except Exception as e:
+            logger.debug(f"Exception upserting into table: {e}")
+            if create_and_retry and not await asyncio.to_thread(self.table_exists):
+                logger.debug(f"Table does not exist: {self.table.name}")
+                logger.debug("Creating table and retrying upsert")
+                await asyncio.to_thread(self.create)
+                return await self.aupsert(session, create_and_retry=False)
+            return None
+        return await self.aread(session_id=session.session_id)
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        """
+        Async version of delete_session(), using the async database engine.
+
+        Args:
+            session_id (Optional[str]): The ID of the session to delete.
+        """
+        if session_id is None:
+            logger.warning("No session_id provided for deletion.")
+            return
+
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                result = await sess.execute(self.table.delete().where(self.table.c.session_id == session_id))
+                if result.rowcount == 0:
+                    logger.debug(f"No session found with session_id: {session_id}")
+                else:
+                    logger.debug(f"Successfully deleted session with session_id: {session_id}")
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
+
     def drop(self) -> None:
         """
         Drop the table from the database if it exists.
@@ -331,10 +679,48 @@ class PostgresWorkflowStorage(WorkflowStorage):
 
     def upgrade_schema(self) -> None:
         """
-        Upgrade the schema of the workflow storage table.
-        This method is currently a placeholder and does not perform any actions.
+        Upgrade the table to the current schema version.
+
+        Indexes missing from tables created by an older version are added.
+        For schema version 2, the title column is added and filled.
         """
-        pass
+        self.create()
+        self._create_missing_columns_and_indexes()
+        if "title" not in self.table.c:
+            return
+
+        try:
+            with self.Session() as sess, sess.begin():
+                rows = sess.execute(select(self.table).where(self.table.c.title.is_(None))).fetchall()
+                for row in rows:
+                    session = WorkflowSession.from_dict(row._mapping)  # type: ignore
+                    title = session.get_title() if session is not None else None
+                    if title is not None:
+                        sess.execute(
+                            update(self.table).where(self.table.c.session_id == row.session_id).values(title=title)
+                        )
+        except Exception as e:
+            logger.error(f"Error filling session titles in {self.table.fullname}: {e}")
+
+    def _create_missing_columns_and_indexes(self) -> None:
+        """Add the columns and indexes of the current schema version that are missing from the existing table"""
+        # Use a new inspector, the table was possibly created after self.inspector cached its columns
+        inspector = inspect(self.db_engine)
+        existing_columns = {column["name"] for column in inspector.get_columns(self.table.name, schema=self.schema)}
+        preparer = self.db_engine.dialect.identifier_preparer
+        with self.db_engine.begin() as connection:
+            for column in self.table.columns:
+                if column.name not in existing_columns:
+                    logger.debug(f"Adding column {column.name} to table: {self.table.fullname}")
+                    column_type = column.type.compile(dialect=self.db_engine.dialect)
+                    connection.execute(
+                        text(
+                            f"ALTER TABLE {preparer.format_table(self.table)} "
+                            f"ADD COLUMN IF NOT EXISTS {preparer.format_column(column)} {column_type}"
+                        )
+                    )
+            for index in self.table.indexes:
+                index.create(connection, checkfirst=True)
 
     def __deepcopy__(self, memo):
         """
@@ -358,7 +744,7 @@ class PostgresWorkflowStorage(WorkflowStorage):
             if k in {"metadata", "table", "inspector"}:
                 continue
             # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "Session"}:
+            elif k in {"db_engine", "Session", "_async_db_engine", "_async_session"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, Mapping, Optional
 
+from agno.storage.session_info import SessionInfo
 from agno.utils.log import logger
 
 
@@ -41,6 +42,29 @@ class WorkflowSession:
             "updated_at": self.updated_at,
         }
 
+    def get_title(self) -> Optional[str]:
+        """Returns the session name, or the first line of the first response if the session is not named"""
+        session_name = self.session_data.get("session_name") if self.session_data is not None else None
+        if session_name is not None:
+            return session_name
+        if self.memory is not None:
+            runs = self.memory.get("runs")
+            if isinstance(runs, list) and len(runs) > 0 and isinstance(runs[0], dict):
+                response = runs[0].get("response")
+                content = response.get("content") if isinstance(response, dict) else None
+                return content.split("\n")[0] if isinstance(content, str) and content else "No title"
+        return None
+
+    def to_session_info(self) -> SessionInfo:
+        return SessionInfo(
+            session_id=self.session_id,
+            title=self.get_title(),
+            session_name=self.session_data.get("session_name") if self.session_data is not None else None,
+            user_id=self.user_id,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
+
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> Optional[WorkflowSession]:
         if data is None or data.get("session_id") is None:
@@ -1,19 +1,20 @@
 import time
 import traceback
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 try:
     from sqlalchemy.dialects import sqlite
     from sqlalchemy.engine import Engine, create_engine
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, sessionmaker
-    from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import select
+    from sqlalchemy.schema import Column, Index, MetaData, Table
+    from sqlalchemy.sql.expression import and_, func, or_, select, text, update
     from sqlalchemy.types import String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
+from agno.storage.session_info import SessionInfo, decode_cursor, get_page
 from agno.storage.workflow.base import WorkflowStorage
 from agno.storage.workflow.session import WorkflowSession
 from agno.utils.log import logger
@@ -43,6 +44,8 @@ class SqliteWorkflowStorage(WorkflowStorage):
             db_url: The database URL to connect to.
             db_file: The database file to connect to.
             db_engine: The SQLAlchemy database engine to use.
+            schema_version: Version of the schema. Version 2 stores the session title to list sessions.
+            auto_upgrade_schema: Whether to upgrade the table created with an older schema version on init.
         """
         _engine: Optional[Engine] = db_engine
         if _engine is None and db_url is not None:
@@ -76,6 +79,12 @@ class SqliteWorkflowStorage(WorkflowStorage):
         # Database table for storage
         self.table: Table = self.get_table()
 
+        if self.schema_version >= 2 and self.inspector.has_table(self.table.name):
+            # Add the title column to tables created with schema version 1, so they can be read before upgrading
+            self._create_missing_columns_and_indexes()
+        if self.auto_upgrade_schema:
+            self.upgrade_schema()
+
     def get_table_v1(self) -> Table:
         """
         Define the table schema for version 1.
@@ -83,7 +92,7 @@ class SqliteWorkflowStorage(WorkflowStorage):
         Returns:
             Table: SQLAlchemy Table object representing the schema.
         """
-        return Table(
+        table = Table(
             self.table_name,
             self.metadata,
             # Session UUID: Primary Key
@@ -108,6 +117,54 @@ class SqliteWorkflowStorage(WorkflowStorage):
             sqlite_autoincrement=True,
         )
 
+        # Add indexes used to list sessions
+        self._add_listing_indexes(table)
+
+        return table
+
+    def get_table_v2(self) -> Table:
+        """
+        Define the table schema for version 2, which stores the session title to list sessions.
+
+        Returns:
+            Table: SQLAlchemy Table object representing the schema.
+        """
+        table = Table(
+            self.table_name,
+            self.metadata,
+            # Session UUID: Primary Key
+            Column("session_id", String, primary_key=True),
+            # ID of the workflow that this session is associated with
+            Column("workflow_id", String),
+            # ID of the user interacting with this workflow
+            Column("user_id", String),
+            # Session name, or the first line of the first response if the session is not named
+            Column("title", String),
+            # Workflow Memory
+            Column("memory", sqlite.JSON),
+            # Workflow Data
+            Column("workflow_data", sqlite.JSON),
+            # Session Data
+            Column("session_data", sqlite.JSON),
+            # Extra Data
+            Column("extra_data", sqlite.JSON),
+            # The Unix timestamp of when this session was created.
+            Column("created_at", sqlite.INTEGER, default=lambda: int(time.time())),
+            # The Unix timestamp of when this session was last updated.
+            Column("updated_at", sqlite.INTEGER, onupdate=lambda: int(time.time())),
+            extend_existing=True,
+            sqlite_autoincrement=True,
+        )
+
+        # Add indexes used to list sessions
+        self._add_listing_indexes(table)
+
+        return table
+
+    def _add_listing_indexes(self, table: Table) -> None:
+        Index(f"idx_{self.table_name}_user_id_created_at", table.c.user_id, table.c.created_at)
+        Index(f"idx_{self.table_name}_workflow_id_created_at", table.c.workflow_id, table.c.created_at)
+
     def get_table(self) -> Table:
         """
         Get the table schema based on the schema version.
@@ -120,6 +177,8 @@ class SqliteWorkflowStorage(WorkflowStorage):
         """
         if self.schema_version == 1:
             return self.get_table_v1()
+        elif self.schema_version == 2:
+            return self.get_table_v2()
         else:
             raise ValueError(f"Unsupported schema version: {self.schema_version}")
 
@@ -234,6 +293,73 @@ class SqliteWorkflowStorage(WorkflowStorage):
             self.create()
         return []
 
+    def _get_title_column(self):
+        """The stored title, or for schema version 1 the session name or first response read from the JSON"""
+        if "title" in self.table.c:
+            return self.table.c.title
+        return func.coalesce(
+            self.table.c.session_data["session_name"].as_string(),
+            self.table.c.memory[("runs", 0, "response", "content")].as_string(),
+        )
+
+    def get_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[SessionInfo], Optional[str]]:
+        """
+        Get a page of session summaries, newest first, without reading the session memory.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            workflow_id (Optional[str]): The ID of the workflow to filter by.
+            limit (Optional[int]): Maximum number of sessions to return. Returns all sessions if None.
+            cursor (Optional[str]): Cursor returned with the previous page.
+
+        Returns:
+            Tuple[List[SessionInfo], Optional[str]]: The sessions and the cursor of the next page, None on the last page.
+        """
+        after = decode_cursor(cursor) if cursor is not None else None
+        try:
+            with self.Session() as sess:
+                stmt = select(
+                    self.table.c.session_id,
+                    self._get_title_column().label("title"),
+                    self.table.c.session_data["session_name"].as_string().label("session_name"),
+                    self.table.c.user_id,
+                    self.table.c.created_at,
+                    self.table.c.updated_at,
+                )
+                if user_id is not None and user_id != "":
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                if workflow_id is not None:
+                    stmt = stmt.where(self.table.c.workflow_id == workflow_id)
+                if after is not None:
+                    # Keyset pagination: continue after the last session of the previous page
+                    stmt = stmt.where(
+                        or_(
+                            self.table.c.created_at < after[0],
+                            and_(self.table.c.created_at == after[0], self.table.c.session_id < after[1]),
+                        )
+                    )
+                stmt = stmt.order_by(self.table.c.created_at.desc(), self.table.c.session_id.desc())
+                if limit is not None:
+                    stmt = stmt.limit(limit + 1)
+                rows = sess.execute(stmt).fetchall()
+                sessions = [SessionInfo(**row._mapping) for row in rows]
+                for session in sessions:
+                    if session.title is not None and session.session_name is None:
+                        session.title = session.title.split("\n")[0]
+                return get_page(sessions, limit)
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            self.create()
+        return [], None
+
     def upsert(self, session: WorkflowSession, create_and_retry: bool = True) -> Optional[WorkflowSession]:
         """
         Insert or update a WorkflowSession in the database.
@@ -245,32 +371,27 @@ class SqliteWorkflowStorage(WorkflowStorage):
         Returns:
             Optional[WorkflowSession]: The upserted WorkflowSession object.
         """
+        values = dict(
+            workflow_id=session.workflow_id,
+            user_id=session.user_id,
+            memory=session.memory,
+            workflow_data=session.workflow_data,
+            session_data=session.session_data,
+            extra_data=session.extra_data,
+        )
+        if self.schema_version >= 2:
+            values["title"] = session.get_title()
+
         try:
             with self.Session() as sess, sess.begin():
                 # Create an insert statement
-                stmt = sqlite.insert(self.table).values(
-                    session_id=session.session_id,
-                    workflow_id=session.workflow_id,
-                    user_id=session.user_id,
-                    memory=session.memory,
-                    workflow_data=session.workflow_data,
-                    session_data=session.session_data,
-                    extra_data=session.extra_data,
-                )
+                stmt = sqlite.insert(self.table).values(session_id=session.session_id, **values)
 
                 # Define the upsert if the session_id already exists
                 # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
                 stmt = stmt.on_conflict_do_update(
                     index_elements=["session_id"],
-                    set_=dict(
-                        workflow_id=session.workflow_id,
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        workflow_data=session.workflow_data,
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                        updated_at=int(time.time()),
-                    ),  # The updated value for each column
+                    set_=dict(**values, updated_at=int(time.time())),  # The updated value for each column
                 )
 
                 sess.execute(stmt)
@@ -324,10 +445,48 @@ class SqliteWorkflowStorage(WorkflowStorage):
 
     def upgrade_schema(self) -> None:
         """
-        Upgrade the schema of the workflow storage table.
-        This method is currently a placeholder and does not perform any actions.
+        Upgrade the table to the current schema version.
+
+        Indexes missing from tables created by an older version are added.
+        For schema version 2, the title column is added and filled.
         """
-        pass
+        self.create()
+        self._create_missing_columns_and_indexes()
+        if "title" not in self.table.c:
+            return
+
+        try:
+            with self.Session() as sess, sess.begin():
+                rows = sess.execute(select(self.table).where(self.table.c.title.is_(None))).fetchall()
+                for row in rows:
+                    session = WorkflowSession.from_dict(row._mapping)  # type: ignore
+                    title = session.get_title() if session is not None else None
+                    if title is not None:
+                        sess.execute(
+                            update(self.table).where(self.table.c.session_id == row.session_id).values(title=title)
+                        )
+        except Exception as e:
+            logger.error(f"Error filling session titles in {self.table.name}: {e}")
+
+    def _create_missing_columns_and_indexes(self) -> None:
+        """Add the columns and indexes of the current schema version that are missing from the existing table"""
+        # Use a new inspector, the table was possibly created after self.inspector cached its columns
+        inspector = inspect(self.db_engine)
+        existing_columns = {column["name"] for column in inspector.get_columns(self.table.name)}
+        preparer = self.db_engine.dialect.identifier_preparer
+        with self.db_engine.begin() as connection:
+            for column in self.table.columns:
+                if column.name not in existing_columns:
+                    logger.debug(f"Adding column {column.name} to table: {self.table.name}")
+                    column_type = column.type.compile(dialect=self.db_engine.dialect)
+                    connection.execute(
+                        text(
+                            f"ALTER TABLE {preparer.format_table(self.table)} "
+                            f"ADD COLUMN {preparer.format_column(column)} {column_type}"
+                        )
+                    )
+            for index in self.table.indexes:
+                index.create(connection, checkfirst=True)
 
     def __deepcopy__(self, memo):
         """
@@ -18,7 +18,7 @@ class CalculatorTools(Toolkit):
         square_root: bool = False,
         enable_all: bool = False,
     ):
-        super().__init__(name="calculator")
+        super().__init__(name="calculator", run_in_parallel=True)
 
         # Register functions in the toolkit
         if add or enable_all:
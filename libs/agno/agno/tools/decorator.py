@@ -22,6 +22,10 @@ def tool(
     sanitize_arguments: Optional[bool] = None,
     show_result: Optional[bool] = None,
     stop_after_call: Optional[bool] = None,
+    run_in_parallel: Optional[bool] = None,
+    cache_results: Optional[bool] = None,
+    cache_ttl: Optional[float] = None,
+    cache_dir: Optional[str] = None,
     pre_hook: Optional[Callable] = None,
     post_hook: Optional[Callable] = None,
 ) -> Callable[[F], Function]: ...
@@ -41,6 +45,10 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
         sanitize_arguments: Optional[bool] - If True, arguments are sanitized before passing to function
         show_result: Optional[bool] - If True, shows the result after function call
         stop_after_call: Optional[bool] - If True, the agent will stop after the function call.
+        run_in_parallel: Optional[bool] - If False, the function never runs in parallel with other tool calls.
+        cache_results: Optional[bool] - If True, results are cached by function name and arguments.
+        cache_ttl: Optional[float] - Number of seconds a cached result is valid for. None means results do not expire.
+        cache_dir: Optional[str] - If set, results are cached on disk in this directory instead of in memory.
         pre_hook: Optional[Callable] - Hook that runs before the function is executed.
         post_hook: Optional[Callable] - Hook that runs after the function is executed.
 
@@ -65,6 +73,10 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
             "sanitize_arguments",
             "show_result",
             "stop_after_call",
+            "run_in_parallel",
+            "cache_results",
+            "cache_ttl",
+            "cache_dir",
             "pre_hook",
             "post_hook",
         }
@@ -92,11 +104,11 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
         # Preserve the original signature
         update_wrapper(wrapper, func)
 
-        # Create Function instance with any provided kwargs
+        # Create Function instance with any provided kwargs. cache_ttl=None means cached results do not expire.
         tool_config = {
             "name": kwargs.get("name", func.__name__),
             "entrypoint": wrapper,
-            **{k: v for k, v in kwargs.items() if k != "name" and v is not None},
+            **{k: v for k, v in kwargs.items() if k != "name" and (v is not None or k == "cache_ttl")},
         }
         return Function(**tool_config)
 
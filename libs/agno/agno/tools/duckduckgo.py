@@ -35,7 +35,8 @@ class DuckDuckGoTools(Toolkit):
         timeout: Optional[int] = 10,
         verify_ssl: bool = True,
     ):
-        super().__init__(name="duckduckgo")
+        # Each search uses its own DDGS client
+        super().__init__(name="duckduckgo", run_in_parallel=True)
 
         self.headers: Optional[Any] = headers
         self.proxy: Optional[str] = proxy
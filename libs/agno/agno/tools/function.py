@@ -1,13 +1,231 @@
-from typing import Any, Callable, Dict, Optional, Type, TypeVar, get_type_hints
+import json
+from copy import deepcopy
+from dataclasses import dataclass
+from hashlib import sha256
+from pathlib import Path
+from time import time
+from types import MethodType, ModuleType
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Optional, Tuple, Type, TypeVar, get_type_hints
+from weakref import WeakKeyDictionary
 
 from docstring_parser import parse
 from pydantic import BaseModel, Field, validate_call
 
 from agno.exceptions import AgentRunException
+from agno.utils.cache import TTLCache
 from agno.utils.log import logger
 
 T = TypeVar("T")
 
+# Results of functions with cache_results=True, shared by every agent in the process
+function_result_cache = TTLCache(max_size=1024)
+# Cache namespaces of the instances whose methods cache results, computed on first use
+_result_cache_namespaces: "WeakKeyDictionary[Any, str]" = WeakKeyDictionary()
+# Schemas and parameter names of callables, shared by every agent in the process
+function_schema_cache = TTLCache(max_size=2048)
+
+
+@dataclass
+class FunctionSchema:
+    """What an agent needs to call a function, computed once per callable"""
+
+    description: str
+    parameters: Dict[str, Any]
+    # validate_call() wrapper of the function. For methods, it wraps the unbound function and is bound on use.
+    validator: Callable
+
+
+def _get_cache_key(c: Callable) -> Tuple[Any, bool]:
+    """Returns the function a callable runs, and whether it is bound to an instance.
+
+    Bound methods are new objects on every attribute access, so they are cached by their underlying function.
+    Functions already wrapped by get_function_schema() map back to the function they wrap.
+    """
+    func, bound = c, False
+    if isinstance(c, MethodType):
+        func, bound = c.__func__, True
+    return getattr(func, "_agno_function", func), bound
+
+
+def _is_closure(func: Any) -> bool:
+    """Closures, like the transfer functions of a team, are created on every call of their enclosing function and
+    keep the objects they capture alive. They are cached by their code, so the cache does not hold on to them."""
+    return bool(getattr(func, "__closure__", None)) and hasattr(func, "__code__")
+
+
+def _get_closure_schema_key(func: Any) -> Tuple[Any, ...]:
+    """Closures from the same factory share their code, but their docstring, annotations and defaults can be set
+    from the factory's arguments. These are part of the key, so each variant gets its own description and schema."""
+    annotations = getattr(func, "__annotations__", None) or {}
+    kwdefaults = getattr(func, "__kwdefaults__", None) or {}
+    return (
+        func.__code__,
+        getattr(func, "__doc__", None),
+        tuple(sorted(annotations.items())),
+        getattr(func, "__defaults__", None),
+        tuple(sorted(kwdefaults.items())),
+    )
+
+
+def _get_cached(key: Hashable, build: Callable[[], T]) -> T:
+    """Returns the cached value for key, building and caching it on a miss. Unhashable keys are not cached."""
+    try:
+        value = function_schema_cache.get(key)
+    except TypeError:
+        return build()
+    if value is None:
+        value = build()
+        function_schema_cache.set(key, value)
+    return value
+
+
+def _get_instance_config_hash(instance: Any) -> str:
+    """Returns a hash of the public attributes of an instance that can be serialized to json.
+
+    Clients and other objects are left out. Credentials are part of the hash, so toolkits with different
+    credentials do not share results, but they are never stored.
+    """
+    config: Dict[str, str] = {}
+    for key, value in sorted(getattr(instance, "__dict__", {}).items()):
+        if key.startswith("_") or key == "functions":
+            continue
+        try:
+            config[key] = json.dumps(value, sort_keys=True)
+        except (TypeError, ValueError):
+            continue
+    return sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def get_result_cache_scope(c: Callable) -> str:
+    """Returns the scope results of a callable are cached in: its qualified name and, for methods, its instance.
+
+    Toolkits with the same functions can hold different credentials or state, so methods are scoped by the
+    cache_namespace of their instance, or a hash of its configuration when it was first used. The scope is stable
+    across copies, processes and restarts, so results cached on disk are reused.
+    """
+    func, _ = _get_cache_key(c)
+    scope = f"{getattr(func, '__module__', None)}.{getattr(func, '__qualname__', None)}"
+    instance = getattr(c, "__self__", None)
+    if instance is None or isinstance(instance, ModuleType):
+        return scope
+    namespace = getattr(instance, "cache_namespace", None)
+    if isinstance(namespace, str):
+        return f"{scope}:{namespace}"
+    try:
+        namespace = _result_cache_namespaces.get(instance)
+        if namespace is None:
+            # Computed once, so state the instance changes while running does not change its scope
+            namespace = _result_cache_namespaces.setdefault(instance, _get_instance_config_hash(instance))
+    except TypeError:
+        # Instances that are not hashable or weakly referenceable are hashed on every call
+        namespace = _get_instance_config_hash(instance)
+    return f"{scope}:{namespace}"
+
+
+def get_parameter_names(c: Callable) -> FrozenSet[str]:
+    """Returns the names of the parameters of a callable, from the cache after the first call"""
+    from inspect import signature
+
+    func, bound = _get_cache_key(c)
+    key = func.__code__ if _is_closure(func) else func
+    return _get_cached(("parameters", key, bound), lambda: frozenset(signature(c).parameters))
+
+
+def get_function_schema(c: Callable, strict: bool = False, name: Optional[str] = None) -> FunctionSchema:
+    """Returns the description, JSON schema and validator of a callable, from the cache after the first call"""
+    func, bound = _get_cache_key(c)
+    if _is_closure(func):
+        # The validator wraps the closure, so only the description and parameters are cached
+        description, parameters = _get_cached(
+            ("closure_schema", _get_closure_schema_key(func), bound, strict),
+            lambda: (get_entrypoint_docstring(entrypoint=c), _build_parameters(c, strict, name)),
+        )
+        return FunctionSchema(description=description, parameters=parameters, validator=_build_validator(c))
+    return _get_cached(("schema", func, bound, strict), lambda: _build_function_schema(c, strict, name))
+
+
+def get_validated_entrypoint(c: Callable, schema: FunctionSchema) -> Callable:
+    """Returns the validator of the schema, bound to the instance of c if c is a bound method"""
+    if isinstance(c, MethodType):
+        return MethodType(schema.validator, c.__self__)
+    return schema.validator
+
+
+def _build_function_schema(c: Callable, strict: bool = False, name: Optional[str] = None) -> FunctionSchema:
+    return FunctionSchema(
+        description=get_entrypoint_docstring(entrypoint=c),
+        parameters=_build_parameters(c, strict, name),
+        validator=_build_validator(c),
+    )
+
+
+def _build_parameters(c: Callable, strict: bool = False, name: Optional[str] = None) -> Dict[str, Any]:
+    from inspect import getdoc, signature
+
+    from agno.utils.json_schema import get_json_schema
+
+    function_name = name or getattr(c, "__name__", str(c))
+    parameters = {"type": "object", "properties": {}, "required": []}
+    try:
+        sig = signature(c)
+        type_hints = get_type_hints(c)
+
+        # If function has an the agent argument, remove the agent parameter from the type hints
+        if "agent" in sig.parameters:
+            type_hints.pop("agent", None)
+        # logger.info(f"Type hints for {function_name}: {type_hints}")
+
+        # Filter out return type and only process parameters
+        param_type_hints = {
+            name: type_hints.get(name) for name in sig.parameters if name != "return" and name != "agent"
+        }
+
+        # Parse docstring for parameters
+        param_descriptions = {}
+        if docstring := getdoc(c):
+            parsed_doc = parse(docstring)
+            param_docs = parsed_doc.params
+
+            if param_docs is not None:
+                for param in param_docs:
+                    param_name = param.arg_name
+                    param_type = param.type_name
+
+                    # TODO: We should use type hints first, then map param types in docs to json schema types.
+                    # This is temporary to not lose information
+                    param_descriptions[param_name] = f"({param_type}) {param.description}"
+
+        # Get JSON schema for parameters only
+        parameters = get_json_schema(type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict)
+
+        # If strict=True mark all fields as required
+        # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
+        if strict:
+            parameters["required"] = [name for name in parameters["properties"] if name != "agent"]
+        else:
+            # Mark a field as required if it has no default value
+            parameters["required"] = [
+                name
+                for name, param in sig.parameters.items()
+                if param.default == param.empty and name != "self" and name != "agent"
+            ]
+
+        # logger.debug(f"JSON schema for {function_name}: {parameters}")
+    except Exception as e:
+        logger.warning(f"Could not parse args for {function_name}: {e}", exc_info=True)
+    return parameters
+
+
+def _build_validator(c: Callable) -> Callable:
+    # Validate the underlying function of methods, so the validator can be shared by every instance
+    func, _ = _get_cache_key(c)
+    validator = validate_call(func, config=dict(arbitrary_types_allowed=True))  # type: ignore
+    try:
+        validator._agno_function = func  # type: ignore
+    except AttributeError:
+        pass
+    return validator
+
 
 def get_entrypoint_docstring(entrypoint: Callable) -> str:
     from inspect import getdoc
@@ -52,6 +270,19 @@ class Function(BaseModel):
     show_result: bool = False
     # If True, the agent will stop after the function call.
     stop_after_tool_call: bool = False
+    # If True, the function can run in parallel with other tool calls.
+    # If False, the function runs on its own in the calling thread, after the tool calls before it have completed.
+    # Functions registered by a Toolkit default to the run_in_parallel of the toolkit, which is False.
+    run_in_parallel: bool = True
+    # If True, results are cached by function and arguments, and identical calls return the cached result.
+    # Methods of instances with a different configuration (e.g. two toolkits with different credentials) never share
+    # results. A toolkit can set cache_namespace to choose which of its instances share results.
+    # Only use for deterministic functions. Failed calls are never cached.
+    cache_results: bool = False
+    # Number of seconds a cached result is valid for. None means cached results do not expire.
+    cache_ttl: Optional[float] = 3600
+    # If set, results are cached as json files in this directory instead of in memory
+    cache_dir: Optional[str] = None
     # Hook that runs before the function is executed.
     # If defined, can accept the FunctionCall instance as a parameter.
     pre_hook: Optional[Callable] = None
@@ -68,137 +299,27 @@ class Function(BaseModel):
 
     @classmethod
     def from_callable(cls, c: Callable, strict: bool = False) -> "Function":
-        from inspect import getdoc, signature
-
-        from agno.utils.json_schema import get_json_schema
-
-        function_name = c.__name__
-        parameters = {"type": "object", "properties": {}, "required": []}
-        try:
-            sig = signature(c)
-            type_hints = get_type_hints(c)
-
-            # If function has an the agent argument, remove the agent parameter from the type hints
-            if "agent" in sig.parameters:
-                del type_hints["agent"]
-            # logger.info(f"Type hints for {function_name}: {type_hints}")
-
-            # Filter out return type and only process parameters
-            param_type_hints = {
-                name: type_hints.get(name) for name in sig.parameters if name != "return" and name != "agent"
-            }
-
-            # Parse docstring for parameters
-            param_descriptions = {}
-            if docstring := getdoc(c):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-
-                        param_descriptions[param_name] = f"({param_type}) {param.description}"
-
-            # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
-
-            # If strict=True mark all fields as required
-            # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
-            if strict:
-                parameters["required"] = [name for name in parameters["properties"] if name != "agent"]
-            else:
-                # Mark a field as required if it has no default value
-                parameters["required"] = [
-                    name
-                    for name, param in sig.parameters.items()
-                    if param.default == param.empty and name != "self" and name != "agent"
-                ]
-
-            # logger.debug(f"JSON schema for {function_name}: {parameters}")
-        except Exception as e:
-            logger.warning(f"Could not parse args for {function_name}: {e}", exc_info=True)
-
+        schema = get_function_schema(c, strict=strict)
         return cls(
-            name=function_name,
-            description=get_entrypoint_docstring(entrypoint=c),
-            parameters=parameters,
-            entrypoint=validate_call(c, config=dict(arbitrary_types_allowed=True)),  # type: ignore
+            name=c.__name__,
+            description=schema.description,
+            parameters=deepcopy(schema.parameters),
+            entrypoint=get_validated_entrypoint(c, schema),
         )
 
     def process_entrypoint(self, strict: bool = False):
         """Process the entrypoint and make it ready for use by an agent."""
-        from inspect import getdoc, signature
-
-        from agno.utils.json_schema import get_json_schema
-
         if self.entrypoint is None:
             return
 
-        parameters = {"type": "object", "properties": {}, "required": []}
-
-        params_set_by_user = False
         # If the user set the parameters (i.e. they are different from the default), we should keep them
-        if self.parameters != parameters:
-            params_set_by_user = True
+        params_set_by_user = self.parameters != {"type": "object", "properties": {}, "required": []}
 
-        try:
-            sig = signature(self.entrypoint)
-            type_hints = get_type_hints(self.entrypoint)
-
-            # If function has an the agent argument, remove the agent parameter from the type hints
-            if "agent" in sig.parameters:
-                del type_hints["agent"]
-            # logger.info(f"Type hints for {self.name}: {type_hints}")
-
-            # Filter out return type and only process parameters
-            param_type_hints = {
-                name: type_hints.get(name) for name in sig.parameters if name != "return" and name != "agent"
-            }
-
-            # Parse docstring for parameters
-            param_descriptions = {}
-            if docstring := getdoc(self.entrypoint):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-
-                        # TODO: We should use type hints first, then map param types in docs to json schema types.
-                        # This is temporary to not lose information
-                        param_descriptions[param_name] = f"({param_type}) {param.description}"
-
-            # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
-
-            # If strict=True mark all fields as required
-            # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
-            if strict:
-                parameters["required"] = [name for name in parameters["properties"] if name != "agent"]
-            else:
-                # Mark a field as required if it has no default value
-                parameters["required"] = [
-                    name
-                    for name, param in sig.parameters.items()
-                    if param.default == param.empty and name != "self" and name != "agent"
-                ]
-
-            # logger.debug(f"JSON schema for {self.name}: {parameters}")
-        except Exception as e:
-            logger.warning(f"Could not parse args for {self.name}: {e}", exc_info=True)
-
-        self.description = self.description or get_entrypoint_docstring(self.entrypoint)
+        schema = get_function_schema(self.entrypoint, strict=strict, name=self.name)
+        self.description = self.description or schema.description
         if not params_set_by_user:
-            self.parameters = parameters
-        self.entrypoint = validate_call(self.entrypoint, config=dict(arbitrary_types_allowed=True))  # type: ignore
+            self.parameters = deepcopy(schema.parameters)
+        self.entrypoint = get_validated_entrypoint(self.entrypoint, schema)
 
     def get_type_name(self, t: Type[T]):
         name = str(t)
@@ -251,6 +372,8 @@ class FunctionCall(BaseModel):
 
     # Error while parsing arguments or running the function.
     error: Optional[str] = None
+    # Whether the result was served from the result cache. None if the function does not cache results.
+    cache_hit: Optional[bool] = None
 
     def get_call_str(self) -> str:
         """Returns a string representation of the function call."""
@@ -270,14 +393,13 @@ class FunctionCall(BaseModel):
         """Handles the pre-hook for the function call."""
         if self.function.pre_hook is not None:
             try:
-                from inspect import signature
-
                 pre_hook_args = {}
+                pre_hook_params = get_parameter_names(self.function.pre_hook)
                 # Check if the pre-hook has and agent argument
-                if "agent" in signature(self.function.pre_hook).parameters:
+                if "agent" in pre_hook_params:
                     pre_hook_args["agent"] = self.function._agent
                 # Check if the pre-hook has an fc argument
-                if "fc" in signature(self.function.pre_hook).parameters:
+                if "fc" in pre_hook_params:
                     pre_hook_args["fc"] = self
                 self.function.pre_hook(**pre_hook_args)
             except AgentRunException as e:
@@ -292,14 +414,13 @@ class FunctionCall(BaseModel):
         """Handles the post-hook for the function call."""
         if self.function.post_hook is not None:
             try:
-                from inspect import signature
-
                 post_hook_args = {}
+                post_hook_params = get_parameter_names(self.function.post_hook)
                 # Check if the post-hook has and agent argument
-                if "agent" in signature(self.function.post_hook).parameters:
+                if "agent" in post_hook_params:
                     post_hook_args["agent"] = self.function._agent
                 # Check if the post-hook has an fc argument
-                if "fc" in signature(self.function.post_hook).parameters:
+                if "fc" in post_hook_params:
                     post_hook_args["fc"] = self
                 self.function.post_hook(**post_hook_args)
             except AgentRunException as e:
@@ -312,17 +433,75 @@ class FunctionCall(BaseModel):
 
     def _build_entrypoint_args(self) -> Dict[str, Any]:
         """Builds the arguments for the entrypoint."""
-        from inspect import signature
-
         entrypoint_args = {}
+        entrypoint_params = get_parameter_names(self.function.entrypoint)  # type: ignore
         # Check if the entrypoint has an agent argument
-        if "agent" in signature(self.function.entrypoint).parameters:  # type: ignore
+        if "agent" in entrypoint_params:
             entrypoint_args["agent"] = self.function._agent
         # Check if the entrypoint has an fc argument
-        if "fc" in signature(self.function.entrypoint).parameters:  # type: ignore
+        if "fc" in entrypoint_params:
             entrypoint_args["fc"] = self
         return entrypoint_args
 
+    def _get_cache_key(self) -> str:
+        """Returns the cache key for this call: the function, the instance it belongs to and the arguments."""
+        arguments = json.dumps(self.arguments or {}, sort_keys=True, default=str)
+        scope = get_result_cache_scope(self.function.entrypoint) if self.function.entrypoint is not None else None
+        return f"{scope}:{self.function.name}:{arguments}"
+
+    def _get_cache_file(self, cache_key: str) -> Path:
+        return Path(self.function.cache_dir) / f"{sha256(cache_key.encode()).hexdigest()}.json"  # type: ignore
+
+    def _get_cached_result(self) -> Tuple[bool, Any]:
+        """Returns whether a cached result was found, and the result."""
+        cache_key = self._get_cache_key()
+        if self.function.cache_dir is None:
+            missing = object()
+            result = function_result_cache.get(cache_key, missing)
+            return (False, None) if result is missing else (True, result)
+
+        cache_file = self._get_cache_file(cache_key)
+        try:
+            cached = json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            return False, None
+        if cached.get("expires_at") is not None and cached["expires_at"] <= time():
+            cache_file.unlink(missing_ok=True)
+            return False, None
+        return True, cached.get("result")
+
+    def _cache_result(self) -> None:
+        """Caches the result of a successful call. Streaming results cannot be cached."""
+        from collections.abc import Iterator
+        from types import AsyncGeneratorType
+
+        if isinstance(self.result, (Iterator, AsyncGeneratorType)):
+            return
+
+        cache_key = self._get_cache_key()
+        if self.function.cache_dir is None:
+            function_result_cache.set(cache_key, self.result, ttl=self.function.cache_ttl)
+            return
+
+        expires_at = time() + self.function.cache_ttl if self.function.cache_ttl is not None else None
+        try:
+            cache_file = self._get_cache_file(cache_key)
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps({"key": cache_key, "expires_at": expires_at, "result": self.result}))
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not cache result of {self.get_call_str()}: {e}")
+
+    def _use_cached_result(self) -> bool:
+        """Sets the result from the cache if the function caches results. Returns True on a cache hit."""
+        if not self.function.cache_results:
+            return False
+        found, result = self._get_cached_result()
+        self.cache_hit = found
+        if found:
+            logger.debug(f"Using cached result for: {self.get_call_str()}")
+            self.result = result
+        return found
+
     def execute(self) -> bool:
         """Runs the function call.
 
@@ -338,6 +517,11 @@ class FunctionCall(BaseModel):
         # Execute pre-hook if it exists
         self._handle_pre_hook()
 
+        # Return the cached result if there is one
+        if self._use_cached_result():
+            self._handle_post_hook()
+            return True
+
         # Call the function with no arguments if none are provided.
         if self.arguments == {} or self.arguments is None:
             try:
@@ -368,6 +552,9 @@ class FunctionCall(BaseModel):
                 self.error = str(e)
                 return function_call_success
 
+        if self.function.cache_results:
+            self._cache_result()
+
         # Execute post-hook if it exists
         self._handle_post_hook()
 
@@ -388,6 +575,11 @@ class FunctionCall(BaseModel):
         # Execute pre-hook if it exists
         self._handle_pre_hook()
 
+        # Return the cached result if there is one
+        if self._use_cached_result():
+            self._handle_post_hook()
+            return True
+
         # Call the function with no arguments if none are provided.
         if self.arguments == {} or self.arguments is None:
             try:
@@ -418,6 +610,9 @@ class FunctionCall(BaseModel):
                 self.error = str(e)
                 return function_call_success
 
+        if self.function.cache_results:
+            self._cache_result()
+
         # Execute post-hook if it exists
         self._handle_post_hook()
 
@@ -12,7 +12,7 @@ class HackerNewsTools(Toolkit):
         get_top_stories: bool = True,
         get_user_details: bool = True,
     ):
-        super().__init__(name="hackers_news")
+        super().__init__(name="hackers_news", run_in_parallel=True)
 
         # Register functions in the toolkit
         if get_top_stories:
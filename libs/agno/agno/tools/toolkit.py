@@ -1,25 +1,46 @@
 from collections import OrderedDict
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Optional
 
 from agno.tools.function import Function
 from agno.utils.log import logger
 
 
 class Toolkit:
-    def __init__(self, name: str = "toolkit"):
+    def __init__(self, name: str = "toolkit", run_in_parallel: bool = False, cache_namespace: Optional[str] = None):
         """Initialize a new Toolkit.
 
         Args:
             name: A descriptive name for the toolkit
+            run_in_parallel: If True, the functions of the toolkit can run in parallel with other tool calls.
+                Toolkits often share a client or state between their functions that is not thread-safe,
+                so they run one at a time unless the toolkit opts in.
+            cache_namespace: Scope of the cached results of the toolkit. Instances with the same namespace share cached
+                results. Defaults to a hash of the configuration of the toolkit.
         """
         self.name: str = name
+        self.run_in_parallel: bool = run_in_parallel
+        self.cache_namespace: Optional[str] = cache_namespace
         self.functions: Dict[str, Function] = OrderedDict()
 
-    def register(self, function: Callable[..., Any], sanitize_arguments: bool = True):
+    def register(
+        self,
+        function: Callable[..., Any],
+        sanitize_arguments: bool = True,
+        run_in_parallel: Optional[bool] = None,
+        cache_results: bool = False,
+        cache_ttl: Optional[float] = 3600,
+        cache_dir: Optional[str] = None,
+    ):
         """Register a function with the toolkit.
 
         Args:
             function: The callable to register
+            sanitize_arguments: If True, the arguments are sanitized before being passed to the function
+            run_in_parallel: If False, the function never runs in parallel with other tool calls.
+                Defaults to the run_in_parallel of the toolkit.
+            cache_results: If True, results are cached by function and arguments, separately for each toolkit config
+            cache_ttl: Number of seconds a cached result is valid for
+            cache_dir: If set, results are cached on disk in this directory instead of in memory
 
         Returns:
             The registered function
@@ -29,6 +50,10 @@ class Toolkit:
                 name=function.__name__,
                 entrypoint=function,
                 sanitize_arguments=sanitize_arguments,
+                run_in_parallel=self.run_in_parallel if run_in_parallel is None else run_in_parallel,
+                cache_results=cache_results,
+                cache_ttl=cache_ttl,
+                cache_dir=cache_dir,
             )
             self.functions[f.name] = f
             logger.debug(f"Function: {f.name} registered with {self.name}")
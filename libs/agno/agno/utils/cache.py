@@ -0,0 +1,60 @@
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Dict, Hashable, Optional, Tuple, Union
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire ttl seconds after they are set"""
+
+    def __init__(self, max_size: int = 1000, ttl: Optional[float] = None):
+        self.max_size: int = max_size
+        self.ttl: Optional[float] = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[Hashable, Tuple[Optional[float], Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        _ttl = ttl if ttl is not None else self.ttl
+        with self._lock:
+            self._entries[key] = (monotonic() + _ttl if _ttl is not None else None, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def cache_info(self) -> Dict[str, Union[int, float]]:
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate, "size": len(self)}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __deepcopy__(self, memo):
+        # The cache holds a lock, and copies of an agent should share cached entries
+        return self
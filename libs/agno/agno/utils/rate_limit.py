@@ -0,0 +1,393 @@
+"""Client-side rate limiting for model and embedder requests.
+
+Limiters are shared by every Model or Embedder in the process with the same provider, API key and model id, so
+agents copied with deep_copy() and agents running concurrently draw from the same budget.
+
+A limiter combines token buckets for requests and tokens per minute with an adaptive concurrency limit. When the
+provider rate limits a request (HTTP 429 or a throttling error), the limiter halves the concurrency limit and pauses
+new requests for the retry-after duration. Each successful request raises the limit again, up to max_concurrency.
+
+Provider SDKs retry rate limited requests on their own. When using a rate limit, set the SDK retries to 0 (for
+example max_retries=0 on the OpenAI client) and use RateLimit.max_retries instead, so retries wait in the limiter.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from functools import wraps
+from hashlib import sha256
+from inspect import isasyncgenfunction, iscoroutinefunction, isgeneratorfunction
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Union
+
+from agno.utils.log import logger
+
+# Seconds to wait before checking again for a free concurrency slot
+POLL_INTERVAL = 0.05
+# Error codes and class names providers use for rate limited requests
+RATE_LIMIT_ERROR_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "RESOURCE_EXHAUSTED",
+    "rate_limit_exceeded",
+}
+RATE_LIMIT_ERROR_NAMES = ("RateLimit", "ResourceExhausted", "TooManyRequests", "Throttling")
+
+
+@dataclass
+class RateLimit:
+    """Rate limit for requests to a provider. Limits that are None are not enforced."""
+
+    requests_per_minute: Optional[float] = None
+    # Tokens are estimated from the request before it is sent
+    tokens_per_minute: Optional[float] = None
+    # Maximum number of requests in flight. The limiter lowers it when rate limited and ramps it back up on success.
+    max_concurrency: Optional[int] = None
+    min_concurrency: int = 1
+    # Seconds to pause after a rate limited request without a retry-after header, doubled on each consecutive one
+    backoff: float = 1.0
+    max_backoff: float = 60.0
+    # Number of times a rate limited request is retried after waiting in the limiter. Streams are not retried.
+    max_retries: int = 2
+
+
+class RateLimiter:
+    """Token bucket and adaptive concurrency limiter, safe to use from threads and event loops"""
+
+    def __init__(self, rate_limit: RateLimit):
+        self.rate_limit: RateLimit = rate_limit
+        self.concurrency_limit: float = float(rate_limit.max_concurrency or math.inf)
+        self.in_flight: int = 0
+        self.paused_until: float = 0.0
+        # Stats
+        self.requests: int = 0
+        self.rate_limited: int = 0
+        self.total_wait_time: float = 0.0
+        # Different rate limits requested for this limiter after it was created, see get_rate_limiter()
+        self.ignored_rate_limits: List[RateLimit] = []
+
+        now = time.monotonic()
+        self._request_bucket: float = rate_limit.requests_per_minute or 0.0
+        self._token_bucket: float = rate_limit.tokens_per_minute or 0.0
+        self._refilled_at: float = now
+        self._consecutive_rate_limits: int = 0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        rpm, tpm = self.rate_limit.requests_per_minute, self.rate_limit.tokens_per_minute
+        if rpm:
+            self._request_bucket = min(rpm, self._request_bucket + elapsed * rpm / 60)
+        if tpm:
+            self._token_bucket = min(tpm, self._token_bucket + elapsed * tpm / 60)
+
+    def try_acquire(self, tokens: int = 0) -> Optional[float]:
+        """Reserves capacity for a request. Returns None if reserved, otherwise the number of seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self.paused_until:
+                return self.paused_until - now
+            if self.concurrency_limit != math.inf:
+                if self.in_flight >= max(self.rate_limit.min_concurrency, math.floor(self.concurrency_limit)):
+                    return POLL_INTERVAL
+
+            rpm, tpm = self.rate_limit.requests_per_minute, self.rate_limit.tokens_per_minute
+            if rpm and self._request_bucket < 1:
+                return (1 - self._request_bucket) * 60 / rpm
+            # Requests larger than the bucket go through once it is full. They are charged their full cost, so the
+            # bucket goes negative and later requests wait until the tokens are refilled.
+            if tpm and self._token_bucket < min(tokens, tpm):
+                return (min(tokens, tpm) - self._token_bucket) * 60 / tpm
+
+            if rpm:
+                self._request_bucket -= 1
+            if tpm:
+                self._token_bucket -= tokens
+            self.in_flight += 1
+            self.requests += 1
+            return None
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Blocks until the request can be sent. Returns the seconds spent waiting."""
+        start = time.monotonic()
+        while (wait := self.try_acquire(tokens)) is not None:
+            time.sleep(wait)
+        return self._record_wait(start)
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """Waits until the request can be sent without blocking the event loop. Returns the seconds spent waiting."""
+        start = time.monotonic()
+        while (wait := self.try_acquire(tokens)) is not None:
+            await asyncio.sleep(wait)
+        return self._record_wait(start)
+
+    def _record_wait(self, start: float) -> float:
+        waited = time.monotonic() - start
+        with self._lock:
+            self.total_wait_time += waited
+        return waited
+
+    def release(self, error: Optional[BaseException] = None) -> None:
+        """Releases a request reserved with acquire(), adapting the concurrency limit to its outcome"""
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            if error is None:
+                # Additive increase: one more request in flight after a full window of successful requests
+                self._consecutive_rate_limits = 0
+                max_concurrency = self.rate_limit.max_concurrency or math.inf
+                if self.concurrency_limit < max_concurrency:
+                    self.concurrency_limit = min(max_concurrency, self.concurrency_limit + 1 / self.concurrency_limit)
+                return
+            if not is_rate_limit_error(error):
+                return
+
+            self.rate_limited += 1
+            self._consecutive_rate_limits += 1
+            # Halve the number of requests in flight when the request was sent
+            in_flight = min(self.concurrency_limit, self.in_flight + 1)
+            self.concurrency_limit = max(float(self.rate_limit.min_concurrency), math.floor(in_flight / 2))
+            delay = get_retry_after(error)
+            if delay is None:
+                delay = self.rate_limit.backoff * 2 ** (self._consecutive_rate_limits - 1)
+            delay = min(delay, self.rate_limit.max_backoff)
+            self.paused_until = max(self.paused_until, time.monotonic() + delay)
+            logger.warning(
+                f"Rate limited, pausing requests for {delay:.2f}s with a concurrency limit of {self.concurrency_limit}"
+            )
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        return {
+            "requests": self.requests,
+            "rate_limited": self.rate_limited,
+            "in_flight": self.in_flight,
+            "concurrency_limit": self.concurrency_limit,
+            "total_wait_time": self.total_wait_time,
+        }
+
+    def __deepcopy__(self, memo):
+        # Copies share the limiter, it tracks requests across the process
+        return self
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter_key(provider: str, api_key: Optional[str], model_id: Optional[str]) -> str:
+    """Returns the key limiters are shared by. The API key is hashed so it is not kept in memory in plain text."""
+    api_key_hash = sha256(api_key.encode()).hexdigest()[:16] if api_key else ""
+    return f"{provider}:{api_key_hash}:{model_id or ''}"
+
+
+def get_rate_limiter(key: str, rate_limit: RateLimit) -> RateLimiter:
+    """Returns the limiter for the key, creating it with the rate limit on first use.
+
+    The limiter keeps the rate limit it was created with. A different rate limit for the same key is logged once,
+    instead of switching the limits of the shared limiter back and forth between models.
+    """
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None:
+            limiter = _rate_limiters[key] = RateLimiter(rate_limit)
+        elif rate_limit != limiter.rate_limit and rate_limit not in limiter.ignored_rate_limits:
+            limiter.ignored_rate_limits.append(rate_limit)
+            logger.warning(
+                f"Ignoring {rate_limit}: requests with the same provider, API key and model id share a limiter that "
+                f"was created with {limiter.rate_limit}. Use the same rate limit for them, or call "
+                "clear_rate_limiters() to create the limiter again."
+            )
+        return limiter
+
+
+def clear_rate_limiters() -> None:
+    with _rate_limiters_lock:
+        _rate_limiters.clear()
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    status_code = getattr(error, "status_code", None)
+    response = getattr(error, "response", None)
+    if status_code is None and response is not None:
+        status_code = getattr(response, "status_code", None)
+    if status_code == 429:
+        return True
+    # botocore ClientError
+    if isinstance(response, dict) and response.get("Error", {}).get("Code") in RATE_LIMIT_ERROR_CODES:
+        return True
+    if getattr(error, "code", None) in RATE_LIMIT_ERROR_CODES or getattr(error, "code", None) == 429:
+        return True
+    return any(name in type(error).__name__ for name in RATE_LIMIT_ERROR_NAMES)
+
+
+def get_retry_after(error: BaseException) -> Optional[float]:
+    """Returns the seconds to wait from the retry-after headers of the error response, if it has them"""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is None:
+        return None
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if retry_after is None:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+# Limiters held by the current call. Nested calls, like get_embedding() calling response(), reuse the
+# reservation of the outer call instead of waiting for a second one. Generators are not tracked, as their context
+# is shared with the caller between items.
+_active_limiters: ContextVar[FrozenSet[int]] = ContextVar("active_limiters", default=frozenset())
+
+
+def rate_limited(
+    fn: Callable,
+    get_limiter: Callable[[Any], Optional[RateLimiter]],
+    count_tokens: Callable[..., int],
+    on_wait: Optional[Callable[[Any, float], None]] = None,
+) -> Callable:
+    """Wraps a method so each call waits for the limiter returned by get_limiter(self).
+
+    count_tokens(*args, **kwargs) estimates the tokens of a request and on_wait(self, seconds) receives the time
+    spent waiting. Generators hold their reservation until they are exhausted.
+    """
+
+    def _before(self) -> Optional[RateLimiter]:
+        limiter = get_limiter(self)
+        if limiter is None or id(limiter) in _active_limiters.get():
+            return None
+        return limiter
+
+    def _waited(self, waited: float) -> None:
+        if on_wait is not None:
+            on_wait(self, waited)
+
+    def _retries(limiter: RateLimiter, error: Exception, attempt: int) -> bool:
+        return is_rate_limit_error(error) and attempt < limiter.rate_limit.max_retries
+
+    if isasyncgenfunction(fn):
+
+        @wraps(fn)
+        async def async_gen_wrapper(self, *args, **kwargs):
+            limiter = _before(self)
+            if limiter is None:
+                async for item in fn(self, *args, **kwargs):
+                    yield item
+                return
+            _waited(self, await limiter.aacquire(count_tokens(*args, **kwargs)))
+            error: Optional[BaseException] = None
+            try:
+                async for item in fn(self, *args, **kwargs):
+                    yield item
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                limiter.release(error)
+
+        return async_gen_wrapper
+
+    if isgeneratorfunction(fn):
+
+        @wraps(fn)
+        def gen_wrapper(self, *args, **kwargs):
+            limiter = _before(self)
+            if limiter is None:
+                yield from fn(self, *args, **kwargs)
+                return
+            _waited(self, limiter.acquire(count_tokens(*args, **kwargs)))
+            error: Optional[BaseException] = None
+            try:
+                yield from fn(self, *args, **kwargs)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                limiter.release(error)
+
+        return gen_wrapper
+
+    if iscoroutinefunction(fn):
+
+        @wraps(fn)
+        async def async_wrapper(self, *args, **kwargs):
+            limiter = _before(self)
+            if limiter is None:
+                return await fn(self, *args, **kwargs)
+            tokens = count_tokens(*args, **kwargs)
+            attempt = 0
+            while True:
+                _waited(self, await limiter.aacquire(tokens))
+                active = _active_limiters.get()
+                _active_limiters.set(active | {id(limiter)})
+                try:
+                    result = await fn(self, *args, **kwargs)
+                except Exception as e:
+                    limiter.release(e)
+                    if not _retries(limiter, e, attempt):
+                        raise
+                    attempt += 1
+                    continue
+                finally:
+                    _active_limiters.set(active)
+                limiter.release()
+                return result
+
+        return async_wrapper
+
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        limiter = _before(self)
+        if limiter is None:
+            return fn(self, *args, **kwargs)
+        tokens = count_tokens(*args, **kwargs)
+        attempt = 0
+        while True:
+            _waited(self, limiter.acquire(tokens))
+            active = _active_limiters.get()
+            _active_limiters.set(active | {id(limiter)})
+            try:
+                result = fn(self, *args, **kwargs)
+            except Exception as e:
+                limiter.release(e)
+                if not _retries(limiter, e, attempt):
+                    raise
+                attempt += 1
+                continue
+            finally:
+                _active_limiters.set(active)
+            limiter.release()
+            return result
+
+    return wrapper
+
+
+def wrap_rate_limited_methods(
+    cls: type,
+    method_names: FrozenSet[str],
+    get_limiter: Callable[[Any], Optional[RateLimiter]],
+    count_tokens: Callable[..., int],
+    on_wait: Optional[Callable[[Any, float], None]] = None,
+) -> None:
+    """Wraps the methods in method_names defined on cls with rate_limited()"""
+    for name in method_names:
+        method = cls.__dict__.get(name)
+        if method is None or getattr(method, "__isabstractmethod__", False) or hasattr(method, "__rate_limited__"):
+            continue
+        wrapper = rate_limited(method, get_limiter, count_tokens, on_wait)
+        wrapper.__rate_limited__ = True  # type: ignore
+        setattr(cls, name, wrapper)
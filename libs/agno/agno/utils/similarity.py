@@ -0,0 +1,9 @@
+import math
+from typing import Sequence
+
+
+def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    """Returns the cosine similarity of two vectors, 0 if either vector is zero"""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
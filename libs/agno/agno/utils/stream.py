@@ -0,0 +1,36 @@
+from typing import List, Optional
+
+
+class StreamBuffer:
+    """Accumulates streamed text as a list of chunks and joins them only when the value is read.
+
+    Appending to a str attribute copies the whole string on every chunk, which is quadratic in the length of the
+    response. Appending to a StreamBuffer is constant time.
+    """
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, value: str = ""):
+        self._chunks: List[str] = [value] if value else []
+
+    def append(self, text: Optional[str]) -> None:
+        if text:
+            self._chunks.append(text)
+
+    def getvalue(self) -> str:
+        if len(self._chunks) > 1:
+            # Keep the joined value, so reading again does not join again
+            self._chunks[:] = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def __str__(self) -> str:
+        return self.getvalue()
+
+    def __bool__(self) -> bool:
+        return len(self._chunks) > 0
+
+    def __len__(self) -> int:
+        return sum(len(chunk) for chunk in self._chunks)
+
+    def __repr__(self) -> str:
+        return f"StreamBuffer({self.getvalue()!r})"
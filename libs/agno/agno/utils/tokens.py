@@ -0,0 +1,17 @@
+import json
+
+from agno.models.message import Message
+
+
+def estimate_tokens(text: str) -> int:
+    """Conservative token estimate used to keep batch requests under provider limits"""
+    return len(text) // 3 + 1
+
+
+def estimate_message_tokens(message: Message) -> int:
+    """Estimate the number of tokens a message takes up in the model context"""
+    tokens = estimate_tokens(message.get_content_string())
+    if message.tool_calls:
+        tokens += estimate_tokens(json.dumps(message.tool_calls, default=str))
+    # Role and formatting overhead of each message
+    return tokens + 4
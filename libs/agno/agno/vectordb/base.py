@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from agno.document import Document
 
@@ -19,6 +20,18 @@ class VectorDb(ABC):
     def name_exists(self, name: str) -> bool:
         raise NotImplementedError
 
+    def doc_exists_batch(self, documents: List[Document]) -> List[bool]:
+        """Returns whether each document exists in the vector db, in the same order as documents.
+
+        Vector dbs that can check many documents in a single query should override this method.
+        The default implementation checks each document individually.
+        """
+        return [self.doc_exists(document) for document in documents]
+
+    def content_hashes_exist(self, content_hashes: List[str]) -> Set[str]:
+        """Returns the subset of content_hashes that are already stored in the vector db"""
+        raise NotImplementedError
+
     def id_exists(self, id: str) -> bool:
         raise NotImplementedError
 
@@ -46,6 +59,32 @@ class VectorDb(ABC):
     def hybrid_search(self, query: str, limit: int = 5) -> List[Document]:
         raise NotImplementedError
 
+    async def async_create(self) -> None:
+        """Async version of create(). Runs the sync implementation in a thread unless overridden."""
+        await asyncio.to_thread(self.create)
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        """Async version of doc_exists(). Runs the sync implementation in a thread unless overridden."""
+        return await asyncio.to_thread(self.doc_exists, document)
+
+    async def async_doc_exists_batch(self, documents: List[Document]) -> List[bool]:
+        """Async version of doc_exists_batch(). Runs the sync implementation in a thread unless overridden."""
+        return await asyncio.to_thread(self.doc_exists_batch, documents)
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Async version of insert(). Runs the sync implementation in a thread unless overridden."""
+        await asyncio.to_thread(self.insert, documents, filters)
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Async version of upsert(). Runs the sync implementation in a thread unless overridden."""
+        await asyncio.to_thread(self.upsert, documents, filters)
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Async version of search(). Runs the sync implementation in a thread unless overridden."""
+        return await asyncio.to_thread(self.search, query, limit, filters)
+
     @abstractmethod
     def drop(self) -> None:
         raise NotImplementedError
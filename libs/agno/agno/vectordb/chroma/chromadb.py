@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from chromadb import Client as ChromaDbClient
@@ -101,6 +101,32 @@ class ChromaDb(VectorDb):
                 logger.error(f"Document does not exist: {e}")
         return False
 
+    def content_hashes_exist(self, content_hashes: List[str]) -> Set[str]:
+        """Return the content hashes that are already stored as document ids.
+        Args:
+            content_hashes (List[str]): Content hashes to check.
+        Returns:
+            Set[str]: The subset of content_hashes that exist in the collection."""
+        if not content_hashes or not self.client:
+            return set()
+        try:
+            collection: Collection = self.client.get_collection(name=self.collection)
+            collection_data: GetResult = collection.get(ids=content_hashes, include=[])
+            return set(collection_data.get("ids", []))
+        except Exception as e:
+            logger.error(f"Error checking if documents exist: {e}")
+        return set()
+
+    def doc_exists_batch(self, documents: List[Document]) -> List[bool]:
+        """Check which documents exist in the collection, using a single request.
+        Args:
+            documents (List[Document]): Documents to check.
+        Returns:
+            List[bool]: Whether each document exists, in the same order as documents."""
+        content_hashes = [md5(doc.content.replace("\x00", "\ufffd").encode()).hexdigest() for doc in documents]
+        existing = self.content_hashes_exist(content_hashes)
+        return [content_hash in existing for content_hash in content_hashes]
+
     def name_exists(self, name: str) -> bool:
         """Check if a document with a given name exists in the collection.
         Args:
@@ -129,8 +155,8 @@ class ChromaDb(VectorDb):
         docs: List = []
         docs_embeddings: List = []
 
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
@@ -160,8 +186,8 @@ class ChromaDb(VectorDb):
         docs: List = []
         docs_embeddings: List = []
 
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from agno.vectordb.clickhouse.index import HNSW
 
@@ -142,6 +142,35 @@ class Clickhouse(VectorDb):
         )
         return bool(result.result_rows)
 
+    def content_hashes_exist(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the table, using a single query
+
+        Args:
+            content_hashes (List[str]): Content hashes to check
+        """
+        if not content_hashes:
+            return set()
+        parameters = self._get_base_parameters()
+        parameters["content_hashes"] = content_hashes
+
+        result = self.client.query(
+            "SELECT content_hash FROM {database_name:Identifier}.{table_name:Identifier} WHERE has({content_hashes:Array(String)}, content_hash)",
+            parameters=parameters,
+        )
+        return {row[0] for row in result.result_rows}
+
+    def doc_exists_batch(self, documents: List[Document]) -> List[bool]:
+        """
+        Validating which documents exist, using a single query
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        content_hashes = [md5(doc.content.replace("\x00", "\ufffd").encode()).hexdigest() for doc in documents]
+        existing = self.content_hashes_exist(content_hashes)
+        return [content_hash in existing for content_hash in content_hashes]
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a row with this name exists or not
@@ -180,8 +209,8 @@ class Clickhouse(VectorDb):
         filters: Optional[Dict[str, Any]] = None,
     ) -> None:
         rows: List[List[Any]] = []
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             content_hash = md5(cleaned_content.encode()).hexdigest()
             _id = document.id or content_hash
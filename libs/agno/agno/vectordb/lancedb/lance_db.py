@@ -1,3 +1,4 @@
+import asyncio
 import json
 from hashlib import md5
 from typing import Any, Dict, List, Optional
@@ -50,7 +51,11 @@ class LanceDb(VectorDb):
 
         # LanceDB connection details
         self.uri: lancedb.URI = uri
+        self.api_key: Optional[str] = api_key
         self.connection: lancedb.LanceDBConnection = connection or lancedb.connect(uri=self.uri, api_key=api_key)
+        # Async connection and table used by the async_* methods, opened lazily
+        self._async_connection: Optional[Any] = None
+        self._async_table: Optional[Any] = None
 
         self.table: Optional[lancedb.db.LanceTable] = table
         self.table_name: Optional[str] = table_name
@@ -102,6 +107,14 @@ class LanceDb(VectorDb):
         if not self.exists():
             self.connection = self._init_table()  # Connection update is needed
 
+    async def _get_async_table(self) -> Any:
+        """Open the table using the async LanceDB API."""
+        if self._async_table is None:
+            if self._async_connection is None:
+                self._async_connection = await lancedb.connect_async(uri=self.uri, api_key=self.api_key)
+            self._async_table = await self._async_connection.open_table(self.table_name)
+        return self._async_table
+
     def _init_table(self) -> lancedb.db.LanceTable:
         schema = pa.schema(
             [
@@ -135,6 +148,21 @@ class LanceDb(VectorDb):
             return len(result) > 0
         return False
 
+    async def async_doc_exists(self, document: Document) -> bool:
+        """
+        Validating if the document exists or not, without blocking the event loop
+
+        Args:
+            document (Document): Document to validate
+        """
+        if self.table is not None:
+            cleaned_content = document.content.replace("\x00", "\ufffd")
+            doc_id = md5(cleaned_content.encode()).hexdigest()
+            table = await self._get_async_table()
+            result = await table.query().where(f"{self._id}='{doc_id}'").limit(1).to_arrow()
+            return len(result) > 0
+        return False
+
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
         Insert documents into the database.
@@ -144,13 +172,54 @@ class LanceDb(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while inserting documents
         """
         logger.debug(f"Inserting {len(documents)} documents")
-        data = []
         if len(documents) <= 0:
             logger.debug("No documents to insert")
             return
 
+        Document.embed_batch(documents, embedder=self.embedder)
+        data = self._get_rows(documents)
+
+        if self.table is None:
+            logger.error("Table not initialized. Please create the table first")
+            return
+
+        if not data:
+            logger.debug("No new data to insert")
+            return
+
+        self.table.add(data)
+        logger.debug(f"Inserted {len(data)} documents")
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Insert documents into the database without blocking the event loop.
+
+        Args:
+            documents (List[Document]): List of documents to insert
+            filters (Optional[Dict[str, Any]]): Filters to apply while inserting documents
+        """
+        logger.debug(f"Inserting {len(documents)} documents")
+        if len(documents) <= 0:
+            logger.debug("No documents to insert")
+            return
+
+        if self.table is None:
+            logger.error("Table not initialized. Please create the table first")
+            return
+
+        await Document.async_embed_batch(documents, embedder=self.embedder)
+        data = self._get_rows(documents)
+        if not data:
+            logger.debug("No new data to insert")
+            return
+
+        table = await self._get_async_table()
+        await table.add(data)
+        logger.debug(f"Inserted {len(data)} documents")
+
+    def _get_rows(self, documents: List[Document]) -> List[Dict[str, Any]]:
+        data = []
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -167,17 +236,7 @@ class LanceDb(VectorDb):
                 }
             )
             logger.debug(f"Parsed document: {document.name} ({document.meta_data})")
-
-        if self.table is None:
-            logger.error("Table not initialized. Please create the table first")
-            return
-
-        if not data:
-            logger.debug("No new data to insert")
-            return
-
-        self.table.add(data)
-        logger.debug(f"Inserted {len(data)} documents")
+        return data
 
     def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -189,6 +248,16 @@ class LanceDb(VectorDb):
         """
         self.insert(documents)
 
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Upsert documents into the database without blocking the event loop.
+
+        Args:
+            documents (List[Document]): List of documents to upsert
+            filters (Optional[Dict[str, Any]]): Filters to apply while upserting
+        """
+        await self.async_insert(documents)
+
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         if self.search_type == SearchType.vector:
             return self.vector_search(query, limit)
@@ -200,6 +269,34 @@ class LanceDb(VectorDb):
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
 
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        # Full-text search needs the (sync) FTS index, so only vector search is natively async
+        if self.search_type != SearchType.vector:
+            return await super().async_search(query=query, limit=limit, filters=filters)
+
+        query_embedding = await self.embedder.async_get_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        if self.table is None:
+            logger.error("Table not initialized. Please create the table first")
+            return []
+
+        table = await self._get_async_table()
+        results = table.vector_search(query_embedding).column(self._vector_col).limit(limit)
+        if self.nprobes:
+            results = results.nprobes(self.nprobes)
+
+        search_results = self._build_search_results(await results.to_pandas())
+
+        if self.reranker:
+            search_results = await asyncio.to_thread(self.reranker.rerank, query=query, documents=search_results)
+
+        return search_results
+
     def vector_search(self, query: str, limit: int = 5) -> List[Document]:
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from pymilvus import MilvusClient  # type: ignore
@@ -102,6 +102,33 @@ class Milvus(VectorDb):
             return len(collection_points) > 0
         return False
 
+    def content_hashes_exist(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that are already stored as document ids, using a single request
+
+        Args:
+            content_hashes (List[str]): Content hashes to check
+        """
+        if not content_hashes or not self.client:
+            return set()
+        collection_points = self.client.get(
+            collection_name=self.collection,
+            ids=content_hashes,
+            output_fields=["id"],
+        )
+        return {point["id"] for point in collection_points}
+
+    def doc_exists_batch(self, documents: List[Document]) -> List[bool]:
+        """
+        Validating which documents exist, using a single request
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        content_hashes = [md5(doc.content.replace("\x00", "\ufffd").encode()).hexdigest() for doc in documents]
+        existing = self.content_hashes_exist(content_hashes)
+        return [content_hash in existing for content_hash in content_hashes]
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -141,8 +168,8 @@ class Milvus(VectorDb):
             batch_size (int): Batch size for inserting documents
         """
         logger.debug(f"Inserting {len(documents)} documents")
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -177,8 +204,8 @@ class Milvus(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while upserting
         """
         logger.debug(f"Upserting {len(documents)} documents")
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -1,5 +1,6 @@
+import asyncio
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from agno.document import Document
 from agno.embedder import Embedder
@@ -67,6 +68,8 @@ class MongoDb(VectorDb):
         self._client = self._get_client()
         self._db = self._client[self.database]
         self._collection = self._get_or_create_collection()
+        # Async client used by the async_* methods, created lazily
+        self._async_client: Optional[Any] = None
 
     def _get_client(self) -> MongoClient:
         """Create or retrieve the MongoDB client."""
@@ -84,6 +87,19 @@ class MongoDb(VectorDb):
             logger.error(f"An error occurred while connecting to MongoDB: {e}")
             raise
 
+    @property
+    def async_collection(self) -> Any:
+        """Get the collection from an async (motor) MongoDB client, creating the client if needed."""
+        if self._async_client is None:
+            try:
+                from motor.motor_asyncio import AsyncIOMotorClient
+            except ImportError:
+                raise ImportError("`motor` not installed. Please install using `pip install motor`")
+
+            logger.debug("Creating async MongoDB Client")
+            self._async_client = AsyncIOMotorClient(self.connection_string, **self.kwargs)
+        return self._async_client[self.database][self.collection_name]
+
     def _get_or_create_collection(self) -> Collection:
         """Get or create the MongoDB collection, handling Atlas Search index creation."""
 
@@ -181,6 +197,52 @@ class MongoDb(VectorDb):
             logger.error(f"Error checking document existence: {e}")
             return False
 
+    async def async_doc_exists(self, document: Document) -> bool:
+        """Check if a document exists in the MongoDB collection without blocking the event loop."""
+        doc_id = md5(document.content.encode("utf-8")).hexdigest()
+        try:
+            exists = await self.async_collection.find_one({"_id": doc_id}) is not None
+            logger.debug(f"Document {'exists' if exists else 'does not exist'}: {doc_id}")
+            return exists
+        except Exception as e:
+            logger.error(f"Error checking document existence: {e}")
+            return False
+
+    def content_hashes_exist(self, content_hashes: List[str]) -> Set[str]:
+        """Return the content hashes that are already stored as document ids, using a single query."""
+        if not content_hashes:
+            return set()
+        try:
+            cursor = self._collection.find({"_id": {"$in": content_hashes}}, {"_id": 1})
+            return {doc["_id"] for doc in cursor}
+        except Exception as e:
+            logger.error(f"Error checking document existence: {e}")
+            return set()
+
+    async def async_content_hashes_exist(self, content_hashes: List[str]) -> Set[str]:
+        """Return the content hashes that are already stored as document ids, without blocking the event loop."""
+        if not content_hashes:
+            return set()
+        try:
+            cursor = self.async_collection.find({"_id": {"$in": content_hashes}}, {"_id": 1})
+            return {doc["_id"] async for doc in cursor}
+        except Exception as e:
+            logger.error(f"Error checking document existence: {e}")
+            return set()
+
+    def doc_exists_batch(self, documents: List[Document]) -> List[bool]:
+        """Check which documents exist in the MongoDB collection, using a single query."""
+        # Ids are computed the same way as in prepare_doc
+        content_hashes = [md5(doc.content.replace("\x00", "\ufffd").encode("utf-8")).hexdigest() for doc in documents]
+        existing = self.content_hashes_exist(content_hashes)
+        return [content_hash in existing for content_hash in content_hashes]
+
+    async def async_doc_exists_batch(self, documents: List[Document]) -> List[bool]:
+        """Check which documents exist in the MongoDB collection without blocking the event loop."""
+        content_hashes = [md5(doc.content.replace("\x00", "\ufffd").encode("utf-8")).hexdigest() for doc in documents]
+        existing = await self.async_content_hashes_exist(content_hashes)
+        return [content_hash in existing for content_hash in content_hashes]
+
     def name_exists(self, name: str) -> bool:
         """Check if a document with a given name exists in the collection."""
         try:
@@ -205,6 +267,7 @@ class MongoDb(VectorDb):
         """Insert documents into the MongoDB collection."""
         logger.info(f"Inserting {len(documents)} documents")
 
+        Document.embed_batch(documents, embedder=self.embedder)
         prepared_docs = []
         for document in documents:
             try:
@@ -230,6 +293,7 @@ class MongoDb(VectorDb):
         """Upsert documents into the MongoDB collection."""
         logger.info(f"Upserting {len(documents)} documents")
 
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
@@ -242,6 +306,46 @@ class MongoDb(VectorDb):
             except Exception as e:
                 logger.error(f"Error upserting document '{document.name}': {e}")
 
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents into the MongoDB collection without blocking the event loop."""
+        logger.info(f"Inserting {len(documents)} documents")
+
+        await Document.async_embed_batch(documents, embedder=self.embedder)
+        prepared_docs = []
+        for document in documents:
+            try:
+                prepared_docs.append(self.prepare_doc(document))
+            except ValueError as e:
+                logger.error(f"Error preparing document '{document.name}': {e}")
+
+        if prepared_docs:
+            try:
+                await self.async_collection.insert_many(prepared_docs, ordered=False)
+                logger.info(f"Inserted {len(prepared_docs)} documents successfully.")
+                if self.wait_after_insert and self.wait_after_insert > 0:
+                    await asyncio.sleep(self.wait_after_insert)
+            except errors.BulkWriteError as e:
+                logger.warning(f"Bulk write error while inserting documents: {e.details}")
+            except Exception as e:
+                logger.error(f"Error inserting documents: {e}")
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Upsert documents into the MongoDB collection without blocking the event loop."""
+        logger.info(f"Upserting {len(documents)} documents")
+
+        await Document.async_embed_batch(documents, embedder=self.embedder)
+        for document in documents:
+            try:
+                doc_data = self.prepare_doc(document)
+                await self.async_collection.update_one(
+                    {"_id": doc_data["_id"]},
+                    {"$set": doc_data},
+                    upsert=True,
+                )
+                logger.info(f"Upserted document: {doc_data['_id']}")
+            except Exception as e:
+                logger.error(f"Error upserting document '{document.name}': {e}")
+
     def upsert_available(self) -> bool:
         """Indicate that upsert functionality is available."""
         return True
@@ -254,36 +358,57 @@ class MongoDb(VectorDb):
             return []
 
         try:
-            pipeline = [
-                {
-                    "$vectorSearch": {
-                        "index": "vector_index_1",
-                        "limit": 10,
-                        "numCandidates": 10,
-                        "queryVector": self.embedder.get_embedding(query),
-                        "path": "embedding",
-                    }
-                },
-                {"$set": {"score": {"$meta": "vectorSearchScore"}}},
-            ]
-            pipeline.append({"$project": {"embedding": 0}})
-            agg = list(self._collection.aggregate(pipeline))  # type: ignore
-            docs = []
-            for doc in agg:
-                docs.append(
-                    Document(
-                        id=str(doc["_id"]),
-                        name=doc.get("name"),
-                        content=doc["content"],
-                        meta_data=doc.get("meta_data", {}),
-                    )
-                )
+            agg = list(self._collection.aggregate(self._get_search_pipeline(query_embedding)))  # type: ignore
+            docs = [self._get_search_result(doc) for doc in agg]
+            logger.info(f"Search completed. Found {len(docs)} documents.")
+            return docs
+        except Exception as e:
+            logger.error(f"Error during search: {e}")
+            return []
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Search the MongoDB collection for documents relevant to the query without blocking the event loop."""
+        query_embedding = await self.embedder.async_get_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Failed to generate embedding for query: {query}")
+            return []
+
+        try:
+            cursor = self.async_collection.aggregate(self._get_search_pipeline(query_embedding))
+            docs = [self._get_search_result(doc) async for doc in cursor]
             logger.info(f"Search completed. Found {len(docs)} documents.")
             return docs
         except Exception as e:
             logger.error(f"Error during search: {e}")
             return []
 
+    def _get_search_pipeline(self, query_embedding: List[float]) -> List[Dict[str, Any]]:
+        """Build the aggregation pipeline for a vector search."""
+        return [
+            {
+                "$vectorSearch": {
+                    "index": "vector_index_1",
+                    "limit": 10,
+                    "numCandidates": 10,
+                    "queryVector": query_embedding,
+                    "path": "embedding",
+                }
+            },
+            {"$set": {"score": {"$meta": "vectorSearchScore"}}},
+            {"$project": {"embedding": 0}},
+        ]
+
+    def _get_search_result(self, doc: Dict[str, Any]) -> Document:
+        """Convert a search result into a Document."""
+        return Document(
+            id=str(doc["_id"]),
+            name=doc.get("name"),
+            content=doc["content"],
+            meta_data=doc.get("meta_data", {}),
+        )
+
     def vector_search(self, query: str, limit: int = 5) -> List[Document]:
         """Perform a vector-based search."""
         logger.debug("Performing vector search.")
@@ -360,7 +485,8 @@ class MongoDb(VectorDb):
 
     def prepare_doc(self, document: Document) -> Dict[str, Any]:
         """Prepare a document for insertion or upsertion into MongoDB."""
-        document.embed(embedder=self.embedder)
+        if document.embedding is None:
+            document.embed(embedder=self.embedder)
         if document.embedding is None:
             raise ValueError(f"Failed to generate embedding for document: {document.id}")
 
@@ -1,10 +1,11 @@
+import asyncio
 from hashlib import md5
 from math import sqrt
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union, cast
 
 try:
     from sqlalchemy.dialects import postgresql
-    from sqlalchemy.engine import Engine, create_engine
+    from sqlalchemy.engine import Engine, create_engine, make_url
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, scoped_session, sessionmaker
     from sqlalchemy.schema import Column, Index, MetaData, Table
@@ -18,6 +19,9 @@ try:
 except ImportError:
     raise ImportError("`pgvector` not installed. Please install using `pip install pgvector`")
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
 from agno.document import Document
 from agno.embedder import Embedder
 from agno.reranker.base import Reranker
@@ -42,6 +46,7 @@ class PgVector(VectorDb):
         schema: str = "ai",
         db_url: Optional[str] = None,
         db_engine: Optional[Engine] = None,
+        async_db_engine: Optional["AsyncEngine"] = None,
         embedder: Optional[Embedder] = None,
         search_type: SearchType = SearchType.vector,
         vector_index: Union[Ivfflat, HNSW] = HNSW(),
@@ -61,6 +66,8 @@ class PgVector(VectorDb):
             schema (str): Database schema name.
             db_url (Optional[str]): Database connection URL.
             db_engine (Optional[Engine]): SQLAlchemy database engine.
+            async_db_engine (Optional[AsyncEngine]): SQLAlchemy async database engine used by the async methods.
+                Created from the sync engine's URL on first use if not provided.
             embedder (Optional[Embedder]): Embedder instance for creating embeddings.
             search_type (SearchType): Type of search to perform.
             vector_index (Union[Ivfflat, HNSW]): Vector index configuration.
@@ -127,10 +134,50 @@ class PgVector(VectorDb):
 
         # Database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+        # Async database engine and session, created lazily
+        self._async_db_engine: Optional["AsyncEngine"] = async_db_engine
+        self._async_session: Optional["async_sessionmaker[AsyncSession]"] = None
         # Database table
         self.table: Table = self.get_table()
         logger.debug(f"Initialized PgVector with table '{self.schema}.{self.table_name}'")
 
+    @property
+    def async_db_engine(self) -> "AsyncEngine":
+        """
+        Get the async database engine, creating it from the sync engine's URL if needed.
+
+        Returns:
+            AsyncEngine: SQLAlchemy async database engine.
+        """
+        if self._async_db_engine is None:
+            try:
+                from sqlalchemy.ext.asyncio import create_async_engine
+            except ImportError:
+                raise ImportError(
+                    "`sqlalchemy[asyncio]` not installed. Please install using `pip install 'sqlalchemy[asyncio]'`"
+                )
+
+            url = make_url(self.db_url) if self.db_url is not None else self.db_engine.url
+            # psycopg2 has no async support, psycopg (v3) does
+            if url.drivername in ("postgresql", "postgresql+psycopg2"):
+                url = url.set(drivername="postgresql+psycopg")
+            self._async_db_engine = create_async_engine(url)
+        return self._async_db_engine
+
+    @property
+    def AsyncSession(self) -> "async_sessionmaker[AsyncSession]":
+        """
+        Get the async session factory bound to the async database engine.
+
+        Returns:
+            async_sessionmaker[AsyncSession]: Factory for async database sessions.
+        """
+        if self._async_session is None:
+            from sqlalchemy.ext.asyncio import async_sessionmaker
+
+            self._async_session = async_sessionmaker(bind=self.async_db_engine)
+        return self._async_session
+
     def get_table_v1(self) -> Table:
         """
         Get the SQLAlchemy Table object for schema version 1.
@@ -203,6 +250,24 @@ class PgVector(VectorDb):
             logger.debug(f"Creating table: {self.table_name}")
             self.table.create(self.db_engine)
 
+    async def async_create(self) -> None:
+        """
+        Create the table if it does not exist, using the async engine.
+        """
+        async with self.async_db_engine.begin() as conn:
+            table_exists = await conn.run_sync(
+                lambda sync_conn: inspect(sync_conn).has_table(self.table_name, schema=self.schema)
+            )
+            if table_exists:
+                return
+            logger.debug("Creating extension: vector")
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector;"))
+            if self.schema is not None:
+                logger.debug(f"Creating schema: {self.schema}")
+                await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.schema};"))
+            logger.debug(f"Creating table: {self.table_name}")
+            await conn.run_sync(self.table.create)
+
     def _record_exists(self, column, value) -> bool:
         """
         Check if a record with the given column value exists in the table.
@@ -237,6 +302,102 @@ class PgVector(VectorDb):
         content_hash = md5(cleaned_content.encode()).hexdigest()
         return self._record_exists(self.table.c.content_hash, content_hash)
 
+    async def async_doc_exists(self, document: Document) -> bool:
+        """
+        Check if a document with the same content hash exists in the table, without blocking the event loop.
+
+        Args:
+            document (Document): The document to check.
+
+        Returns:
+            bool: True if the document exists, False otherwise.
+        """
+        cleaned_content = document.content.replace("\x00", "\ufffd")
+        content_hash = md5(cleaned_content.encode()).hexdigest()
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                stmt = select(1).where(self.table.c.content_hash == content_hash).limit(1)
+                result = (await sess.execute(stmt)).first()
+                return result is not None
+        except Exception as e:
+            logger.error(f"Error checking if record exists: {e}")
+            return False
+
+    def _get_content_hashes_exist_stmt(self, content_hashes: List[str]):
+        """Select the content hashes that exist, sending all hashes as a single array parameter."""
+        return select(self.table.c.content_hash).where(
+            self.table.c.content_hash
+            == func.any(bindparam("content_hashes", value=content_hashes, type_=postgresql.ARRAY(String)))
+        )
+
+    def content_hashes_exist(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the table, using a single query.
+
+        Args:
+            content_hashes (List[str]): The content hashes to check.
+
+        Returns:
+            Set[str]: The subset of content_hashes that exist in the table.
+        """
+        if not content_hashes:
+            return set()
+        try:
+            with self.Session() as sess, sess.begin():
+                result = sess.execute(self._get_content_hashes_exist_stmt(content_hashes))
+                return {row.content_hash for row in result}
+        except Exception as e:
+            logger.error(f"Error checking if records exist: {e}")
+            return set()
+
+    async def async_content_hashes_exist(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the table, without blocking the event loop.
+
+        Args:
+            content_hashes (List[str]): The content hashes to check.
+
+        Returns:
+            Set[str]: The subset of content_hashes that exist in the table.
+        """
+        if not content_hashes:
+            return set()
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                result = await sess.execute(self._get_content_hashes_exist_stmt(content_hashes))
+                return {row.content_hash for row in result}
+        except Exception as e:
+            logger.error(f"Error checking if records exist: {e}")
+            return set()
+
+    def doc_exists_batch(self, documents: List[Document]) -> List[bool]:
+        """
+        Check which documents already exist in the table, using a single query.
+
+        Args:
+            documents (List[Document]): The documents to check.
+
+        Returns:
+            List[bool]: Whether each document exists, in the same order as documents.
+        """
+        content_hashes = [md5(doc.content.replace("\x00", "\ufffd").encode()).hexdigest() for doc in documents]
+        existing = self.content_hashes_exist(content_hashes)
+        return [content_hash in existing for content_hash in content_hashes]
+
+    async def async_doc_exists_batch(self, documents: List[Document]) -> List[bool]:
+        """
+        Check which documents already exist in the table, without blocking the event loop.
+
+        Args:
+            documents (List[Document]): The documents to check.
+
+        Returns:
+            List[bool]: Whether each document exists, in the same order as documents.
+        """
+        content_hashes = [md5(doc.content.replace("\x00", "\ufffd").encode()).hexdigest() for doc in documents]
+        existing = await self.async_content_hashes_exist(content_hashes)
+        return [content_hash in existing for content_hash in content_hashes]
+
     def name_exists(self, name: str) -> bool:
         """
         Check if a document with the given name exists in the table.
@@ -273,6 +434,60 @@ class PgVector(VectorDb):
         """
         return content.replace("\x00", "\ufffd")
 
+    def _get_records(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Convert embedded documents into table records.
+
+        Args:
+            documents (List[Document]): List of embedded documents.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+
+        Returns:
+            List[Dict[str, Any]]: List of records ready to be written to the table.
+        """
+        records = []
+        for doc in documents:
+            try:
+                cleaned_content = self._clean_content(doc.content)
+                content_hash = md5(cleaned_content.encode()).hexdigest()
+                _id = doc.id or content_hash
+                records.append(
+                    {
+                        "id": _id,
+                        "name": doc.name,
+                        "meta_data": doc.meta_data,
+                        "filters": filters,
+                        "content": cleaned_content,
+                        "embedding": doc.embedding,
+                        "usage": doc.usage,
+                        "content_hash": content_hash,
+                    }
+                )
+            except Exception as e:
+                logger.error(f"Error processing document '{doc.name}': {e}")
+        return records
+
+    def _get_upsert_stmt(self, records: List[Dict[str, Any]]):
+        """
+        Build an INSERT ... ON CONFLICT DO UPDATE statement for the given records.
+
+        Args:
+            records (List[Dict[str, Any]]): List of records to upsert.
+        """
+        insert_stmt = postgresql.insert(self.table).values(records)
+        return insert_stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_=dict(
+                name=insert_stmt.excluded.name,
+                meta_data=insert_stmt.excluded.meta_data,
+                filters=insert_stmt.excluded.filters,
+                content=insert_stmt.excluded.content,
+                embedding=insert_stmt.excluded.embedding,
+                usage=insert_stmt.excluded.usage,
+                content_hash=insert_stmt.excluded.content_hash,
+            ),
+        )
+
     def insert(
         self,
         documents: List[Document],
@@ -293,27 +508,11 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     logger.debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the whole batch in as few requests as the embedder allows
+                        Document.embed_batch(batch_docs, embedder=self.embedder)
+
                         # Prepare documents for insertion
-                        batch_records = []
-                        for doc in batch_docs:
-                            try:
-                                doc.embed(embedder=self.embedder)
-                                cleaned_content = self._clean_content(doc.content)
-                                content_hash = md5(cleaned_content.encode()).hexdigest()
-                                _id = doc.id or content_hash
-                                record = {
-                                    "id": _id,
-                                    "name": doc.name,
-                                    "meta_data": doc.meta_data,
-                                    "filters": filters,
-                                    "content": cleaned_content,
-                                    "embedding": doc.embedding,
-                                    "usage": doc.usage,
-                                    "content_hash": content_hash,
-                                }
-                                batch_records.append(record)
-                            except Exception as e:
-                                logger.error(f"Error processing document '{doc.name}': {e}")
+                        batch_records = self._get_records(batch_docs, filters=filters)
 
                         # Insert the batch of records
                         insert_stmt = postgresql.insert(self.table)
@@ -328,6 +527,39 @@ class PgVector(VectorDb):
             logger.error(f"Error inserting documents: {e}")
             raise
 
+    async def async_insert(
+        self,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+    ) -> None:
+        """
+        Insert documents into the database using the async engine.
+
+        Args:
+            documents (List[Document]): List of documents to insert.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+            batch_size (int): Number of documents to insert in each batch.
+        """
+        try:
+            async with self.AsyncSession() as sess:
+                for i in range(0, len(documents), batch_size):
+                    batch_docs = documents[i : i + batch_size]
+                    logger.debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
+                    try:
+                        await Document.async_embed_batch(batch_docs, embedder=self.embedder)
+                        batch_records = self._get_records(batch_docs, filters=filters)
+                        await sess.execute(postgresql.insert(self.table), batch_records)
+                        await sess.commit()
+                        logger.info(f"Inserted batch of {len(batch_records)} documents.")
+                    except Exception as e:
+                        logger.error(f"Error with batch starting at index {i}: {e}")
+                        await sess.rollback()
+                        raise
+        except Exception as e:
+            logger.error(f"Error inserting documents: {e}")
+            raise
+
     def upsert_available(self) -> bool:
         """
         Check if upsert operation is available.
@@ -357,43 +589,14 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     logger.debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the whole batch in as few requests as the embedder allows
+                        Document.embed_batch(batch_docs, embedder=self.embedder)
+
                         # Prepare documents for upserting
-                        batch_records = []
-                        for doc in batch_docs:
-                            try:
-                                doc.embed(embedder=self.embedder)
-                                cleaned_content = self._clean_content(doc.content)
-                                content_hash = md5(cleaned_content.encode()).hexdigest()
-                                _id = doc.id or content_hash
-                                record = {
-                                    "id": _id,
-                                    "name": doc.name,
-                                    "meta_data": doc.meta_data,
-                                    "filters": filters,
-                                    "content": cleaned_content,
-                                    "embedding": doc.embedding,
-                                    "usage": doc.usage,
-                                    "content_hash": content_hash,
-                                }
-                                batch_records.append(record)
-                            except Exception as e:
-                                logger.error(f"Error processing document '{doc.name}': {e}")
+                        batch_records = self._get_records(batch_docs, filters=filters)
 
                         # Upsert the batch of records
-                        insert_stmt = postgresql.insert(self.table).values(batch_records)
-                        upsert_stmt = insert_stmt.on_conflict_do_update(
-                            index_elements=["id"],
-                            set_=dict(
-                                name=insert_stmt.excluded.name,
-                                meta_data=insert_stmt.excluded.meta_data,
-                                filters=insert_stmt.excluded.filters,
-                                content=insert_stmt.excluded.content,
-                                embedding=insert_stmt.excluded.embedding,
-                                usage=insert_stmt.excluded.usage,
-                                content_hash=insert_stmt.excluded.content_hash,
-                            ),
-                        )
-                        sess.execute(upsert_stmt)
+                        sess.execute(self._get_upsert_stmt(batch_records))
                         sess.commit()  # Commit batch independently
                         logger.info(f"Upserted batch of {len(batch_records)} documents.")
                     except Exception as e:
@@ -404,6 +607,39 @@ class PgVector(VectorDb):
             logger.error(f"Error upserting documents: {e}")
             raise
 
+    async def async_upsert(
+        self,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+    ) -> None:
+        """
+        Upsert (insert or update) documents in the database using the async engine.
+
+        Args:
+            documents (List[Document]): List of documents to upsert.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+            batch_size (int): Number of documents to upsert in each batch.
+        """
+        try:
+            async with self.AsyncSession() as sess:
+                for i in range(0, len(documents), batch_size):
+                    batch_docs = documents[i : i + batch_size]
+                    logger.debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
+                    try:
+                        await Document.async_embed_batch(batch_docs, embedder=self.embedder)
+                        batch_records = self._get_records(batch_docs, filters=filters)
+                        await sess.execute(self._get_upsert_stmt(batch_records))
+                        await sess.commit()
+                        logger.info(f"Upserted batch of {len(batch_records)} documents.")
+                    except Exception as e:
+                        logger.error(f"Error with batch starting at index {i}: {e}")
+                        await sess.rollback()
+                        raise
+        except Exception as e:
+            logger.error(f"Error upserting documents: {e}")
+            raise
+
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
         Perform a search based on the configured search type.
@@ -426,6 +662,143 @@ class PgVector(VectorDb):
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
 
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """
+        Perform a search based on the configured search type using the async engine.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        try:
+            if self.search_type == SearchType.keyword:
+                stmt = self._get_keyword_search_stmt(query=query, limit=limit, filters=filters)
+            elif self.search_type in (SearchType.vector, SearchType.hybrid):
+                query_embedding = await self.embedder.async_get_embedding(query)
+                if query_embedding is None:
+                    logger.error(f"Error getting embedding for Query: {query}")
+                    return []
+                if self.search_type == SearchType.vector:
+                    stmt = self._get_vector_search_stmt(query_embedding=query_embedding, limit=limit, filters=filters)
+                else:
+                    stmt = self._get_hybrid_search_stmt(
+                        query=query, query_embedding=query_embedding, limit=limit, filters=filters
+                    )
+            else:
+                logger.error(f"Invalid search type '{self.search_type}'.")
+                return []
+            if stmt is None:
+                return []
+
+            logger.debug(f"Async {self.search_type.value} search query: {stmt}")
+            try:
+                async with self.AsyncSession() as sess, sess.begin():
+                    index_settings = self._get_vector_index_settings()
+                    if index_settings is not None and self.search_type != SearchType.keyword:
+                        await sess.execute(index_settings)
+                    results = (await sess.execute(stmt)).fetchall()
+            except Exception as e:
+                logger.error(f"Error performing {self.search_type.value} search: {e}")
+                return []
+
+            search_results = [self._result_to_document(result) for result in results]
+            if self.reranker and self.search_type == SearchType.vector:
+                search_results = await asyncio.to_thread(self.reranker.rerank, query=query, documents=search_results)
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during {self.search_type.value} search: {e}")
+            return []
+
+    def _get_search_columns(self) -> List[Column]:
+        """
+        Get the columns selected by every search type.
+
+        Returns:
+            List[Column]: The columns to select.
+        """
+        return [
+            self.table.c.id,
+            self.table.c.name,
+            self.table.c.meta_data,
+            self.table.c.content,
+            self.table.c.embedding,
+            self.table.c.usage,
+        ]
+
+    def _get_vector_index_settings(self):
+        """
+        Get the SET LOCAL statement tuning the vector index for the current transaction.
+
+        Returns:
+            The statement to execute, or None if no vector index is configured.
+        """
+        if isinstance(self.vector_index, Ivfflat):
+            return text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}")
+        elif isinstance(self.vector_index, HNSW):
+            return text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}")
+        return None
+
+    def _result_to_document(self, result: Any) -> Document:
+        """
+        Convert a search result row into a Document.
+
+        Args:
+            result: The result row.
+
+        Returns:
+            Document: The document for the row.
+        """
+        return Document(
+            id=result.id,
+            name=result.name,
+            meta_data=result.meta_data,
+            content=result.content,
+            embedder=self.embedder,
+            embedding=result.embedding,
+            usage=result.usage,
+        )
+
+    def _get_vector_search_stmt(
+        self, query_embedding: List[float], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Build the statement for a vector similarity search.
+
+        Args:
+            query_embedding (List[float]): The embedding of the search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            The select statement, or None if the distance metric is unknown.
+        """
+        # Build the base statement
+        stmt = select(*self._get_search_columns())
+
+        # Apply filters if provided
+        if filters is not None:
+            stmt = stmt.where(self.table.c.filters.contains(filters))
+
+        # Order the results based on the distance metric
+        if self.distance == Distance.l2:
+            stmt = stmt.order_by(self.table.c.embedding.l2_distance(query_embedding))
+        elif self.distance == Distance.cosine:
+            stmt = stmt.order_by(self.table.c.embedding.cosine_distance(query_embedding))
+        elif self.distance == Distance.max_inner_product:
+            stmt = stmt.order_by(self.table.c.embedding.max_inner_product(query_embedding))
+        else:
+            logger.error(f"Unknown distance metric: {self.distance}")
+            return None
+
+        # Limit the number of results
+        return stmt.limit(limit)
+
     def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
         Perform a vector similarity search.
@@ -445,48 +818,19 @@ class PgVector(VectorDb):
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the base statement
-            stmt = select(*columns)
-
-            # Apply filters if provided
-            if filters is not None:
-                stmt = stmt.where(self.table.c.filters.contains(filters))
-
-            # Order the results based on the distance metric
-            if self.distance == Distance.l2:
-                stmt = stmt.order_by(self.table.c.embedding.l2_distance(query_embedding))
-            elif self.distance == Distance.cosine:
-                stmt = stmt.order_by(self.table.c.embedding.cosine_distance(query_embedding))
-            elif self.distance == Distance.max_inner_product:
-                stmt = stmt.order_by(self.table.c.embedding.max_inner_product(query_embedding))
-            else:
-                logger.error(f"Unknown distance metric: {self.distance}")
+            stmt = self._get_vector_search_stmt(query_embedding=query_embedding, limit=limit, filters=filters)
+            if stmt is None:
                 return []
 
-            # Limit the number of results
-            stmt = stmt.limit(limit)
-
             # Log the query for debugging
             logger.debug(f"Vector search query: {stmt}")
 
             # Execute the query
             try:
                 with self.Session() as sess, sess.begin():
-                    if self.vector_index is not None:
-                        if isinstance(self.vector_index, Ivfflat):
-                            sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
-                        elif isinstance(self.vector_index, HNSW):
-                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
+                    index_settings = self._get_vector_index_settings()
+                    if index_settings is not None:
+                        sess.execute(index_settings)
                     results = sess.execute(stmt).fetchall()
             except Exception as e:
                 logger.error(f"Error performing semantic search: {e}")
@@ -495,19 +839,7 @@ class PgVector(VectorDb):
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+            search_results: List[Document] = [self._result_to_document(result) for result in results]
 
             if self.reranker:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
@@ -532,6 +864,44 @@ class PgVector(VectorDb):
         processed_words = [word + "*" for word in words]
         return " ".join(processed_words)
 
+    def _get_text_rank(self, query: str):
+        """
+        Build the full-text search rank expression for a query.
+
+        Args:
+            query (str): The search query.
+        """
+        # Build the text search vector
+        ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
+        # Create the ts_query using websearch_to_tsquery with parameter binding
+        processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
+        ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
+        # Compute the text rank
+        return func.ts_rank_cd(ts_vector, ts_query)
+
+    def _get_keyword_search_stmt(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None):
+        """
+        Build the statement for a keyword search on the 'content' column.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+        """
+        # Build the base statement
+        stmt = select(*self._get_search_columns())
+
+        # Apply filters if provided
+        if filters is not None:
+            # Use the contains() method for JSONB columns to check if the filters column contains the specified filters
+            stmt = stmt.where(self.table.c.filters.contains(filters))
+
+        # Order by the relevance rank
+        stmt = stmt.order_by(self._get_text_rank(query).desc())
+
+        # Limit the number of results
+        return stmt.limit(limit)
+
     def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
         Perform a keyword search on the 'content' column.
@@ -545,37 +915,7 @@ class PgVector(VectorDb):
             List[Document]: List of matching documents.
         """
         try:
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the base statement
-            stmt = select(*columns)
-
-            # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
-            # Create the ts_query using websearch_to_tsquery with parameter binding
-            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
-            # Compute the text rank
-            text_rank = func.ts_rank_cd(ts_vector, ts_query)
-
-            # Apply filters if provided
-            if filters is not None:
-                # Use the contains() method for JSONB columns to check if the filters column contains the specified filters
-                stmt = stmt.where(self.table.c.filters.contains(filters))
-
-            # Order by the relevance rank
-            stmt = stmt.order_by(text_rank.desc())
-
-            # Limit the number of results
-            stmt = stmt.limit(limit)
+            stmt = self._get_keyword_search_stmt(query=query, limit=limit, filters=filters)
 
             # Log the query for debugging
             logger.debug(f"Keyword search query: {stmt}")
@@ -591,25 +931,77 @@ class PgVector(VectorDb):
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
-
-            return search_results
+            return [self._result_to_document(result) for result in results]
         except Exception as e:
             logger.error(f"Error during keyword search: {e}")
             return []
 
+    def _get_hybrid_search_stmt(
+        self,
+        query: str,
+        query_embedding: List[float],
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Build the statement for a hybrid search combining vector similarity and full-text search.
+
+        Args:
+            query (str): The search query.
+            query_embedding (List[float]): The embedding of the search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            The select statement, or None if the distance metric is unknown.
+        """
+        text_rank = self._get_text_rank(query)
+
+        # Compute the vector similarity score
+        if self.distance == Distance.l2:
+            # For L2 distance, smaller distances are better
+            vector_distance = self.table.c.embedding.l2_distance(query_embedding)
+            # Invert and normalize the distance to get a similarity score between 0 and 1
+            vector_score = 1 / (1 + vector_distance)
+        elif self.distance == Distance.cosine:
+            # For cosine distance, smaller distances are better
+            vector_distance = self.table.c.embedding.cosine_distance(query_embedding)
+            vector_score = 1 / (1 + vector_distance)
+        elif self.distance == Distance.max_inner_product:
+            # For inner product, higher values are better
+            # Assume embeddings are normalized, so inner product ranges from -1 to 1
+            raw_vector_score = self.table.c.embedding.max_inner_product(query_embedding)
+            # Normalize to range [0, 1]
+            vector_score = (raw_vector_score + 1) / 2
+        else:
+            logger.error(f"Unknown distance metric: {self.distance}")
+            return None
+
+        # Apply weights to control the influence of each score
+        # Validate the vector_weight parameter
+        if not 0 <= self.vector_score_weight <= 1:
+            raise ValueError("vector_score_weight must be between 0 and 1")
+        text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
+
+        # Combine the scores into a hybrid score
+        hybrid_score = (self.vector_score_weight * vector_score) + (text_rank_weight * text_rank)
+
+        # Build the base statement, including the hybrid score
+        stmt = select(*self._get_search_columns(), hybrid_score.label("hybrid_score"))
+
+        # Add the full-text search condition
+        # stmt = stmt.where(ts_vector.op("@@")(ts_query))
+
+        # Apply filters if provided
+        if filters is not None:
+            stmt = stmt.where(self.table.c.filters.contains(filters))
+
+        # Order the results by the hybrid score in descending order
+        stmt = stmt.order_by(desc("hybrid_score"))
+
+        # Limit the number of results
+        return stmt.limit(limit)
+
     def hybrid_search(
         self,
         query: str,
@@ -634,101 +1026,28 @@ class PgVector(VectorDb):
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
-            # Create the ts_query using websearch_to_tsquery with parameter binding
-            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
-            # Compute the text rank
-            text_rank = func.ts_rank_cd(ts_vector, ts_query)
-
-            # Compute the vector similarity score
-            if self.distance == Distance.l2:
-                # For L2 distance, smaller distances are better
-                vector_distance = self.table.c.embedding.l2_distance(query_embedding)
-                # Invert and normalize the distance to get a similarity score between 0 and 1
-                vector_score = 1 / (1 + vector_distance)
-            elif self.distance == Distance.cosine:
-                # For cosine distance, smaller distances are better
-                vector_distance = self.table.c.embedding.cosine_distance(query_embedding)
-                vector_score = 1 / (1 + vector_distance)
-            elif self.distance == Distance.max_inner_product:
-                # For inner product, higher values are better
-                # Assume embeddings are normalized, so inner product ranges from -1 to 1
-                raw_vector_score = self.table.c.embedding.max_inner_product(query_embedding)
-                # Normalize to range [0, 1]
-                vector_score = (raw_vector_score + 1) / 2
-            else:
-                logger.error(f"Unknown distance metric: {self.distance}")
+            stmt = self._get_hybrid_search_stmt(
+                query=query, query_embedding=query_embedding, limit=limit, filters=filters
+            )
+            if stmt is None:
                 return []
 
-            # Apply weights to control the influence of each score
-            # Validate the vector_weight parameter
-            if not 0 <= self.vector_score_weight <= 1:
-                raise ValueError("vector_score_weight must be between 0 and 1")
-            text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
-
-            # Combine the scores into a hybrid score
-            hybrid_score = (self.vector_score_weight * vector_score) + (text_rank_weight * text_rank)
-
-            # Build the base statement, including the hybrid score
-            stmt = select(*columns, hybrid_score.label("hybrid_score"))
-
-            # Add the full-text search condition
-            # stmt = stmt.where(ts_vector.op("@@")(ts_query))
-
-            # Apply filters if provided
-            if filters is not None:
-                stmt = stmt.where(self.table.c.filters.contains(filters))
-
-            # Order the results by the hybrid score in descending order
-            stmt = stmt.order_by(desc("hybrid_score"))
-
-            # Limit the number of results
-            stmt = stmt.limit(limit)
-
             # Log the query for debugging
             logger.debug(f"Hybrid search query: {stmt}")
 
             # Execute the query
             try:
                 with self.Session() as sess, sess.begin():
-                    if self.vector_index is not None:
-                        if isinstance(self.vector_index, Ivfflat):
-                            sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
-                        elif isinstance(self.vector_index, HNSW):
-                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
+                    index_settings = self._get_vector_index_settings()
+                    if index_settings is not None:
+                        sess.execute(index_settings)
                     results = sess.execute(stmt).fetchall()
             except Exception as e:
                 logger.error(f"Error performing hybrid search: {e}")
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
-
-            return search_results
+            return [self._result_to_document(result) for result in results]
         except Exception as e:
             logger.error(f"Error during hybrid search: {e}")
             return []
@@ -1013,7 +1332,7 @@ class PgVector(VectorDb):
             if k in {"metadata", "table"}:
                 continue
             # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "Session", "embedder"}:
+            elif k in {"db_engine", "Session", "_async_db_engine", "_async_session", "embedder"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
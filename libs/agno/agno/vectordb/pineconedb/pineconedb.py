@@ -182,6 +182,24 @@ class PineconeDb(VectorDb):
         response = self.index.fetch(ids=[document.id])
         return len(response.vectors) > 0
 
+    def doc_exists_batch(self, documents: List[Document]) -> List[bool]:
+        """Check which documents exist in the index, fetching ids in batches.
+
+        Args:
+            documents (List[Document]): The documents to check.
+
+        Returns:
+            List[bool]: Whether each document exists, in the same order as documents.
+
+        """
+        ids = [document.id for document in documents if document.id is not None]
+        existing = set()
+        # Pinecone fetches at most 1000 ids per request
+        for i in range(0, len(ids), 1000):
+            response = self.index.fetch(ids=ids[i : i + 1000])
+            existing.update(response.vectors.keys())
+        return [document.id is not None and document.id in existing for document in documents]
+
     def name_exists(self, name: str) -> bool:
         """Check if an index with the given name exists.
 
@@ -218,8 +236,8 @@ class PineconeDb(VectorDb):
         """
 
         vectors = []
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             document.meta_data["text"] = document.content
             data_to_upsert = {
                 "id": document.id,
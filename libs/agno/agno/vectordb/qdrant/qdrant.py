@@ -1,8 +1,10 @@
+import asyncio
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
+from uuid import UUID
 
 try:
-    from qdrant_client import QdrantClient  # noqa: F401
+    from qdrant_client import AsyncQdrantClient, QdrantClient  # noqa: F401
     from qdrant_client.http import models
 except ImportError:
     raise ImportError(
@@ -51,8 +53,9 @@ class Qdrant(VectorDb):
         # Distance metric
         self.distance: Distance = distance
 
-        # Qdrant client instance
+        # Qdrant client instances
         self._client: Optional[QdrantClient] = None
+        self._async_client: Optional[AsyncQdrantClient] = None
 
         # Qdrant client arguments
         self.location: Optional[str] = location
@@ -73,39 +76,59 @@ class Qdrant(VectorDb):
         # Qdrant client kwargs
         self.kwargs = kwargs
 
+    def _get_client_params(self) -> Dict[str, Any]:
+        return dict(
+            location=self.location,
+            url=self.url,
+            port=self.port,
+            grpc_port=self.grpc_port,
+            prefer_grpc=self.prefer_grpc,
+            https=self.https,
+            api_key=self.api_key,
+            prefix=self.prefix,
+            timeout=int(self.timeout) if self.timeout is not None else None,
+            host=self.host,
+            path=self.path,
+            **self.kwargs,
+        )
+
     @property
     def client(self) -> QdrantClient:
         if self._client is None:
             logger.debug("Creating Qdrant Client")
-            self._client = QdrantClient(
-                location=self.location,
-                url=self.url,
-                port=self.port,
-                grpc_port=self.grpc_port,
-                prefer_grpc=self.prefer_grpc,
-                https=self.https,
-                api_key=self.api_key,
-                prefix=self.prefix,
-                timeout=int(self.timeout) if self.timeout is not None else None,
-                host=self.host,
-                path=self.path,
-                **self.kwargs,
-            )
+            self._client = QdrantClient(**self._get_client_params())
         return self._client
 
-    def create(self) -> None:
+    @property
+    def async_client(self) -> AsyncQdrantClient:
+        if self._async_client is None:
+            logger.debug("Creating Async Qdrant Client")
+            self._async_client = AsyncQdrantClient(**self._get_client_params())
+        return self._async_client
+
+    def _get_vectors_config(self) -> models.VectorParams:
         # Collection distance
         _distance = models.Distance.COSINE
         if self.distance == Distance.l2:
             _distance = models.Distance.EUCLID
         elif self.distance == Distance.max_inner_product:
             _distance = models.Distance.DOT
+        return models.VectorParams(size=self.dimensions, distance=_distance)
 
+    def create(self) -> None:
         if not self.exists():
             logger.debug(f"Creating collection: {self.collection}")
             self.client.create_collection(
                 collection_name=self.collection,
-                vectors_config=models.VectorParams(size=self.dimensions, distance=_distance),
+                vectors_config=self._get_vectors_config(),
+            )
+
+    async def async_create(self) -> None:
+        if not await self.async_client.collection_exists(collection_name=self.collection):
+            logger.debug(f"Creating collection: {self.collection}")
+            await self.async_client.create_collection(
+                collection_name=self.collection,
+                vectors_config=self._get_vectors_config(),
             )
 
     def doc_exists(self, document: Document) -> bool:
@@ -125,6 +148,78 @@ class Qdrant(VectorDb):
             return len(collection_points) > 0
         return False
 
+    async def async_doc_exists(self, document: Document) -> bool:
+        """
+        Validating if the document exists or not, without blocking the event loop
+
+        Args:
+            document (Document): Document to validate
+        """
+        cleaned_content = document.content.replace("\x00", "\ufffd")
+        doc_id = md5(cleaned_content.encode()).hexdigest()
+        collection_points = await self.async_client.retrieve(
+            collection_name=self.collection,
+            ids=[doc_id],
+        )
+        return len(collection_points) > 0
+
+    def content_hashes_exist(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that are already stored as point ids, using a single request
+
+        Args:
+            content_hashes (List[str]): Content hashes to check
+        """
+        if not content_hashes:
+            return set()
+        collection_points = self.client.retrieve(
+            collection_name=self.collection,
+            ids=content_hashes,
+            with_payload=False,
+            with_vectors=False,
+        )
+        # Qdrant returns the md5 hex ids in UUID format
+        return {UUID(str(point.id)).hex for point in collection_points}
+
+    async def async_content_hashes_exist(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that are already stored as point ids, without blocking the event loop
+
+        Args:
+            content_hashes (List[str]): Content hashes to check
+        """
+        if not content_hashes:
+            return set()
+        collection_points = await self.async_client.retrieve(
+            collection_name=self.collection,
+            ids=content_hashes,
+            with_payload=False,
+            with_vectors=False,
+        )
+        return {UUID(str(point.id)).hex for point in collection_points}
+
+    def doc_exists_batch(self, documents: List[Document]) -> List[bool]:
+        """
+        Validating which documents exist, using a single request
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        content_hashes = [md5(doc.content.replace("\x00", "\ufffd").encode()).hexdigest() for doc in documents]
+        existing = self.content_hashes_exist(content_hashes)
+        return [content_hash in existing for content_hash in content_hashes]
+
+    async def async_doc_exists_batch(self, documents: List[Document]) -> List[bool]:
+        """
+        Validating which documents exist, without blocking the event loop
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        content_hashes = [md5(doc.content.replace("\x00", "\ufffd").encode()).hexdigest() for doc in documents]
+        existing = await self.async_content_hashes_exist(content_hashes)
+        return [content_hash in existing for content_hash in content_hashes]
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -156,9 +251,30 @@ class Qdrant(VectorDb):
             batch_size (int): Batch size for inserting documents
         """
         logger.debug(f"Inserting {len(documents)} documents")
+        Document.embed_batch(documents, embedder=self.embedder)
+        points = self._get_points(documents)
+        if len(points) > 0:
+            self.client.upsert(collection_name=self.collection, wait=False, points=points)
+        logger.debug(f"Upsert {len(points)} documents")
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Insert documents into the database without blocking the event loop.
+
+        Args:
+            documents (List[Document]): List of documents to insert
+            filters (Optional[Dict[str, Any]]): Filters to apply while inserting documents
+        """
+        logger.debug(f"Inserting {len(documents)} documents")
+        await Document.async_embed_batch(documents, embedder=self.embedder)
+        points = self._get_points(documents)
+        if len(points) > 0:
+            await self.async_client.upsert(collection_name=self.collection, wait=False, points=points)
+        logger.debug(f"Upsert {len(points)} documents")
+
+    def _get_points(self, documents: List[Document]) -> List[models.PointStruct]:
         points = []
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             points.append(
@@ -174,9 +290,7 @@ class Qdrant(VectorDb):
                 )
             )
             logger.debug(f"Inserted document: {document.name} ({document.meta_data})")
-        if len(points) > 0:
-            self.client.upsert(collection_name=self.collection, wait=False, points=points)
-        logger.debug(f"Upsert {len(points)} documents")
+        return points
 
     def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -189,6 +303,17 @@ class Qdrant(VectorDb):
         logger.debug("Redirecting the request to insert")
         self.insert(documents)
 
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Upsert documents into the database without blocking the event loop.
+
+        Args:
+            documents (List[Document]): List of documents to upsert
+            filters (Optional[Dict[str, Any]]): Filters to apply while upserting
+        """
+        logger.debug("Redirecting the request to async_insert")
+        await self.async_insert(documents)
+
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
         Search for documents in the database.
@@ -210,7 +335,44 @@ class Qdrant(VectorDb):
             with_payload=True,
             limit=limit,
         )
+        search_results = self._get_search_results(results)
+
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+
+        return search_results
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """
+        Search for documents in the database without blocking the event loop.
 
+        Args:
+            query (str): Query to search for
+            limit (int): Number of search results to return
+            filters (Optional[Dict[str, Any]]): Filters to apply while searching
+        """
+        query_embedding = await self.embedder.async_get_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        results = await self.async_client.search(
+            collection_name=self.collection,
+            query_vector=query_embedding,
+            with_vectors=True,
+            with_payload=True,
+            limit=limit,
+        )
+        search_results = self._get_search_results(results)
+
+        if self.reranker:
+            search_results = await asyncio.to_thread(self.reranker.rerank, query=query, documents=search_results)
+
+        return search_results
+
+    def _get_search_results(self, results: List[models.ScoredPoint]) -> List[Document]:
         # Build search results
         search_results: List[Document] = []
         for result in results:
@@ -226,10 +388,6 @@ class Qdrant(VectorDb):
                     usage=result.payload["usage"],
                 )
             )
-
-        if self.reranker:
-            search_results = self.reranker.rerank(query=query, documents=search_results)
-
         return search_results
 
     def drop(self) -> None:
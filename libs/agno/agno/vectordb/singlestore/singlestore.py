@@ -1,6 +1,6 @@
 import json
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from sqlalchemy.dialects import mysql
@@ -144,6 +144,30 @@ class SingleStore(VectorDb):
             result = sess.execute(stmt).first()
             return result is not None
 
+    def content_hashes_exist(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the table, using a single query
+
+        Args:
+            content_hashes (List[str]): Content hashes to check
+        """
+        if not content_hashes:
+            return set()
+        with self.Session.begin() as sess:
+            stmt = select(self.table.c.content_hash).where(self.table.c.content_hash.in_(content_hashes))
+            return {row.content_hash for row in sess.execute(stmt)}
+
+    def doc_exists_batch(self, documents: List[Document]) -> List[bool]:
+        """
+        Validating which documents exist, using a single query
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        content_hashes = [md5(doc.content.replace("\x00", "\ufffd").encode()).hexdigest() for doc in documents]
+        existing = self.content_hashes_exist(content_hashes)
+        return [content_hash in existing for content_hash in content_hashes]
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a row with this name exists or not
@@ -177,10 +201,10 @@ class SingleStore(VectorDb):
             filters (Optional[Dict[str, Any]]): Optional filters for the insert.
             batch_size (int): Number of documents to insert in each batch.
         """
+        Document.embed_batch(documents, embedder=self.embedder)
         with self.Session.begin() as sess:
             counter = 0
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -216,10 +240,10 @@ class SingleStore(VectorDb):
             filters (Optional[Dict[str, Any]]): Optional filters for the upsert.
             batch_size (int): Number of documents to upsert in each batch.
         """
+        Document.embed_batch(documents, embedder=self.embedder)
         with self.Session.begin() as sess:
             counter = 0
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
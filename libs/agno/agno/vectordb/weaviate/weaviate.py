@@ -2,7 +2,7 @@ import json
 import uuid
 from hashlib import md5
 from os import getenv
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     import weaviate
@@ -129,6 +129,44 @@ class Weaviate(VectorDb):
         collection = self.get_client().collections.get(self.collection)
         return collection.data.exists(doc_uuid)
 
+    def content_hashes_exist(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes whose UUIDs already exist in Weaviate, using a single query.
+
+        Args:
+            content_hashes (List[str]): Content hashes to check
+
+        Returns:
+            Set[str]: The subset of content_hashes that exist in the collection
+        """
+        if not content_hashes:
+            return set()
+
+        uuid_to_hash = {uuid.UUID(hex=content_hash[:32]): content_hash for content_hash in content_hashes}
+        collection = self.get_client().collections.get(self.collection)
+        result = collection.query.fetch_objects(
+            limit=len(uuid_to_hash),
+            filters=Filter.by_id().contains_any(list(uuid_to_hash.keys())),
+            return_properties=[],
+        )
+        return {uuid_to_hash[obj.uuid] for obj in result.objects if obj.uuid in uuid_to_hash}
+
+    def doc_exists_batch(self, documents: List[Document]) -> List[bool]:
+        """
+        Validate which documents exist, using a single query.
+
+        Args:
+            documents (List[Document]): Documents to validate
+
+        Returns:
+            List[bool]: Whether each document exists, in the same order as documents
+        """
+        content_hashes = [md5(doc.content.replace("\x00", "\ufffd").encode()).hexdigest() for doc in documents]
+        existing = self.content_hashes_exist(
+            [content_hash for doc, content_hash in zip(documents, content_hashes) if doc.content]
+        )
+        return [content_hash in existing for content_hash in content_hashes]
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a document with the given name exists in Weaviate.
@@ -157,8 +195,8 @@ class Weaviate(VectorDb):
         logger.debug(f"Inserting {len(documents)} documents into Weaviate.")
         collection = self.get_client().collections.get(self.collection)
 
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             if document.embedding is None:
                 logger.error(f"Document embedding is None: {document.name}")
                 continue
@@ -0,0 +1,149 @@
+import json
+import threading
+
+import httpx
+
+from agno.api.exporter import TelemetryExporter
+from agno.api.schemas.agent import AgentRunCreate, AgentSessionCreate
+
+
+def _make_exporter(requests, release=None, **kwargs):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if release is not None:
+            release.wait(5)
+        requests.append((request.url.path, json.loads(request.content)))
+        return httpx.Response(200)
+
+    client = httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler))
+    return TelemetryExporter(client=client, **kwargs)
+
+
+def test_export_posts_in_background_and_flushes():
+    requests = []
+    exporter = _make_exporter(requests)
+
+    exporter.export("/runs", "run", AgentRunCreate(session_id="s1", run_id="r1"), coalesce_key="r1")
+    assert exporter.flush(timeout=5)
+    exporter.shutdown()
+
+    assert requests == [("/runs", {"run": {"session_id": "s1", "run_id": "r1"}})]
+
+
+def test_session_events_are_coalesced_within_a_batch():
+    requests = []
+    release = threading.Event()
+    exporter = _make_exporter(requests, release=release)
+
+    # The first event blocks the worker so the following ones are drained as one batch
+    exporter.export("/warmup", "session", {"session_id": "w"})
+    while not exporter._queue.empty():
+        pass
+    for i in range(3):
+        exporter.export(
+            "/sessions",
+            "session",
+            AgentSessionCreate(session_id="s1", agent_data={"version": i}),
+            coalesce_key="s1",
+        )
+    exporter.export("/sessions", "session", AgentSessionCreate(session_id="s2"), coalesce_key="s2")
+    release.set()
+    assert exporter.flush(timeout=5)
+    exporter.shutdown()
+
+    sessions = [body["session"] for path, body in requests if path == "/sessions"]
+    assert sessions == [{"session_id": "s1", "agent_data": {"version": 2}}, {"session_id": "s2"}]
+
+
+def test_full_queue_spills_to_disk_and_replays(tmp_path):
+    requests = []
+    release = threading.Event()
+    spill_path = tmp_path / "spill.jsonl"
+    exporter = _make_exporter(requests, release=release, max_queue_size=1, flush_interval=0.05, spill_path=spill_path)
+
+    exporter.export("/runs", "run", {"run_id": "r0"})
+    # Wait for the worker to pick up the first event, so the queue holds exactly one more
+    while not exporter._queue.empty():
+        pass
+    exporter.export("/runs", "run", {"run_id": "r1"})
+    exporter.export("/runs", "run", {"run_id": "r2"})
+
+    assert exporter.spilled == 1
+    assert spill_path.exists()
+
+    release.set()
+    assert exporter.flush(timeout=5)
+    # The spill file is replayed once the worker is idle
+    for _ in range(100):
+        if len(requests) == 3:
+            break
+        threading.Event().wait(0.05)
+    exporter.shutdown()
+
+    assert sorted(body["run"]["run_id"] for _, body in requests) == ["r0", "r1", "r2"]
+    assert not spill_path.exists()
+
+
+def test_full_queue_without_spill_path_drops_events():
+    requests = []
+    release = threading.Event()
+    exporter = _make_exporter(requests, release=release, max_queue_size=1)
+
+    exporter.export("/runs", "run", {"run_id": "r0"})
+    while not exporter._queue.empty():
+        pass
+    exporter.export("/runs", "run", {"run_id": "r1"})
+    exporter.export("/runs", "run", {"run_id": "r2"})
+    assert exporter.dropped == 1
+
+    release.set()
+    exporter.shutdown()
+    assert [body["run"]["run_id"] for _, body in requests] == ["r0", "r1"]
+
+
+def test_payload_functions_are_called_on_the_worker_thread():
+    requests = []
+    threads = []
+    exporter = _make_exporter(requests)
+
+    def build_run() -> AgentRunCreate:
+        threads.append(threading.current_thread())
+        return AgentRunCreate(session_id="s1", run_id="r1")
+
+    exporter.export("/runs", "run", build_run, coalesce_key="r1")
+    assert exporter.flush(timeout=5)
+    exporter.shutdown()
+
+    assert threads and threads[0] is not threading.current_thread()
+    assert requests == [("/runs", {"run": {"session_id": "s1", "run_id": "r1"}})]
+
+
+def test_agent_runs_are_serialized_by_the_worker_from_a_snapshot(monkeypatch):
+    import agno.api.agent
+    from agno.agent import Agent
+    from agno.run.response import RunResponse
+
+    requests = []
+    exporter = _make_exporter(requests)
+    monkeypatch.setattr(agno.api.agent, "telemetry_exporter", exporter)
+    monkeypatch.setattr(agno.api.agent.agno_cli_settings, "api_enabled", True)
+
+    serialized_on = []
+    to_dict = RunResponse.to_dict
+    monkeypatch.setattr(
+        RunResponse, "to_dict", lambda self: serialized_on.append(threading.current_thread()) or to_dict(self)
+    )
+
+    agent = Agent(monitoring=True, session_id="s1")
+    agent.run_id = "r1"
+    agent.run_response = RunResponse(content="hello", metrics={"input_tokens": [10]})
+    agent.log_agent_run()
+    # The next run updates the metrics in place
+    agent.run_response.metrics["input_tokens"].append(20)
+    assert exporter.flush(timeout=5)
+    exporter.shutdown()
+
+    assert serialized_on and threading.current_thread() not in serialized_on
+    run = requests[0][1]["run"]
+    assert run["run_id"] == "r1" and run["session_id"] == "s1"
+    assert run["run_data"]["metrics"] == {"input_tokens": [10]}
+    assert run["run_data"]["run_response"]["content"] == "hello"
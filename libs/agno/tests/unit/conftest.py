@@ -0,0 +1,104 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from agno.document import Document
+from agno.memory.db import MemoryDb
+from agno.memory.row import MemoryRow
+from agno.vectordb.base import VectorDb
+
+
+class InMemoryVectorDb(VectorDb):
+    def __init__(self):
+        self.documents: List[Document] = []
+        self.created = False
+        self.insert_calls = 0
+        self._lock = threading.Lock()
+
+    def create(self) -> None:
+        self.created = True
+
+    def doc_exists(self, document: Document) -> bool:
+        return any(d.content == document.content for d in self.documents)
+
+    def name_exists(self, name: str) -> bool:
+        return any(d.name == name for d in self.documents)
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        with self._lock:
+            self.insert_calls += 1
+            self.documents.extend(documents)
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.insert(documents, filters)
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        return [d for d in self.documents if query in d.content][:limit]
+
+    def drop(self) -> None:
+        self.documents = []
+
+    def exists(self) -> bool:
+        return self.created
+
+    def delete(self) -> bool:
+        self.documents = []
+        return True
+
+
+@pytest.fixture
+def vector_db() -> InMemoryVectorDb:
+    return InMemoryVectorDb()
+
+
+class InMemoryMemoryDb(MemoryDb):
+    def __init__(self):
+        self.rows: Dict[str, MemoryRow] = {}
+        self.upsert_calls = 0
+        self.delete_calls = 0
+
+    def create(self) -> None:
+        pass
+
+    def memory_exists(self, memory: MemoryRow) -> bool:
+        return memory.id in self.rows
+
+    def read_memories(
+        self, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
+    ) -> List[MemoryRow]:
+        rows = [row for row in self.rows.values() if user_id is None or row.user_id == user_id]
+        if sort != "asc":
+            rows.reverse()
+        return rows[:limit] if limit is not None else rows
+
+    def upsert_memory(self, memory: MemoryRow) -> None:
+        self.upsert_memories([memory])
+
+    def upsert_memories(self, memories: List[MemoryRow]) -> None:
+        self.upsert_calls += 1
+        for memory in self.embed_memories(memories):
+            self.rows[memory.id] = memory  # type: ignore
+
+    def delete_memory(self, id: str) -> None:
+        self.delete_memories([id])
+
+    def delete_memories(self, ids: List[str]) -> None:
+        self.delete_calls += 1
+        for id in ids:
+            self.rows.pop(id, None)
+
+    def drop_table(self) -> None:
+        self.rows.clear()
+
+    def table_exists(self) -> bool:
+        return True
+
+    def clear(self) -> bool:
+        self.rows.clear()
+        return True
+
+
+@pytest.fixture
+def memory_db() -> InMemoryMemoryDb:
+    return InMemoryMemoryDb()
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.document.base import Document
+from agno.embedder.base import Embedder
+from agno.embedder.cached import CachedEmbedder, InMemoryEmbeddingCache, MmapEmbeddingCache, SqliteEmbeddingCache
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    id: str = "counting"
+    dimensions: int = 2
+    calls: List[str] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(len(text)), 0.5]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.calls.append(text)
+        return self.get_embedding(text), {"total_tokens": len(text)}
+
+
+@pytest.fixture(params=["memory", "sqlite", "mmap"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryEmbeddingCache()
+    if request.param == "sqlite":
+        return SqliteEmbeddingCache(db_file=tmp_path / "cache.db")
+    return MmapEmbeddingCache(path=tmp_path / "cache")
+
+
+def test_cached_embedder_serves_repeated_texts_from_cache(cache):
+    wrapped = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=wrapped, cache=cache)
+
+    assert embedder.get_embedding("query") == [5.0, 0.5]
+    assert embedder.get_embedding("query") == [5.0, 0.5]
+
+    assert wrapped.calls == ["query"]
+    assert embedder.cache_info() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_cached_embedder_batch_only_embeds_missing_texts(cache):
+    wrapped = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=wrapped, cache=cache)
+    embedder.get_embedding("bb")
+
+    documents = [Document(content=c) for c in ["a", "bb", "ccc", "a"]]
+    Document.embed_batch(documents, embedder=embedder)
+
+    assert [d.embedding for d in documents] == [[1.0, 0.5], [2.0, 0.5], [3.0, 0.5], [1.0, 0.5]]
+    assert wrapped.calls == ["bb", "a", "ccc"]
+    assert (embedder.hits, embedder.misses) == (2, 3)
+
+
+def test_cached_embedder_async_batch(cache):
+    wrapped = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=wrapped, cache=cache)
+
+    asyncio.run(embedder.async_get_embeddings_batch(["x", "yy"]))
+    embeddings, usage = asyncio.run(embedder.async_get_embeddings_batch(["yy", "x"]))
+
+    assert embeddings == [[2.0, 0.5], [1.0, 0.5]]
+    assert usage is None
+    assert wrapped.calls == ["x", "yy"]
+
+
+def test_cache_key_depends_on_embedder_id_and_dimensions():
+    cache = InMemoryEmbeddingCache()
+    first = CachedEmbedder(embedder=CountingEmbedder(id="a"), cache=cache)
+    second = CachedEmbedder(embedder=CountingEmbedder(id="b"), cache=cache)
+    third = CachedEmbedder(embedder=CountingEmbedder(id="a", dimensions=3), cache=cache)
+
+    assert len({first.cache_key("text"), second.cache_key("text"), third.cache_key("text")}) == 3
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "mmap"])
+def test_persistent_caches_survive_reopening(tmp_path, backend):
+    def open_cache():
+        if backend == "sqlite":
+            return SqliteEmbeddingCache(db_file=tmp_path / "cache.db")
+        return MmapEmbeddingCache(path=tmp_path / "cache")
+
+    CachedEmbedder(embedder=CountingEmbedder(), cache=open_cache()).get_embeddings_batch(["one", "three"])
+
+    wrapped = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=wrapped, cache=open_cache())
+    embeddings, _ = embedder.get_embeddings_batch(["three", "one"])
+
+    assert embeddings == [[5.0, 0.5], [3.0, 0.5]]
+    assert wrapped.calls == []
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryEmbeddingCache(max_size=2)
+    cache.set("a", [1.0])
+    cache.set("b", [2.0])
+    cache.get("a")
+    cache.set("c", [3.0])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [1.0]
+    assert len(cache) == 2
+
+
+def test_deepcopy_shares_cache():
+    embedder = CachedEmbedder(embedder=CountingEmbedder())
+    assert deepcopy(embedder).cache is embedder.cache
+
+
+def test_mmap_caches_sharing_a_directory_do_not_overwrite_each_other(tmp_path):
+    # Each cache stands in for a process with its own view of the directory
+    first = MmapEmbeddingCache(path=tmp_path / "cache")
+    second = MmapEmbeddingCache(path=tmp_path / "cache")
+
+    first.set("a", [1.0, 1.0])
+    second.set("b", [2.0, 2.0])
+    first.set_many({"c": [3.0, 3.0], "a": [1.0, 1.0]})
+
+    expected = {"a": [1.0, 1.0], "b": [2.0, 2.0], "c": [3.0, 3.0]}
+    assert first.get_many(["a", "b", "c"]) == expected
+    assert second.get_many(["a", "b", "c"]) == expected
+    assert MmapEmbeddingCache(path=tmp_path / "cache").get_many(["a", "b", "c"]) == expected
+
+
+def test_mmap_caches_append_concurrently(tmp_path):
+    caches = [MmapEmbeddingCache(path=tmp_path / "cache") for _ in range(4)]
+
+    def write(index: int) -> None:
+        for i in range(50):
+            caches[index].set(f"{index}-{i}", [float(index), float(i)])
+
+    threads = [threading.Thread(target=write, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    reopened = MmapEmbeddingCache(path=tmp_path / "cache")
+    keys = [f"{index}-{i}" for index in range(4) for i in range(50)]
+    assert reopened.get_many(keys) == {key: [float(key.split("-")[0]), float(key.split("-")[1])] for key in keys}
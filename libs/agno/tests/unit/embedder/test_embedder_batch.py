@@ -0,0 +1,81 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from agno.document.base import Document
+from agno.embedder.base import Embedder, merge_usage, split_usage
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    dimensions: int = 2
+    calls: List[str] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(len(text)), 1.0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.calls.append(text)
+        return self.get_embedding(text), {"total_tokens": len(text)}
+
+
+def test_default_batch_preserves_order_and_merges_usage():
+    embedder = CountingEmbedder()
+    embeddings, usage = embedder.get_embeddings_batch(["a", "bbb", "cc"])
+
+    assert embeddings == [[1.0, 1.0], [3.0, 1.0], [2.0, 1.0]]
+    assert usage == {"total_tokens": 6}
+
+
+def test_iter_batches_respects_item_limit():
+    embedder = CountingEmbedder(batch_size=2)
+    batches = list(embedder.iter_batches(["a", "b", "c", "d", "e"]))
+
+    assert batches == [["a", "b"], ["c", "d"], ["e"]]
+
+
+def test_iter_batches_respects_token_limit():
+    embedder = CountingEmbedder(batch_size=100, max_batch_tokens=10)
+    texts = ["x" * 15, "y" * 15, "z" * 15]
+    batches = list(embedder.iter_batches(texts))
+
+    assert batches == [["x" * 15], ["y" * 15], ["z" * 15]]
+
+
+def test_iter_batches_keeps_oversized_text_in_its_own_batch():
+    embedder = CountingEmbedder(max_batch_tokens=1)
+    batches = list(embedder.iter_batches(["long text", "more"]))
+
+    assert batches == [["long text"], ["more"]]
+
+
+def test_merge_usage():
+    assert merge_usage(None, None) is None
+    assert merge_usage(None, {"total_tokens": 1}) == {"total_tokens": 1}
+    assert merge_usage({"total_tokens": 1, "model": "m"}, {"total_tokens": 2, "prompt_tokens": 3}) == {
+        "total_tokens": 3,
+        "model": "m",
+        "prompt_tokens": 3,
+    }
+
+
+def test_document_embed_batch():
+    embedder = CountingEmbedder()
+    documents = [Document(content="one"), Document(content="three")]
+    Document.embed_batch(documents, embedder=embedder)
+
+    assert [d.embedding for d in documents] == [[3.0, 1.0], [5.0, 1.0]]
+    assert embedder.calls == ["one", "three"]
+    # The batch usage of 8 tokens is split across the documents, both are estimated at 2 tokens
+    assert [d.usage for d in documents] == [{"total_tokens": 4}, {"total_tokens": 4}]
+
+
+def test_split_usage():
+    # Estimated at 10, 20 and 30 tokens
+    texts = ["x" * 29, "y" * 59, "z" * 89]
+    parts = split_usage({"total_tokens": 100, "cost": 0.6, "model": "m"}, texts)
+
+    assert sum(part["total_tokens"] for part in parts) == 100
+    assert [part["total_tokens"] for part in parts] == [17, 33, 50]
+    assert [round(part["cost"], 2) for part in parts] == [0.1, 0.2, 0.3]
+    assert all(part["model"] == "m" for part in parts)
+    assert split_usage(None, texts) == [None, None, None]
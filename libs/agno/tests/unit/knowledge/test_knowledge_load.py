@@ -0,0 +1,111 @@
+import asyncio
+import time
+
+import pytest
+
+from agno.document import Document
+from agno.knowledge.document import DocumentKnowledgeBase
+
+
+def make_knowledge_base(vector_db) -> DocumentKnowledgeBase:
+    contents = ["alpha", "beta", "alpha", "gamma", "delta", "beta"]
+    return DocumentKnowledgeBase(documents=[Document(content=c) for c in contents], vector_db=vector_db)
+
+
+@pytest.mark.parametrize("max_concurrency", [None, 3])
+def test_load_skips_duplicates_and_existing(vector_db, max_concurrency):
+    vector_db.insert([Document(content="delta")])
+    knowledge_base = make_knowledge_base(vector_db)
+
+    knowledge_base.load(max_concurrency=max_concurrency)
+
+    assert sorted(d.content for d in vector_db.documents) == ["alpha", "beta", "delta", "gamma"]
+
+
+def test_aload_skips_duplicates_and_existing(vector_db):
+    vector_db.insert([Document(content="delta")])
+    knowledge_base = make_knowledge_base(vector_db)
+
+    asyncio.run(knowledge_base.aload(max_concurrency=2))
+
+    assert vector_db.created
+    assert sorted(d.content for d in vector_db.documents) == ["alpha", "beta", "delta", "gamma"]
+
+
+def test_aload_recreate(vector_db):
+    vector_db.insert([Document(content="stale")])
+    knowledge_base = make_knowledge_base(vector_db)
+
+    asyncio.run(knowledge_base.aload(recreate=True, skip_existing=False, max_concurrency=1))
+
+    assert sorted(d.content for d in vector_db.documents) == ["alpha", "alpha", "beta", "beta", "delta", "gamma"]
+
+
+def test_load_documents_checks_existence_in_one_batch(vector_db, monkeypatch):
+    vector_db.insert([Document(content="delta")])
+    knowledge_base = make_knowledge_base(vector_db)
+
+    batch_calls = []
+    doc_exists_batch = vector_db.doc_exists_batch
+    monkeypatch.setattr(vector_db, "doc_exists_batch", lambda docs: batch_calls.append(docs) or doc_exists_batch(docs))
+
+    knowledge_base.load_documents([Document(content="delta"), Document(content="epsilon")])
+
+    assert len(batch_calls) == 1
+    assert sorted(d.content for d in vector_db.documents) == ["delta", "epsilon"]
+
+
+def test_doc_exists_batch_default_preserves_order(vector_db):
+    vector_db.insert([Document(content="beta")])
+
+    exists = vector_db.doc_exists_batch([Document(content=c) for c in ["alpha", "beta", "gamma"]])
+
+    assert exists == [False, True, False]
+
+
+def test_load_tracks_digests_of_seen_content(vector_db):
+    seen_content: set = set()
+    knowledge_base = make_knowledge_base(vector_db)
+
+    unseen = knowledge_base._claim_unseen_documents([Document(content=c) for c in ["alpha", "alpha"]], seen_content)
+
+    assert [d.content for d in unseen] == ["alpha"]
+    assert "alpha" not in seen_content and len(seen_content) == 1
+
+
+def test_aload_stops_the_reader_when_a_writer_fails(vector_db, monkeypatch):
+    async def failing_insert(documents, filters=None):
+        raise RuntimeError("insert failed")
+
+    monkeypatch.setattr(vector_db, "async_insert", failing_insert)
+    documents = [Document(content=str(i)) for i in range(20)]
+    knowledge_base = DocumentKnowledgeBase(documents=documents, vector_db=vector_db)
+    monkeypatch.setattr(DocumentKnowledgeBase, "document_lists", property(lambda self: ([d] for d in documents)))
+
+    with pytest.raises(RuntimeError, match="insert failed"):
+        asyncio.run(asyncio.wait_for(knowledge_base.aload(max_concurrency=1), timeout=5))
+
+
+def test_load_stops_submitting_when_a_worker_fails(vector_db, monkeypatch):
+    inserted = []
+
+    def failing_insert(documents, filters=None):
+        inserted.extend(documents)
+        if documents[0].content == "0":
+            raise RuntimeError("insert failed")
+        time.sleep(0.01)
+
+    monkeypatch.setattr(vector_db, "insert", failing_insert)
+    documents = [Document(content=str(i)) for i in range(50)]
+    read = []
+    knowledge_base = DocumentKnowledgeBase(documents=documents, vector_db=vector_db)
+    monkeypatch.setattr(
+        DocumentKnowledgeBase, "document_lists", property(lambda self: (read.append(d) or [d] for d in documents))
+    )
+
+    with pytest.raises(RuntimeError, match="insert failed"):
+        knowledge_base.load(max_concurrency=2)
+
+    # At most the document lists in flight when the first one failed are read and loaded
+    assert len(read) <= 5
+    assert len(inserted) <= 5
@@ -0,0 +1,100 @@
+import asyncio
+
+from agno.document import Document
+from agno.knowledge.document import DocumentKnowledgeBase
+
+
+def make_knowledge_base(vector_db, **kwargs) -> DocumentKnowledgeBase:
+    vector_db.insert([Document(content="how to reset a password"), Document(content="how to delete an account")])
+    return DocumentKnowledgeBase(documents=[], vector_db=vector_db, **kwargs)
+
+
+def count_searches(vector_db, monkeypatch):
+    calls = []
+    search = vector_db.search
+    monkeypatch.setattr(vector_db, "search", lambda **kwargs: calls.append(kwargs) or search(**kwargs))
+    return calls
+
+
+def test_search_is_not_cached_by_default(vector_db, monkeypatch):
+    knowledge_base = make_knowledge_base(vector_db)
+    calls = count_searches(vector_db, monkeypatch)
+
+    knowledge_base.search("password")
+    knowledge_base.search("password")
+
+    assert len(calls) == 2
+    assert knowledge_base.search_cache_info() is None
+
+
+def test_repeated_queries_are_served_from_cache(vector_db, monkeypatch):
+    knowledge_base = make_knowledge_base(vector_db, cache_search_results=True)
+    calls = count_searches(vector_db, monkeypatch)
+
+    first = knowledge_base.search("password")
+    second = knowledge_base.search("password")
+    knowledge_base.search("password", num_documents=1)
+    knowledge_base.search("password", filters={"lang": "en"})
+
+    assert [d.content for d in first] == [d.content for d in second] == ["how to reset a password"]
+    assert len(calls) == 3
+    assert knowledge_base.search_cache_info() == {"hits": 1, "misses": 3, "hit_rate": 0.25, "size": 3}
+
+
+def test_queries_that_differ_in_case_are_cached_separately(vector_db, monkeypatch):
+    knowledge_base = make_knowledge_base(vector_db, cache_search_results=True)
+    calls = count_searches(vector_db, monkeypatch)
+
+    knowledge_base.search("password")
+    knowledge_base.search("Password")
+
+    assert [call["query"] for call in calls] == ["password", "Password"]
+
+
+def test_empty_results_are_not_cached(vector_db, monkeypatch):
+    knowledge_base = make_knowledge_base(vector_db, cache_search_results=True)
+    calls = count_searches(vector_db, monkeypatch)
+
+    assert knowledge_base.search("refund") == []
+    vector_db.insert([Document(content="how to request a refund")])
+    assert [d.content for d in knowledge_base.search("refund")] == ["how to request a refund"]
+    assert len(calls) == 2
+
+
+def test_async_search_uses_cache(vector_db, monkeypatch):
+    knowledge_base = make_knowledge_base(vector_db, cache_search_results=True)
+    calls = count_searches(vector_db, monkeypatch)
+
+    knowledge_base.search("account")
+    documents = asyncio.run(knowledge_base.async_search("account"))
+
+    assert [d.content for d in documents] == ["how to delete an account"]
+    assert len(calls) == 1
+
+
+def test_loading_documents_invalidates_cache(vector_db):
+    knowledge_base = make_knowledge_base(vector_db, cache_search_results=True)
+
+    assert len(knowledge_base.search("password")) == 1
+    knowledge_base.load_text("password rules")
+    assert len(knowledge_base.search("password")) == 2
+
+    knowledge_base.delete()
+    assert knowledge_base.search("password") == []
+
+
+def test_cached_results_expire(vector_db, monkeypatch):
+    import agno.utils.cache
+
+    now = [1000.0]
+    monkeypatch.setattr(agno.utils.cache, "monotonic", lambda: now[0])
+    knowledge_base = make_knowledge_base(vector_db, cache_search_results=True, search_cache_ttl=60)
+    calls = count_searches(vector_db, monkeypatch)
+
+    knowledge_base.search("password")
+    now[0] += 30
+    knowledge_base.search("password")
+    now[0] += 31
+    knowledge_base.search("password")
+
+    assert len(calls) == 2
@@ -0,0 +1,85 @@
+from typing import List, Optional, Tuple
+
+from agno.memory.agent import AgentMemory, AgentRun
+from agno.memory.summarizer import MemorySummarizer
+from agno.memory.summary import SessionSummary
+from agno.models.message import Message
+from agno.run.response import RunResponse
+
+
+def _run(i: int) -> AgentRun:
+    user = Message(role="user", content=f"question {i}")
+    assistant = Message(role="assistant", content=f"answer {i}")
+    return AgentRun(message=user, response=RunResponse(content=f"answer {i}", messages=[user, assistant]))
+
+
+def test_runs_beyond_max_runs_are_evicted_but_stored():
+    memory = AgentMemory(max_runs=2)
+    memory.add_system_message(Message(role="system", content="You are helpful"))
+    for i in range(5):
+        memory.add_run(_run(i))
+
+    assert [run.message.content for run in memory.runs] == ["question 3", "question 4"]
+    assert memory.get_num_runs() == 5
+    stored = memory.to_dict()
+    assert [run["message"]["content"] for run in stored["runs"]] == [f"question {i}" for i in range(5)]
+
+    # Loading the stored memory keeps only max_runs runs as AgentRuns
+    loaded = AgentMemory(max_runs=2)
+    loaded.set_runs(stored["runs"])
+    assert [run.message.content for run in loaded.runs] == ["question 3", "question 4"]
+    assert loaded.to_dict()["runs"] == stored["runs"]
+
+
+def test_messages_beyond_max_messages_are_evicted_but_stored():
+    memory = AgentMemory(max_messages=2)
+    memory.add_system_message(Message(role="system", content="You are helpful"))
+    memory.add_messages([Message(role="user", content=f"message {i}") for i in range(4)])
+
+    assert [m.content for m in memory.messages] == ["You are helpful", "message 2", "message 3"]
+    assert [m["content"] for m in memory.to_dict()["messages"]] == ["You are helpful"] + [
+        f"message {i}" for i in range(4)
+    ]
+
+
+def test_history_is_selected_by_token_budget():
+    memory = AgentMemory(token_counter=lambda message: 10)
+    for i in range(4):
+        memory.add_run(_run(i))
+
+    # Each run has two messages of 10 tokens
+    history = memory.get_messages_from_last_n_runs(max_tokens=45)
+    assert [m.content for m in history] == ["question 2", "answer 2", "question 3", "answer 3"]
+    assert memory.get_messages_from_last_n_runs(last_n=1, max_tokens=45)[0].content == "question 3"
+    assert memory.get_messages_from_last_n_runs(max_tokens=15) == []
+
+    memory.max_history_tokens = 25
+    assert len(memory.get_messages_from_last_n_runs(last_n=3)) == 2
+    assert len(memory.get_messages_from_last_n_runs(last_n=3, max_tokens=1000)) == 6
+
+
+class RecordingSummarizer(MemorySummarizer):
+    calls: List[Tuple[List[str], Optional[str]]] = []
+
+    def run(self, message_pairs, previous_summary=None, **kwargs):
+        questions = [user_message.content for user_message, _ in message_pairs]
+        self.calls.append((questions, previous_summary.summary if previous_summary else None))
+        return SessionSummary(summary=" ".join(questions))
+
+
+def test_incremental_summary_only_sends_runs_since_the_last_summary():
+    summarizer = RecordingSummarizer()
+    memory = AgentMemory(
+        summarizer=summarizer, incremental_session_summary=True, session_summary_every_n_runs=2, max_runs=1
+    )
+    for i in range(5):
+        memory.add_run(_run(i))
+        if memory.should_update_summary():
+            memory.update_summary()
+
+    assert summarizer.calls == [
+        (["question 0", "question 1"], None),
+        (["question 2", "question 3"], "question 0 question 1"),
+    ]
+    assert memory.summarized_runs == 4
+    assert memory.to_dict()["summarized_runs"] == 4
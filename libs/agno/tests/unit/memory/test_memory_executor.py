@@ -0,0 +1,226 @@
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional
+
+import pytest
+
+from agno.agent import Agent
+from agno.memory.agent import AgentMemory
+from agno.memory.executor import MemoryExecutor
+from agno.memory.summarizer import MemorySummarizer
+from agno.memory.summary import SessionSummary
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from agno.storage.agent.sqlite import SqliteAgentStorage
+
+
+def test_tasks_with_the_same_key_run_in_order():
+    executor = MemoryExecutor(max_workers=4)
+    calls = []
+    release = threading.Event()
+
+    def update(key, i):
+        if i == 0:
+            release.wait(5)
+        calls.append((key, i))
+
+    for i in range(3):
+        executor.submit("s1", update, "s1", i)
+    executor.submit("s2", update, "s2", 1)
+    # Tasks of another session are not held up by s1
+    assert executor.flush(key="s2", timeout=5)
+    assert calls == [("s2", 1)]
+
+    release.set()
+    assert executor.flush(timeout=5)
+    assert calls[1:] == [("s1", 0), ("s1", 1), ("s1", 2)]
+    executor.shutdown()
+
+
+def test_errors_do_not_stop_later_tasks():
+    executor = MemoryExecutor()
+    calls = []
+
+    def fail():
+        raise RuntimeError("model unavailable")
+
+    executor.submit("s1", fail)
+    executor.submit("s1", calls.append, "done")
+    assert executor.flush(timeout=5)
+    assert calls == ["done"]
+    executor.shutdown()
+
+
+def test_async_tasks_run_in_order_and_are_flushed():
+    executor = MemoryExecutor()
+    calls = []
+
+    async def update(i):
+        await asyncio.sleep(0.01 * (3 - i))
+        calls.append(i)
+
+    async def main():
+        for i in range(3):
+            executor.asubmit("s1", update, i)
+        assert calls == []
+        await executor.aflush()
+
+    asyncio.run(main())
+    assert calls == [0, 1, 2]
+
+
+@dataclass
+class EchoModel(Model):
+    id: str = "echo"
+
+    def invoke(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[Any]:
+        raise NotImplementedError
+
+    async def ainvoke_stream(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    def response(self, messages: List[Message]) -> ModelResponse:
+        messages.append(Message(role="assistant", content=f"echo: {messages[-1].content}"))
+        return ModelResponse(content=messages[-1].content)
+
+    async def aresponse(self, messages: List[Message]) -> ModelResponse:
+        return self.response(messages)
+
+    def response_stream(self, messages: List[Message]) -> Iterator[ModelResponse]:
+        yield self.response(messages)
+
+    async def aresponse_stream(self, messages: List[Message]) -> Any:
+        yield self.response(messages)
+
+
+summaries_released = threading.Event()
+
+
+class QuestionsSummarizer(MemorySummarizer):
+    """Summarizes a session as its questions, once summaries_released is set"""
+
+    def run(self, message_pairs, previous_summary=None, **kwargs):
+        summaries_released.wait(5)
+        return SessionSummary(summary=" ".join(user_message.content for user_message, _ in message_pairs))
+
+    async def arun(self, message_pairs, previous_summary=None, **kwargs):
+        while not summaries_released.is_set():
+            await asyncio.sleep(0.01)
+        return self.run(message_pairs, previous_summary)
+
+
+def _agent(tmp_path, executor: Optional[MemoryExecutor]) -> Agent:
+    return Agent(
+        model=EchoModel(),
+        storage=SqliteAgentStorage(table_name="sessions", db_file=str(tmp_path / "agents.db")),
+        session_id="s1",
+        memory=AgentMemory(create_session_summary=True, summarizer=QuestionsSummarizer()),
+        defer_memory_updates=True,
+        memory_executor=executor,
+        telemetry=False,
+        monitoring=False,
+    )
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_deferred_updates_are_saved_to_their_own_session(tmp_path, use_async):
+    summaries_released.clear()
+    executor = MemoryExecutor()
+    agent = _agent(tmp_path, executor)
+
+    def run(message: str):
+        if use_async:
+            # Updates outlive the event loop of the run
+            asyncio.run(agent.arun(message))
+        else:
+            agent.run(message)
+
+    run("question 1")
+    # Switch to another session while the update of s1 is running
+    agent.new_session()
+    run("question 2")
+    summaries_released.set()
+    assert executor.flush(timeout=5)
+
+    sessions = {s.session_id: s for s in agent.storage.get_all_sessions()}
+    assert sessions["s1"].memory["summary"]["summary"] == "question 1"
+    assert [run["message"]["content"] for run in sessions["s1"].memory["runs"]] == ["question 1"]
+    assert sessions[agent.session_id].memory["summary"]["summary"] == "question 2"
+    assert agent.memory.summary.summary == "question 2"
+    executor.shutdown()
+
+
+def test_the_next_run_on_a_session_waits_for_its_update(tmp_path):
+    summaries_released.clear()
+    executor = MemoryExecutor()
+    agent = _agent(tmp_path, executor)
+    agent.run("question 1")
+
+    threading.Timer(0.1, summaries_released.set).start()
+    agent.run("question 2")
+    summaries_released.set()
+    assert executor.flush(timeout=5)
+
+    memory = agent.storage.read("s1").memory
+    assert [run["message"]["content"] for run in memory["runs"]] == ["question 1", "question 2"]
+    assert memory["summary"]["summary"] == "question 1 question 2"
+    executor.shutdown()
+
+
+def test_waiting_tasks_do_not_hold_a_worker():
+    executor = MemoryExecutor(max_workers=1)
+    release = threading.Event()
+    calls = []
+
+    executor.submit("s1", release.wait, 5)
+    executor.submit("s1", calls.append, "s1")
+    executor.submit("s2", calls.append, "s2")
+    # The only worker runs the first task of s1, then the task of s2 before the second task of s1
+    release.set()
+    assert executor.flush(timeout=5)
+    assert calls == ["s2", "s1"]
+    executor.shutdown()
+
+
+def test_deferred_update_keeps_runs_written_while_it_ran(tmp_path):
+    summaries_released.clear()
+    executor = MemoryExecutor()
+    agent = _agent(tmp_path, executor)
+    agent.run("question 1")
+
+    # Another worker adds a run to the session before the update of the first run is saved
+    other = Agent(
+        model=EchoModel(),
+        storage=SqliteAgentStorage(table_name="sessions", db_file=str(tmp_path / "agents.db")),
+        session_id="s1",
+        telemetry=False,
+        monitoring=False,
+    )
+    other.run("question 2")
+    summaries_released.set()
+    assert executor.flush(timeout=5)
+
+    memory = agent.storage.read("s1").memory
+    assert [run["message"]["content"] for run in memory["runs"]] == ["question 1", "question 2"]
+    assert (memory["summary"]["summary"], memory["summarized_runs"]) == ("question 1", 1)
+    executor.shutdown()
+
+
+def test_flush_waits_for_updates_submitted_by_other_agents(tmp_path):
+    summaries_released.clear()
+    _agent(tmp_path, executor=None).run("question 1")
+
+    # The update was submitted to the default executor, before this agent submitted an update of its own
+    agent = _agent(tmp_path, executor=None)
+    assert agent.flush_memory_updates(timeout=0.1) is False
+    summaries_released.set()
+    assert agent.flush_memory_updates(timeout=5) is True
+    assert agent.storage.read("s1").memory["summary"]["summary"] == "question 1"
@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterator, List, Optional
+
+import pytest
+
+from agno.memory.manager import MemoryManager
+from agno.memory.memory import Memory
+from agno.memory.row import MemoryRow
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+
+
+def test_memory_changes_during_a_run_are_written_in_one_batch(memory_db):
+    memory_db.upsert_memory(MemoryRow(id="old", user_id="u1", memory=Memory(memory="User lives in Paris").to_dict()))
+    memory_db.upsert_calls = 0
+    manager = MemoryManager(user_id="u1", db=memory_db)
+
+    manager.start_batch()
+    manager.add_memory("User likes tea")
+    manager.add_memory("User likes hiking")
+    manager.update_memory(id="old", memory="User lives in Berlin")
+    manager.delete_memory(id="old")
+    manager.update_memory(id="old", memory="User lives in Rome")
+    assert memory_db.upsert_calls == 0
+    manager.flush_batch()
+
+    assert memory_db.upsert_calls == 1
+    assert memory_db.delete_calls == 0
+    assert sorted(row.memory["memory"] for row in memory_db.rows.values()) == [
+        "User likes hiking",
+        "User likes tea",
+        "User lives in Rome",
+    ]
+
+
+
+@dataclass
+class ToolCallingModel(Model):
+    """Calls on_response, e.g. a memory tool, and responds that the memory was added"""
+
+    id: str = "tool-calling"
+    on_response: Optional[Callable[[], Any]] = None
+
+    def invoke(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[Any]:
+        raise NotImplementedError
+
+    async def ainvoke_stream(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    def response(self, messages: List[Message]) -> ModelResponse:
+        assert self.on_response is not None
+        return ModelResponse(content=f"Added: {self.on_response()}")
+
+    async def aresponse(self, messages: List[Message]) -> ModelResponse:
+        return self.response(messages)
+
+    def response_stream(self, messages: List[Message]) -> Iterator[ModelResponse]:
+        yield self.response(messages)
+
+    async def aresponse_stream(self, messages: List[Message]) -> Any:
+        yield self.response(messages)
+
+
+def test_failed_batch_writes_are_returned_from_the_run(memory_db, monkeypatch):
+    def fail(memories):
+        raise RuntimeError("db unavailable")
+
+    monkeypatch.setattr(memory_db, "upsert_memories", fail)
+    manager = MemoryManager(user_id="u1", db=memory_db)
+    manager.model = ToolCallingModel(on_response=lambda: manager.add_memory("User likes tea"))
+
+    assert manager.run("I like tea") == "Error writing memories: db unavailable"
+    manager.start_batch()
+    manager.add_memory("User likes tea")
+    assert manager.flush_batch() == "Error writing memories: db unavailable"
+
+def test_memory_changes_outside_a_run_are_written_immediately(memory_db):
+    manager = MemoryManager(user_id="u1", db=memory_db)
+    manager.add_memory("User likes tea")
+    assert [row.memory["memory"] for row in memory_db.rows.values()] == ["User likes tea"]
+
+
+def test_read_memories_page(memory_db):
+    start = datetime(2025, 1, 1)
+    for i in range(5):
+        memory_db.upsert_memory(
+            MemoryRow(user_id="u1", memory=Memory(memory=f"memory {i}").to_dict(), created_at=start + timedelta(i))
+        )
+
+    pages = []
+    page, cursor = memory_db.read_memories_page(user_id="u1", limit=2)
+    pages.append([m.memory["memory"] for m in page])
+    while cursor is not None:
+        page, cursor = memory_db.read_memories_page(user_id="u1", limit=2, cursor=cursor)
+        pages.append([m.memory["memory"] for m in page])
+
+    assert pages == [["memory 4", "memory 3"], ["memory 2", "memory 1"], ["memory 0"]]
+    with pytest.raises(ValueError):
+        memory_db.read_memories_page(cursor="invalid")
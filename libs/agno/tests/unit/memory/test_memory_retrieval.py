@@ -0,0 +1,187 @@
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.agent import Agent
+from agno.embedder.base import Embedder
+from agno.memory.agent import AgentMemory, MemoryRetrieval
+from agno.memory.db import MemoryDb
+from agno.memory.memory import Memory
+from agno.memory.row import MemoryRow
+
+TOPICS = ["coffee", "hiking", "python"]
+
+
+@dataclass
+class KeywordEmbedder(Embedder):
+    """Embeds a text as the count of each topic word"""
+
+    dimensions: Optional[int] = len(TOPICS)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(text.lower().count(topic)) for topic in TOPICS]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+def _add_memories(db: MemoryDb, embedder: Optional[Embedder]) -> MemoryDb:
+    db.embedder = embedder
+    for text in ["User drinks coffee every morning", "User likes hiking", "User writes python", "User owns a cat"]:
+        db.upsert_memory(MemoryRow(user_id="u1", memory=Memory(memory=text).to_dict()))
+    db.upsert_memory(MemoryRow(user_id="u2", memory=Memory(memory="User likes hiking and coffee").to_dict()))
+    return db
+
+
+def test_memories_are_embedded_on_upsert(memory_db):
+    _add_memories(memory_db, KeywordEmbedder())
+    assert all(row.embedding is not None for row in memory_db.rows.values())
+    assert "embedding" not in next(iter(memory_db.rows.values())).to_dict()
+
+
+def test_semantic_retrieval_loads_the_most_relevant_memories_of_the_user(memory_db):
+    db = _add_memories(memory_db, KeywordEmbedder())
+    memory = AgentMemory(db=db, user_id="u1", retrieval=MemoryRetrieval.semantic, num_memories=1)
+
+    memory.load_user_memories(query="Any hiking trails nearby?")
+
+    assert [m.memory for m in memory.memories] == ["User likes hiking"]
+
+
+def test_semantic_retrieval_without_a_query_or_embedder_loads_the_latest_memories(memory_db):
+    db = _add_memories(memory_db, KeywordEmbedder())
+    memory = AgentMemory(db=db, user_id="u1", retrieval=MemoryRetrieval.semantic, num_memories=2)
+    memory.load_user_memories()
+    assert [m.memory for m in memory.memories] == ["User owns a cat", "User writes python"]
+
+    memory_db.clear()
+    db = _add_memories(memory_db, None)
+    memory = AgentMemory(db=db, user_id="u1", retrieval=MemoryRetrieval.semantic, num_memories=2)
+    memory.load_user_memories(query="coffee")
+    assert [m.memory for m in memory.memories] == ["User owns a cat", "User writes python"]
+
+
+def test_memories_without_an_embedding_are_embedded_before_the_search(memory_db):
+    _add_memories(memory_db, None)
+    memory_db.embedder = KeywordEmbedder()
+    memory = AgentMemory(db=memory_db, user_id="u1", retrieval=MemoryRetrieval.semantic, num_memories=1)
+
+    memory.load_user_memories(query="Any hiking trails nearby?")
+
+    assert [m.memory for m in memory.memories] == ["User likes hiking"]
+    # Only the memories of the user are embedded, once
+    assert [row.embedding is not None for row in memory_db.rows.values()] == [True] * 4 + [False]
+    assert memory_db.backfill_embeddings(user_id="u1") == 0
+
+
+@pytest.mark.parametrize("query", ["Any hiking trails nearby?", None])
+def test_async_retrieval_reads_the_memory_db_off_the_event_loop(memory_db, monkeypatch, query):
+    db = _add_memories(memory_db, KeywordEmbedder())
+    threads = []
+    for name in ("search_memories", "read_memories"):
+        method = getattr(db, name)
+        monkeypatch.setattr(
+            db, name, lambda _method=method, **kw: threads.append(threading.current_thread()) or _method(**kw)
+        )
+    memory = AgentMemory(db=db, user_id="u1", retrieval=MemoryRetrieval.semantic, num_memories=1)
+
+    asyncio.run(memory.aload_user_memories(query=query))
+
+    assert [m.memory for m in memory.memories] == ["User likes hiking" if query else "User owns a cat"]
+    assert len(threads) > 0 and threading.current_thread() not in threads
+
+
+def test_agent_with_semantic_retrieval_does_not_load_all_memories_when_reading_the_session(memory_db, monkeypatch):
+    from agno.storage.agent.sqlite import SqliteAgentStorage
+
+    db = _add_memories(memory_db, KeywordEmbedder())
+    read_memories_calls = []
+    read_memories = db.read_memories
+    monkeypatch.setattr(db, "read_memories", lambda **kw: read_memories_calls.append(kw) or read_memories(**kw))
+    agent = Agent(
+        memory=AgentMemory(db=db, create_user_memories=True, retrieval=MemoryRetrieval.semantic, num_memories=1),
+        storage=SqliteAgentStorage(table_name="agent_sessions", db_url="sqlite://"),
+        user_id="u1",
+        session_id="s1",
+        telemetry=False,
+        monitoring=False,
+    )
+
+    agent.read_from_storage()
+    assert read_memories_calls == []
+
+    agent.retrieve_user_memories("Any hiking trails nearby?")
+    assert [m.memory for m in agent.memory.memories] == ["User likes hiking"]
+
+    # Without a text message the latest memories are loaded
+    agent.retrieve_user_memories(None)
+    assert [m.memory for m in agent.memory.memories] == ["User owns a cat"]
+
+
+def _sqlite_memory_db(tmp_path) -> Callable[[Optional[Embedder]], MemoryDb]:
+    from agno.memory.db.sqlite import SqliteMemoryDb
+
+    return lambda embedder: SqliteMemoryDb(db_file=str(tmp_path / "memory.db"), embedder=embedder)
+
+
+def _postgres_memory_db(tmp_path) -> Callable[[Optional[Embedder]], MemoryDb]:
+    pytest.importorskip("pgvector")
+    pytest.importorskip("psycopg")
+    from sqlalchemy import create_engine
+    from sqlalchemy.exc import OperationalError
+
+    from agno.memory.db.postgres import PgMemoryDb
+
+    db_engine = create_engine("postgresql+psycopg://ai:ai@localhost:5532/ai")
+    try:
+        db_engine.connect().close()
+    except OperationalError:
+        pytest.skip("Postgres is not running")
+    table_name = f"memory_{tmp_path.name}".replace("-", "_")
+    return lambda embedder: PgMemoryDb(table_name=table_name, db_engine=db_engine, embedder=embedder)
+
+
+def _mongo_memory_db(tmp_path) -> Callable[[Optional[Embedder]], MemoryDb]:
+    pytest.importorskip("pymongo")
+    mongomock = pytest.importorskip("mongomock")
+    from agno.memory.db.mongodb import MongoMemoryDb
+
+    client = mongomock.MongoClient()
+    return lambda embedder: MongoMemoryDb(client=client, embedder=embedder)
+
+
+@pytest.fixture(params=[_sqlite_memory_db, _postgres_memory_db, _mongo_memory_db], ids=["sqlite", "postgres", "mongo"])
+def make_memory_db(request, tmp_path):
+    """Returns a function that opens the same memory db with an embedder"""
+    make_db = request.param(tmp_path)
+    yield make_db
+    make_db(None).drop_table()
+
+
+def test_semantic_retrieval_from_a_memory_db(make_memory_db):
+    db = make_memory_db(KeywordEmbedder())
+    db.create()
+    _add_memories(db, db.embedder)
+    memory = AgentMemory(db=db, user_id="u1", retrieval=MemoryRetrieval.semantic, num_memories=2)
+
+    memory.load_user_memories(query="Is there coffee on the hiking trail?")
+
+    assert sorted(m.memory for m in memory.memories) == ["User drinks coffee every morning", "User likes hiking"]
+
+
+def test_memory_db_embeds_memories_written_before_the_embedder_was_configured(make_memory_db):
+    db = make_memory_db(None)
+    db.create()
+    _add_memories(db, None)
+    assert all(row.embedding is None for row in db.read_memories())
+
+    db = make_memory_db(KeywordEmbedder())
+    memory = AgentMemory(db=db, user_id="u1", retrieval=MemoryRetrieval.semantic, num_memories=1)
+    memory.load_user_memories(query="Any hiking trails nearby?")
+
+    assert [m.memory for m in memory.memories] == ["User likes hiking"]
+    assert all(row.embedding is not None for row in db.read_memories(user_id="u1"))
+    assert all(row.embedding is None for row in db.read_memories(user_id="u2"))
@@ -0,0 +1,47 @@
+import pytest
+
+from agno.models.message import Message
+
+pytest.importorskip("anthropic")
+
+from agno.models.anthropic.claude import Claude  # noqa: E402
+
+
+def get_weather(city: str) -> str:
+    """Get the weather for a city."""
+    return f"It is sunny in {city}"
+
+
+def _messages():
+    return [
+        Message(role="system", content="You are a helpful assistant."),
+        Message(role="user", content="Hi"),
+        Message(role="assistant", content="Hello!"),
+        Message(role="user", content="What is the weather in Paris?"),
+    ]
+
+
+def test_claude_adds_no_cache_breakpoints_by_default():
+    model = Claude(api_key="test")
+    model.add_tool(get_weather)
+    chat_messages, request_kwargs = model.prepare_request(_messages())
+
+    assert request_kwargs["system"] == "You are a helpful assistant."
+    assert "cache_control" not in request_kwargs["tools"][-1]
+    assert chat_messages[-1]["content"] == [{"type": "text", "text": "What is the weather in Paris?"}]
+
+
+def test_claude_adds_cache_breakpoints():
+    model = Claude(api_key="test", cache_system_prompt=True, cache_tools=True, cache_history=True)
+    model.add_tool(get_weather)
+    messages = _messages()
+    chat_messages, request_kwargs = model.prepare_request(messages)
+
+    assert request_kwargs["system"] == [
+        {"type": "text", "text": "You are a helpful assistant.", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert request_kwargs["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert chat_messages[-1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+    # Only the last message has a breakpoint, and the conversation history is not modified
+    assert all("cache_control" not in str(m["content"]) for m in chat_messages[:-1])
+    assert messages[-1].content == "What is the weather in Paris?"
@@ -0,0 +1,69 @@
+import asyncio
+from copy import deepcopy
+
+from agno.embedder.openai import OpenAIEmbedder
+from agno.models.openai import OpenAIChat
+from agno.models.openrouter import OpenRouter
+
+
+def test_async_client_is_reused_within_event_loop():
+    model = OpenAIChat(api_key="test")
+
+    async def get_clients():
+        return model.get_async_client(), model.get_async_client()
+
+    first, second = asyncio.run(get_clients())
+
+    assert first is second
+    assert first._client is model.async_http_client
+
+
+def test_async_client_is_recreated_on_new_event_loop():
+    model = OpenRouter(api_key="test")
+
+    async def get_client():
+        return model.get_async_client()
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert first is not second
+
+
+def test_aclose_releases_async_client():
+    model = OpenAIChat(api_key="test")
+
+    async def open_and_close():
+        http_client = model.get_async_client()._client
+        await model.aclose()
+        return http_client
+
+    http_client = asyncio.run(open_and_close())
+
+    assert http_client.is_closed
+    assert model.async_client is None
+    assert model.async_http_client is None
+
+
+def test_deep_copy_shares_clients():
+    model = OpenAIChat(api_key="test")
+    client = model.get_client()
+
+    assert deepcopy(model).get_client() is client
+
+
+def test_deep_copy_without_sharing_creates_new_clients():
+    model = OpenAIChat(api_key="test", share_clients=False)
+    client = model.get_client()
+
+    copied = deepcopy(model)
+
+    assert copied.client is None
+    assert copied.get_client() is not client
+
+
+def test_embedder_client_is_cached_and_shared_with_copies():
+    embedder = OpenAIEmbedder(api_key="test")
+
+    assert embedder.client is embedder.client
+    assert deepcopy(embedder).client is embedder.client
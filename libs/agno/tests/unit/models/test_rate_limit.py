@@ -0,0 +1,219 @@
+import asyncio
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import pytest
+
+from agno.embedder.base import Embedder
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from agno.utils import rate_limit
+from agno.utils.rate_limit import RateLimit, RateLimiter, clear_rate_limiters
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers: Dict[str, str]):
+        self.status_code = status_code
+        self.headers = headers
+
+
+class FakeRateLimitError(Exception):
+    def __init__(self, retry_after: str):
+        super().__init__("Too many requests")
+        self.response = FakeResponse(429, {"retry-after": retry_after})
+
+
+@dataclass
+class FlakyModel(Model):
+    """Raises a rate limit error for the first `failures` requests"""
+
+    id: str = "flaky"
+    api_key: Optional[str] = "key"
+    failures: int = 0
+    _requests: List[int] = field(default_factory=list)
+
+    def _call(self, messages: List[Message]) -> str:
+        self._requests.append(len(messages))
+        if len(self._requests) <= self.failures:
+            raise FakeRateLimitError(retry_after="0.01")
+        return "ok"
+
+    def invoke(self, messages: List[Message]) -> Any:
+        return self._call(messages)
+
+    async def ainvoke(self, messages: List[Message]) -> Any:
+        await asyncio.sleep(0.01)
+        return self._call(messages)
+
+    def invoke_stream(self, messages: List[Message]) -> Iterator[Any]:
+        yield self._call(messages)
+
+    async def ainvoke_stream(self, messages: List[Message]) -> Any:
+        yield self._call(messages)
+
+    def response(self, messages: List[Message]) -> ModelResponse:
+        return ModelResponse(content=self.invoke(messages))
+
+    async def aresponse(self, messages: List[Message]) -> ModelResponse:
+        return ModelResponse(content=await self.ainvoke(messages))
+
+    def response_stream(self, messages: List[Message]) -> Iterator[ModelResponse]:
+        for content in self.invoke_stream(messages):
+            yield ModelResponse(content=content)
+
+    async def aresponse_stream(self, messages: List[Message]) -> Any:
+        async for content in self.ainvoke_stream(messages):
+            yield ModelResponse(content=content)
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    dimensions: Optional[int] = 1
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(len(text))]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+@dataclass
+class BatchEmbedder(CountingEmbedder):
+    """Sends one request per batch, like the provider embedders"""
+
+    _requests: List[List[str]] = field(default_factory=list)
+
+    def response(self, text: Union[str, List[str]]) -> List[List[float]]:
+        texts = text if isinstance(text, list) else [text]
+        self._requests.append(texts)
+        return [[float(len(t))] for t in texts]
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.response(text)[0]
+
+    def get_embeddings_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        embeddings: List[List[float]] = []
+        for batch in self.iter_batches(texts):
+            embeddings.extend(self.response(text=batch))
+        return embeddings, None
+
+    async def async_get_embeddings_batch(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        return self.get_embeddings_batch(texts)
+
+
+@pytest.fixture(autouse=True)
+def rate_limiters():
+    clear_rate_limiters()
+    yield
+    clear_rate_limiters()
+
+
+def test_limiters_are_shared_by_provider_api_key_and_model_id():
+    model = FlakyModel(rate_limit=RateLimit(requests_per_minute=100))
+    assert deepcopy(model).get_rate_limiter() is model.get_rate_limiter()
+    assert FlakyModel(rate_limit=RateLimit()).get_rate_limiter() is model.get_rate_limiter()
+    assert FlakyModel(api_key="other", rate_limit=RateLimit()).get_rate_limiter() is not model.get_rate_limiter()
+    assert FlakyModel().get_rate_limiter() is None
+
+
+
+def test_a_different_rate_limit_for_a_shared_limiter_is_logged_once(monkeypatch):
+    warnings: List[str] = []
+    monkeypatch.setattr(rate_limit.logger, "warning", warnings.append)
+    limiter = FlakyModel(rate_limit=RateLimit(requests_per_minute=100)).get_rate_limiter()
+
+    for _ in range(2):
+        assert FlakyModel(rate_limit=RateLimit(requests_per_minute=10)).get_rate_limiter() is limiter
+        assert FlakyModel(rate_limit=RateLimit(requests_per_minute=100)).get_rate_limiter() is limiter
+
+    assert limiter.rate_limit.requests_per_minute == 100
+    assert len(warnings) == 1 and "requests_per_minute=10," in warnings[0]
+
+def test_request_bucket_delays_requests_over_the_limit():
+    limiter = RateLimiter(RateLimit(requests_per_minute=2))
+    assert limiter.try_acquire() is None
+    assert limiter.try_acquire() is None
+    wait = limiter.try_acquire()
+    assert wait is not None and 0 < wait <= 30
+
+
+def test_large_requests_wait_for_a_full_token_bucket_and_are_charged_their_full_cost():
+    limiter = RateLimiter(RateLimit(tokens_per_minute=100))
+    limiter.try_acquire(tokens=50)
+    assert limiter.try_acquire(tokens=1000) is not None
+    limiter._token_bucket = 100
+    assert limiter.try_acquire(tokens=1000) is None
+    # The 900 tokens over the bucket and the 10 tokens of the next request are refilled first
+    wait = limiter.try_acquire(tokens=10)
+    assert wait is not None and wait > 9 * 60
+
+
+def test_rate_limited_requests_back_off_and_are_retried():
+    model = FlakyModel(failures=1, rate_limit=RateLimit(max_concurrency=8))
+    messages = [Message(role="user", content="Hi")]
+
+    assert model.response(messages).content == "ok"
+    limiter = model.get_rate_limiter()
+    assert len(model._requests) == 2
+    assert limiter.rate_limited == 1
+    # Halved to 1 by the rate limited request, then raised by the successful retry
+    assert limiter.concurrency_limit == 2
+    assert limiter.in_flight == 0
+    # The retry waited in the limiter for the rest of the retry-after time
+    assert model.metrics["queue_wait_time"] > 0
+
+
+def test_concurrency_ramps_up_after_successful_requests():
+    limiter = RateLimiter(RateLimit(max_concurrency=4))
+    limiter.concurrency_limit = 1
+    for _ in range(3):
+        assert limiter.try_acquire() is None
+        limiter.release()
+    assert 2 < limiter.concurrency_limit <= 4
+
+
+def test_retries_are_limited():
+    model = FlakyModel(failures=5, rate_limit=RateLimit(max_retries=1, max_backoff=0.01))
+    with pytest.raises(FakeRateLimitError):
+        model.response([Message(role="user", content="Hi")])
+    assert len(model._requests) == 2
+
+
+def test_async_and_stream_requests_are_limited():
+    model = FlakyModel(rate_limit=RateLimit(max_concurrency=2))
+    messages = [Message(role="user", content="Hi")]
+
+    async def run():
+        await asyncio.gather(*[model.aresponse(messages) for _ in range(5)])
+        return [chunk.content async for chunk in model.aresponse_stream(messages)]
+
+    assert asyncio.run(run()) == ["ok"]
+    assert [chunk.content for chunk in model.response_stream(messages)] == ["ok"]
+    assert model.get_rate_limiter().requests == 7
+    assert model.get_rate_limiter().in_flight == 0
+
+
+def test_embedder_requests_are_limited():
+    embedder = CountingEmbedder(rate_limit=RateLimit(requests_per_minute=100))
+    embeddings, _ = embedder.get_embeddings_batch(["a", "bb"])
+    assert embeddings == [[1.0], [2.0]]
+    assert embedder.get_rate_limiter().requests == 2
+
+
+def test_batches_take_a_request_each():
+    embedder = BatchEmbedder(batch_size=2, rate_limit=RateLimit(requests_per_minute=100))
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    embeddings, _ = embedder.get_embeddings_batch(texts)
+    assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert len(embedder._requests) == 3
+    assert embedder.get_rate_limiter().requests == 3
+
+    asyncio.run(embedder.async_get_embeddings_batch(texts))
+    assert embedder.get_rate_limiter().requests == 6
+    # A single embedding calls response() from get_embedding(), it is one request
+    embedder.get_embedding("a")
+    assert embedder.get_rate_limiter().requests == 7
+    assert embedder.get_rate_limiter().in_flight == 0
@@ -0,0 +1,136 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional
+
+import pytest
+
+from agno.embedder.base import Embedder
+from agno.models.base import Model
+from agno.models.cache import DiskResponseCacheStore, ResponseCache, SqliteResponseCacheStore
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+
+
+@dataclass
+class EchoModel(Model):
+    """Answers with the last user message and counts calls to the provider"""
+
+    id: str = "echo"
+    temperature: Optional[float] = None
+    _calls: int = 0
+
+    def invoke(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[Any]:
+        raise NotImplementedError
+
+    async def ainvoke_stream(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    def _answer(self, messages: List[Message]) -> str:
+        self._calls += 1
+        answer = f"echo: {messages[-1].content}"
+        messages.append(Message(role="assistant", content=answer))
+        return answer
+
+    def response(self, messages: List[Message]) -> ModelResponse:
+        return ModelResponse(content=self._answer(messages))
+
+    async def aresponse(self, messages: List[Message]) -> ModelResponse:
+        return ModelResponse(content=self._answer(messages))
+
+    def response_stream(self, messages: List[Message]) -> Iterator[ModelResponse]:
+        for word in self._answer(messages).split(" "):
+            yield ModelResponse(content=word)
+
+    async def aresponse_stream(self, messages: List[Message]) -> Any:
+        for word in self._answer(messages).split(" "):
+            yield ModelResponse(content=word)
+
+
+@dataclass
+class LengthEmbedder(Embedder):
+    dimensions: Optional[int] = 2
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [1.0, float("?" in text)]
+
+
+def _messages(text: str = "Hi") -> List[Message]:
+    return [Message(role="system", content="Be brief."), Message(role="user", content=text)]
+
+
+@pytest.mark.parametrize("store", ["memory", "sqlite", "disk"])
+def test_identical_requests_are_served_from_the_cache(store, tmp_path):
+    if store == "sqlite":
+        cache = ResponseCache(store=SqliteResponseCacheStore(db_file=tmp_path / "cache.db"))
+    elif store == "disk":
+        cache = ResponseCache(store=DiskResponseCacheStore(path=tmp_path / "cache"))
+    else:
+        cache = ResponseCache()
+    model = EchoModel(response_cache=cache)
+
+    first_messages, second_messages = _messages(), _messages()
+    first = model.response(first_messages)
+    second = model.response(second_messages)
+
+    assert model._calls == 1
+    assert second.content == first.content == "echo: Hi"
+    assert [m.content for m in second_messages] == [m.content for m in first_messages]
+    assert cache.cache_info() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_changed_messages_or_params_are_cache_misses():
+    model = EchoModel(response_cache=ResponseCache())
+    model.response(_messages("Hi"))
+    model.response(_messages("Bye"))
+    model.temperature = 0.5
+    model.response(_messages("Hi"))
+    assert model._calls == 3
+
+
+def test_streams_are_replayed_from_the_cache():
+    model = EchoModel(response_cache=ResponseCache())
+    first = [chunk.content for chunk in model.response_stream(_messages())]
+    messages = _messages()
+    second = [chunk.content for chunk in model.response_stream(messages)]
+
+    assert model._calls == 1
+    assert second == first == ["echo:", "Hi"]
+    assert messages[-1].content == "echo: Hi"
+
+
+def test_async_responses_are_cached():
+    async def run():
+        model = EchoModel(response_cache=ResponseCache())
+        first = await model.aresponse(_messages())
+        second = await model.aresponse(_messages())
+        chunks = [chunk.content async for chunk in model.aresponse_stream(_messages())]
+        cached_chunks = [chunk.content async for chunk in model.aresponse_stream(_messages())]
+        return model._calls, first, second, chunks, cached_chunks
+
+    calls, first, second, chunks, cached_chunks = asyncio.run(run())
+    assert calls == 2
+    assert second.content == first.content
+    assert cached_chunks == chunks
+
+
+def test_similar_user_messages_are_served_from_the_cache():
+    model = EchoModel(response_cache=ResponseCache(embedder=LengthEmbedder()))
+    model.response(_messages("How are you?"))
+    cached = model.response(_messages("How are you doing?"))
+    model.response(_messages("Hello"))
+
+    assert cached.content == "echo: How are you?"
+    assert model._calls == 2
+
+
+def test_expired_responses_are_not_served():
+    model = EchoModel(response_cache=ResponseCache(ttl=0))
+    model.response(_messages())
+    model.response(_messages())
+    assert model._calls == 2
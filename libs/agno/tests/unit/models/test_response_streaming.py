@@ -0,0 +1,82 @@
+import asyncio
+from typing import Any, AsyncIterator, Iterator, List
+
+from openai.types.chat.chat_completion_chunk import (
+    ChatCompletionChunk,
+    Choice,
+    ChoiceDelta,
+    ChoiceDeltaToolCall,
+    ChoiceDeltaToolCallFunction,
+)
+
+from agno.agent import Agent
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+
+CONTENT = ["It is ", "sunny ", "in Paris"]
+
+
+def get_weather(city: str) -> str:
+    """Get the weather in a city"""
+    return f"sunny in {city}"
+
+
+def _chunk(delta: ChoiceDelta) -> ChatCompletionChunk:
+    return ChatCompletionChunk(
+        id="chunk", object="chat.completion.chunk", created=0, model="gpt-4o", choices=[Choice(index=0, delta=delta)]
+    )
+
+
+class ToolCallingModel(OpenAIChat):
+    """Streams a get_weather tool call, then the answer in chunks once the tool result is in the messages"""
+
+    def _chunks(self, messages: List[Message]) -> List[ChatCompletionChunk]:
+        if messages[-1].role != "tool":
+            tool_call = ChoiceDeltaToolCall(
+                index=0,
+                id="call_1",
+                type="function",
+                function=ChoiceDeltaToolCallFunction(name="get_weather", arguments='{"city": "Paris"}'),
+            )
+            return [_chunk(ChoiceDelta(role="assistant", tool_calls=[tool_call]))]
+        return [_chunk(ChoiceDelta(role="assistant", content=content)) for content in CONTENT]
+
+    def invoke_stream(self, messages: List[Message]) -> Iterator[Any]:
+        yield from self._chunks(messages)
+
+    async def ainvoke_stream(self, messages: List[Message]) -> AsyncIterator[Any]:
+        for chunk in self._chunks(messages):
+            yield chunk
+
+
+def _agent() -> Agent:
+    return Agent(model=ToolCallingModel(api_key="test"), tools=[get_weather], telemetry=False, monitoring=False)
+
+
+def _check_stream(agent: Agent, chunks) -> None:
+    assert [chunk.content for chunk in chunks] == CONTENT
+    assert agent.run_response.content == "".join(CONTENT)
+    assert agent.memory.messages[-1].role == "assistant"
+    assert agent.memory.messages[-1].content == "".join(CONTENT)
+    assert [message.content for message in agent.memory.messages if message.role == "tool"] == ["sunny in Paris"]
+    # Each chunk is its own copy of the template built after the tool call
+    assert len({id(chunk) for chunk in chunks}) == len(CONTENT)
+    for chunk in chunks:
+        assert chunk.run_id == agent.run_response.run_id
+        assert [tool["tool_call_id"] for tool in chunk.tools] == ["call_1"]
+
+
+def test_agent_stream_over_a_tool_call():
+    agent = _agent()
+    chunks = list(agent.run("What is the weather in Paris?", stream=True))
+    _check_stream(agent, chunks)
+
+
+def test_agent_async_stream_over_a_tool_call():
+    agent = _agent()
+
+    async def run():
+        return [chunk async for chunk in await agent.arun("What is the weather in Paris?", stream=True)]
+
+    chunks = asyncio.run(run())
+    _check_stream(agent, chunks)
@@ -0,0 +1,175 @@
+import threading
+import time
+from typing import List
+
+from agno.agent import Agent
+from agno.memory import AgentMemory
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.models.response import ModelResponseEvent
+from agno.run.response import RunResponse
+from agno.tools.function import Function, FunctionCall
+
+
+def make_calls(functions: List[Function], delays: List[float]) -> List[FunctionCall]:
+    return [
+        FunctionCall(function=function, arguments={"delay": delay}, call_id=f"call_{i}")
+        for i, (function, delay) in enumerate(zip(functions, delays))
+    ]
+
+
+def sleep_and_return(delay: float) -> str:
+    """Sleep for delay seconds"""
+    time.sleep(delay)
+    return f"slept {delay}"
+
+
+def run(model: OpenAIChat, function_calls: List[FunctionCall]):
+    results: List[Message] = []
+    responses = list(model.run_function_calls(function_calls, results))
+    return responses, results
+
+
+def test_sync_tool_calls_run_in_parallel_and_keep_order():
+    function = Function.from_callable(sleep_and_return)
+    model = OpenAIChat(api_key="test")
+
+    start = time.perf_counter()
+    responses, results = run(model, make_calls([function] * 4, [0.3, 0.2, 0.1, 0.2]))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.6
+    assert [r.content for r in results] == ["slept 0.3", "slept 0.2", "slept 0.1", "slept 0.2"]
+    events = [r.event for r in responses]
+    assert (
+        events == [ModelResponseEvent.tool_call_started.value] * 4 + [ModelResponseEvent.tool_call_completed.value] * 4
+    )
+
+
+def test_max_parallel_tool_calls_one_runs_sequentially():
+    function = Function.from_callable(sleep_and_return)
+    model = OpenAIChat(api_key="test", max_parallel_tool_calls=1)
+
+    responses, results = run(model, make_calls([function] * 2, [0.0, 0.0]))
+
+    events = [r.event for r in responses]
+    assert (
+        events
+        == [
+            ModelResponseEvent.tool_call_started.value,
+            ModelResponseEvent.tool_call_completed.value,
+        ]
+        * 2
+    )
+    assert len(results) == 2
+
+
+def test_functions_can_opt_out_of_parallel_execution():
+    threads = []
+
+    def record_thread(delay: float) -> str:
+        """Record the thread"""
+        threads.append(threading.current_thread())
+        return "ok"
+
+    parallel = Function.from_callable(sleep_and_return)
+    sequential = Function.from_callable(record_thread)
+    sequential.run_in_parallel = False
+    model = OpenAIChat(api_key="test")
+
+    _, results = run(model, make_calls([parallel, sequential, parallel], [0.05, 0.0, 0.05]))
+
+    assert threads == [threading.current_thread()]
+    assert [r.content for r in results] == ["slept 0.05", "ok", "slept 0.05"]
+
+
+def test_tool_call_limit_stops_extra_calls_from_running():
+    calls = []
+
+    def count(delay: float) -> str:
+        """Count calls"""
+        calls.append(delay)
+        return "ok"
+
+    function = Function.from_callable(count)
+    model = OpenAIChat(api_key="test", tool_call_limit=2)
+
+    _, results = run(model, make_calls([function] * 4, [1, 2, 3, 4]))
+
+    assert sorted(calls) == [1, 2]
+    assert len(results) == 2
+    assert model.tool_choice == "none"
+
+
+def test_transfers_to_the_same_member_run_one_at_a_time(monkeypatch):
+    member = Agent(name="Researcher", model=OpenAIChat(api_key="test"))
+    leader = Agent(model=OpenAIChat(api_key="test"), team=[member])
+    running, max_running = [0], [0]
+
+    def run_member(task: str, stream: bool = False) -> RunResponse:
+        running[0] += 1
+        max_running[0] = max(max_running[0], running[0])
+        time.sleep(0.05)
+        running[0] -= 1
+        return RunResponse(content=task.split("\n")[0])
+
+    monkeypatch.setattr(member, "run", run_member)
+    transfer = leader.get_transfer_function(member, 0)
+    transfer.process_entrypoint()
+    assert transfer.run_in_parallel is False
+    function_calls = [
+        FunctionCall(
+            function=transfer,
+            arguments={"task_description": f"task {i}", "expected_output": "summary"},
+            call_id=f"call_{i}",
+        )
+        for i in range(2)
+    ]
+
+    _, results = run(OpenAIChat(api_key="test"), function_calls)
+
+    assert max_running[0] == 1
+    assert [r.content.startswith(f"task {i}") for i, r in enumerate(results)] == [True, True]
+
+
+def test_tools_that_change_agent_state_are_not_run_in_parallel(vector_db):
+    from agno.knowledge.document import DocumentKnowledgeBase
+
+    agent = Agent(
+        memory=AgentMemory(create_user_memories=True),
+        knowledge=DocumentKnowledgeBase(documents=[], vector_db=vector_db),
+        update_knowledge=True,
+        read_chat_history=True,
+    )
+
+    run_in_parallel = {
+        tool.name if isinstance(tool, Function) else tool.__name__: getattr(tool, "run_in_parallel", True)
+        for tool in agent.get_tools()
+    }
+
+    assert run_in_parallel == {
+        "get_chat_history": True,
+        "update_memory": False,
+        "search_knowledge_base": False,
+        "add_to_knowledge": False,
+    }
+
+
+def test_toolkit_functions_run_sequentially_unless_the_toolkit_opts_in():
+    from agno.tools import Toolkit
+    from agno.tools.calculator import CalculatorTools
+
+    stateful = Toolkit(name="stateful")
+    stateful.register(sleep_and_return)
+    assert stateful.functions["sleep_and_return"].run_in_parallel is False
+
+    stateful.register(sleep_and_return, run_in_parallel=True)
+    assert stateful.functions["sleep_and_return"].run_in_parallel is True
+
+    stateless = Toolkit(name="stateless", run_in_parallel=True)
+    stateless.register(sleep_and_return)
+    assert stateless.functions["sleep_and_return"].run_in_parallel is True
+
+    assert all(f.run_in_parallel for f in CalculatorTools().functions.values())
+    # Plain functions still run in parallel by default
+    assert Function.from_callable(sleep_and_return).run_in_parallel is True
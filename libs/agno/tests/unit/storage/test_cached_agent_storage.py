@@ -0,0 +1,173 @@
+import threading
+
+from agno.agent import Agent
+from agno.memory.agent import AgentMemory
+from agno.models.message import Message
+from agno.storage.agent.cached import CachedAgentStorage
+from agno.storage.agent.session import AgentSession
+from agno.storage.agent.sqlite import SqliteAgentStorage
+
+
+class CountingStorage(SqliteAgentStorage):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reads = 0
+        self.upserts = 0
+        self.validations = 0
+
+    def read(self, session_id, user_id=None):
+        self.reads += 1
+        return super().read(session_id=session_id, user_id=user_id)
+
+    def upsert(self, session, create_and_retry=True):
+        self.upserts += 1
+        return super().upsert(session, create_and_retry=create_and_retry)
+
+    def get_session_updated_at(self, session_id):
+        self.validations += 1
+        return super().get_session_updated_at(session_id)
+
+
+def _session(session_id: str, state: int) -> AgentSession:
+    return AgentSession(
+        session_id=session_id,
+        user_id="u1",
+        memory={"runs": [], "messages": []},
+        session_data={"session_state": {"state": state}},
+    )
+
+
+def test_read_is_served_from_cache_after_upsert(tmp_path):
+    backend = CountingStorage(table_name="sessions", db_file=str(tmp_path / "agents.db"))
+    storage = CachedAgentStorage(backend)
+
+    storage.upsert(_session("s1", state=1))
+    reads = backend.reads
+    session = storage.read("s1")
+
+    assert session.session_data == {"session_state": {"state": 1}}
+    assert backend.reads == reads
+    assert storage.hits == 1
+
+    # Mutating a returned session does not change the cached one
+    session.session_data["session_state"]["state"] = 2
+    assert storage.read("s1").session_data == {"session_state": {"state": 1}}
+
+
+def test_upsert_does_not_read_the_session_back(tmp_path):
+    backend = CountingStorage(table_name="sessions", db_file=str(tmp_path / "agents.db"))
+    storage = CachedAgentStorage(backend)
+
+    saved = storage.upsert(_session("s1", state=1))
+
+    assert backend.reads == 0
+    assert saved.created_at is not None
+
+
+def test_sessions_are_validated_at_most_once_per_interval(tmp_path):
+    backend = CountingStorage(table_name="sessions", db_file=str(tmp_path / "agents.db"))
+    storage = CachedAgentStorage(backend, validate_interval=60)
+    storage.upsert(_session("s1", state=1))
+
+    for _ in range(3):
+        assert storage.read("s1") is not None
+    assert backend.validations == 0
+
+    storage.validate_interval = 0
+    assert storage.read("s1") is not None
+    assert backend.validations == 1
+
+
+def test_agent_does_not_rebuild_an_unchanged_cached_memory(tmp_path, monkeypatch):
+    backend = CountingStorage(table_name="sessions", db_file=str(tmp_path / "agents.db"))
+    storage = CachedAgentStorage(backend, write_behind=True, flush_interval=60)
+    agent = Agent(storage=storage, session_id="s1", memory=AgentMemory(), telemetry=False, monitoring=False)
+    agent.memory.add_system_message(Message(role="system", content="You are helpful"), system_message_role="system")
+    agent.write_to_storage()
+
+    set_runs = []
+    monkeypatch.setattr(AgentMemory, "set_runs", lambda self, runs: set_runs.append(runs))
+    for _ in range(2):
+        agent.read_from_storage()
+    assert set_runs == []
+    assert len(agent.memory.messages) == 1
+
+    # A session written by another agent is loaded
+    other = Agent(storage=storage, session_id="s1", telemetry=False, monitoring=False)
+    other.read_from_storage()
+    other.write_to_storage()
+    set_runs.clear()
+    agent.read_from_storage()
+    assert len(set_runs) == 1
+    storage.close()
+
+
+def test_sessions_written_by_another_worker_are_reloaded(tmp_path):
+    backend = CountingStorage(table_name="sessions", db_file=str(tmp_path / "agents.db"))
+    storage = CachedAgentStorage(backend, validate_interval=0)
+    storage.upsert(_session("s1", state=1))
+
+    # Another worker writes the session to the same database
+    other_worker = SqliteAgentStorage(table_name="sessions", db_file=str(tmp_path / "agents.db"))
+    other_worker.upsert(_session("s1", state=2))
+    with other_worker.Session() as sess, sess.begin():
+        sess.execute(other_worker.table.update().values(updated_at=4102444800))
+
+    assert storage.read("s1").session_data == {"session_state": {"state": 2}}
+    assert storage.misses == 1
+
+    other_worker.delete_session("s1")
+    assert storage.read("s1") is None
+
+
+def test_write_behind_coalesces_writes_until_flush(tmp_path):
+    backend = CountingStorage(table_name="sessions", db_file=str(tmp_path / "agents.db"))
+    backend.create()
+    storage = CachedAgentStorage(backend, write_behind=True, flush_interval=60)
+
+    for state in range(5):
+        session = _session("s1", state=state)
+        saved = storage.upsert(session)
+        # The agent keeps mutating its session_state after the write
+        session.session_data["session_state"]["state"] = -1
+        assert saved.session_data == {"session_state": {"state": state}}
+
+    assert backend.upserts == 0
+    assert storage.read("s1").session_data == {"session_state": {"state": 4}}
+
+    storage.flush()
+    assert backend.upserts == 1
+    assert backend.read("s1").session_data == {"session_state": {"state": 4}}
+    assert storage.cache_info()["pending_writes"] == 0
+
+    storage.upsert(_session("s2", state=1))
+    # Listings include sessions with pending writes
+    assert sorted(storage.get_all_session_ids()) == ["s1", "s2"]
+    storage.close()
+
+
+def test_delete_waits_for_a_flush_writing_the_session(tmp_path):
+    writing, deleted = threading.Event(), threading.Event()
+
+    class SlowStorage(CountingStorage):
+        def upsert(self, session, create_and_retry=True):
+            writing.set()
+            # A delete that does not wait for the flush would finish before the write
+            deleted.wait(timeout=0.5)
+            return super().upsert(session, create_and_retry=create_and_retry)
+
+    backend = SlowStorage(table_name="sessions", db_file=str(tmp_path / "agents.db"))
+    backend.create()
+    storage = CachedAgentStorage(backend, write_behind=True, flush_interval=60)
+    storage.upsert(_session("s1", state=1))
+
+    flush = threading.Thread(target=storage.flush)
+    flush.start()
+    writing.wait(timeout=5)
+    storage.delete_session("s1")
+    deleted.set()
+    flush.join()
+
+    assert backend.read("s1") is None
+    assert storage.read("s1") is None
+    storage.close()
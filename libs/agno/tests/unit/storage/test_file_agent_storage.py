@@ -0,0 +1,122 @@
+import json
+import threading
+
+import pytest
+
+from agno.storage.agent.file import SessionIndex
+from agno.storage.agent.json import JsonAgentStorage
+from agno.storage.agent.session import AgentSession
+from agno.storage.agent.yaml import YamlAgentStorage
+
+
+def _session(session_id: str, user_id: str = "u1", agent_id: str = "a1", created_at=None) -> AgentSession:
+    return AgentSession(
+        session_id=session_id,
+        user_id=user_id,
+        agent_id=agent_id,
+        memory={"runs": [{"message": {"role": "user", "content": f"hello {session_id}"}}]},
+        session_data={"session_name": f"name {session_id}" if session_id == "s2" else None},
+        created_at=created_at,
+    )
+
+
+@pytest.mark.parametrize(
+    "storage_class, kwargs",
+    [(JsonAgentStorage, {}), (JsonAgentStorage, {"compact": True}), (YamlAgentStorage, {})],
+)
+def test_listings_are_served_from_the_index(tmp_path, storage_class, kwargs):
+    storage = storage_class(dir_path=tmp_path, **kwargs)
+    for i, user_id in enumerate(["u1", "u2", "u1"]):
+        storage.upsert(_session(f"s{i + 1}", user_id=user_id, created_at=100 + i))
+
+    assert storage.read("s1").memory["runs"][0]["message"]["content"] == "hello s1"
+    assert storage.get_all_session_ids() == ["s3", "s2", "s1"]
+    assert storage.get_all_session_ids(user_id="u1") == ["s3", "s1"]
+    assert [s.session_id for s in storage.get_all_sessions(user_id="u1")] == ["s3", "s1"]
+    assert storage.get_session_updated_at("s1") is not None
+
+    page, cursor = storage.get_session_summaries(limit=2)
+    assert [(s.session_id, s.title) for s in page] == [("s3", "hello s3"), ("s2", "name s2")]
+    page, cursor = storage.get_session_summaries(limit=2, cursor=cursor)
+    assert [s.session_id for s in page] == ["s1"] and cursor is None
+
+    storage.delete_session("s2")
+    assert storage.get_all_session_ids() == ["s3", "s1"]
+    assert storage.read("s2") is None
+    assert sorted(p.name for p in tmp_path.iterdir() if not p.name.startswith(".")) == [
+        f"s1.{storage.extension}",
+        f"s3.{storage.extension}",
+    ]
+
+    storage.drop()
+    assert storage.get_all_session_ids() == []
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_upsert_keeps_created_at_and_compacts_the_index(tmp_path):
+    storage = JsonAgentStorage(dir_path=tmp_path)
+    storage.index.min_compact_lines = 4
+    first = storage.upsert(_session("s1"))
+    created_at = first.created_at
+    for _ in range(10):
+        storage.upsert(_session("s1"))
+
+    assert storage.read("s1").created_at == created_at
+    assert len((tmp_path / ".index.jsonl").read_text().splitlines()) <= 4
+
+    # A second storage on the same directory sees the writes of the first
+    other = JsonAgentStorage(dir_path=tmp_path)
+    storage.upsert(_session("s2"))
+    assert sorted(other.get_all_session_ids()) == ["s1", "s2"]
+
+
+def test_index_is_built_for_existing_session_files(tmp_path):
+    for session_id in ["s1", "s2"]:
+        (tmp_path / f"{session_id}.json").write_text(
+            json.dumps({"session_id": session_id, "user_id": "u1", "agent_id": "a1", "created_at": 1})
+        )
+
+    storage = JsonAgentStorage(dir_path=tmp_path)
+
+    assert sorted(storage.get_all_session_ids(user_id="u1")) == ["s1", "s2"]
+    assert (tmp_path / ".index.jsonl").exists()
+
+
+def test_index_is_repaired_after_a_crash_between_the_session_write_and_the_index_update(tmp_path):
+    storage = JsonAgentStorage(dir_path=tmp_path)
+    storage.upsert(_session("s1"))
+    storage.upsert(_session("s2"))
+    # The process stopped after writing s3 and after deleting s2, before updating the index
+    (tmp_path / "s3.json").write_text(json.dumps({"session_id": "s3", "user_id": "u1", "created_at": 1}))
+    (tmp_path / "s2.json").unlink()
+
+    assert sorted(JsonAgentStorage(dir_path=tmp_path).get_all_session_ids()) == ["s1", "s3"]
+
+
+def test_index_entries_are_a_copy(tmp_path):
+    index = SessionIndex(tmp_path / ".index.jsonl")
+    index.put({"session_id": "s1"})
+
+    entries = index.entries()
+    index.put({"session_id": "s2"})
+
+    assert [entry["session_id"] for entry in entries] == ["s1"]
+
+
+def test_compaction_keeps_the_lines_appended_by_other_writers(tmp_path):
+    # Two indexes on the same file, as used by two processes
+    indexes = [SessionIndex(tmp_path / ".index.jsonl", min_compact_lines=4) for _ in range(2)]
+
+    def write(writer: int):
+        for i in range(100):
+            indexes[writer].put({"session_id": f"w{writer}-{i % 10}", "n": i})
+
+    threads = [threading.Thread(target=write, args=(writer,)) for writer in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for index in indexes:
+        entries = {entry["session_id"]: entry["n"] for entry in index.entries()}
+        assert entries == {f"w{writer}-{i}": 90 + i for writer in range(2) for i in range(10)}
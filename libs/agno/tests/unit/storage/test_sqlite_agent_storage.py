@@ -0,0 +1,264 @@
+import asyncio
+
+import pytest
+
+from agno.agent import Agent
+from agno.memory.agent import AgentMemory, AgentRun
+from agno.models.message import Message
+from agno.run.response import RunResponse, RunResponseExtraData
+from agno.storage.agent import normalize
+from agno.storage.agent.session import AgentSession
+from agno.storage.agent.sqlite import SqliteAgentStorage
+
+
+def _memory(num_runs: int, add_history: bool = False):
+    system = Message(role="system", content="You are helpful", created_at=1)
+    memory = AgentMemory()
+    memory.messages.append(system)
+    history = [system]
+    for i in range(num_runs):
+        user = Message(role="user", content=f"question {i}", created_at=10 + i)
+        assistant = Message(role="assistant", content=f"answer {i}", created_at=100 + i)
+        # Each run's response replays the whole history
+        messages = history + [user, assistant]
+        extra_data = RunResponseExtraData(history=history) if add_history else None
+        memory.add_run(
+            AgentRun(
+                message=user,
+                messages=[user, assistant],
+                response=RunResponse(
+                    run_id=f"run-{i}", content=f"answer {i}", messages=messages, extra_data=extra_data
+                ),
+            )
+        )
+        memory.messages.extend([user, assistant])
+        history = messages
+    return memory.to_dict()
+
+
+def _first_runs(memory, num_runs: int):
+    # The same runs as in memory, run responses have a created_at timestamp
+    return dict(memory, runs=memory["runs"][:num_runs], messages=memory["messages"][: 1 + 2 * num_runs])
+
+
+def test_v2_round_trips_memory_and_stores_each_message_once(tmp_path):
+    storage = SqliteAgentStorage(table_name="agent_sessions", db_file=str(tmp_path / "agents.db"), schema_version=2)
+    memory = _memory(num_runs=3)
+
+    saved = storage.upsert(AgentSession(session_id="s1", agent_id="a1", memory=memory))
+    assert saved is not None
+    assert saved.created_at is not None
+
+    read = storage.read("s1")
+    assert read is not None
+    assert read.memory == memory
+
+    with storage.Session() as sess:
+        assert sess.query(storage.runs_table).count() == 3
+        # 1 system message + 2 messages per run, despite the replayed history
+        assert sess.query(storage.messages_table).count() == 7
+
+
+def test_v2_only_writes_runs_that_changed(tmp_path):
+    storage = SqliteAgentStorage(table_name="agent_sessions", db_file=str(tmp_path / "agents.db"), schema_version=2)
+    memory = _memory(num_runs=3)
+    storage.upsert(AgentSession(session_id="s1", memory=_first_runs(memory, 2)))
+    with storage.Session() as sess:
+        first_run_hash = (
+            sess.execute(storage.runs_table.select().where(storage.runs_table.c.run_index == 0)).fetchone().run_hash
+        )
+
+    storage.upsert(AgentSession(session_id="s1", memory=memory))
+
+    with storage.Session() as sess:
+        rows = sess.execute(storage.runs_table.select().order_by(storage.runs_table.c.run_index)).fetchall()
+    assert [row.run_id for row in rows] == ["run-0", "run-1", "run-2"]
+    assert rows[0].run_hash == first_run_hash
+    assert rows[0].updated_at is None
+    assert storage.read("s1").memory == memory
+
+    storage.delete_session("s1")
+    assert storage.read("s1") is None
+    with storage.Session() as sess:
+        assert sess.query(storage.runs_table).count() == 0
+        assert sess.query(storage.messages_table).count() == 0
+
+
+def test_v2_stores_the_history_of_runs_as_message_references(tmp_path):
+    storage = SqliteAgentStorage(table_name="agent_sessions", db_file=str(tmp_path / "agents.db"), schema_version=2)
+    memory = _memory(num_runs=3, add_history=True)
+
+    storage.upsert(AgentSession(session_id="s1", memory=memory))
+
+    with storage.Session() as sess:
+        assert sess.query(storage.messages_table).count() == 7
+        rows = sess.execute(storage.runs_table.select().order_by(storage.runs_table.c.run_index)).fetchall()
+    history = rows[2].run["response"]["extra_data"]["history"]
+    assert len(history) == 5 and all(isinstance(h, str) for h in history)
+    assert storage.read("s1").memory == memory
+
+
+def test_v2_only_hashes_runs_added_since_the_last_write(tmp_path, monkeypatch):
+    storage = SqliteAgentStorage(table_name="agent_sessions", db_file=str(tmp_path / "agents.db"), schema_version=2)
+    memory = _memory(num_runs=3)
+    storage.upsert(AgentSession(session_id="s1", memory=_first_runs(memory, 2)))
+
+    hashed = []
+    get_hash = normalize.get_hash
+    monkeypatch.setattr(normalize, "get_hash", lambda data: hashed.append(data) or get_hash(data))
+    storage.upsert(AgentSession(session_id="s1", memory=memory))
+
+    # The 2 new memory messages and the new run with its message, 2 messages and the 7 messages of its response
+    assert len(hashed) == 13
+    assert [h["response"]["run_id"] for h in hashed if "response" in h] == ["run-2"]
+    assert storage.read("s1").memory == memory
+
+
+def test_v2_only_reads_the_hashes_of_runs_from_the_last_written_run_on(tmp_path, monkeypatch):
+    storage = SqliteAgentStorage(table_name="agent_sessions", db_file=str(tmp_path / "agents.db"), schema_version=2)
+    memory = _memory(num_runs=4)
+    storage.upsert(AgentSession(session_id="s1", memory=_first_runs(memory, 3)))
+
+    read_hashes = []
+    read_run_hashes = storage._read_run_hashes
+    monkeypatch.setattr(
+        storage,
+        "_read_run_hashes",
+        lambda *args: read_hashes.append(read_run_hashes(*args)) or read_hashes[-1],
+    )
+    storage.upsert(AgentSession(session_id="s1", memory=memory))
+
+    # The hash of the last run of the previous write checks the session was not changed by another writer
+    assert [sorted(hashes) for hashes in read_hashes] == [[2]]
+    assert storage.read("s1").memory == memory
+
+def test_v2_rewrites_runs_deleted_by_another_writer(tmp_path):
+    db_file = str(tmp_path / "agents.db")
+    storage = SqliteAgentStorage(table_name="agent_sessions", db_file=db_file, schema_version=2)
+    other = SqliteAgentStorage(table_name="agent_sessions", db_file=db_file, schema_version=2)
+    storage.upsert(AgentSession(session_id="s1", memory=_memory(num_runs=2)))
+    other.delete_session("s1")
+
+    memory = _memory(num_runs=2)
+    storage.upsert(AgentSession(session_id="s1", memory=memory))
+
+    assert other.read("s1").memory == memory
+
+
+def test_v2_reads_runs_with_inline_history(tmp_path):
+    storage = SqliteAgentStorage(table_name="agent_sessions", db_file=str(tmp_path / "agents.db"), schema_version=2)
+    memory = _memory(num_runs=2, add_history=True)
+    storage.upsert(AgentSession(session_id="s1", memory=memory))
+
+    # Runs written before the history was normalized hold the history messages inline
+    with storage.Session() as sess, sess.begin():
+        row = sess.execute(storage.runs_table.select().where(storage.runs_table.c.run_index == 1)).fetchone()
+        run_data = dict(row.run)
+        run_data["response"] = dict(run_data["response"], extra_data=memory["runs"][1]["response"]["extra_data"])
+        sess.execute(
+            storage.runs_table.update().where(storage.runs_table.c.run_index == 1).values(run=run_data)
+        )
+
+    assert storage.read("s1").memory == memory
+
+
+def test_upgrade_schema_migrates_v1_sessions(tmp_path):
+    db_file = str(tmp_path / "agents.db")
+    memory = _memory(num_runs=2)
+    SqliteAgentStorage(table_name="agent_sessions", db_file=db_file).upsert(
+        AgentSession(session_id="s1", memory=memory)
+    )
+
+    storage = SqliteAgentStorage(table_name="agent_sessions", db_file=db_file, schema_version=2)
+    # Sessions written with schema version 1 can be read before they are migrated
+    assert storage.read("s1").memory == memory
+
+    storage.upgrade_schema()
+
+    with storage.Session() as sess:
+        stored_memory = sess.execute(storage.table.select()).fetchone().memory
+        assert "runs" not in stored_memory and "messages" not in stored_memory
+        assert sess.query(storage.runs_table).count() == 2
+    assert storage.read("s1").memory == memory
+    assert [s.session_id for s in storage.get_all_sessions()] == ["s1"]
+
+
+def test_agent_reloads_session_from_v2_storage(tmp_path):
+    storage = SqliteAgentStorage(table_name="agent_sessions", db_file=str(tmp_path / "agents.db"), schema_version=2)
+    storage.upsert(AgentSession(session_id="s1", agent_id="a1", memory=_memory(num_runs=2)))
+
+    agent = Agent(storage=storage, session_id="s1", telemetry=False, monitoring=False)
+    agent.read_from_storage()
+
+    assert [run.response.run_id for run in agent.memory.runs] == ["run-0", "run-1"]
+    assert agent.memory.runs[1].response.messages[0].role == "system"
+    assert len(agent.memory.messages) == 5
+
+
+def test_async_methods_do_not_block_the_event_loop(tmp_path):
+    storage = SqliteAgentStorage(table_name="agent_sessions", db_file=str(tmp_path / "agents.db"), schema_version=2)
+    memory = _memory(num_runs=2)
+
+    async def main():
+        await storage.aupsert(AgentSession(session_id="s1", user_id="u1", memory=memory))
+        session = await storage.aread("s1")
+        session_ids = await storage.aget_all_session_ids(user_id="u1")
+        await storage.adelete_session("s1")
+        return session, session_ids, await storage.aread("s1")
+
+    session, session_ids, deleted = asyncio.run(main())
+    assert session.memory == memory
+    assert session_ids == ["s1"]
+    assert deleted is None
+
+
+@pytest.mark.parametrize("schema_version", [1, 2])
+def test_session_summaries_are_paged_with_a_cursor(tmp_path, schema_version):
+    storage = SqliteAgentStorage(
+        table_name="agent_sessions", db_file=str(tmp_path / "agents.db"), schema_version=schema_version
+    )
+    for i in range(5):
+        session_data = {"session_name": "named"} if i == 2 else None
+        storage.upsert(AgentSession(session_id=f"s{i}", user_id="u1", memory=_memory(1), session_data=session_data))
+    storage.upsert(AgentSession(session_id="other", user_id="u2", memory=_memory(1)))
+
+    pages = []
+    sessions, cursor = storage.get_session_summaries(user_id="u1", limit=2)
+    pages.append([s.session_id for s in sessions])
+    while cursor is not None:
+        sessions, cursor = storage.get_session_summaries(user_id="u1", limit=2, cursor=cursor)
+        pages.append([s.session_id for s in sessions])
+
+    assert pages == [["s4", "s3"], ["s2", "s1"], ["s0"]]
+    summaries = {s.session_id: s for s in storage.get_session_summaries(user_id="u1")[0]}
+    assert summaries["s0"].title == "question 0"
+    assert summaries["s2"].title == "named" and summaries["s2"].session_name == "named"
+
+
+@pytest.mark.parametrize("schema_version", [1, 2])
+def test_session_summary_title_uses_the_text_of_list_content(tmp_path, schema_version):
+    storage = SqliteAgentStorage(
+        table_name="agent_sessions", db_file=str(tmp_path / "agents.db"), schema_version=schema_version
+    )
+    memory = _memory(num_runs=1)
+    memory["runs"][0]["message"]["content"] = [
+        {"type": "text", "text": "describe"},
+        {"type": "image_url", "image_url": {"url": "https://example.com/image.png"}},
+        {"type": "text", "text": "this image"},
+    ]
+    storage.upsert(AgentSession(session_id="s1", memory=memory))
+
+    assert storage.get_session_summaries()[0][0].title == "describe this image"
+
+def test_v2_storage_adds_and_fills_the_title_column_of_v1_tables(tmp_path):
+    db_file = str(tmp_path / "agents.db")
+    SqliteAgentStorage(table_name="agent_sessions", db_file=db_file).upsert(
+        AgentSession(session_id="s1", memory=_memory(num_runs=1))
+    )
+
+    storage = SqliteAgentStorage(table_name="agent_sessions", db_file=db_file, schema_version=2)
+    assert storage.read("s1") is not None
+    assert storage.get_session_summaries()[0][0].title is None
+
+    storage.upgrade_schema()
+    assert storage.get_session_summaries()[0][0].title == "question 0"
@@ -0,0 +1,170 @@
+import asyncio
+from copy import deepcopy
+
+import pytest
+
+from agno.tools import Toolkit
+from agno.tools.decorator import tool
+from agno.tools.function import FunctionCall, function_result_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    function_result_cache.clear()
+    yield
+    function_result_cache.clear()
+
+
+def test_cached_results_skip_the_entrypoint():
+    calls = []
+
+    @tool(cache_results=True)
+    def get_price(symbol: str) -> str:
+        """Get the price"""
+        calls.append(symbol)
+        return f"{symbol}: 100"
+
+    first = FunctionCall(function=get_price, arguments={"symbol": "NVDA"})
+    second = FunctionCall(function=get_price, arguments={"symbol": "NVDA"})
+    other = FunctionCall(function=get_price, arguments={"symbol": "AAPL"})
+
+    assert first.execute() and second.execute() and other.execute()
+    assert second.result == "NVDA: 100"
+    assert calls == ["NVDA", "AAPL"]
+    assert (first.cache_hit, second.cache_hit, other.cache_hit) == (False, True, False)
+
+
+def test_failed_calls_are_not_cached():
+    calls = []
+
+    @tool(cache_results=True)
+    def flaky(symbol: str) -> str:
+        """Fail the first time"""
+        calls.append(symbol)
+        if len(calls) == 1:
+            raise ValueError("unavailable")
+        return "ok"
+
+    assert not FunctionCall(function=flaky, arguments={"symbol": "NVDA"}).execute()
+    assert FunctionCall(function=flaky, arguments={"symbol": "NVDA"}).execute()
+    assert len(calls) == 2
+
+
+def test_functions_without_cache_results_are_not_cached():
+    calls = []
+
+    @tool
+    def get_price(symbol: str) -> str:
+        """Get the price"""
+        calls.append(symbol)
+        return "100"
+
+    fc = FunctionCall(function=get_price, arguments={"symbol": "NVDA"})
+    fc.execute()
+    FunctionCall(function=get_price, arguments={"symbol": "NVDA"}).execute()
+
+    assert len(calls) == 2
+    assert fc.cache_hit is None
+
+
+def test_disk_cache_is_shared_by_functions_with_the_same_entrypoint(tmp_path):
+    calls = []
+
+    def get_price(symbol: str) -> str:
+        """Get the price"""
+        calls.append(symbol)
+        return "100"
+
+    for _ in range(2):
+        function = tool(cache_results=True, cache_dir=str(tmp_path))(get_price)
+        assert FunctionCall(function=function, arguments={"symbol": "NVDA"}).execute()
+
+    assert calls == ["NVDA"]
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+class PriceTools(Toolkit):
+    def __init__(self, currency: str):
+        super().__init__(name="price_tools")
+        self.currency = currency
+        self.calls = 0
+        self.register(self.get_price, cache_results=True)
+
+    def get_price(self, symbol: str) -> str:
+        """Get the price"""
+        self.calls += 1
+        return f"100 {self.currency}"
+
+
+def test_toolkit_instances_do_not_share_cached_results():
+    usd, eur = PriceTools("USD"), PriceTools("EUR")
+
+    results = []
+    for toolkit in (usd, eur, usd):
+        fc = FunctionCall(function=toolkit.functions["get_price"], arguments={"symbol": "NVDA"})
+        assert fc.execute()
+        results.append((fc.result, fc.cache_hit))
+
+    assert results == [("100 USD", False), ("100 EUR", False), ("100 USD", True)]
+    assert (usd.calls, eur.calls) == (1, 1)
+
+
+def test_cache_ttl_none_caches_without_expiry():
+    @tool(cache_results=True, cache_ttl=None)
+    def get_price(symbol: str) -> str:
+        """Get the price"""
+        return "100"
+
+    assert get_price.cache_ttl is None
+
+
+def test_async_execute_uses_cache():
+    calls = []
+
+    @tool(cache_results=True)
+    async def search(query: str) -> str:
+        """Search"""
+        calls.append(query)
+        return "result"
+
+    async def run_twice():
+        for _ in range(2):
+            fc = FunctionCall(function=search, arguments={"query": "agno"})
+            await fc.aexecute()
+        return fc
+
+    fc = asyncio.run(run_twice())
+
+    assert fc.result == "result"
+    assert fc.cache_hit is True
+    assert calls == ["agno"]
+
+
+class DiskPriceTools(PriceTools):
+    def __init__(self, currency: str, cache_dir: str, cache_namespace=None):
+        Toolkit.__init__(self, name="price_tools", cache_namespace=cache_namespace)
+        self.currency = currency
+        self.calls = 0
+        self.register(self.get_price, cache_results=True, cache_dir=cache_dir)
+
+
+def test_disk_cached_results_are_shared_by_toolkits_with_the_same_config(tmp_path):
+    def call(toolkit: Toolkit) -> FunctionCall:
+        fc = FunctionCall(function=toolkit.functions["get_price"], arguments={"symbol": "NVDA"})
+        assert fc.execute()
+        return fc
+
+    call(DiskPriceTools("USD", str(tmp_path)))
+    # A new instance, as after a restart, and a copy of an agent hit the results on disk
+    restarted = DiskPriceTools("USD", str(tmp_path))
+    assert call(restarted).cache_hit is True
+    assert call(deepcopy(restarted)).cache_hit is True
+    assert restarted.calls == 0
+
+    assert call(DiskPriceTools("EUR", str(tmp_path))).cache_hit is False
+    assert len(list(tmp_path.iterdir())) == 2
+
+    # Toolkits with the same namespace share results regardless of their configuration
+    call(DiskPriceTools("USD", str(tmp_path), cache_namespace="prices"))
+    fc = call(DiskPriceTools("GBP", str(tmp_path), cache_namespace="prices"))
+    assert (fc.cache_hit, fc.result) == (True, "100 USD")
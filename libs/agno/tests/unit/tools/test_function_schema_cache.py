@@ -0,0 +1,144 @@
+import gc
+import weakref
+from unittest.mock import patch
+
+import pytest
+
+from agno.tools import Toolkit
+from agno.tools.function import Function, FunctionCall, function_schema_cache
+from agno.utils import json_schema
+
+
+@pytest.fixture(autouse=True)
+def clear_schema_cache():
+    function_schema_cache.clear()
+    yield
+    function_schema_cache.clear()
+
+
+class Weather(Toolkit):
+    def __init__(self, unit: str = "C"):
+        super().__init__(name="weather")
+        self.unit = unit
+        self.register(self.get_temperature)
+
+    def get_temperature(self, city: str, agent=None) -> str:
+        """Get the temperature in a city.
+
+        Args:
+            city (str): Name of the city.
+        """
+        return f"20{self.unit} in {city} for {agent}"
+
+
+def get_time(city: str, fc=None) -> str:
+    """Get the time in a city."""
+    return f"12:00 in {city} for {fc.function.name}"
+
+
+def test_schemas_are_computed_once_per_function():
+    with patch("agno.utils.json_schema.get_json_schema", wraps=json_schema.get_json_schema) as get_json_schema:
+        first = Function.from_callable(get_time)
+        second = Function.from_callable(get_time)
+        Function.from_callable(get_time, strict=True)
+
+    assert get_json_schema.call_count == 2
+    assert first.parameters == second.parameters
+    assert first.parameters is not second.parameters
+    assert first.entrypoint is second.entrypoint
+
+
+def test_methods_share_the_schema_and_are_bound_to_their_instance():
+    celsius, fahrenheit = Weather(unit="C"), Weather(unit="F")
+    for toolkit in (celsius, fahrenheit):
+        toolkit.functions["get_temperature"].process_entrypoint()
+
+    celsius_function = celsius.functions["get_temperature"]
+    fahrenheit_function = fahrenheit.functions["get_temperature"]
+    assert celsius_function.parameters["required"] == ["city"]
+    assert celsius_function.description == "Get the temperature in a city."
+
+    celsius_function._agent = "agent"
+    call = FunctionCall(function=celsius_function, arguments={"city": "Paris"})
+    assert call.execute()
+    assert call.result == "20C in Paris for agent"
+
+    fahrenheit_call = FunctionCall(function=fahrenheit_function, arguments={"city": "Paris"})
+    assert fahrenheit_call.execute()
+    assert fahrenheit_call.result == "20F in Paris for None"
+
+
+def test_processing_twice_does_not_wrap_the_entrypoint_again():
+    function = Function(name="get_time", entrypoint=get_time)
+    function.process_entrypoint()
+    entrypoint = function.entrypoint
+    function.process_entrypoint()
+    assert function.entrypoint is entrypoint
+
+
+def test_calls_do_not_inspect_the_signature():
+    function = Function.from_callable(get_time)
+    FunctionCall(function=function, arguments={"city": "Oslo"}).execute()
+
+    with patch("inspect.signature") as signature:
+        call = FunctionCall(function=function, arguments={"city": "Oslo"})
+        assert call.execute()
+
+    signature.assert_not_called()
+    assert call.result == "12:00 in Oslo for get_time"
+
+
+class Member:
+    """Stands in for the member agent a transfer function captures"""
+
+
+def make_transfer_function(member: Member):
+    def transfer_task(task: str, agent=None) -> str:
+        """Transfer a task to the member."""
+        return f"{task} for {member.__class__.__name__}"
+
+    return transfer_task
+
+
+def test_closures_are_not_kept_alive_by_the_cache():
+    member = Member()
+    member_ref = weakref.ref(member)
+    function = Function.from_callable(make_transfer_function(member))
+    call = FunctionCall(function=function, arguments={"task": "Write"})
+    assert call.execute()
+    assert call.result == "Write for Member"
+    assert function.parameters["required"] == ["task"]
+
+    # A closure made for the next run shares the cached schema and calls what it captures
+    with patch("agno.utils.json_schema.get_json_schema", wraps=json_schema.get_json_schema) as get_json_schema:
+        other = Function.from_callable(make_transfer_function(Member()))
+    get_json_schema.assert_not_called()
+    assert other.parameters == function.parameters
+    assert other.entrypoint is not function.entrypoint
+
+    del member, function, call
+    gc.collect()
+    assert member_ref() is None
+
+
+def make_converter(t: type, doc: str):
+    def convert(x: t) -> str:  # type: ignore
+        return str(t(x))
+
+    convert.__doc__ = doc
+    return convert
+
+
+def test_closures_from_the_same_factory_get_their_own_schema():
+    to_int = Function.from_callable(make_converter(int, "Convert to an integer"))
+    to_bool = Function.from_callable(make_converter(bool, "Convert to a boolean"))
+    again = Function.from_callable(make_converter(int, "Convert to an integer"))
+
+    assert (to_int.description, to_bool.description) == ("Convert to an integer", "Convert to a boolean")
+    assert to_int.parameters["properties"]["x"]["type"] == "number"
+    assert to_bool.parameters["properties"]["x"]["type"] == "boolean"
+    assert again.parameters == to_int.parameters
+
+    call = FunctionCall(function=to_bool, arguments={"x": True})
+    assert call.execute()
+    assert call.result == "True"
@@ -0,0 +1,43 @@
+from agno.run.response import RunResponse
+from agno.utils.stream import StreamBuffer
+
+
+def test_stream_buffer_joins_appended_chunks():
+    buffer = StreamBuffer()
+    assert not buffer and len(buffer) == 0 and buffer.getvalue() == ""
+
+    buffer.append("Hello")
+    buffer.append(None)
+    buffer.append("")
+    buffer.append(", ")
+    buffer.append("world")
+
+    assert buffer
+    assert len(buffer) == 12
+    assert buffer.getvalue() == "Hello, world"
+    assert str(buffer) == "Hello, world"
+
+
+def test_stream_buffer_appends_after_getvalue():
+    buffer = StreamBuffer("a")
+    buffer.append("b")
+    assert buffer.getvalue() == "ab"
+
+    buffer.append("c")
+
+    assert len(buffer) == 3
+    assert buffer.getvalue() == "abc"
+    assert buffer.getvalue() == "abc"
+
+
+def test_copy_with_content_does_not_change_the_template():
+    template = RunResponse(run_id="run-1", session_id="s1", content=None, tools=[{"tool_call_id": "call_1"}])
+    created_at = template.created_at
+
+    chunk = template.copy_with_content("Hello", created_at=created_at + 1)
+
+    assert chunk is not template and isinstance(chunk, RunResponse)
+    assert (chunk.run_id, chunk.session_id, chunk.content, chunk.created_at) == ("run-1", "s1", "Hello", created_at + 1)
+    assert chunk.tools == template.tools
+    assert template.content is None and template.created_at == created_at
+    assert template.copy_with_content("World").created_at == created_at
@@ -0,0 +1,30 @@
+import asyncio
+
+from agno.document import Document
+from agno.knowledge.agent import AgentKnowledge
+
+
+def test_async_methods_fall_back_to_sync_implementation(vector_db):
+
+    async def run():
+        await vector_db.async_create()
+        await vector_db.async_insert([Document(content="apple pie"), Document(content="banana bread")])
+        await vector_db.async_upsert([Document(content="apple tart")])
+        exists = await vector_db.async_doc_exists(Document(content="banana bread"))
+        results = await vector_db.async_search("apple", limit=1)
+        return exists, results
+
+    exists, results = asyncio.run(run())
+
+    assert vector_db.created
+    assert exists
+    assert [d.content for d in results] == ["apple pie"]
+
+
+def test_knowledge_async_search(vector_db):
+    vector_db.insert([Document(content="apple pie"), Document(content="apple tart")])
+    knowledge = AgentKnowledge(vector_db=vector_db, num_documents=5)
+
+    results = asyncio.run(knowledge.async_search("apple"))
+
+    assert [d.content for d in results] == ["apple pie", "apple tart"]